@@ -0,0 +1,134 @@
+"""Script to benchmark the latency of the standalone deployment runtime.
+
+The script does not need Isaac Sim: it only requires the ``ext_template_deploy`` package and the backend of the
+model. It measures the import time of the runtime package and the latency of a control step (writing all the
+observation terms and running the policy). Without a model, a synthetic policy with the layout of the rough
+AnymalD task (232 observations, 12 actions, 512-256-128 actor) is exported with torch.
+
+.. code-block:: bash
+
+    # benchmark an exported policy
+    python scripts/benchmarks/benchmark_deploy_runtime.py --model logs/rsl_rl/<experiment>/<run>/exported/policy.onnx
+    # benchmark a synthetic policy
+    python scripts/benchmarks/benchmark_deploy_runtime.py --format onnx pt
+
+"""
+
+import argparse
+import json
+import numpy as np
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from ext_template_deploy import PolicyRuntime
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the latency of the deployment runtime.")
+parser.add_argument("--model", type=str, default=None, help="Path to the exported model. Defaults to a synthetic one.")
+parser.add_argument("--manifest", type=str, default=None, help="Path to the manifest. Defaults to the model directory.")
+parser.add_argument(
+    "--format", type=str, nargs="+", default=["onnx", "pt"], help="Formats of the synthetic model to benchmark."
+)
+parser.add_argument("--num_steps", type=int, default=10000, help="Number of timed control steps.")
+parser.add_argument("--num_threads", type=int, default=1, help="Number of threads of the model backend.")
+args_cli = parser.parse_args()
+
+
+def export_synthetic_policy(path: str, formats: list[str]) -> list[str]:
+    """Export a random policy and its manifest with the observation layout of the rough AnymalD task."""
+    import torch
+
+    joint_names = [f"{leg}_{joint}" for joint in ("HAA", "HFE", "KFE") for leg in ("LF", "LH", "RF", "RH")]
+    terms = [("base_ang_vel", 3), ("projected_gravity", 3), ("velocity_commands", 3)]
+    observations = [{"name": name, "func": f"isaaclab.envs.mdp:{name}", "dim": dim} for name, dim in terms]
+    observations += [
+        {"name": "joint_pos", "func": "isaaclab.envs.mdp:joint_pos_rel", "dim": 12, "offset": [0.1] * 12},
+        {"name": "joint_vel", "func": "isaaclab.envs.mdp:joint_vel_rel", "dim": 12, "offset": [0.0] * 12},
+        {"name": "actions", "func": "isaaclab.envs.mdp:last_action", "dim": 12, "source": "last_action"},
+        {"name": "height_scan", "func": "isaaclab.envs.mdp:height_scan", "dim": 187, "offset": 0.5, "clip": [-1, 1]},
+    ]
+    actions = [{"name": "joint_pos", "type": "JointPositionAction", "dim": 12, "scale": 0.5, "offset": [0.1] * 12}]
+    actions[0]["joint_names"] = joint_names
+    manifest = {"obs_dim": 232, "action_dim": 12, "step_dt": 0.02, "observations": observations, "actions": actions}
+    with open(os.path.join(path, "policy_manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    # random actor with the normalizer folded in
+    layers = []
+    for in_dim, out_dim in zip([232, 512, 256], [512, 256, 128]):
+        layers += [torch.nn.Linear(in_dim, out_dim), torch.nn.ELU()]
+    actor = torch.nn.Sequential(*layers, torch.nn.Linear(128, 12)).eval()
+    models = []
+    if "pt" in formats:
+        models.append(os.path.join(path, "policy.pt"))
+        torch.jit.script(actor).save(models[-1])
+    if "onnx" in formats:
+        models.append(os.path.join(path, "policy.onnx"))
+        torch.onnx.export(
+            actor, torch.zeros(1, 232), models[-1], input_names=["obs"], output_names=["actions"], dynamo=False
+        )
+    return models
+
+
+def measure_import_time(module: str) -> float:
+    """Measure the import time of a module in a fresh interpreter (in ms)."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return 1000.0 * float(output)
+
+
+def benchmark(model_path: str, manifest_path: str | None) -> dict[str, float]:
+    """Measure the construction time and the latency of a control step of the runtime."""
+    start = time.perf_counter()
+    runtime = PolicyRuntime(model_path, manifest_path, num_threads=args_cli.num_threads)
+    load_time = time.perf_counter() - start
+    # random inputs of the terms
+    rng = np.random.default_rng(0)
+    inputs = [
+        (name, rng.standard_normal(runtime._terms[name].spec.dim).astype(np.float32)) for name in runtime.input_terms
+    ]
+    runtime.reset()
+    # warm-up
+    for _ in range(100):
+        for name, value in inputs:
+            runtime.set_observation(name, value)
+        runtime.step()
+    # timed steps
+    timings = np.empty(args_cli.num_steps)
+    for index in range(args_cli.num_steps):
+        start = time.perf_counter()
+        for name, value in inputs:
+            runtime.set_observation(name, value)
+        runtime.step()
+        timings[index] = time.perf_counter() - start
+    timings *= 1.0e6
+    return {
+        "load (ms)": 1000.0 * load_time,
+        "mean (us)": timings.mean(),
+        "p50 (us)": np.percentile(timings, 50),
+        "p99 (us)": np.percentile(timings, 99),
+    }
+
+
+def main():
+    """Benchmark the deployment runtime."""
+    print(
+        f"[INFO] Import time of ext_template_deploy: {measure_import_time('ext_template_deploy'):.1f} ms"
+        f" (numpy alone: {measure_import_time('numpy'):.1f} ms)"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        models = [args_cli.model] if args_cli.model is not None else export_synthetic_policy(directory, args_cli.format)
+        results = {os.path.basename(model): benchmark(model, args_cli.manifest) for model in models}
+    # print the results
+    keys = list(next(iter(results.values())).keys())
+    print(f"{'Model':>12} | " + " | ".join(f"{key:>10}" for key in keys))
+    for name, result in results.items():
+        print(f"{name:>12} | " + " | ".join(f"{result[key]:>10.2f}" for key in keys))
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,155 @@
+"""Script to check and benchmark the sharing of observation terms between the observation groups.
+
+The script creates a task with the :class:`~ext_template.managers.ExtObservationManager` and counts the calls
+of the observation functions while stepping the environment: every function term must be evaluated once per
+computation of the observations, whatever the number of groups that include it. It then times the computation
+of all the groups with and without sharing the terms, and with and without fusing the noise, clipping and scaling
+of the terms of a group.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/benchmarks/benchmark_observation_manager.py --task Ext-Isaac-Velocity-Rough-Anymal-D-v0
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the sharing of observation terms between groups.")
+parser.add_argument("--task", type=str, default="Ext-Isaac-Velocity-Rough-Anymal-D-v0", help="Name of the task.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments to simulate.")
+parser.add_argument("--num_steps", type=int, default=50, help="Number of environment steps of the call count check.")
+parser.add_argument("--num_repeats", type=int, default=100, help="Number of timed computations.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import collections
+import gymnasium as gym
+import time
+import torch
+
+from isaaclab.managers import ManagerTermBase
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.managers import ExtObservationManager
+
+
+def count_calls(obs_manager: ExtObservationManager) -> tuple[collections.Counter, dict[object, list[str]]]:
+    """Wrap the function terms of the manager to count the evaluations of every shared value."""
+    counts = collections.Counter()
+    terms = collections.defaultdict(list)
+
+    def counted(func, key):
+        def wrapper(*args, **kwargs):
+            counts[key] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    for group_name, term_cfgs in obs_manager._group_obs_term_cfgs.items():
+        term_names = obs_manager.active_terms[group_name]
+        for term_name, term_cfg, key in zip(term_names, term_cfgs, obs_manager._group_obs_term_keys[group_name]):
+            # note: class terms are not wrapped since the manager resets them
+            if isinstance(term_cfg.func, ManagerTermBase):
+                continue
+            terms[key].append(f"{group_name}/{term_name}")
+            term_cfg.func = counted(term_cfg.func, key)
+    return counts, terms
+
+
+def timeit(func, device: str) -> float:
+    """Return the median wall-clock time of the function in milliseconds."""
+    synchronize = torch.cuda.synchronize if device.startswith("cuda") else lambda: None
+    timings = []
+    for _ in range(args_cli.num_repeats + 1):
+        synchronize()
+        start = time.perf_counter()
+        func()
+        synchronize()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    # discard the warm-up iteration
+    return sorted(timings[1:])[len(timings[1:]) // 2]
+
+
+def main():
+    """Check and benchmark the observation manager."""
+    env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs)
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    obs_manager = env.unwrapped.observation_manager
+    if not isinstance(obs_manager, ExtObservationManager):
+        raise TypeError(f"The task '{args_cli.task}' does not use the ExtObservationManager.")
+
+    # count the evaluations of the terms and the computations of the observations
+    counts, terms = count_calls(obs_manager)
+    compute = obs_manager.compute
+    num_computations = 0
+
+    def counted_compute(*args, **kwargs):
+        nonlocal num_computations
+        num_computations += 1
+        return compute(*args, **kwargs)
+
+    obs_manager.compute = counted_compute
+    env.reset()
+    actions = torch.zeros(
+        env.unwrapped.num_envs, env.unwrapped.action_manager.total_action_dim, device=env.unwrapped.device
+    )
+    with torch.inference_mode():
+        for _ in range(args_cli.num_steps):
+            env.step(actions)
+    obs_manager.compute = compute
+
+    # check that every shared value was evaluated once per computation
+    print(f"[INFO] {num_computations} computations of the observations")
+    print(f"{'Calls':>6} | Terms")
+    for key, term_names in terms.items():
+        print(f"{counts[key]:>6} | {', '.join(term_names)}")
+    failed = [", ".join(terms[key]) for key in terms if counts[key] != num_computations]
+    if failed:
+        raise RuntimeError(f"Terms evaluated more than once per computation: {failed}")
+    num_terms = sum(len(term_names) for term_names in terms.values())
+    print(f"[INFO] Every function term was evaluated once per computation ({len(terms)} values for {num_terms} terms).")
+
+    # time the computation of all the groups with and without sharing the terms
+    with torch.inference_mode():
+        shared = timeit(obs_manager.compute, env.unwrapped.device)
+        separate = timeit(
+            lambda: [obs_manager.compute_group(group_name) for group_name in obs_manager.active_terms],
+            env.unwrapped.device,
+        )
+    print(f"[INFO] Computation of the observations: {separate:.3f} ms separate, {shared:.3f} ms shared")
+
+    # time the computation of all the groups with and without fusing the post-processing of the terms
+    fused_post_processing = obs_manager._group_obs_fused_post_processing
+    print(
+        f"[INFO] Groups with fused post-processing: {[name for name, fused in fused_post_processing.items() if fused]}"
+    )
+    obs_manager._group_obs_fused_post_processing = dict.fromkeys(fused_post_processing)
+    with torch.inference_mode():
+        per_term = timeit(obs_manager.compute, env.unwrapped.device)
+    obs_manager._group_obs_fused_post_processing = fused_post_processing
+    print(f"[INFO] Post-processing of the observations: {per_term:.3f} ms per term, {shared:.3f} ms fused")
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,129 @@
+"""Script to benchmark the step time of a task against the update period of its held observation terms.
+
+The script creates a task and sets the update period of all its :class:`held_observation` terms (for the velocity
+task, the height scans of the policy and critic groups) to each of the given values. For every period, it steps
+the environment with random actions and reports the median step time, the number of evaluations of the source
+terms per step and the number of environments reset per step. The environments that are reset still refresh their
+held values at the next step: the episodes can be shortened with ``--episode_length_s`` to measure these refreshes.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/benchmarks/benchmark_observation_update_period.py --update_periods 1 2 4
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the step time against the update period of observations.")
+parser.add_argument("--task", type=str, default="Ext-Isaac-Velocity-Rough-Anymal-D-v0", help="Name of the task.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments to simulate.")
+parser.add_argument("--update_periods", type=int, nargs="+", default=[1, 2, 4], help="Update periods (in steps).")
+parser.add_argument("--num_warmup_steps", type=int, default=20, help="Number of steps before the timing.")
+parser.add_argument("--num_steps", type=int, default=200, help="Number of timed steps per update period.")
+parser.add_argument("--episode_length_s", type=float, default=None, help="Length of the episodes (in seconds).")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import time
+import torch
+
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.tasks.locomotion.velocity.mdp import held_observation
+
+
+def main():
+    """Benchmark the step time against the update period."""
+    env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs)
+    if args_cli.episode_length_s is not None:
+        env_cfg.episode_length_s = args_cli.episode_length_s
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    obs_manager = env.unwrapped.observation_manager
+
+    # find the held terms and count the evaluations of their source terms
+    held_terms = []
+    num_evaluations = 0
+    for group_name, term_cfgs in obs_manager._group_obs_term_cfgs.items():
+        for term_name, term_cfg in zip(obs_manager.active_terms[group_name], term_cfgs):
+            if isinstance(term_cfg.func, held_observation):
+                held_terms.append(term_cfg.func)
+                print(f"[INFO] Held term: {group_name}/{term_name}")
+    if not held_terms:
+        raise RuntimeError(f"The task '{args_cli.task}' has no held observation terms.")
+
+    def counted(func):
+        def wrapper(*args, **kwargs):
+            nonlocal num_evaluations
+            num_evaluations += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    for term in held_terms:
+        term.source_cfg.func = counted(term.source_cfg.func)
+
+    synchronize = torch.cuda.synchronize if env.unwrapped.device.startswith("cuda") else lambda: None
+    num_actions = env.unwrapped.action_manager.total_action_dim
+    env.reset()
+    # note: the episodes are started at random lengths, which spreads the time-outs over the steps
+    env.unwrapped.episode_length_buf = torch.randint_like(
+        env.unwrapped.episode_length_buf, high=int(env.unwrapped.max_episode_length)
+    )
+    results = []
+    with torch.inference_mode():
+        for update_period in args_cli.update_periods:
+            for term in held_terms:
+                term.update_period = update_period
+            timings = []
+            num_evaluations = 0
+            num_resets = 0
+            for step in range(args_cli.num_warmup_steps + args_cli.num_steps):
+                if step == args_cli.num_warmup_steps:
+                    num_evaluations = 0
+                    num_resets = 0
+                actions = 2.0 * torch.rand(env.unwrapped.num_envs, num_actions, device=env.unwrapped.device) - 1.0
+                synchronize()
+                start = time.perf_counter()
+                env.step(actions)
+                synchronize()
+                timings.append((time.perf_counter() - start) * 1000.0)
+                num_resets += env.unwrapped.reset_buf.sum().item()
+            timings = sorted(timings[args_cli.num_warmup_steps :])
+            results.append(
+                (
+                    update_period,
+                    timings[len(timings) // 2],
+                    num_evaluations / args_cli.num_steps,
+                    num_resets / args_cli.num_steps,
+                )
+            )
+
+    print(f"{'Period':>6} | {'Step (ms)':>9} | {'Evaluations per step':>20} | {'Resets per step':>15}")
+    for update_period, step_time, evaluations, resets in results:
+        print(f"{update_period:>6} | {step_time:>9.3f} | {evaluations:>20.2f} | {resets:>15.1f}")
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,100 @@
+"""Script to benchmark the fused reset event of the velocity task against the separate reset events.
+
+The script creates the environment of a task and times, for bursts of resetting environments of several sizes,
+the fused :class:`~ext_template.tasks.locomotion.velocity.mdp.reset_root_and_joint_state` term of the task against
+:func:`~isaaclab.envs.mdp.reset_root_state_uniform` followed by :func:`~isaaclab.envs.mdp.reset_joints_by_scale`
+with the same parameters.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/benchmarks/benchmark_reset_events.py --task Ext-Isaac-Velocity-Rough-Anymal-D-v0 \
+        --num_envs 4096
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the fused reset event.")
+parser.add_argument("--task", type=str, default="Ext-Isaac-Velocity-Rough-Anymal-D-v0", help="Name of the task.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments to simulate.")
+parser.add_argument("--term", type=str, default="reset_robot", help="Name of the fused reset event term.")
+parser.add_argument("--num_repeats", type=int, default=100, help="Number of timed resets per burst size.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import time
+import torch
+
+import isaaclab.envs.mdp as mdp
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+
+
+def _time(func, device: str) -> float:
+    """Average duration of a function (in s) over the repeats."""
+    func()
+    if "cuda" in device:
+        torch.cuda.synchronize(device)
+    start = time.perf_counter()
+    for _ in range(args_cli.num_repeats):
+        func()
+    if "cuda" in device:
+        torch.cuda.synchronize(device)
+    return (time.perf_counter() - start) / args_cli.num_repeats
+
+
+def main():
+    """Benchmark the fused reset event."""
+    env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs)
+    env = gym.make(args_cli.task, cfg=env_cfg).unwrapped
+    env.reset()
+    term_cfg = env.event_manager.get_term_cfg(args_cli.term)
+    params = dict(term_cfg.params)
+    asset_cfg = params.pop("asset_cfg", None)
+    asset_kwargs = {} if asset_cfg is None else {"asset_cfg": asset_cfg}
+
+    def fused(env_ids: torch.Tensor):
+        term_cfg.func(env, env_ids, **term_cfg.params)
+
+    def separate(env_ids: torch.Tensor):
+        mdp.reset_root_state_uniform(env, env_ids, params["pose_range"], params["velocity_range"], **asset_kwargs)
+        mdp.reset_joints_by_scale(
+            env, env_ids, params["joint_position_range"], params["joint_velocity_range"], **asset_kwargs
+        )
+
+    print(f"{'Resets':>8} | {'Separate (ms)':>13} | {'Fused (ms)':>10} | {'Speed-up':>8}")
+    num_resets = 16
+    while num_resets <= env.num_envs:
+        env_ids = torch.randperm(env.num_envs, device=env.device)[:num_resets]
+        separate_time = _time(lambda: separate(env_ids), env.device)
+        fused_time = _time(lambda: fused(env_ids), env.device)
+        print(
+            f"{num_resets:>8} | {separate_time * 1e3:>13.3f} | {fused_time * 1e3:>10.3f} |"
+            f" {separate_time / fused_time:>8.2f}"
+        )
+        num_resets *= 4
+
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
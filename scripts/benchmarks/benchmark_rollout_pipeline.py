@@ -0,0 +1,164 @@
+"""Script to benchmark the pipelined rollout collection of the extension runner.
+
+The script trains a PPO agent on a synthetic vectorized environment with both collection modes of the
+:class:`~ext_template.rsl_rl.ExtOnPolicyRunner` and reports the collection time per iteration. The
+environment emulates the latency of the simulation with a fixed sleep per step. Both modes are seeded
+identically, so the script also checks that they collect the same rollout.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/benchmarks/benchmark_rollout_pipeline.py --num_envs 4096 --step_latency 2.0
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the pipelined rollout collection.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--num_steps_per_env", type=int, default=24, help="Number of steps per environment.")
+parser.add_argument("--num_obs", type=int, default=235, help="Dimension of the observations.")
+parser.add_argument("--num_actions", type=int, default=12, help="Dimension of the actions.")
+parser.add_argument("--step_latency", type=float, default=2.0, help="Emulated simulation latency per step (ms).")
+parser.add_argument("--num_iterations", type=int, default=5, help="Number of learning iterations.")
+parser.add_argument("--runner_device", type=str, default="cpu", help="Device of the runner.")
+parser.add_argument("--seed", type=int, default=42, help="Seed of the benchmark.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+import torch
+
+from rsl_rl.env import VecEnv
+
+from ext_template.rsl_rl import ExtOnPolicyRunner
+
+
+class SyntheticVecEnv(VecEnv):
+    """Vectorized environment with random dynamics and a fixed stepping latency."""
+
+    def __init__(self, num_envs: int, num_obs: int, num_actions: int, device: str):
+        self.num_envs = num_envs
+        self.num_actions = num_actions
+        self.max_episode_length = 100
+        self.device = device
+        self.cfg = dict()
+        self.generator = torch.Generator(device=device).manual_seed(args_cli.seed)
+        self.obs_buf = torch.zeros(num_envs, num_obs, device=device)
+        self.rew_buf = torch.zeros(num_envs, device=device)
+        self.episode_length_buf = torch.zeros(num_envs, dtype=torch.long, device=device)
+
+    def get_observations(self) -> tuple[torch.Tensor, dict]:
+        return self.obs_buf, {"observations": {}}
+
+    def reset(self) -> tuple[torch.Tensor, dict]:
+        self.episode_length_buf.zero_()
+        return self.get_observations()
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        # emulate the simulation
+        time.sleep(args_cli.step_latency / 1000.0)
+        # update the buffers in-place, as the Isaac Lab environments do
+        self.episode_length_buf += 1
+        time_outs = self.episode_length_buf >= self.max_episode_length
+        dones = time_outs | (torch.rand(self.num_envs, generator=self.generator, device=self.device) < 0.01)
+        self.episode_length_buf[dones] = 0
+        self.obs_buf.normal_(generator=self.generator)
+        self.rew_buf.copy_(-torch.sum(torch.square(actions), dim=1))
+        return self.obs_buf.clone(), self.rew_buf, dones.long(), {"observations": {}, "time_outs": time_outs}
+
+
+def make_train_cfg(pipelined_collection: bool) -> dict:
+    """Create the training configuration of the runner."""
+    return {
+        "num_steps_per_env": args_cli.num_steps_per_env,
+        "save_interval": 50,
+        "empirical_normalization": False,
+        "fast_storage": True,
+        "pipelined_collection": pipelined_collection,
+        "policy": {
+            "class_name": "ActorCritic",
+            "init_noise_std": 1.0,
+            "actor_hidden_dims": [512, 256, 128],
+            "critic_hidden_dims": [512, 256, 128],
+            "activation": "elu",
+        },
+        "algorithm": {
+            "class_name": "PPO",
+            "value_loss_coef": 1.0,
+            "use_clipped_value_loss": True,
+            "clip_param": 0.2,
+            "entropy_coef": 0.005,
+            "num_learning_epochs": 5,
+            "num_mini_batches": 4,
+            "learning_rate": 1.0e-3,
+            "schedule": "adaptive",
+            "gamma": 0.99,
+            "lam": 0.95,
+            "desired_kl": 0.01,
+            "max_grad_norm": 1.0,
+        },
+    }
+
+
+def run(pipelined_collection: bool) -> tuple[float, ExtOnPolicyRunner]:
+    """Train the agent and return the mean collection time per iteration in milliseconds."""
+    torch.manual_seed(args_cli.seed)
+    env = SyntheticVecEnv(args_cli.num_envs, args_cli.num_obs, args_cli.num_actions, args_cli.runner_device)
+    runner = ExtOnPolicyRunner(env, make_train_cfg(pipelined_collection), device=args_cli.runner_device)
+    # time the collection through the update of the algorithm
+    collection_times = []
+    update = runner.alg.update
+
+    def timed_update():
+        if args_cli.runner_device.startswith("cuda"):
+            torch.cuda.synchronize()
+        collection_times.append(time.perf_counter() - timed_update.start)
+        loss_dict = update()
+        timed_update.start = time.perf_counter()
+        return loss_dict
+
+    runner.alg.update = timed_update
+    timed_update.start = time.perf_counter()
+    runner.learn(args_cli.num_iterations)
+    # discard the warm-up iteration
+    return 1000.0 * sum(collection_times[1:]) / len(collection_times[1:]), runner
+
+
+def main():
+    """Benchmark the collection modes."""
+    sequential_time, sequential_runner = run(pipelined_collection=False)
+    pipelined_time, pipelined_runner = run(pipelined_collection=True)
+
+    # check that both modes collected the same rollout
+    names = ["observations", "actions", "rewards", "dones", "values", "actions_log_prob", "returns"]
+    error = 0.0
+    for name in names:
+        sequential_buffer = getattr(sequential_runner.alg.storage, name).float()
+        pipelined_buffer = getattr(pipelined_runner.alg.storage, name).float()
+        error = max(error, torch.max(torch.abs(sequential_buffer - pipelined_buffer)).item())
+
+    print(f"[INFO] {args_cli.num_envs} envs x {args_cli.num_steps_per_env} steps (max. rollout error: {error:.2e})")
+    print(f"{'Collection':>12} | {'Time / iteration (ms)':>21}")
+    print(f"{'sequential':>12} | {sequential_time:21.2f}")
+    print(f"{'pipelined':>12} | {pipelined_time:21.2f}")
+    print(f"{'Speed-up':>12} | {sequential_time / pipelined_time:20.2f}x")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,122 @@
+"""Script to benchmark the rollout storage of the extension against the one from RSL-RL.
+
+The script fills both storages with the same random rollout and times the computation of the returns
+and one PPO update worth of mini-batches. The benchmark runs on the CPU by default.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/benchmarks/benchmark_rollout_storage.py --num_envs 4096 16384
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the rollout storage used for PPO.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[4096, 16384], help="Number of environments.")
+parser.add_argument("--num_steps_per_env", type=int, default=24, help="Number of steps per environment.")
+parser.add_argument("--num_obs", type=int, default=235, help="Dimension of the observations.")
+parser.add_argument("--num_actions", type=int, default=12, help="Dimension of the actions.")
+parser.add_argument("--num_learning_epochs", type=int, default=5, help="Number of learning epochs per update.")
+parser.add_argument("--num_mini_batches", type=int, default=4, help="Number of mini-batches per epoch.")
+parser.add_argument("--num_repeats", type=int, default=10, help="Number of timed repetitions.")
+parser.add_argument("--storage_device", type=str, default="cpu", help="Device of the rollout storage.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import copy
+import time
+import torch
+
+from rsl_rl.storage import RolloutStorage
+
+from ext_template.rsl_rl import FastRolloutStorage
+
+
+def make_storage(num_envs: int) -> RolloutStorage:
+    """Create a rollout storage filled with a random rollout."""
+    storage = RolloutStorage(
+        "rl",
+        num_envs,
+        args_cli.num_steps_per_env,
+        [args_cli.num_obs],
+        [args_cli.num_obs],
+        [args_cli.num_actions],
+        device=args_cli.storage_device,
+    )
+    for name in ["observations", "privileged_observations", "actions", "rewards", "values", "mu", "sigma"]:
+        getattr(storage, name).normal_()
+    storage.actions_log_prob.uniform_(-10.0, 0.0)
+    storage.dones.copy_(torch.rand_like(storage.rewards) < 0.02)
+    storage.step = args_cli.num_steps_per_env
+    return storage
+
+
+def consume_mini_batches(storage: RolloutStorage) -> float:
+    """Iterate over the mini-batches of one update and touch every tensor of them."""
+    total = 0.0
+    for batch in storage.mini_batch_generator(args_cli.num_mini_batches, args_cli.num_learning_epochs):
+        for tensor in batch[:9]:
+            total += float(tensor[0].sum())
+    return total
+
+
+def timeit(func, *args) -> float:
+    """Return the median wall-clock time of the function in milliseconds."""
+    timings = []
+    for _ in range(args_cli.num_repeats + 1):
+        start = time.perf_counter()
+        with torch.inference_mode():
+            func(*args)
+        if args_cli.storage_device.startswith("cuda"):
+            torch.cuda.synchronize()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    # discard the warm-up iteration
+    return sorted(timings[1:])[len(timings[1:]) // 2]
+
+
+def main():
+    """Benchmark the rollout storages."""
+    for num_envs in args_cli.num_envs:
+        storage = make_storage(num_envs)
+        fast_storage = FastRolloutStorage.from_storage(copy.deepcopy(storage))
+        last_values = torch.randn(num_envs, 1, device=args_cli.storage_device)
+
+        # check that both storages compute the same returns
+        with torch.inference_mode():
+            storage.compute_returns(last_values, gamma=0.99, lam=0.95)
+            fast_storage.compute_returns(last_values, gamma=0.99, lam=0.95)
+        error = torch.max(torch.abs(storage.returns - fast_storage.returns)).item()
+
+        # time the different stages
+        results = {}
+        for name, buffer in [("RolloutStorage", storage), ("FastRolloutStorage", fast_storage)]:
+            returns_time = timeit(buffer.compute_returns, last_values, 0.99, 0.95)
+            batches_time = timeit(consume_mini_batches, buffer)
+            results[name] = (returns_time, batches_time)
+
+        print(f"[INFO] {num_envs} envs x {args_cli.num_steps_per_env} steps (max. return error: {error:.2e})")
+        print(f"{'Storage':>20} | {'Returns (ms)':>12} | {'Mini-batches (ms)':>17}")
+        for name, (returns_time, batches_time) in results.items():
+            print(f"{name:>20} | {returns_time:12.2f} | {batches_time:17.2f}")
+        base, fast = results["RolloutStorage"], results["FastRolloutStorage"]
+        print(f"{'Speed-up':>20} | {base[0] / fast[0]:11.2f}x | {base[1] / fast[1]:16.2f}x\n")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,89 @@
+"""Script to benchmark the generation of a terrain against its loading from the terrain cache.
+
+The script generates the terrain of a task with the :class:`~isaaclab.terrains.TerrainGenerator` and with the
+:class:`~ext_template.terrains.CachedTerrainGenerator` (in an empty cache directory, then again from the cache),
+reports the time of each, and checks that the cached terrain is identical to the generated one.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/benchmarks/benchmark_terrain_cache.py --task Ext-Isaac-Velocity-Rough-Anymal-D-v0
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the terrain cache.")
+parser.add_argument("--task", type=str, default="Ext-Isaac-Velocity-Rough-Anymal-D-v0", help="Name of the task.")
+parser.add_argument("--seed", type=int, default=42, help="Seed of the terrain generator.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import numpy as np
+import tempfile
+import time
+import torch
+
+from isaaclab.terrains import TerrainGenerator
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.terrains import CachedTerrainGeneratorCfg, cached_terrain_generator_cfg
+
+
+def main():
+    """Benchmark the terrain cache."""
+    env_cfg = parse_env_cfg(args_cli.task, device="cpu", num_envs=1)
+    terrain_cfg = env_cfg.scene.terrain.terrain_generator
+    if terrain_cfg is None:
+        raise RuntimeError(f"The task '{args_cli.task}' has no terrain generator.")
+    if not isinstance(terrain_cfg, CachedTerrainGeneratorCfg):
+        terrain_cfg = cached_terrain_generator_cfg(terrain_cfg)
+    terrain_cfg.seed = args_cli.seed
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        terrain_cfg.terrain_cache_dir = cache_dir
+        results = []
+        for name, generator_cls in (
+            ("generator", TerrainGenerator),
+            ("cache (miss)", terrain_cfg.class_type),
+            ("cache (hit)", terrain_cfg.class_type),
+        ):
+            start = time.perf_counter()
+            generator = generator_cls(terrain_cfg.copy())
+            results.append((name, time.perf_counter() - start, generator))
+
+    print(f"{'Terrain':<12} | {'Time (s)':>8}")
+    for name, duration, _ in results:
+        print(f"{name:<12} | {duration:>8.3f}")
+
+    # check that the cached terrain is identical to the generated one
+    generated, cached = results[0][2], results[-1][2]
+    identical = (
+        np.array_equal(generated.terrain_mesh.vertices, cached.terrain_mesh.vertices)
+        and np.array_equal(generated.terrain_mesh.faces, cached.terrain_mesh.faces)
+        and np.array_equal(generated.terrain_origins, cached.terrain_origins)
+        and generated.flat_patches.keys() == cached.flat_patches.keys()
+        and all(torch.equal(generated.flat_patches[k], cached.flat_patches[k]) for k in generated.flat_patches)
+    )
+    print(f"[INFO] Cached terrain identical to the generated terrain: {identical}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
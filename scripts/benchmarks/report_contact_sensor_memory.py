@@ -0,0 +1,87 @@
+"""Script to report the memory saved by restricting the contact sensor to the referenced bodies.
+
+The script creates a task, whose environment restricts the contact sensor to the bodies referenced by its terms
+(see :func:`~ext_template.envs.restrict_contact_sensor_bodies`), and reports the size of the buffers of the sensor
+per environment with all the bodies of the robot and with the referenced bodies only. The sizes are computed
+analytically with :func:`~ext_template.envs.contact_sensor_buffer_size` and checked against the buffers allocated
+by the restricted sensor.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/benchmarks/report_contact_sensor_memory.py --task Ext-Isaac-Velocity-Rough-Anymal-D-v0
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Report the memory of the restricted contact sensor.")
+parser.add_argument("--task", type=str, default="Ext-Isaac-Velocity-Rough-Anymal-D-v0", help="Name of the task.")
+parser.add_argument("--num_envs", type=int, default=16, help="Number of environments to simulate.")
+parser.add_argument("--sensor", type=str, default="contact_forces", help="Name of the contact sensor.")
+parser.add_argument("--asset", type=str, default="robot", help="Name of the articulation of the sensor.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import torch
+
+from isaaclab_tasks.utils import parse_env_cfg
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.envs import contact_sensor_buffer_size
+
+
+def main():
+    """Report the memory of the contact sensor."""
+    env_cfg = parse_env_cfg(args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs)
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    scene = env.unwrapped.scene
+    sensor = scene[args_cli.sensor]
+    asset = scene[args_cli.asset]
+    num_filters = sensor.contact_physx_view.filter_count if sensor.cfg.filter_prim_paths_expr else 0
+
+    # size of the buffers with all the bodies of the asset and with the referenced bodies
+    # note: all the bodies of the asset report their contacts when it activates the contact sensors
+    full = contact_sensor_buffer_size(sensor.cfg, asset.num_bodies, num_filters)
+    restricted = contact_sensor_buffer_size(sensor.cfg, sensor.num_bodies, num_filters)
+    # size of the buffers allocated by the sensor (views of other buffers are not counted)
+    storages = {
+        value.untyped_storage().data_ptr(): value.untyped_storage().nbytes()
+        for value in vars(sensor.data).values()
+        if isinstance(value, torch.Tensor)
+    }
+    allocated = sum(storages.values()) // env.unwrapped.num_envs
+
+    print(f"[INFO] Contact sensor '{args_cli.sensor}': {sensor.cfg.prim_path}")
+    print(f"[INFO] Bodies: {asset.num_bodies} in the asset, {sensor.num_bodies} tracked: {sensor.body_names}")
+    print(f"{'Bodies':<12} | {'Bytes per env':>13}")
+    print(f"{'all':<12} | {full:>13}")
+    print(f"{'referenced':<12} | {restricted:>13}")
+    print(f"[INFO] Memory saved per environment: {full - restricted} bytes ({1.0 - restricted / full:.1%})")
+    print(f"[INFO] Memory allocated by the restricted sensor per environment: {allocated} bytes")
+    if allocated != restricted:
+        print("[WARN] The analytic size does not match the allocated buffers of the sensor.")
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,609 @@
+"""Script to check the MDP terms for patterns that synchronize the device or allocate memory in the hot paths.
+
+The script parses the sources of the MDP modules of the tasks (``ext_template/tasks/**/mdp``) and of the term
+functions referenced by the configurations of the tasks (``func=...`` arguments, resolved statically through the
+imports of the configurations, e.g. to the modules of Isaac Lab). It reports the following patterns with their
+location and severity:
+
+* ``HZ101`` (error): transfer to the host with ``.item()``, ``.cpu()``, ``.tolist()``, ``.numpy()`` or ``.to("cpu")``.
+* ``HZ102`` (error): ``nonzero`` and single-argument ``where``, whose output shape depends on the data.
+* ``HZ103`` (error): reduction with ``any``/``all`` used as the condition of an ``if`` or ``while`` statement.
+* ``HZ201`` (warning): indexing with a boolean mask, whose output shape depends on the data.
+* ``HZ202`` (info): indexing with a list of consecutive integers or with a range, which could be a slice.
+* ``HZ301`` (warning): Python loop over the environments.
+* ``HZ401`` (warning): tensor creation without the ``device`` argument.
+* ``HZ402`` (warning): tensor creation from host data in a hot path.
+
+The findings in the ``__init__`` methods of the class terms, and in the terms that are only referenced by events
+in the ``startup`` or ``prestartup`` modes, are only evaluated once and are reported as ``info``.
+A line is excluded from the check with a ``# noqa`` comment, optionally followed by the excluded codes
+(e.g. ``# noqa: HZ101``).
+
+The script only parses the sources: it runs on any machine, without the simulator and without importing the
+modules. The sources of the modules referenced by the configurations are searched in the Python path and in the
+directories passed with ``--search_path``.
+
+.. code-block:: bash
+
+    # check the MDP modules and the terms referenced by the configurations
+    python scripts/check_mdp_hazards.py
+    # check additional files and fail on warnings
+    python scripts/check_mdp_hazards.py path/to/rewards.py --fail_on warning
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+SEVERITIES = ("info", "warning", "error")
+"""Severities of the findings, in increasing order."""
+
+HOST_TRANSFER_METHODS = ("item", "cpu", "tolist", "numpy")
+"""Methods that transfer the data of a tensor to the host."""
+
+DATA_DEPENDENT_FUNCTIONS = ("nonzero", "argwhere", "masked_select", "unique")
+"""Functions and methods whose output shape depends on the data of the input."""
+
+CREATION_FUNCTIONS = (
+    "zeros",
+    "ones",
+    "empty",
+    "full",
+    "rand",
+    "randn",
+    "randint",
+    "randperm",
+    "arange",
+    "linspace",
+    "eye",
+    "tensor",
+    "as_tensor",
+)
+"""Functions of :mod:`torch` that create tensors on the default device if the ``device`` argument is missing."""
+
+HOST_DATA_CREATION_FUNCTIONS = ("tensor", "as_tensor")
+"""Functions of :mod:`torch` that copy host data to the device."""
+
+ENV_DIMENSION_PATTERN = re.compile(r"num_envs|env_ids|\.shape\[0\]|\.size\(0\)")
+"""Pattern of the expressions that iterate over the environments."""
+
+NOQA_PATTERN = re.compile(r"#\s*noqa(?::\s*(?P<codes>[A-Z0-9, ]+))?", re.IGNORECASE)
+"""Pattern of the comments excluding a line from the check."""
+
+
+@dataclass(frozen=True)
+class Finding:
+    """A pattern found in the source of a term."""
+
+    path: str
+    """Path of the source file."""
+
+    line: int
+    """Line of the pattern."""
+
+    column: int
+    """Column of the pattern."""
+
+    code: str
+    """Code of the pattern."""
+
+    severity: str
+    """Severity of the finding, one of :data:`SEVERITIES`."""
+
+    message: str
+    """Description of the pattern."""
+
+    scope: str
+    """Qualified name of the function containing the pattern."""
+
+    def __str__(self) -> str:
+        return (
+            f"{self.path}:{self.line}:{self.column + 1}: {self.severity} [{self.code}] {self.message} (in {self.scope})"
+        )
+
+
+"""
+Analysis of the sources.
+"""
+
+
+class HazardVisitor(ast.NodeVisitor):
+    """Visitor reporting the hazardous patterns in the functions of a module."""
+
+    def __init__(self, path: str, source_lines: list[str]):
+        """Initializes the visitor.
+
+        Args:
+            path: The path of the source file, used in the findings.
+            source_lines: The lines of the source file, used to read the ``noqa`` comments.
+        """
+        self.path = path
+        self.source_lines = source_lines
+        self.hot = True
+        """Whether the visited definitions are called in the hot paths. Otherwise, the findings are infos."""
+        self.findings: list[Finding] = []
+        # stack of the names of the enclosing classes and functions
+        self._scopes: list[str] = []
+        # names assigned to boolean masks in the enclosing functions
+        self._masks: list[set[str]] = []
+
+    """
+    Visitors.
+    """
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self._scopes.append(node.name)
+        self.generic_visit(node)
+        self._scopes.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._scopes.append(node.name)
+        self._masks.append(set())
+        self.generic_visit(node)
+        self._masks.pop()
+        self._scopes.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Assign(self, node: ast.Assign):
+        if self._masks and _is_mask(node.value, self._masks[-1]):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self._masks[-1].add(target.id)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        if self._in_function():
+            self._check_call(node)
+        self.generic_visit(node)
+
+    def visit_If(self, node: ast.If):
+        if self._in_function():
+            self._check_condition(node.test)
+        self.generic_visit(node)
+
+    visit_While = visit_If
+
+    def visit_Subscript(self, node: ast.Subscript):
+        if self._in_function():
+            self._check_subscript(node)
+        self.generic_visit(node)
+
+    def visit_For(self, node: ast.For):
+        if self._in_function():
+            self._check_loop(node.iter, node)
+        self.generic_visit(node)
+
+    def visit_comprehension(self, node: ast.comprehension):
+        if self._in_function():
+            self._check_loop(node.iter, node.iter)
+        self.generic_visit(node)
+
+    """
+    Checks.
+    """
+
+    def _check_call(self, node: ast.Call):
+        name = _call_name(node)
+        method = node.func.attr if isinstance(node.func, ast.Attribute) else None
+        # transfers to the host
+        if method in HOST_TRANSFER_METHODS and not _is_module(node.func.value):
+            self._report(node, "HZ101", "error", f"'.{method}()' copies the tensor to the host and synchronizes")
+        elif method == "to" and any(_is_cpu(arg) for arg in node.args + [kw.value for kw in node.keywords]):
+            self._report(node, "HZ101", "error", "'.to(\"cpu\")' copies the tensor to the host and synchronizes")
+        # data-dependent shapes
+        if method in DATA_DEPENDENT_FUNCTIONS:
+            self._report(node, "HZ102", "error", f"'{method}' has a data-dependent shape and synchronizes")
+        elif method == "where" and len(node.args) == 1 and not node.keywords:
+            self._report(node, "HZ102", "error", "single-argument 'where' has a data-dependent shape and synchronizes")
+        # tensor creation
+        if name is not None and name.startswith("torch.") and name[len("torch.") :] in CREATION_FUNCTIONS:
+            function = name[len("torch.") :]
+            if not any(kw.arg in ("device", "out") for kw in node.keywords) and not _has_tensor_input(node):
+                self._report(node, "HZ401", "warning", f"'{name}' without 'device' allocates on the default device")
+            if function == "tensor" or (function in HOST_DATA_CREATION_FUNCTIONS and not _has_tensor_input(node)):
+                self._report(node, "HZ402", "warning", f"'{name}' copies host data to the device on every call")
+
+    def _check_condition(self, test: ast.expr):
+        for node in ast.walk(test):
+            if isinstance(node, ast.Call):
+                name = _call_name(node) or ""
+                method = node.func.attr if isinstance(node.func, ast.Attribute) else None
+                if method in ("any", "all") and not name.startswith("np."):
+                    self._report(
+                        node,
+                        "HZ103",
+                        "error",
+                        f"the condition reads the result of '{method}' on the host and synchronizes",
+                    )
+
+    def _check_subscript(self, node: ast.Subscript):
+        elements = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        masks = self._masks[-1] if self._masks else set()
+        for element in elements:
+            if _is_mask(element, masks):
+                self._report(
+                    node, "HZ201", "warning", "boolean mask indexing has a data-dependent shape and synchronizes"
+                )
+            elif _is_contiguous_index(element):
+                self._report(node, "HZ202", "info", "the indices are contiguous: a slice would return a view")
+
+    def _check_loop(self, iterator: ast.expr, node: ast.AST):
+        source = ast.unparse(iterator)
+        is_range = isinstance(iterator, ast.Call) and _call_name(iterator) == "range"
+        if (is_range and ENV_DIMENSION_PATTERN.search(source)) or (
+            isinstance(iterator, ast.Name) and iterator.id == "env_ids"
+        ):
+            self._report(node, "HZ301", "warning", f"Python loop over the environments ('{source}')")
+
+    """
+    Helper functions.
+    """
+
+    def _in_function(self) -> bool:
+        """Whether the visited node is in a function (the statements at module and class level are skipped)."""
+        return bool(self._masks)
+
+    def _report(self, node: ast.AST, code: str, severity: str, message: str):
+        """Record a finding, unless it is excluded by a ``noqa`` comment."""
+        line = node.lineno
+        match = NOQA_PATTERN.search(self.source_lines[line - 1]) if line <= len(self.source_lines) else None
+        if match is not None:
+            codes = match.group("codes")
+            if codes is None or code in [c.strip().upper() for c in codes.split(",")]:
+                return
+        # note: the constructors of the class terms are only called once
+        if not self.hot or "__init__" in self._scopes:
+            severity = "info"
+        scope = ".".join(self._scopes)
+        self.findings.append(Finding(self.path, line, node.col_offset, code, severity, message, scope))
+
+
+def _call_name(node: ast.Call) -> str | None:
+    """Dotted name of the called function, e.g. ``torch.zeros``, or None if it is not a dotted name."""
+    parts = []
+    func = node.func
+    while isinstance(func, ast.Attribute):
+        parts.append(func.attr)
+        func = func.value
+    if not isinstance(func, ast.Name):
+        return None
+    parts.append(func.id)
+    return ".".join(reversed(parts))
+
+
+def _is_module(node: ast.expr) -> bool:
+    """Whether the expression is one of the modules whose functions share the names of the transfer methods."""
+    return isinstance(node, ast.Name) and node.id in ("np", "numpy", "math")
+
+
+def _is_cpu(node: ast.expr) -> bool:
+    """Whether the expression is the CPU device."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value.startswith("cpu")
+    return isinstance(node, ast.Call) and _call_name(node) == "torch.device" and any(_is_cpu(arg) for arg in node.args)
+
+
+def _has_tensor_input(node: ast.Call) -> bool:
+    """Whether a creation function receives a tensor, whose device it then inherits (e.g. ``torch.as_tensor(x)``)."""
+    name = _call_name(node)
+    if name not in ("torch.tensor", "torch.as_tensor") or not node.args:
+        return False
+    # note: the literals are host data, other expressions may be tensors
+    return not isinstance(node.args[0], (ast.List, ast.Tuple, ast.Constant, ast.ListComp))
+
+
+def _is_mask(node: ast.expr, masks: set[str]) -> bool:
+    """Whether the expression is a boolean mask."""
+    if isinstance(node, ast.Compare):
+        return True
+    if isinstance(node, ast.Name):
+        return node.id in masks
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+        return _is_mask(node.operand, masks)
+    if isinstance(node, ast.Subscript):
+        return _is_mask(node.value, masks)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr, ast.BitXor)):
+        return _is_mask(node.left, masks) or _is_mask(node.right, masks)
+    if isinstance(node, ast.Call):
+        name = _call_name(node) or ""
+        method = node.func.attr if isinstance(node.func, ast.Attribute) else ""
+        return method == "bool" or name.startswith(("torch.logical_", "torch.isnan", "torch.isinf", "torch.isfinite"))
+    return False
+
+
+def _is_contiguous_index(node: ast.expr) -> bool:
+    """Whether the index is a list of consecutive integers or a range, which could be a slice."""
+    if isinstance(node, ast.List) and node.elts:
+        values = [element.value for element in node.elts if isinstance(element, ast.Constant)]
+        if len(values) != len(node.elts) or not all(isinstance(value, int) for value in values):
+            return False
+        return values == list(range(values[0], values[0] + len(values)))
+    if isinstance(node, ast.Call):
+        name = _call_name(node)
+        # note: the ranges with a step are not contiguous
+        return (
+            name in ("range", "torch.arange") and len(node.args) <= 2 and "step" not in [kw.arg for kw in node.keywords]
+        )
+    return False
+
+
+def analyze_source(path: str, source: str, names: dict[str, bool] | None = None) -> list[Finding]:
+    """Analyze the functions and classes of a module.
+
+    Args:
+        path: The path of the module, used in the findings.
+        source: The source of the module.
+        names: The names of the top-level functions and classes to analyze, mapped to whether they are called in
+            the hot paths. Defaults to None, in which case all the functions and classes of the module are analyzed
+            as hot paths.
+
+    Returns:
+        The findings, in the order of the source.
+    """
+    tree = ast.parse(source, filename=path)
+    visitor = HazardVisitor(path, source.splitlines())
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if names is None or node.name in names:
+                visitor.hot = names is None or names[node.name]
+                visitor.visit(node)
+    return visitor.findings
+
+
+"""
+Resolution of the terms referenced by the configurations.
+"""
+
+
+class ModuleResolver:
+    """Static resolver of the modules and of the names defined in them.
+
+    The modules are located in the search paths without being imported, and the names are resolved by following
+    the imports of the modules (including the star imports of the packages).
+    """
+
+    def __init__(self, search_paths: list[str]):
+        """Initializes the resolver.
+
+        Args:
+            search_paths: The directories in which the top-level packages are searched.
+        """
+        self.search_paths = [path for path in search_paths if os.path.isdir(path)]
+        self._trees: dict[str, ast.Module | None] = {}
+
+    def find_module(self, module: str) -> str | None:
+        """Return the path of the source of a module, or None if it is not found."""
+        parts = module.split(".")
+        for root in self.search_paths:
+            base = os.path.join(root, *parts)
+            for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+                if os.path.isfile(candidate):
+                    return candidate
+        return None
+
+    def resolve(self, dotted_name: str, depth: int = 0) -> tuple[str, str] | None:
+        """Resolve a dotted name to the module path and the name of its definition.
+
+        Args:
+            dotted_name: The dotted name, e.g. ``isaaclab.envs.mdp.joint_pos_rel``.
+            depth: The depth of the resolution, to stop on cyclic imports.
+
+        Returns:
+            The path of the module defining the name and the name of the definition, or None if the name is
+            not found.
+        """
+        if depth > 16 or "." not in dotted_name:
+            return None
+        module, name = dotted_name.rsplit(".", 1)
+        path = self.find_module(module)
+        if path is None:
+            return None
+        tree = self._parse(path)
+        if tree is None:
+            return None
+        is_package = path.endswith("__init__.py")
+        # definitions of the module
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name == name:
+                return path, name
+        # explicit imports, then star imports (the last one takes precedence)
+        star_modules = []
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom):
+                source_module = _absolute_module(module, node, is_package)
+                for alias in node.names:
+                    if alias.name == "*":
+                        star_modules.append(source_module)
+                    elif (alias.asname or alias.name) == name:
+                        return self.resolve(f"{source_module}.{alias.name}", depth + 1)
+        # note: submodules of a package are also attributes of the package
+        if is_package and self.find_module(dotted_name) is not None:
+            return None
+        for source_module in reversed(star_modules):
+            resolved = self.resolve(f"{source_module}.{name}", depth + 1)
+            if resolved is not None:
+                return resolved
+        return None
+
+    def _parse(self, path: str) -> ast.Module | None:
+        """Parse a module once."""
+        if path not in self._trees:
+            try:
+                self._trees[path] = ast.parse(Path(path).read_text(), filename=path)
+            except (OSError, SyntaxError, UnicodeDecodeError):
+                self._trees[path] = None
+        return self._trees[path]
+
+
+def _absolute_module(module: str, node: ast.ImportFrom, is_package: bool) -> str:
+    """Absolute name of the module imported by a ``from ... import`` statement of a module."""
+    if node.level == 0:
+        return node.module or ""
+    package = module if is_package else module.rsplit(".", 1)[0]
+    base = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+    return f"{base}.{node.module}" if node.module else base
+
+
+def referenced_terms(path: str, module: str) -> dict[str, bool]:
+    """Return the dotted names of the term functions referenced by a configuration module.
+
+    The terms are the values of the ``func`` keyword arguments that are dotted names of the imported modules,
+    e.g. ``RewTerm(func=mdp.joint_torques_l2)`` with ``import isaaclab.envs.mdp as mdp``.
+
+    Args:
+        path: The path of the configuration module.
+        module: The name of the configuration module, to resolve its relative imports.
+
+    Returns:
+        The dotted names of the referenced terms, mapped to whether they are called in the hot paths, i.e. whether
+        they are referenced by a term that is not an event in the ``startup`` or ``prestartup`` modes.
+    """
+    tree = ast.parse(Path(path).read_text(), filename=path)
+    is_package = path.endswith("__init__.py")
+    # aliases of the imported modules and names
+    aliases = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname is not None:
+                    aliases[alias.asname] = alias.name
+                else:
+                    top = alias.name.split(".")[0]
+                    aliases[top] = top
+        elif isinstance(node, ast.ImportFrom):
+            source_module = _absolute_module(module, node, is_package)
+            for alias in node.names:
+                if alias.name != "*":
+                    aliases[alias.asname or alias.name] = f"{source_module}.{alias.name}"
+    # values of the func arguments
+    terms = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        hot = not any(
+            keyword.arg == "mode"
+            and isinstance(keyword.value, ast.Constant)
+            and keyword.value.value in ("startup", "prestartup")
+            for keyword in node.keywords
+        )
+        for keyword in node.keywords:
+            if keyword.arg != "func":
+                continue
+            parts = []
+            value = keyword.value
+            while isinstance(value, ast.Attribute):
+                parts.append(value.attr)
+                value = value.value
+            if isinstance(value, ast.Name) and value.id in aliases:
+                term = ".".join([aliases[value.id]] + list(reversed(parts)))
+                terms[term] = terms.get(term, False) or hot
+    return terms
+
+
+"""
+Main.
+"""
+
+
+def _module_name(path: Path, source_root: Path) -> str:
+    """Name of the module of a source file under a root of the Python path."""
+    parts = list(path.relative_to(source_root).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def main():
+    """Check the MDP modules and the referenced terms."""
+    repo_root = Path(__file__).resolve().parent.parent
+    source_root = repo_root / "source" / "ext_template"
+    tasks_root = source_root / "ext_template" / "tasks"
+
+    parser = argparse.ArgumentParser(description="Check the MDP terms for host synchronizations and allocations.")
+    parser.add_argument("paths", nargs="*", help="Additional source files or directories to check.")
+    parser.add_argument(
+        "--search_path", action="append", default=[], help="Additional directory to search for the modules."
+    )
+    parser.add_argument(
+        "--no_config_terms", action="store_true", default=False, help="Skip the terms referenced by the configs."
+    )
+    parser.add_argument(
+        "--min_severity",
+        type=str,
+        default="info",
+        choices=SEVERITIES,
+        help="Minimum severity of the reported findings.",
+    )
+    parser.add_argument(
+        "--fail_on", type=str, default="error", choices=SEVERITIES, help="Minimum severity of the failing findings."
+    )
+    args_cli = parser.parse_args()
+
+    # sources of the MDP modules and of the additional paths: all their functions and classes
+    targets: dict[str, dict[str, bool] | None] = {}
+    files = [path for path in tasks_root.rglob("*.py") if "mdp" in path.relative_to(tasks_root).parts]
+    for extra in args_cli.paths:
+        extra = Path(extra)
+        files += sorted(extra.rglob("*.py")) if extra.is_dir() else [extra]
+    for path in files:
+        targets[str(path.resolve())] = None
+
+    # terms referenced by the configurations: only the referenced definitions
+    unresolved = []
+    if not args_cli.no_config_terms:
+        resolver = ModuleResolver(args_cli.search_path + [str(source_root)] + sys.path)
+        for path in sorted(tasks_root.rglob("*.py")):
+            if "mdp" in path.relative_to(tasks_root).parts:
+                continue
+            for term, hot in referenced_terms(str(path), _module_name(path, source_root)).items():
+                resolved = resolver.resolve(term)
+                if resolved is None:
+                    unresolved.append(term)
+                    continue
+                module_path, name = resolved
+                module_path = str(Path(module_path).resolve())
+                names = targets.setdefault(module_path, {})
+                if names is not None:
+                    names[name] = names.get(name, False) or hot
+
+    # analyze the sources
+    findings = []
+    for path, names in targets.items():
+        try:
+            source = Path(path).read_text()
+        except OSError as e:
+            print(f"[WARN] Skipping {path}: {e}")
+            continue
+        display_path = os.path.relpath(path) if path.startswith(str(repo_root)) else path
+        findings += analyze_source(display_path, source, names)
+
+    # report
+    min_level = SEVERITIES.index(args_cli.min_severity)
+    reported = [finding for finding in findings if SEVERITIES.index(finding.severity) >= min_level]
+    for finding in reported:
+        print(finding)
+    if unresolved:
+        unresolved = sorted(set(unresolved))
+        print(
+            f"[INFO] Could not locate the sources of {len(unresolved)} referenced terms (see --search_path),"
+            f" e.g. '{unresolved[0]}'."
+        )
+    counts = {severity: sum(finding.severity == severity for finding in findings) for severity in SEVERITIES}
+    print(
+        f"[INFO] Checked {len(targets)} modules: {counts['error']} errors, {counts['warning']} warnings,"
+        f" {counts['info']} infos."
+    )
+    fail_level = SEVERITIES.index(args_cli.fail_on)
+    sys.exit(int(any(SEVERITIES.index(finding.severity) >= fail_level for finding in findings)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Script to benchmark the training loop with RSL-RL on the surrogate environment, without the simulator.
+
+The script trains an agent like ``train.py`` on the surrogate of a task (see
+:class:`~ext_template.envs.SurrogateManagerBasedRLEnv`) for a few iterations and for each number of environments,
+and reports the throughput of the training loop. The surrogate dynamics are cheap, so the throughput measures the
+managers, the terms and the learning algorithm, which catches their scaling regressions on any device. The
+simulator is not launched: its modules are replaced by placeholders.
+
+.. code-block:: bash
+
+    python scripts/rsl_rl/benchmark_surrogate.py --num_envs 1024 4096 16384 65536 --max_iterations 5
+
+"""
+
+"""Replace the simulator modules first."""
+
+import argparse
+import sys
+
+# local imports
+import sim_placeholders  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the training loop with RSL-RL on the surrogate environment.")
+parser.add_argument(
+    "--task", type=str, default="Ext-Isaac-Velocity-Surrogate-Anymal-D-v0", help="Name of the surrogate task."
+)
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[1024, 4096, 16384, 65536], help="Numbers of environments."
+)
+parser.add_argument("--max_iterations", type=int, default=5, help="Number of timed training iterations.")
+parser.add_argument("--warmup_iterations", type=int, default=1, help="Number of training iterations to warm up.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the environment and the agent.")
+args_cli, hydra_args = parser.parse_known_args()
+
+# clear out sys.argv for Hydra
+sys.argv = [sys.argv[0]] + hydra_args
+
+sim_placeholders.install_simulator_placeholders()
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import time
+import torch
+
+from isaaclab.envs import ManagerBasedRLEnvCfg
+from isaaclab_rl.rsl_rl import RslRlVecEnvWrapper
+from isaaclab_tasks.utils.hydra import hydra_task_config
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.rsl_rl import ExtOnPolicyRunner, ExtRslRlOnPolicyRunnerCfg
+
+
+def _synchronize(device: str):
+    """Wait for the kernels of the device to complete."""
+    if "cuda" in device:
+        torch.cuda.synchronize(device)
+
+
+@hydra_task_config(args_cli.task, "rsl_rl_cfg_entry_point")
+def main(env_cfg: ManagerBasedRLEnvCfg, agent_cfg: ExtRslRlOnPolicyRunnerCfg):
+    """Benchmark the training loop for each number of environments."""
+    env_cfg.seed = agent_cfg.seed
+    env_cfg.sim.device = args_cli.device
+    agent_cfg.device = args_cli.device
+
+    results = []
+    for num_envs in args_cli.num_envs:
+        env_cfg.scene.num_envs = num_envs
+        start = time.perf_counter()
+        env = RslRlVecEnvWrapper(gym.make(args_cli.task, cfg=env_cfg.copy()))
+        # note: the runner does not log without a log directory, since logging is not part of the training loop
+        runner = ExtOnPolicyRunner(env, agent_cfg.to_dict(), log_dir=None, device=agent_cfg.device)
+        setup_time = time.perf_counter() - start
+        # warm up the allocators and the lazy buffers
+        runner.learn(num_learning_iterations=args_cli.warmup_iterations, init_at_random_ep_len=True)
+        _synchronize(args_cli.device)
+        start = time.perf_counter()
+        runner.learn(num_learning_iterations=args_cli.max_iterations)
+        _synchronize(args_cli.device)
+        duration = time.perf_counter() - start
+        num_steps = num_envs * agent_cfg.num_steps_per_env * args_cli.max_iterations
+        results.append((num_envs, setup_time, duration / args_cli.max_iterations, num_steps / duration))
+        env.close()
+
+    print(f"[INFO] Task: {args_cli.task} on '{args_cli.device}'")
+    print(f"{'Environments':>12} | {'Setup (s)':>9} | {'Iteration (s)':>13} | {'Steps/s':>10}")
+    for num_envs, setup_time, iteration_time, throughput in results:
+        print(f"{num_envs:>12} | {setup_time:>9.2f} | {iteration_time:>13.3f} | {throughput:>10.0f}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -24,6 +24,22 @@ def add_rsl_rl_args(parser: argparse.ArgumentParser):
     arg_group.add_argument("--resume", type=bool, default=None, help="Whether to resume from a checkpoint.")
     arg_group.add_argument("--load_run", type=str, default=None, help="Name of the run folder to resume from.")
     arg_group.add_argument("--checkpoint", type=str, default=None, help="Checkpoint file to resume from.")
+    # -- training arguments
+    arg_group.add_argument(
+        "--num_policies", type=int, default=None, help="Number of policies trained in parallel with consecutive seeds."
+    )
+    arg_group.add_argument(
+        "--hot_reload",
+        action="store_true",
+        default=None,
+        help="Apply the changes of the hot reload file of the run directory during training.",
+    )
+    arg_group.add_argument(
+        "--telemetry_interval",
+        type=float,
+        default=None,
+        help="Interval in seconds between the samples of the resource telemetry (0 to disable).",
+    )
     # -- logger arguments
     arg_group.add_argument(
         "--logger", type=str, default=None, choices={"wandb", "tensorboard", "neptune"}, help="Logger module to use."
@@ -72,6 +88,12 @@ def update_rsl_rl_cfg(agent_cfg: RslRlOnPolicyRunnerCfg, args_cli: argparse.Name
         agent_cfg.load_checkpoint = args_cli.checkpoint
     if args_cli.run_name is not None:
         agent_cfg.run_name = args_cli.run_name
+    if getattr(args_cli, "num_policies", None) is not None:
+        agent_cfg.num_policies = args_cli.num_policies
+    if getattr(args_cli, "hot_reload", None) is not None:
+        agent_cfg.hot_reload = args_cli.hot_reload
+    if getattr(args_cli, "telemetry_interval", None) is not None:
+        agent_cfg.telemetry_interval = args_cli.telemetry_interval
     if args_cli.logger is not None:
         agent_cfg.logger = args_cli.logger
     # set the project name for wandb and neptune
@@ -0,0 +1,280 @@
+"""Script to distill a trained RL agent from RSL-RL into a compact student policy.
+
+The teacher is loaded from a checkpoint and labels the observations visited in the environment with its mean
+actions. The teacher acts in the first round of data collection, the student in the following ones (dataset
+aggregation). Recorded shards of labelled observations can be used in addition to, or instead of, the rollouts.
+After the training, the student and the teacher are evaluated in interleaved environments of the same instance.
+The script reports the action error of the student, the inference speed-up over the teacher and the episode
+returns of both policies, and exports the student next to the report.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/rsl_rl/distill.py --task Ext-Isaac-Velocity-Rough-Anymal-D-v0 --headless \
+        --load_run 2025-01-01_12-00-00 --student_hidden_dims 128 64
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# local imports
+import cli_args  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Distill an RL agent trained with RSL-RL into a student policy.")
+parser.add_argument(
+    "--disable_fabric", action="store_true", default=False, help="Disable fabric and use USD I/O operations."
+)
+parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument("--seed", type=int, default=None, help="Seed used for the environment and the student.")
+parser.add_argument(
+    "--student_hidden_dims", type=int, nargs="+", default=None, help="Widths of the hidden layers of the student."
+)
+parser.add_argument("--num_rounds", type=int, default=None, help="Number of rounds of data collection and training.")
+parser.add_argument(
+    "--num_steps_per_round", type=int, default=None, help="Number of environment steps per round (0: shards only)."
+)
+parser.add_argument("--num_epochs", type=int, default=None, help="Number of passes over the dataset per round.")
+parser.add_argument("--shards", type=str, nargs="+", default=None, help="Recorded shards of labelled observations.")
+parser.add_argument(
+    "--save_dataset", action="store_true", default=False, help="Save the labelled observations as a shard."
+)
+parser.add_argument("--episodes_per_env", type=int, default=1, help="Number of evaluated episodes per environment.")
+# append RSL-RL cli arguments
+cli_args.add_rsl_rl_args(parser)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import json
+import os
+import torch
+
+from isaaclab.envs import DirectMARLEnv, multi_agent_to_single_agent
+from isaaclab.utils.io import dump_yaml
+from isaaclab_rl.rsl_rl import RslRlVecEnvWrapper, export_policy_as_jit, export_policy_as_onnx
+from isaaclab_tasks.utils import get_checkpoint_path, parse_env_cfg
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.rsl_rl import (
+    DistillationDataset,
+    EpisodeMetrics,
+    ExtOnPolicyRunner,
+    ExtRslRlDistillationCfg,
+    ExtRslRlOnPolicyRunnerCfg,
+    StudentPolicy,
+    action_error,
+    export_policy_manifest,
+    measure_inference_time,
+    train_student,
+)
+
+
+def update_distillation_cfg(cfg: ExtRslRlDistillationCfg) -> ExtRslRlDistillationCfg:
+    """Override the distillation configuration with the command line arguments."""
+    if args_cli.student_hidden_dims is not None:
+        cfg.student_hidden_dims = args_cli.student_hidden_dims
+    if args_cli.num_rounds is not None:
+        cfg.num_rounds = args_cli.num_rounds
+    if args_cli.num_steps_per_round is not None:
+        cfg.num_steps_per_round = args_cli.num_steps_per_round
+    if args_cli.num_epochs is not None:
+        cfg.num_epochs = args_cli.num_epochs
+    return cfg
+
+
+def collect(
+    env: RslRlVecEnvWrapper,
+    teacher: torch.nn.Module,
+    actor: torch.nn.Module,
+    dataset: DistillationDataset,
+    num_steps: int,
+):
+    """Roll out the acting policy and add the observations labelled by the teacher to the dataset."""
+    obs, _ = env.get_observations()
+    with torch.no_grad():
+        for _ in range(num_steps):
+            labels = teacher(obs)
+            dataset.add(obs, labels)
+            actions = labels if actor is teacher else actor(obs)
+            obs, _, _, _ = env.step(actions)
+
+
+def evaluate(env: RslRlVecEnvWrapper, policies: list[torch.nn.Module]) -> list[dict[str, float]]:
+    """Evaluate the policies in interleaved environments (environment ``i`` runs policy ``i % len(policies)``)."""
+    num_policies = len(policies)
+    group_ids = torch.arange(env.num_envs, device=env.device) % num_policies
+    metrics = EpisodeMetrics(group_ids, num_policies, ["return"], episodes_per_env=args_cli.episodes_per_env)
+    # start all the environments from a new episode
+    env.unwrapped.reset()
+    obs, _ = env.get_observations()
+    max_steps = args_cli.episodes_per_env * int(env.max_episode_length)
+    with torch.inference_mode():
+        actions = torch.zeros(env.num_envs, env.num_actions, device=env.device)
+        for step in range(max_steps):
+            for index, policy in enumerate(policies):
+                actions[index::num_policies] = policy(obs[index::num_policies])
+            obs, rewards, dones, _ = env.step(actions)
+            metrics.add({"return": rewards}, dones)
+            # stop early once every environment has completed its budget (one host sync per episode length)
+            if (step + 1) % int(env.max_episode_length) == 0 and metrics.is_complete().item():
+                break
+    return metrics.summary()
+
+
+def main():
+    """Distill an RSL-RL agent into a student policy."""
+    # parse configuration
+    env_cfg = parse_env_cfg(
+        args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs, use_fabric=not args_cli.disable_fabric
+    )
+    agent_cfg: ExtRslRlOnPolicyRunnerCfg = cli_args.parse_rsl_rl_cfg(args_cli.task, args_cli)
+    distillation_cfg = update_distillation_cfg(agent_cfg.distillation)
+    if args_cli.seed is not None:
+        env_cfg.seed = args_cli.seed
+    torch.manual_seed(agent_cfg.seed)
+
+    # specify directory for logging experiments
+    log_root_path = os.path.join("logs", "rsl_rl", agent_cfg.experiment_name)
+    log_root_path = os.path.abspath(log_root_path)
+    print(f"[INFO] Loading experiment from directory: {log_root_path}")
+    resume_path = get_checkpoint_path(log_root_path, agent_cfg.load_run, agent_cfg.load_checkpoint)
+    student_name = "student_" + "x".join(str(dim) for dim in distillation_cfg.student_hidden_dims)
+    log_dir = os.path.join(os.path.dirname(resume_path), "distillation", student_name)
+    os.makedirs(log_dir, exist_ok=True)
+    dump_yaml(os.path.join(log_dir, "distillation.yaml"), distillation_cfg)
+
+    # create isaac environment
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    # convert to single-agent instance if required by the RL algorithm
+    if isinstance(env.unwrapped, DirectMARLEnv):
+        env = multi_agent_to_single_agent(env)
+    # wrap around environment for rsl-rl
+    env = RslRlVecEnvWrapper(env)
+
+    # load the teacher
+    print(f"[INFO]: Loading teacher checkpoint from: {resume_path}")
+    runner = ExtOnPolicyRunner(env, agent_cfg.to_dict(), log_dir=None, device=agent_cfg.device)
+    runner.load(resume_path, load_optimizer=False)
+    runner.eval_mode()
+    normalizer = runner.obs_normalizer
+    teacher = torch.nn.Sequential(normalizer, runner.alg.policy.actor)
+
+    # create the student: it shares the (frozen) observation normalizer of the teacher
+    student = StudentPolicy(
+        env.num_obs, env.num_actions, distillation_cfg.student_hidden_dims, distillation_cfg.activation
+    ).to(env.device)
+    student_policy = torch.nn.Sequential(normalizer, student)
+
+    # create the dataset
+    if args_cli.shards is not None:
+        dataset = DistillationDataset.load(
+            args_cli.shards, device=env.device, capacity=max(distillation_cfg.dataset_capacity, 1)
+        )
+        print(f"[INFO] Loaded {len(dataset)} labelled observations from {len(args_cli.shards)} shards.")
+    else:
+        dataset = DistillationDataset(distillation_cfg.dataset_capacity, env.num_obs, env.num_actions, env.device)
+
+    # collect the labelled observations and train the student
+    history = []
+    generator = torch.Generator().manual_seed(agent_cfg.seed)
+    for round_index in range(distillation_cfg.num_rounds):
+        # the teacher acts in the first round, unless recorded shards are available
+        actor = teacher if round_index == 0 and args_cli.shards is None else student_policy
+        collect(env, teacher, actor, dataset, distillation_cfg.num_steps_per_round)
+        if len(dataset) == 0:
+            raise ValueError("The dataset is empty: collect steps or provide recorded shards.")
+        round_history = train_student(
+            student,
+            dataset,
+            num_epochs=distillation_cfg.num_epochs,
+            mini_batch_size=distillation_cfg.mini_batch_size,
+            learning_rate=distillation_cfg.learning_rate,
+            max_grad_norm=distillation_cfg.max_grad_norm,
+            validation_fraction=distillation_cfg.validation_fraction,
+            normalizer=normalizer,
+            generator=generator,
+        )
+        history.append({name: values[-1] for name, values in round_history.items()})
+        print(
+            f"[INFO] Round {round_index + 1}/{distillation_cfg.num_rounds}: {len(dataset)} samples, "
+            + ", ".join(f"{name}: {value:.5f}" for name, value in history[-1].items())
+        )
+    if args_cli.save_dataset:
+        dataset.save(os.path.join(log_dir, "dataset.pt"))
+
+    # action error on fresh observations visited by the student
+    evaluation_dataset = DistillationDataset(env.num_envs * 10, env.num_obs, env.num_actions, env.device)
+    collect(env, teacher, student_policy, evaluation_dataset, 10)
+    errors = action_error(student_policy, evaluation_dataset.observations, evaluation_dataset.actions)
+
+    # inference speed-up (median time of a forward pass)
+    timings = {}
+    for batch_size in sorted({1, env.num_envs}):
+        teacher_time = measure_inference_time(teacher, env.num_obs, batch_size, device=env.device)
+        student_time = measure_inference_time(student_policy, env.num_obs, batch_size, device=env.device)
+        timings[batch_size] = {
+            "teacher_ms": 1000.0 * teacher_time,
+            "student_ms": 1000.0 * student_time,
+            "speedup": teacher_time / student_time,
+        }
+
+    # evaluation return
+    teacher_summary, student_summary = evaluate(env, [teacher, student_policy])
+
+    # report
+    report = {
+        "task": args_cli.task,
+        "teacher": resume_path,
+        "student_hidden_dims": distillation_cfg.student_hidden_dims,
+        "teacher_parameters": sum(parameter.numel() for parameter in runner.alg.policy.actor.parameters()),
+        "student_parameters": sum(parameter.numel() for parameter in student.parameters()),
+        "rounds": history,
+        "action_error": errors,
+        "inference": {str(batch_size): timing for batch_size, timing in timings.items()},
+        "teacher_return": teacher_summary["return"],
+        "student_return": student_summary["return"],
+        "episodes": min(teacher_summary["episodes"], student_summary["episodes"]),
+    }
+    print(f"[INFO] Student action error: {', '.join(f'{name}: {value:.5f}' for name, value in errors.items())}")
+    for batch_size, timing in timings.items():
+        print(
+            f"[INFO] Inference with batch size {batch_size}: teacher {timing['teacher_ms']:.4f} ms, student"
+            f" {timing['student_ms']:.4f} ms, speed-up {timing['speedup']:.2f}x"
+        )
+    print(f"[INFO] Evaluation return: teacher {report['teacher_return']:.4f}, student {report['student_return']:.4f}")
+    with open(os.path.join(log_dir, "report.json"), "w") as f:
+        json.dump(report, f, indent=2)
+
+    # save and export the student
+    torch.save(
+        {"model_state_dict": student.state_dict(), "normalizer_state_dict": normalizer.state_dict()},
+        os.path.join(log_dir, "student.pt"),
+    )
+    export_model_dir = os.path.join(log_dir, "exported")
+    export_policy_as_jit(student, normalizer, path=export_model_dir, filename="policy.pt")
+    export_policy_as_onnx(student, normalizer=normalizer, path=export_model_dir, filename="policy.onnx")
+    export_policy_manifest(env.unwrapped, path=export_model_dir)
+    print(f"[INFO] Saved the student and the report to: {log_dir}")
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,138 @@
+"""Script to estimate the device memory and compute of training an RL agent with RSL-RL, without the simulator.
+
+The script resolves the environment and agent configurations of a task like ``train.py`` (including the overrides
+of the command line, with the syntax of Hydra: ``env.<path>=<value>`` and ``agent.<path>=<value>``) and estimates
+the memory of the training components and the floating-point operations of the actor-critic with
+:func:`~ext_template.rsl_rl.estimate_training_footprint`.
+
+The estimate is analytic, so that the script does not import Isaac Lab, PyTorch or the simulator, which takes
+several seconds: the modules of the configurations are read statically (see :mod:`static_modules`), and only the
+modules of the estimate are imported. The configurations are instantiated from the entry points of the registered
+task and the overrides are applied with OmegaConf.
+
+.. code-block:: bash
+
+    python scripts/rsl_rl/estimate_footprint.py --task Ext-Isaac-Velocity-Rough-Anymal-D-v0 --num_envs 16384 \
+        --device_memory 24 agent.num_steps_per_env=48
+
+"""
+
+"""Read the modules of the configurations statically first."""
+
+import argparse
+import time
+
+_start_time = time.perf_counter()
+
+# local imports
+import static_modules  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Estimate the memory and compute of training an RL agent with RSL-RL.")
+parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument("--device_memory", type=float, default=None, help="Memory of the device (in GiB) to check.")
+args_cli, overrides = parser.parse_known_args()
+
+# note: the modules of the estimate are imported, the other modules of the configurations are read
+static_modules.install_static_modules(
+    executed=(
+        "isaaclab.utils.string",
+        "ext_template.envs.articulation_spec",
+        "ext_template.envs.contact_bodies",
+        "ext_template.envs.finalize",
+        "ext_template.envs.noop_terms",
+        "ext_template.rsl_rl.footprint",
+    )
+)
+
+"""Rest everything follows."""
+
+import importlib
+
+from omegaconf import OmegaConf
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.rsl_rl.footprint import estimate_training_footprint
+
+
+def load_task_cfg(task_name: str, entry_point_key: str) -> object:
+    """Instantiate the configuration registered under an entry point of a task.
+
+    Args:
+        task_name: The name of the task.
+        entry_point_key: The key of the entry point in the keyword arguments of the gym specification of the task.
+
+    Returns:
+        The configuration object.
+
+    Raises:
+        ValueError: If the task is not registered or has no such entry point.
+    """
+    # note: the registrations of the tasks are recorded by the static modules
+    specs = {kwargs["id"]: kwargs for _, kwargs in static_modules.recorded_calls("gymnasium.register")}
+    if task_name not in specs:
+        raise ValueError(f"The task '{task_name}' is not registered.")
+    entry_point = specs[task_name].get("kwargs", {}).get(entry_point_key)
+    if entry_point is None:
+        raise ValueError(f"The task '{task_name}' has no entry point '{entry_point_key}'.")
+    # the entry points are either classes or their paths ("<module>:<class>")
+    if isinstance(entry_point, str):
+        module_name, class_name = entry_point.split(":")
+        entry_point = getattr(importlib.import_module(module_name), class_name)
+    return entry_point()
+
+
+def apply_overrides(env_cfg: object, agent_cfg: object, overrides: list[str]):
+    """Apply the overrides of the command line to the configurations.
+
+    Args:
+        env_cfg: The environment configuration.
+        agent_cfg: The agent configuration.
+        overrides: The overrides, in the form ``env.<path>=<value>`` or ``agent.<path>=<value>``.
+
+    Raises:
+        ValueError: If an override does not start with ``env.`` or ``agent.``.
+        KeyError: If an override sets a field that does not exist.
+    """
+    invalid = [override for override in overrides if not override.startswith(("env.", "agent."))]
+    if invalid:
+        raise ValueError(f"The overrides must start with 'env.' or 'agent.', got: {invalid}.")
+    # note: the values are parsed like Hydra parses them, and only the overridden fields are updated
+    values = OmegaConf.to_container(OmegaConf.from_dotlist(overrides))
+    env_cfg.from_dict(values.get("env", {}))
+    agent_cfg.from_dict(values.get("agent", {}))
+
+
+def main():
+    """Estimate the footprint of training an agent."""
+    env_cfg = load_task_cfg(args_cli.task, "env_cfg_entry_point")
+    agent_cfg = load_task_cfg(args_cli.task, "rsl_rl_cfg_entry_point")
+    apply_overrides(env_cfg, agent_cfg, overrides)
+    env_cfg.scene.num_envs = args_cli.num_envs if args_cli.num_envs is not None else env_cfg.scene.num_envs
+    footprint = estimate_training_footprint(env_cfg, agent_cfg)
+
+    print(f"[INFO] Task: {args_cli.task} with {footprint.num_envs} environments")
+    print(f"[INFO] Observations: {footprint.obs_dims}, actions: {footprint.action_dim}")
+    print(f"{'Component':<16} | {'Memory (MiB)':>12}")
+    for name, size in footprint.memory.items():
+        print(f"{name:<16} | {size / 1024**2:>12.1f}")
+    print(f"{'total':<16} | {footprint.total_memory / 1024**2:>12.1f}")
+    print(f"{'Compute':<24} | {'FLOPs':>10}")
+    for name, flops in footprint.flops.items():
+        print(f"{name:<24} | {flops:>10.3e}")
+    if args_cli.device_memory is not None:
+        # note: the simulation and the CUDA context are not included in the estimate
+        free_memory = args_cli.device_memory * 1024**3 - footprint.total_memory
+        status = "fit" if free_memory > 0 else "do not fit"
+        print(
+            f"[INFO] The estimated buffers {status} in {args_cli.device_memory:.1f} GiB:"
+            f" {free_memory / 1024**3:.2f} GiB left for the simulation."
+        )
+    print(f"[INFO] Estimated in {time.perf_counter() - _start_time:.2f} s.")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
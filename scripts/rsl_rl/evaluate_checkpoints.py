@@ -0,0 +1,191 @@
+"""Script to evaluate many checkpoints of an RL agent from RSL-RL in a single environment instance.
+
+The checkpoints of a run are assigned to interleaved groups of environments (environment ``i`` runs checkpoint
+``i % M``), so that every checkpoint sees the same distribution of terrains. The policies of all the checkpoints
+are evaluated in one batched forward pass per step. Every environment runs a fixed number of episodes, and the
+script reports per-checkpoint episode return, episode length, fall rate, velocity tracking error and terrain level.
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/rsl_rl/evaluate_checkpoints.py --task Ext-Isaac-Velocity-Rough-Anymal-D-Play-v0 \
+        --load_run 2025-01-01_12-00-00 --num_envs_per_checkpoint 64 --episodes_per_env 2
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# local imports
+import cli_args  # isort: skip
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Evaluate the checkpoints of an RL agent trained with RSL-RL.")
+parser.add_argument(
+    "--disable_fabric", action="store_true", default=False, help="Disable fabric and use USD I/O operations."
+)
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument("--seed", type=int, default=None, help="Seed used for the environment.")
+parser.add_argument(
+    "--checkpoints", type=str, default=r"model_\d+\.pt", help="Regex expression of the checkpoints to evaluate."
+)
+parser.add_argument("--stride", type=int, default=1, help="Evaluate every n-th matching checkpoint.")
+parser.add_argument("--num_envs_per_checkpoint", type=int, default=64, help="Number of environments per checkpoint.")
+parser.add_argument("--episodes_per_env", type=int, default=1, help="Number of evaluated episodes per environment.")
+parser.add_argument("--output", type=str, default=None, help="Path of the JSON report. Defaults to the run directory.")
+# append RSL-RL cli arguments
+cli_args.add_rsl_rl_args(parser)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+# evaluation is always headless
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import json
+import os
+import re
+import torch
+
+from isaaclab.envs import DirectMARLEnv, multi_agent_to_single_agent
+from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper
+from isaaclab_tasks.utils import get_checkpoint_path, parse_env_cfg
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.rsl_rl import EpisodeMetrics, ExtOnPolicyRunner, load_batched_policy
+
+
+def find_checkpoints(run_dir: str) -> list[str]:
+    """Find the checkpoints to evaluate in the run directory, sorted by iteration."""
+    names = [name for name in os.listdir(run_dir) if re.fullmatch(args_cli.checkpoints, name)]
+    names.sort(key=lambda name: [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)])
+    return [os.path.join(run_dir, name) for name in names[:: args_cli.stride]]
+
+
+def main():
+    """Evaluate the checkpoints of an RSL-RL agent."""
+    agent_cfg: RslRlOnPolicyRunnerCfg = cli_args.parse_rsl_rl_cfg(args_cli.task, args_cli)
+
+    # specify directory for logging experiments
+    log_root_path = os.path.join("logs", "rsl_rl", agent_cfg.experiment_name)
+    log_root_path = os.path.abspath(log_root_path)
+    print(f"[INFO] Loading experiment from directory: {log_root_path}")
+    run_dir = os.path.dirname(get_checkpoint_path(log_root_path, agent_cfg.load_run, agent_cfg.load_checkpoint))
+    checkpoints = find_checkpoints(run_dir)
+    if len(checkpoints) == 0:
+        raise ValueError(f"No checkpoints matching '{args_cli.checkpoints}' found in: {run_dir}")
+    num_checkpoints = len(checkpoints)
+    print(f"[INFO] Evaluating {num_checkpoints} checkpoints from: {run_dir}")
+
+    # parse configuration
+    env_cfg = parse_env_cfg(
+        args_cli.task,
+        device=args_cli.device,
+        num_envs=num_checkpoints * args_cli.num_envs_per_checkpoint,
+        use_fabric=not args_cli.disable_fabric,
+    )
+    if args_cli.seed is not None:
+        env_cfg.seed = args_cli.seed
+
+    # create isaac environment
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    # convert to single-agent instance if required by the RL algorithm
+    if isinstance(env.unwrapped, DirectMARLEnv):
+        env = multi_agent_to_single_agent(env)
+    # wrap around environment for rsl-rl
+    env = RslRlVecEnvWrapper(env)
+
+    # load the policies of all the checkpoints
+    runner = ExtOnPolicyRunner(env, agent_cfg.to_dict(), log_dir=None, device=agent_cfg.device)
+    policies = load_batched_policy(runner, checkpoints)
+
+    # resolve the metrics available in the environment
+    unwrapped = env.unwrapped
+    names = ["return", "fall"]
+    command_manager = getattr(unwrapped, "command_manager", None)
+    track_velocity = command_manager is not None and "base_velocity" in command_manager.active_terms
+    if track_velocity:
+        names += ["lin_vel_error", "ang_vel_error"]
+    terrain_levels = getattr(unwrapped.scene.terrain, "terrain_levels", None)
+    if terrain_levels is not None:
+        names.append("terrain_level")
+    # environment i runs the checkpoint i % num_checkpoints
+    group_ids = torch.arange(env.num_envs, device=env.device) % num_checkpoints
+    metrics = EpisodeMetrics(group_ids, num_checkpoints, names, episodes_per_env=args_cli.episodes_per_env)
+
+    # reset environment
+    obs, _ = env.get_observations()
+    # every environment completes its episode budget within this number of steps (episodes end on time-out)
+    max_steps = args_cli.episodes_per_env * int(env.max_episode_length)
+    with torch.inference_mode():
+        for step in range(max_steps):
+            # agent stepping
+            actions = policies.interleaved(obs)
+            # env stepping
+            obs, rewards, dones, extras = env.step(actions)
+            # compute the metrics of the step
+            dones = dones > 0
+            values = {"return": rewards, "fall": (dones & ~extras["time_outs"]).float()}
+            if track_velocity:
+                command = command_manager.get_command("base_velocity")
+                robot = unwrapped.scene["robot"]
+                values["lin_vel_error"] = torch.norm(command[:, :2] - robot.data.root_lin_vel_b[:, :2], dim=1)
+                values["ang_vel_error"] = torch.abs(command[:, 2] - robot.data.root_ang_vel_b[:, 2])
+            if terrain_levels is not None:
+                # the terrain level reached at the end of the episode
+                values["terrain_level"] = unwrapped.scene.terrain.terrain_levels * dones
+            metrics.add(values, dones)
+            # stop early once every environment has completed its budget (one host sync per episode length)
+            if (step + 1) % int(env.max_episode_length) == 0 and metrics.is_complete().item():
+                break
+
+    # build the report
+    report = []
+    for path, summary in zip(checkpoints, metrics.summary()):
+        entry = {
+            "checkpoint": os.path.basename(path),
+            "episodes": summary["episodes"],
+            "return": summary["return"],
+            "length": summary["length"],
+            "fall_rate": summary["fall"],
+        }
+        if track_velocity:
+            # tracking errors averaged over the steps
+            entry["lin_vel_error"] = summary["lin_vel_error"] / max(summary["length"], 1.0)
+            entry["ang_vel_error"] = summary["ang_vel_error"] / max(summary["length"], 1.0)
+        if terrain_levels is not None:
+            entry["terrain_level"] = summary["terrain_level"]
+        report.append(entry)
+
+    # print the report
+    keys = [key for key in report[0] if key != "checkpoint"]
+    print(f"{'checkpoint':>20} | " + " | ".join(f"{key:>13}" for key in keys))
+    for entry in report:
+        print(f"{entry['checkpoint']:>20} | " + " | ".join(f"{entry[key]:>13.4f}" for key in keys))
+    best = max(report, key=lambda entry: entry["return"])
+    print(f"[INFO] Best checkpoint by episode return: {best['checkpoint']}")
+
+    # save the report
+    output = args_cli.output if args_cli.output is not None else os.path.join(run_dir, "evaluation.json")
+    with open(output, "w") as f:
+        json.dump({"task": args_cli.task, "run_dir": run_dir, "checkpoints": report}, f, indent=2)
+    print(f"[INFO] Saved the evaluation report to: {output}")
+
+    # close the simulator
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -18,11 +18,26 @@ parser.add_argument(
 )
 parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
 parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument(
+    "--eval", action="store_true", default=False, help="Run a headless fixed-budget evaluation and exit."
+)
+parser.add_argument("--eval_episodes", type=int, default=None, help="Number of evaluated episodes (evaluation mode).")
+parser.add_argument("--eval_steps", type=int, default=None, help="Number of evaluated steps (evaluation mode).")
+parser.add_argument(
+    "--eval_report_interval", type=int, default=None, help="Steps between progress reports. Defaults to an episode."
+)
+parser.add_argument("--eval_output", type=str, default=None, help="Path of the JSON report (evaluation mode).")
 # append RSL-RL cli arguments
 cli_args.add_rsl_rl_args(parser)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 args_cli = parser.parse_args()
+# evaluation runs without rendering
+if args_cli.eval:
+    if args_cli.eval_episodes is None and args_cli.eval_steps is None:
+        parser.error("The evaluation mode requires --eval_episodes or --eval_steps.")
+    args_cli.headless = True
+    args_cli.video = False
 # always enable cameras to record video
 if args_cli.video:
     args_cli.enable_cameras = True
@@ -34,6 +49,8 @@ simulation_app = app_launcher.app
 """Rest everything follows."""
 
 import gymnasium as gym
+import json
+import math
 import os
 import torch
 
@@ -46,6 +63,86 @@ from isaaclab_tasks.utils import get_checkpoint_path, parse_env_cfg
 
 # Import extensions to set up environment tasks
 import ext_template.tasks  # noqa: F401
+from ext_template.rsl_rl import EpisodeMetrics, export_policy_manifest
+
+
+def evaluate(env: RslRlVecEnvWrapper, policy, resume_path: str):
+    """Evaluate the policy for a fixed budget of episodes or steps and save a JSON report.
+
+    The metrics are reduced on the device. The device is synchronized with the host once per reporting window.
+    """
+    unwrapped = env.unwrapped
+    # resolve the metrics: returns, per-term rewards and termination causes
+    reward_manager = getattr(unwrapped, "reward_manager", None)
+    termination_manager = getattr(unwrapped, "termination_manager", None)
+    reward_terms = reward_manager.active_terms if reward_manager is not None else []
+    termination_terms = termination_manager.active_terms if termination_manager is not None else []
+    names = ["return"] + [f"reward/{term}" for term in reward_terms]
+    names += [f"termination/{term}" for term in termination_terms]
+    # every environment counts the same number of episodes, so that short episodes are not favoured
+    episodes_per_env = None
+    if args_cli.eval_episodes is not None:
+        episodes_per_env = math.ceil(args_cli.eval_episodes / env.num_envs)
+    group_ids = torch.zeros(env.num_envs, dtype=torch.long, device=env.device)
+    metrics = EpisodeMetrics(group_ids, 1, names, episodes_per_env=episodes_per_env)
+
+    # resolve the budget
+    max_steps = args_cli.eval_steps
+    if max_steps is None:
+        # every environment completes its episode budget within this number of steps (episodes end on time-out)
+        max_steps = episodes_per_env * int(env.max_episode_length)
+    report_interval = args_cli.eval_report_interval or int(env.max_episode_length)
+
+    # reset environment
+    obs, _ = env.get_observations()
+    step = 0
+    with torch.inference_mode():
+        while step < max_steps:
+            # agent stepping
+            actions = policy(obs)
+            # env stepping
+            obs, rewards, dones, _ = env.step(actions)
+            step += 1
+            # accumulate the metrics of the step
+            dones = dones > 0
+            values = {"return": rewards}
+            for index, term in enumerate(reward_terms):
+                # note: the reward manager stores the weighted reward rates of the last step
+                values[f"reward/{term}"] = reward_manager._step_reward[:, index] * unwrapped.step_dt
+            for term in termination_terms:
+                values[f"termination/{term}"] = (termination_manager.get_term(term) & dones).float()
+            metrics.add(values, dones)
+            # report the progress (single host sync per window)
+            if step % report_interval == 0 or step == max_steps:
+                summary = metrics.summary()[0]
+                print(
+                    f"[INFO] Evaluation step {step}/{max_steps}: {summary['episodes']} episodes,"
+                    f" mean return: {summary['return']:.4f}, mean length: {summary['length']:.1f}"
+                )
+                if episodes_per_env is not None and metrics.is_complete().item():
+                    break
+
+    # build the report
+    summary = metrics.summary()[0]
+    report = {
+        "task": args_cli.task,
+        "checkpoint": resume_path,
+        "num_envs": env.num_envs,
+        "steps": step,
+        "episodes": summary["episodes"],
+        "return": summary["return"],
+        "length": summary["length"],
+        "reward_terms": {term: summary[f"reward/{term}"] for term in reward_terms},
+        "terminations": {term: summary[f"termination/{term}"] for term in termination_terms},
+    }
+    # save the report
+    output = args_cli.eval_output
+    if output is None:
+        output = os.path.join(os.path.dirname(resume_path), "evaluation", f"{os.path.basename(resume_path)}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[INFO] Saved the evaluation report to: {output}")
 
 
 def main():
@@ -92,14 +189,29 @@ def main():
     # obtain the trained policy for inference
     policy = ppo_runner.get_inference_policy(device=env.unwrapped.device)
 
+    # extract the neural network module
+    # we do this in a try-except to maintain backwards compatibility.
+    try:
+        # version 2.3 onwards
+        policy_nn = ppo_runner.alg.policy
+    except AttributeError:
+        # version 2.2 and below
+        policy_nn = ppo_runner.alg.actor_critic
+
+    # evaluate the policy and exit
+    if args_cli.eval:
+        evaluate(env, policy, resume_path)
+        env.close()
+        return
+
     # export policy to onnx/jit
     export_model_dir = os.path.join(os.path.dirname(resume_path), "exported")
-    export_policy_as_jit(
-        ppo_runner.alg.actor_critic, ppo_runner.obs_normalizer, path=export_model_dir, filename="policy.pt"
-    )
+    export_policy_as_jit(policy_nn, ppo_runner.obs_normalizer, path=export_model_dir, filename="policy.pt")
     export_policy_as_onnx(
-        ppo_runner.alg.actor_critic, normalizer=ppo_runner.obs_normalizer, path=export_model_dir, filename="policy.onnx"
+        policy_nn, normalizer=ppo_runner.obs_normalizer, path=export_model_dir, filename="policy.onnx"
     )
+    # export the observation and action layout for the deployment runtime
+    export_policy_manifest(env.unwrapped, path=export_model_dir)
 
     # reset environment
     obs, _ = env.get_observations()
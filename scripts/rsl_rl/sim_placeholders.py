@@ -0,0 +1,78 @@
+"""Placeholders of the simulator modules, to import the modules of Isaac Lab without launching the simulator.
+
+The placeholders are sufficient to import the configurations of the tasks and to run the surrogate environment
+(see :class:`~ext_template.envs.SurrogateManagerBasedRLEnv`), which never calls into the simulator.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import sys
+import types
+
+SIMULATOR_MODULES = ("omni", "carb", "pxr", "isaacsim", "Semantics")
+"""Top-level modules that are only available once the simulator is launched."""
+
+
+class _Placeholder(type):
+    """Placeholder of the objects of the simulator modules.
+
+    Placeholders are classes, so that they can be subclassed, called, used as decorators and have attributes,
+    which are all placeholders as well.
+    """
+
+    def __getattr__(cls, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Placeholder(name, (), {})
+
+    def __call__(cls, *args, **kwargs):
+        # note: a decorator returns the decorated function
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return args[0]
+        return _Placeholder(cls.__name__, (), {})
+
+
+class _PlaceholderModule(types.ModuleType):
+    """Module whose attributes are placeholders."""
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _Placeholder(name, (), {})
+        setattr(self, name, value)
+        return value
+
+
+class _PlaceholderFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Import the simulator modules (and their submodules) as placeholder modules."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".")[0] in SIMULATOR_MODULES:
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = _PlaceholderModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def install_simulator_placeholders():
+    """Replace the simulator modules by placeholders.
+
+    This must be called before any module of Isaac Lab is imported.
+
+    Raises:
+        RuntimeError: If a simulator module is already imported.
+    """
+    if any(isinstance(finder, _PlaceholderFinder) for finder in sys.meta_path):
+        return
+    imported = [name for name in sys.modules if name.split(".")[0] in SIMULATOR_MODULES]
+    if imported:
+        raise RuntimeError(f"The simulator modules are already imported: {imported[:5]}.")
+    sys.meta_path.insert(0, _PlaceholderFinder())
@@ -0,0 +1,1094 @@
+"""Static reading of the configuration modules, to resolve the configurations of the tasks without importing them.
+
+Importing the configurations of the tasks imports Isaac Lab, and with it PyTorch and Warp, which takes several
+seconds. The tools that only read the configurations import the modules of the configurations as static modules
+instead: the sources of the modules are parsed and their statements are interpreted, with the following changes:
+
+* The classes are replaced by dataclasses with the same fields, defaults and ``__post_init__`` methods, and with
+  the methods ``replace``, ``copy`` and ``from_dict`` of the classes decorated with
+  :func:`isaaclab.utils.configclass`. Their other methods are interpreted when they are called.
+* The modules of the standard library are imported. The other modules (PyTorch, Warp, the simulator, Gymnasium...)
+  are replaced by opaque values, which absorb the accesses to their attributes, the calls and the operations. The
+  calls of the opaque values are recorded, for instance the registrations of the tasks with ``gymnasium.register``.
+* The statements of the modules that depend on the truth value or the items of an opaque value are skipped: the
+  names they define are opaque. So are the values returned by the calls of the modules and of the class bodies
+  that depend on them. The functions called from the imported modules, for instance the ``__post_init__`` methods
+  of the configurations, raise a :class:`StaticReadError` instead.
+
+The modules listed as executed are imported normally, from their files. They can use the static modules, for
+instance to check the classes of the configurations or to compare the functions of their terms.
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import copy
+import dataclasses
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import operator
+import re
+import sys
+import types
+from collections.abc import Iterable, Mapping
+
+STATIC_PACKAGES = ("isaaclab", "isaaclab_assets", "isaaclab_rl", "isaaclab_tasks", "ext_template")
+"""Top-level packages whose modules are read statically."""
+
+
+class StaticReadError(Exception):
+    """Raised when a statement cannot be interpreted without the modules that are not read."""
+
+
+def install_static_modules(packages: Iterable[str] = STATIC_PACKAGES, executed: Iterable[str] = ()):
+    """Read the modules of the packages statically.
+
+    This must be called before any module of the packages is imported.
+
+    Args:
+        packages: The top-level packages whose modules are read statically. Defaults to :data:`STATIC_PACKAGES`.
+        executed: The modules of the packages that are imported normally. Defaults to none.
+
+    Raises:
+        RuntimeError: If a module of the packages is already imported.
+    """
+    if any(isinstance(finder, _StaticFinder) for finder in sys.meta_path):
+        return
+    packages = tuple(packages)
+    imported = [name for name in sys.modules if name.split(".")[0] in packages]
+    if imported:
+        raise RuntimeError(f"The modules are already imported: {imported[:5]}.")
+    sys.meta_path.insert(0, _StaticFinder(packages, tuple(executed)))
+
+
+def recorded_calls(path: str) -> list[tuple[tuple, dict]]:
+    """Calls of an opaque value.
+
+    Args:
+        path: The path of the opaque value, for instance ``gymnasium.register``.
+
+    Returns:
+        The positional and keyword arguments of the calls, in the order of the calls.
+    """
+    return _RECORDED_CALLS.get(path, [])
+
+
+"""
+Values.
+"""
+
+_RECORDED_CALLS: dict[str, list[tuple[tuple, dict]]] = {}
+"""Arguments of the calls of the opaque values, keyed by their path."""
+
+
+class _Opaque:
+    """Value of a module that is not read, or computed from such a value."""
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: str):
+        object.__setattr__(self, "_path", path)
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Opaque(f"{self._path}.{name}")
+
+    def __setattr__(self, name: str, value):
+        pass
+
+    def __call__(self, *args, **kwargs):
+        _RECORDED_CALLS.setdefault(self._path, []).append((args, kwargs))
+        return _Opaque(f"{self._path}()")
+
+    def __getitem__(self, key):
+        return _Opaque(f"{self._path}[]")
+
+    def __setitem__(self, key, value):
+        pass
+
+    def __bool__(self):
+        raise StaticReadError(f"The truth value of '{self._path}' is unknown.")
+
+    def __iter__(self):
+        raise StaticReadError(f"The items of '{self._path}' are unknown.")
+
+    def __len__(self):
+        raise StaticReadError(f"The length of '{self._path}' is unknown.")
+
+    def __format__(self, format_spec: str) -> str:
+        # note: the opaque values are formatted as placeholders, for instance in the paths of the assets
+        return "{" + self._path + "}"
+
+    def __str__(self) -> str:
+        return "{" + self._path + "}"
+
+    def __repr__(self) -> str:
+        return f"<opaque {self._path}>"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __mro_entries__(self, bases):
+        return ()
+
+    def _absorb(self, *args):
+        return _Opaque(self._path)
+
+
+for _name in ("add", "sub", "mul", "matmul", "truediv", "floordiv", "mod", "pow", "and", "or", "xor", "lshift"):
+    setattr(_Opaque, f"__{_name}__", _Opaque._absorb)
+    setattr(_Opaque, f"__r{_name}__", _Opaque._absorb)
+for _name in ("rshift", "neg", "pos", "invert", "abs", "lt", "le", "gt", "ge"):
+    setattr(_Opaque, f"__{_name}__", _Opaque._absorb)
+
+
+class _StaticFunction:
+    """Function of a static module, interpreted when it is called."""
+
+    def __init__(self, node: ast.FunctionDef | ast.Lambda, qualname: str, closure: _Frame, defaults, kw_defaults):
+        self.__name__ = getattr(node, "name", "<lambda>")
+        self.__qualname__ = qualname
+        self.__module__ = closure.module.__name__
+        self.node = node
+        self.closure = closure
+        self.defaults = defaults
+        self.kw_defaults = kw_defaults
+        self.owner: type | None = None
+        """Class defining the function, for the calls of :func:`super` without arguments."""
+
+    @property
+    def is_method(self) -> bool:
+        """Whether the first parameter of the function is ``self`` or ``cls``."""
+        params = self.node.args.posonlyargs + self.node.args.args
+        return bool(params) and params[0].arg in ("self", "cls")
+
+    def __call__(self, *args, **kwargs):
+        frame = _Frame(self.closure.module, self._bind(args, kwargs), self.closure, f"{self.__qualname__}.<locals>.")
+        frame.function = self
+        if isinstance(self.node, ast.Lambda):
+            return _eval(frame, self.node.body)
+        try:
+            _exec_body(frame, _function_node(self.closure.module, self.node).body)
+        except _Return as ret:
+            return ret.value
+        return None
+
+    def __get__(self, instance, owner=None):
+        return self if instance is None else types.MethodType(self, instance)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self) -> str:
+        return f"<static function {self.__module__}.{self.__qualname__}>"
+
+    def _bind(self, args: tuple, kwargs: dict) -> dict:
+        """Bind the arguments of a call to the parameters of the function."""
+        arguments = self.node.args
+        params = [param.arg for param in arguments.posonlyargs + arguments.args]
+        scope = dict(zip(params, args))
+        if arguments.vararg is not None:
+            scope[arguments.vararg.arg] = tuple(args[len(params) :])
+        elif len(args) > len(params):
+            raise TypeError(
+                f"{self.__qualname__}() takes {len(params)} positional arguments but {len(args)} were given"
+            )
+        kwonly = [param.arg for param in arguments.kwonlyargs]
+        extra = dict()
+        for name, value in kwargs.items():
+            if name in scope:
+                raise TypeError(f"{self.__qualname__}() got multiple values for argument '{name}'")
+            if name in params or name in kwonly:
+                scope[name] = value
+            elif arguments.kwarg is not None:
+                extra[name] = value
+            else:
+                raise TypeError(f"{self.__qualname__}() got an unexpected keyword argument '{name}'")
+        defaults = dict(zip(params[len(params) - len(self.defaults) :], self.defaults))
+        defaults.update(
+            (name, default) for name, default in zip(kwonly, self.kw_defaults) if default is not _NO_DEFAULT
+        )
+        for name in params + kwonly:
+            if name not in scope:
+                if name not in defaults:
+                    raise TypeError(f"{self.__qualname__}() missing required argument: '{name}'")
+                scope[name] = defaults[name]
+        if arguments.kwarg is not None:
+            scope[arguments.kwarg.arg] = extra
+        return scope
+
+
+_NO_DEFAULT = object()
+"""Default of the keyword-only parameters without default."""
+
+
+@dataclasses.dataclass(init=False, repr=False, eq=False)
+class _Record:
+    """Base of the classes of the static modules.
+
+    The classes are dataclasses (with the fields of the classes decorated with :func:`isaaclab.utils.configclass`):
+    their defaults are deep-copied into the instances, after which the ``__post_init__`` method is interpreted.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = _record_fields(type(self))
+        if len(args) > len(fields):
+            raise TypeError(
+                f"{type(self).__name__}() takes {len(fields)} positional arguments but {len(args)} were given"
+            )
+        values = dict(zip(fields, args))
+        for name, value in kwargs.items():
+            if name not in fields:
+                raise TypeError(f"{type(self).__name__}() got an unexpected keyword argument '{name}'")
+            if name in values:
+                raise TypeError(f"{type(self).__name__}() got multiple values for argument '{name}'")
+            values[name] = value
+        for name, default in fields.items():
+            if name in values:
+                self.__dict__[name] = values[name]
+            elif isinstance(default, dataclasses.Field):
+                has_factory = default.default_factory is not dataclasses.MISSING
+                self.__dict__[name] = default.default_factory() if has_factory else copy.deepcopy(default.default)
+            else:
+                self.__dict__[name] = copy.deepcopy(default)
+        self.__post_init__()
+        # note: like the configuration classes, the members are deep-copied after the initialization
+        for name, value in self.__dict__.items():
+            if not callable(value):
+                self.__dict__[name] = copy.deepcopy(value)
+
+    def __post_init__(self):
+        # note: the configuration classes all have this method, which deep-copies the defaults like the records do
+        pass
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in self.__dict__.items())
+        return f"{type(self).__name__}({values})"
+
+    def replace(self, **kwargs):
+        """Return a new instance with the fields replaced, like :func:`dataclasses.replace`."""
+        return type(self)(**{**{name: self.__dict__[name] for name in _record_fields(type(self))}, **kwargs})
+
+    def copy(self):
+        """Return a deep copy of the instance."""
+        return copy.deepcopy(self)
+
+    def from_dict(self, data: dict):
+        """Update the fields from a dictionary, like :func:`isaaclab.utils.dict.update_class_from_dict`."""
+        _update_from_dict(self, data)
+
+
+def _record_fields(cls: type) -> dict:
+    """Defaults of the fields of a record class, with the fields of its bases first."""
+    fields = cls.__dict__.get("__static_fields__")
+    if fields is None:
+        fields = dict()
+        for base in reversed(cls.__mro__):
+            fields.update(base.__dict__.get("__static_own_fields__", {}))
+        cls.__static_fields__ = fields
+    return fields
+
+
+def _make_record_class(name: str, qualname: str, bases: tuple, frame: _Frame) -> type:
+    """Create a record class from the namespace and the members of its body."""
+    # note: the special methods are not interpreted, except for the initialization of the fields
+    namespace = {
+        name: value
+        for name, value in frame.locals.items()
+        if not (name.startswith("__") and name.endswith("__")) or name == "__post_init__"
+    }
+    inherited = set().union(*(_record_fields(base) for base in bases))
+    own_fields = dict()
+    for member in dict.fromkeys(frame.members):
+        if member.startswith("__") and member.endswith("__"):
+            continue
+        value = namespace.get(member, dataclasses.MISSING)
+        # note: the members that are not annotated are skipped like by the configuration classes
+        if member not in frame.annotations and member not in inherited:
+            if isinstance(value, (type, property, staticmethod, classmethod)):
+                continue
+            if isinstance(value, _StaticFunction) and value.is_method:
+                continue
+        own_fields[member] = value
+    cls = type(name, bases, {**namespace, "__module__": frame.module.__name__, "__qualname__": qualname})
+    cls.__static_own_fields__ = own_fields
+    for field_name, value in own_fields.items():
+        setattr(cls, field_name, value)
+    for value in namespace.values():
+        function = value.__func__ if isinstance(value, (staticmethod, classmethod)) else value
+        function = function.fget if isinstance(function, property) else function
+        if isinstance(function, _StaticFunction):
+            function.owner = cls
+    return cls
+
+
+def _update_from_dict(obj, data: Mapping, namespace: str = ""):
+    """Update an object recursively from a dictionary, like :func:`isaaclab.utils.dict.update_class_from_dict`."""
+    for key, value in data.items():
+        key_namespace = f"{namespace}/{key}"
+        if not (hasattr(obj, key) or (isinstance(obj, dict) and key in obj)):
+            raise KeyError(f"[Config]: Key not found under namespace: {key_namespace}.")
+        member = obj[key] if isinstance(obj, dict) else getattr(obj, key)
+        if isinstance(value, Mapping):
+            _update_from_dict(member, value, key_namespace)
+            continue
+        if isinstance(value, Iterable) and not isinstance(value, str):
+            # note: the lists of mappings update the items of the lists, the other iterables replace them
+            if any(isinstance(item, Mapping) for item in value):
+                if member is None or len(member) != len(value):
+                    raise ValueError(f"[Config]: Cannot merge the list under namespace: {key_namespace}.")
+                if not isinstance(member, tuple):
+                    for item, item_value in zip(member, value):
+                        if isinstance(item_value, Mapping):
+                            _update_from_dict(item, item_value, key_namespace)
+                    continue
+            value = tuple(value) if isinstance(member, tuple) else value
+        elif callable(member) and isinstance(value, str):
+            module_name, attr_name = value.split(":")
+            value = getattr(importlib.import_module(module_name), attr_name)
+        elif not (value is None or isinstance(value, type(member))):
+            raise ValueError(
+                f"[Config]: Incorrect type under namespace: {key_namespace}."
+                f" Expected: {type(member)}, Received: {type(value)}."
+            )
+        if isinstance(obj, dict):
+            obj[key] = value
+        else:
+            setattr(obj, key, value)
+
+
+"""
+Modules.
+"""
+
+
+class _StaticModule(types.ModuleType):
+    """Module whose statements are interpreted.
+
+    The names imported from the static modules are only resolved when they are used, since most of the names
+    imported by the modules of Isaac Lab are not used by the configurations.
+    """
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        namespace = self.__dict__
+        imports = namespace.get("__static_imports__", {})
+        if name in imports:
+            # note: a package importing its own submodules resolves them as submodules
+            resolve, args = imports.pop(name)
+            value = resolve(*args)
+        else:
+            for source_name in reversed(namespace.get("__static_stars__", [])):
+                source = importlib.import_module(source_name)
+                if _exports(source, name):
+                    value = getattr(source, name)
+                    break
+            else:
+                # note: the submodules of the packages are attributes once imported
+                if "__path__" not in namespace or importlib.util.find_spec(f"{self.__name__}.{name}") is None:
+                    raise AttributeError(f"module '{self.__name__}' has no attribute '{name}'")
+                value = importlib.import_module(f"{self.__name__}.{name}")
+        namespace[name] = value
+        return value
+
+
+def _exports(module: types.ModuleType, name: str) -> bool:
+    """Whether a name is imported by the star imports of a module."""
+    if not isinstance(module, _StaticModule):
+        exported = getattr(module, "__all__", None)
+        return name in exported if exported is not None else not name.startswith("_") and hasattr(module, name)
+    namespace = module.__dict__
+    if "__all__" in namespace:
+        return name in namespace["__all__"]
+    if name.startswith("_"):
+        return False
+    if name in namespace or name in namespace.get("__static_imports__", {}):
+        return True
+    return any(_exports(importlib.import_module(source), name) for source in namespace.get("__static_stars__", []))
+
+
+def _import(name: str):
+    """Import a module: statically, for real from the standard library, or as an opaque value otherwise."""
+    top_name = name.partition(".")[0]
+    if top_name in sys.stdlib_module_names or top_name in _FINDER.packages:
+        return importlib.import_module(name)
+    return _Opaque(name)
+
+
+def _import_module(module_name: str, bind_top: bool = False):
+    """Imported module, or its top-level package if it is bound like by ``import a.b``."""
+    module = _import(module_name)
+    if not bind_top:
+        return module
+    top_name = module_name.partition(".")[0]
+    return _Opaque(top_name) if isinstance(module, _Opaque) else sys.modules[top_name]
+
+
+def _import_from(module_name: str, name: str):
+    """Value of a name imported from a module."""
+    module = _import(module_name)
+    if isinstance(module, _Opaque):
+        return getattr(module, name)
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        return importlib.import_module(f"{module_name}.{name}")
+
+
+class _StaticFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Import the modules of the packages (except the executed ones) as static modules."""
+
+    def __init__(self, packages: tuple[str, ...], executed: tuple[str, ...]):
+        global _FINDER
+        self.packages = packages
+        self.executed = executed
+        _FINDER = self
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".")[0] not in self.packages or fullname in self.executed:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is None or spec.origin is None or not spec.origin.endswith(".py"):
+            return spec
+        return importlib.util.spec_from_file_location(
+            fullname, spec.origin, loader=self, submodule_search_locations=spec.submodule_search_locations
+        )
+
+    def create_module(self, spec):
+        return _StaticModule(spec.name)
+
+    def exec_module(self, module):
+        with open(module.__file__, encoding="utf-8") as file:
+            source = file.read()
+        # note: most functions are not called, their bodies are parsed when they are
+        try:
+            tree = ast.parse(_strip_function_bodies(source), module.__file__)
+            module.__static_source__ = source
+        except SyntaxError:
+            tree = ast.parse(source, module.__file__)
+        module.__static_imports__ = dict()
+        module.__static_stars__ = list()
+        frame = _Frame(module, module.__dict__, None, "")
+        for node in tree.body:
+            try:
+                _exec(frame, node)
+            except StaticReadError:
+                # note: the names defined by the statement are opaque
+                for name in _defined_names(node):
+                    module.__dict__[name] = _Opaque(f"{module.__name__}.{name}")
+
+
+_FINDER: _StaticFinder | None = None
+"""The installed finder."""
+
+_DEF_LINE = re.compile(r"^([ \t]*)(?:async[ \t]+)?def[ \t]")
+"""Regular expression of the first line of the definitions of the functions."""
+
+
+def _strip_function_bodies(source: str) -> str:
+    """Replace the bodies of the functions by ``pass``, keeping the line numbers of the statements.
+
+    The source is split by the indentation of its lines: the sources that are not split properly do not parse,
+    in which case they are parsed with the bodies of their functions.
+    """
+    lines = source.split("\n")
+    index = 0
+    while index < len(lines):
+        match = _DEF_LINE.match(lines[index])
+        if match is None:
+            index += 1
+            continue
+        indent = len(match.group(1).expandtabs())
+        # find the end of the signature
+        depth = 0
+        end = index
+        while end < len(lines):
+            code = lines[end].split("#")[0].rstrip()
+            depth += sum(map(code.count, "([{")) - sum(map(code.count, ")]}"))
+            if depth <= 0:
+                break
+            end += 1
+        if end == len(lines) or not code.endswith(":"):
+            # note: the body is on the line of the signature
+            index = end + 1
+            continue
+        # the body is made of the following lines that are indented further (or without code)
+        stop = end + 1
+        first = None
+        while stop < len(lines):
+            line = lines[stop].expandtabs()
+            code = line.lstrip()
+            if code and not code.startswith("#"):
+                if len(line) - len(code) <= indent:
+                    break
+                if first is None:
+                    first = stop
+            stop += 1
+        if first is not None:
+            body_indent = lines[first][: len(lines[first]) - len(lines[first].lstrip())]
+            lines[end + 1 : stop] = [""] * (stop - end - 1)
+            lines[first] = body_indent + "pass"
+        index = stop
+    return "\n".join(lines)
+
+
+def _function_node(module: _StaticModule, node: ast.FunctionDef) -> ast.FunctionDef:
+    """Definition of a function with its body."""
+    if "__static_source__" not in module.__dict__:
+        return node
+    functions = module.__dict__.get("__static_functions__")
+    if functions is None:
+        tree = ast.parse(module.__static_source__, module.__file__)
+        functions = {
+            (item.lineno, item.col_offset): item
+            for item in ast.walk(tree)
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
+        module.__static_functions__ = functions
+    return functions[(node.lineno, node.col_offset)]
+
+
+def _defined_names(node: ast.stmt) -> list[str]:
+    """Names defined by a statement of a module."""
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return [alias.asname or alias.name.partition(".")[0] for alias in node.names if alias.name != "*"]
+    targets = node.targets if isinstance(node, ast.Assign) else [getattr(node, "target", None)]
+    return [target.id for target in targets if isinstance(target, ast.Name)]
+
+
+"""
+Interpreter.
+"""
+
+
+class _Frame:
+    """Scope of the statements being interpreted."""
+
+    __slots__ = ("module", "locals", "outer", "qualname", "is_class", "function", "members", "annotations", "error")
+
+    def __init__(self, module: _StaticModule, scope: dict, outer: _Frame | None, qualname: str, is_class=False):
+        self.module = module
+        self.locals = scope
+        self.outer = outer
+        self.qualname = qualname
+        self.is_class = is_class
+        self.function: _StaticFunction | None = None
+        self.members: list[str] = []
+        self.annotations: set[str] = set()
+        self.error: BaseException | None = None
+
+
+class _Return(BaseException):
+    def __init__(self, value):
+        self.value = value
+
+
+class _Break(BaseException):
+    pass
+
+
+class _Continue(BaseException):
+    pass
+
+
+_BUILTINS = {
+    name: value
+    for name, value in vars(builtins).items()
+    if name not in ("eval", "exec", "compile", "__import__", "globals", "locals", "input", "breakpoint", "exit")
+}
+"""Built-in names available to the interpreted statements."""
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.MatMult: operator.matmul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+    ast.BitXor: operator.xor,
+    ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift,
+}
+
+_UNARY_OPERATORS = {ast.UAdd: operator.pos, ast.USub: operator.neg, ast.Invert: operator.invert, ast.Not: operator.not_}
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+
+
+def _exec_body(frame: _Frame, body: list[ast.stmt]):
+    for node in body:
+        _exec(frame, node)
+
+
+def _exec(frame: _Frame, node: ast.stmt):
+    handler = _STATEMENTS.get(type(node))
+    if handler is None:
+        raise StaticReadError(f"Unsupported statement '{type(node).__name__}' in {frame.module.__name__}.")
+    handler(frame, node)
+
+
+def _exec_expr(frame, node):
+    _eval(frame, node.value)
+
+
+def _exec_assign(frame, node):
+    value = _eval(frame, node.value)
+    for target in node.targets:
+        _assign(frame, target, value)
+
+
+def _exec_ann_assign(frame, node):
+    if frame.is_class and isinstance(node.target, ast.Name):
+        frame.members.append(node.target.id)
+        frame.annotations.add(node.target.id)
+    if node.value is not None:
+        _assign(frame, node.target, _eval(frame, node.value))
+
+
+def _exec_aug_assign(frame, node):
+    target = node.target
+    value = _eval(frame, node.value)
+    op = _BINARY_OPERATORS[type(node.op)]
+    if isinstance(target, ast.Name):
+        _assign(frame, target, op(_load_name(frame, target.id), value))
+    elif isinstance(target, ast.Attribute):
+        obj = _eval(frame, target.value)
+        setattr(obj, target.attr, op(getattr(obj, target.attr), value))
+    else:
+        obj, key = _eval(frame, target.value), _eval(frame, target.slice)
+        obj[key] = op(obj[key], value)
+
+
+def _assign(frame: _Frame, target: ast.expr, value):
+    if isinstance(target, ast.Name):
+        if frame.is_class and target.id not in frame.locals:
+            frame.members.append(target.id)
+        frame.locals[target.id] = value
+    elif isinstance(target, ast.Attribute):
+        setattr(_eval(frame, target.value), target.attr, value)
+    elif isinstance(target, ast.Subscript):
+        _eval(frame, target.value)[_eval(frame, target.slice)] = value
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        values = list(value)
+        starred = [i for i, item in enumerate(target.elts) if isinstance(item, ast.Starred)]
+        if starred:
+            index, num_after = starred[0], len(target.elts) - starred[0] - 1
+            values = values[:index] + [values[index : len(values) - num_after]] + values[len(values) - num_after :]
+        if len(values) != len(target.elts):
+            raise ValueError(f"Cannot unpack {len(values)} values into {len(target.elts)} targets.")
+        for item, item_value in zip(target.elts, values):
+            _assign(frame, item.value if isinstance(item, ast.Starred) else item, item_value)
+    else:
+        raise StaticReadError(f"Unsupported assignment target '{type(target).__name__}'.")
+
+
+def _exec_delete(frame, node):
+    for target in node.targets:
+        if isinstance(target, ast.Name):
+            del frame.locals[target.id]
+        elif isinstance(target, ast.Attribute):
+            delattr(_eval(frame, target.value), target.attr)
+        else:
+            del _eval(frame, target.value)[_eval(frame, target.slice)]
+
+
+def _exec_import(frame, node):
+    for alias in node.names:
+        name = alias.asname or alias.name.partition(".")[0]
+        _bind_import(frame, name, _import_module, (alias.name, alias.asname is None))
+
+
+def _exec_import_from(frame, node):
+    module = frame.module
+    if node.level > 0:
+        module_name = importlib.util.resolve_name("." * node.level + (node.module or ""), module.__package__)
+    else:
+        module_name = node.module
+    if module_name == "__future__":
+        return
+    for alias in node.names:
+        if alias.name == "*":
+            module.__static_stars__.append(module_name)
+            _import(module_name)
+        else:
+            _bind_import(frame, alias.asname or alias.name, _import_from, (module_name, alias.name))
+
+
+def _bind_import(frame: _Frame, name: str, resolve, args: tuple):
+    """Bind an imported name, which is resolved when it is used if it is imported by the module."""
+    module = frame.module
+    if frame.locals is module.__dict__:
+        module.__dict__.pop(name, None)
+        module.__static_imports__[name] = (resolve, args)
+    else:
+        frame.locals[name] = resolve(*args)
+
+
+def _exec_function_def(frame, node):
+    function = _make_function(frame, node, f"{frame.qualname}{node.name}")
+    for decorator in reversed(node.decorator_list):
+        # note: the other decorators are ignored
+        if isinstance(decorator, ast.Name) and decorator.id in ("staticmethod", "classmethod", "property"):
+            function = _BUILTINS[decorator.id](function)
+    frame.locals[node.name] = function
+
+
+def _make_function(frame: _Frame, node: ast.FunctionDef | ast.Lambda, qualname: str) -> _StaticFunction:
+    defaults = [_eval(frame, default) for default in node.args.defaults]
+    kw_defaults = [_NO_DEFAULT if default is None else _eval(frame, default) for default in node.args.kw_defaults]
+    return _StaticFunction(node, qualname, frame, defaults, kw_defaults)
+
+
+def _exec_class_def(frame, node):
+    bases = tuple(base for base in map(lambda base: _eval(frame, base), node.bases) if _is_record_class(base))
+    qualname = f"{frame.qualname}{node.name}"
+    class_frame = _Frame(frame.module, dict(), frame, f"{qualname}.", is_class=True)
+    _exec_body(class_frame, node.body)
+    frame.locals[node.name] = _make_record_class(node.name, qualname, bases or (_Record,), class_frame)
+
+
+def _is_record_class(value) -> bool:
+    return isinstance(value, type) and issubclass(value, _Record)
+
+
+def _exec_return(frame, node):
+    raise _Return(None if node.value is None else _eval(frame, node.value))
+
+
+def _exec_if(frame, node):
+    _exec_body(frame, node.body if _truth(_eval(frame, node.test)) else node.orelse)
+
+
+def _exec_for(frame, node):
+    for value in _iterate(_eval(frame, node.iter)):
+        _assign(frame, node.target, value)
+        try:
+            _exec_body(frame, node.body)
+        except _Break:
+            break
+        except _Continue:
+            continue
+    else:
+        _exec_body(frame, node.orelse)
+
+
+def _exec_while(frame, node):
+    while _truth(_eval(frame, node.test)):
+        try:
+            _exec_body(frame, node.body)
+        except _Break:
+            break
+        except _Continue:
+            continue
+    else:
+        _exec_body(frame, node.orelse)
+
+
+def _exec_break(frame, node):
+    raise _Break()
+
+
+def _exec_continue(frame, node):
+    raise _Continue()
+
+
+def _exec_try(frame, node):
+    try:
+        try:
+            _exec_body(frame, node.body)
+        except StaticReadError:
+            raise
+        except Exception as error:
+            for handler in node.handlers:
+                error_type = None if handler.type is None else _eval(frame, handler.type)
+                if error_type is None or (not isinstance(error_type, _Opaque) and isinstance(error, error_type)):
+                    if handler.name is not None:
+                        frame.locals[handler.name] = error
+                    frame.error = error
+                    _exec_body(frame, handler.body)
+                    break
+            else:
+                raise
+        else:
+            _exec_body(frame, node.orelse)
+    finally:
+        _exec_body(frame, node.finalbody)
+
+
+def _exec_raise(frame, node):
+    if node.exc is None:
+        if frame.error is None:
+            raise RuntimeError("No active exception to re-raise.")
+        raise frame.error
+    error = _eval(frame, node.exc)
+    raise error if node.cause is None else error from _eval(frame, node.cause)
+
+
+def _exec_assert(frame, node):
+    if not _truth(_eval(frame, node.test)):
+        raise AssertionError(None if node.msg is None else _eval(frame, node.msg))
+
+
+def _exec_global(frame, node):
+    raise StaticReadError("Unsupported global names.")
+
+
+def _exec_pass(frame, node):
+    pass
+
+
+_STATEMENTS = {
+    ast.Expr: _exec_expr,
+    ast.Assign: _exec_assign,
+    ast.AnnAssign: _exec_ann_assign,
+    ast.AugAssign: _exec_aug_assign,
+    ast.Delete: _exec_delete,
+    ast.Import: _exec_import,
+    ast.ImportFrom: _exec_import_from,
+    ast.FunctionDef: _exec_function_def,
+    ast.ClassDef: _exec_class_def,
+    ast.Return: _exec_return,
+    ast.If: _exec_if,
+    ast.For: _exec_for,
+    ast.While: _exec_while,
+    ast.Break: _exec_break,
+    ast.Continue: _exec_continue,
+    ast.Try: _exec_try,
+    ast.Raise: _exec_raise,
+    ast.Assert: _exec_assert,
+    ast.Global: _exec_global,
+    ast.Nonlocal: _exec_global,
+    ast.Pass: _exec_pass,
+}
+
+
+def _truth(value) -> bool:
+    return bool(value)
+
+
+def _iterate(value) -> Iterable:
+    return iter(value)
+
+
+def _load_name(frame: _Frame, name: str):
+    if name in frame.locals:
+        return frame.locals[name]
+    scope = frame.outer
+    while scope is not None:
+        # note: the functions defined in a class do not see the names of the class
+        if not scope.is_class and name in scope.locals:
+            return scope.locals[name]
+        scope = scope.outer
+    module = frame.module
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        if name in _BUILTINS:
+            return _BUILTINS[name]
+    raise StaticReadError(f"Name '{name}' is not defined in {module.__name__}.")
+
+
+def _eval(frame: _Frame, node: ast.expr):
+    handler = _EXPRESSIONS.get(type(node))
+    if handler is None:
+        raise StaticReadError(f"Unsupported expression '{type(node).__name__}' in {frame.module.__name__}.")
+    return handler(frame, node)
+
+
+def _eval_call(frame, node):
+    func = _eval(frame, node.func)
+    args = []
+    for arg in node.args:
+        if isinstance(arg, ast.Starred):
+            args.extend(_iterate(_eval(frame, arg.value)))
+        else:
+            args.append(_eval(frame, arg))
+    kwargs = dict()
+    for keyword in node.keywords:
+        if keyword.arg is None:
+            kwargs.update(_eval(frame, keyword.value))
+        else:
+            kwargs[keyword.arg] = _eval(frame, keyword.value)
+    if func is super and not args:
+        function = frame.function
+        if function is None or function.owner is None:
+            raise StaticReadError("Unsupported call of super() outside of a method.")
+        args = [function.owner, frame.locals[_first_param(function)]]
+    try:
+        return func(*args, **kwargs)
+    except StaticReadError:
+        # note: the calls of the modules and of the class bodies that cannot be interpreted return opaque values
+        if frame.function is not None:
+            raise
+        return _Opaque(f"{getattr(func, '__qualname__', type(func).__name__)}()")
+    except Exception:
+        if any(isinstance(value, _Opaque) for value in (*args, *kwargs.values())):
+            return _Opaque(f"{getattr(func, '__qualname__', type(func).__name__)}()")
+        raise
+
+
+def _first_param(function: _StaticFunction) -> str:
+    return (function.node.args.posonlyargs + function.node.args.args)[0].arg
+
+
+def _eval_formatted_value(frame, node):
+    value = _eval(frame, node.value)
+    if node.conversion == ord("r"):
+        value = repr(value)
+    elif node.conversion == ord("s"):
+        value = str(value)
+    elif node.conversion == ord("a"):
+        value = ascii(value)
+    return format(value, "" if node.format_spec is None else _eval(frame, node.format_spec))
+
+
+def _eval_comprehension(frame: _Frame, generators: list[ast.comprehension], emit):
+    # note: the first iterable is evaluated in the enclosing scope
+    scope = _Frame(frame.module, dict(), frame, frame.qualname)
+    scope.function = frame.function
+
+    def loop(index: int, values: Iterable):
+        generator = generators[index]
+        for value in values:
+            _assign(scope, generator.target, value)
+            if all(_truth(_eval(scope, condition)) for condition in generator.ifs):
+                if index + 1 == len(generators):
+                    emit(scope)
+                else:
+                    loop(index + 1, _iterate(_eval(scope, generators[index + 1].iter)))
+
+    loop(0, _iterate(_eval(frame, generators[0].iter)))
+
+
+def _eval_list_comp(frame, node):
+    values = []
+    _eval_comprehension(frame, node.generators, lambda scope: values.append(_eval(scope, node.elt)))
+    return values
+
+
+def _eval_set_comp(frame, node):
+    return set(_eval_list_comp(frame, node))
+
+
+def _eval_generator_exp(frame, node):
+    return iter(_eval_list_comp(frame, node))
+
+
+def _eval_dict_comp(frame, node):
+    values = dict()
+
+    def emit(scope):
+        values[_eval(scope, node.key)] = _eval(scope, node.value)
+
+    _eval_comprehension(frame, node.generators, emit)
+    return values
+
+
+def _eval_dict(frame, node):
+    values = dict()
+    for key, value in zip(node.keys, node.values):
+        if key is None:
+            values.update(_eval(frame, value))
+        else:
+            values[_eval(frame, key)] = _eval(frame, value)
+    return values
+
+
+def _eval_items(frame: _Frame, nodes: list[ast.expr]) -> list:
+    values = []
+    for item in nodes:
+        if isinstance(item, ast.Starred):
+            values.extend(_iterate(_eval(frame, item.value)))
+        else:
+            values.append(_eval(frame, item))
+    return values
+
+
+def _eval_bool_op(frame, node):
+    is_and = isinstance(node.op, ast.And)
+    for item in node.values:
+        value = _eval(frame, item)
+        if _truth(value) != is_and:
+            return value
+    return value
+
+
+def _eval_compare(frame, node):
+    left = _eval(frame, node.left)
+    for index, (op, comparator) in enumerate(zip(node.ops, node.comparators)):
+        right = _eval(frame, comparator)
+        result = _COMPARISONS[type(op)](left, right)
+        # note: the chained comparisons stop at the first false comparison
+        if index + 1 < len(node.ops) and not _truth(result):
+            return result
+        left = right
+    return result
+
+
+def _eval_if_exp(frame, node):
+    return _eval(frame, node.body if _truth(_eval(frame, node.test)) else node.orelse)
+
+
+def _eval_named_expr(frame, node):
+    value = _eval(frame, node.value)
+    _assign(frame, node.target, value)
+    return value
+
+
+def _eval_slice(frame, node):
+    return slice(*(None if item is None else _eval(frame, item) for item in (node.lower, node.upper, node.step)))
+
+
+_EXPRESSIONS = {
+    ast.Constant: lambda frame, node: node.value,
+    ast.Name: lambda frame, node: _load_name(frame, node.id),
+    ast.Attribute: lambda frame, node: getattr(_eval(frame, node.value), node.attr),
+    ast.Subscript: lambda frame, node: _eval(frame, node.value)[_eval(frame, node.slice)],
+    ast.Slice: _eval_slice,
+    ast.Call: _eval_call,
+    ast.JoinedStr: lambda frame, node: "".join(str(_eval(frame, value)) for value in node.values),
+    ast.FormattedValue: _eval_formatted_value,
+    ast.Tuple: lambda frame, node: tuple(_eval_items(frame, node.elts)),
+    ast.List: lambda frame, node: _eval_items(frame, node.elts),
+    ast.Set: lambda frame, node: set(_eval_items(frame, node.elts)),
+    ast.Dict: _eval_dict,
+    ast.ListComp: _eval_list_comp,
+    ast.SetComp: _eval_set_comp,
+    ast.GeneratorExp: _eval_generator_exp,
+    ast.DictComp: _eval_dict_comp,
+    ast.BinOp: lambda frame, node: _BINARY_OPERATORS[type(node.op)](_eval(frame, node.left), _eval(frame, node.right)),
+    ast.UnaryOp: lambda frame, node: _UNARY_OPERATORS[type(node.op)](_eval(frame, node.operand)),
+    ast.BoolOp: _eval_bool_op,
+    ast.Compare: _eval_compare,
+    ast.IfExp: _eval_if_exp,
+    ast.NamedExpr: _eval_named_expr,
+    ast.Lambda: lambda frame, node: _make_function(frame, node, f"{frame.qualname}<lambda>"),
+}
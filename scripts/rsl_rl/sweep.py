@@ -0,0 +1,242 @@
+"""Script to train several RL agents with RSL-RL in a single launch of the simulator.
+
+The script launches the simulator once and trains an agent for each point of a sweep, like ``train.py`` would with
+the Hydra overrides of the point. The overrides passed on the command line apply to all the points.
+
+Between two points, the environment is only created again if the configurations differ in their structure. The
+changes that are supported by :func:`~ext_template.envs.reconfigure_env` (the seed, the episode length, the weights
+of the rewards and the parameters of the function terms) are applied to the existing environment instead, whose
+curriculum state is restored to its initial value (see :class:`~ext_template.envs.EnvStateSnapshot`). The changes
+of the agent configuration never require a new environment.
+
+The points are read from a YAML file holding a list, whose items are lists of overrides or mappings with the
+entries ``name`` (the suffix of the run directory) and ``overrides``:
+
+.. code-block:: yaml
+
+    - name: seed1
+      overrides: [agent.seed=1]
+    - [agent.seed=2, env.rewards.feet_air_time.weight=0.5]
+    - [agent.algorithm.learning_rate=3.0e-4]
+
+.. code-block:: bash
+
+    ./isaaclab_ext.sh -p scripts/rsl_rl/sweep.py --task Ext-Isaac-Velocity-Flat-Anymal-D-v0 --headless \
+        --sweep sweep.yaml agent.max_iterations=300
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+import sys
+
+from isaaclab.app import AppLauncher
+
+# local imports
+import cli_args  # isort: skip
+
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Train several RL agents with RSL-RL in a single simulator launch.")
+parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument("--max_iterations", type=int, default=None, help="RL Policy training iterations.")
+parser.add_argument("--sweep", type=str, default=None, help="YAML file listing the overrides of the sweep points.")
+parser.add_argument(
+    "--points", type=str, nargs="+", default=None, help="Overrides of the sweep points (space-separated per point)."
+)
+parser.add_argument(
+    "--rebuild", action="store_true", default=False, help="Create the environment again for every point."
+)
+# append RSL-RL cli arguments
+cli_args.add_rsl_rl_args(parser)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+args_cli, hydra_args = parser.parse_known_args()
+
+if (args_cli.sweep is None) == (args_cli.points is None):
+    parser.error("Exactly one of --sweep and --points is required.")
+if args_cli.resume:
+    parser.error("The sweep trains every point from scratch: resuming is not supported.")
+
+# clear out sys.argv for Hydra
+sys.argv = [sys.argv[0]]
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import os
+import time
+import torch
+import yaml
+from datetime import datetime
+
+import omni.usd
+from hydra import compose, initialize
+from omegaconf import OmegaConf
+
+from isaaclab.envs import ManagerBasedRLEnvCfg
+from isaaclab.envs.utils.spaces import replace_strings_with_env_cfg_spaces
+from isaaclab.utils import replace_strings_with_slices
+from isaaclab.utils.io import dump_pickle, dump_yaml
+from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg, RslRlVecEnvWrapper
+from isaaclab_tasks.utils.hydra import register_task_to_hydra
+
+# Import extensions to set up environment tasks
+import ext_template.tasks  # noqa: F401
+from ext_template.envs import EnvStateSnapshot, find_cfg_changes, reconfigure_env
+from ext_template.rsl_rl import ExtOnPolicyRunner, MultiPolicyRunner
+
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.allow_tf32 = True
+torch.backends.cudnn.deterministic = False
+torch.backends.cudnn.benchmark = False
+
+
+def load_points() -> list[tuple[str, list[str]]]:
+    """Read the names and the overrides of the sweep points."""
+    if args_cli.points is not None:
+        items = [point.split() for point in args_cli.points]
+    else:
+        with open(args_cli.sweep) as f:
+            items = yaml.safe_load(f)
+    points = []
+    for index, item in enumerate(items):
+        if isinstance(item, dict):
+            points.append((item.get("name", f"point{index}"), list(item.get("overrides", []))))
+        else:
+            points.append((f"point{index}", list(item)))
+    return points
+
+
+def compose_cfgs(task_name: str, overrides: list[str]) -> tuple[ManagerBasedRLEnvCfg, RslRlOnPolicyRunnerCfg]:
+    """Create the configurations of a sweep point.
+
+    Note:
+        This mirrors :func:`isaaclab_tasks.utils.hydra.hydra_task_config`, with the Hydra compose API instead of
+        the command line.
+    """
+    # note: the registration parses the default configurations again, which are then updated in-place
+    env_cfg, agent_cfg = register_task_to_hydra(task_name, "rsl_rl_cfg_entry_point")
+    hydra_cfg = compose(config_name=task_name, overrides=overrides)
+    hydra_cfg = replace_strings_with_slices(OmegaConf.to_container(hydra_cfg, resolve=True))
+    env_cfg.from_dict(hydra_cfg["env"])
+    env_cfg = replace_strings_with_env_cfg_spaces(env_cfg)
+    agent_cfg.from_dict(hydra_cfg["agent"])
+    # override configurations with non-hydra CLI arguments
+    agent_cfg = cli_args.update_rsl_rl_cfg(agent_cfg, args_cli)
+    env_cfg.scene.num_envs = args_cli.num_envs if args_cli.num_envs is not None else env_cfg.scene.num_envs
+    agent_cfg.max_iterations = (
+        args_cli.max_iterations if args_cli.max_iterations is not None else agent_cfg.max_iterations
+    )
+    # set the environment seed
+    env_cfg.seed = agent_cfg.seed
+    env_cfg.sim.device = args_cli.device if args_cli.device is not None else env_cfg.sim.device
+    # keep the reward terms with zero weight, whose weights can then be changed by the hot reload
+    if getattr(agent_cfg, "hot_reload", False) and hasattr(env_cfg, "prune_noop_terms"):
+        env_cfg.prune_noop_terms = False
+    return env_cfg, agent_cfg
+
+
+def close_runner(runner: ExtOnPolicyRunner | MultiPolicyRunner):
+    """Close the summary writers of a runner."""
+    for group_runner in getattr(runner, "runners", [runner]):
+        writer = group_runner.writer
+        if writer is None:
+            continue
+        # note: the writers of wandb and neptune end their run on stop
+        if hasattr(writer, "stop"):
+            writer.stop()
+        writer.close()
+
+
+def main():
+    """Train an agent for each point of the sweep."""
+    task_name = args_cli.task.split(":")[-1]
+    points = load_points()
+    print(f"[INFO] Sweeping {len(points)} points of the task: {task_name}")
+
+    env = None
+    snapshot = None
+    env_cfg_dict = None
+    results = []
+    with initialize(config_path=None, version_base="1.3"):
+        for name, overrides in points:
+            start = time.perf_counter()
+            env_cfg, agent_cfg = compose_cfgs(task_name, hydra_args + overrides)
+            agent_cfg.run_name = f"{agent_cfg.run_name}_{name}" if agent_cfg.run_name else name
+            print(f"[INFO] Sweep point '{name}' with overrides: {overrides}")
+
+            # reuse the environment if possible
+            new_env_cfg_dict = env_cfg.to_dict()
+            if env is not None:
+                changes = find_cfg_changes(env_cfg_dict, new_env_cfg_dict)
+                if not args_cli.rebuild and reconfigure_env(env.unwrapped, changes):
+                    print(f"[INFO] Reconfigured the environment: {sorted(changes)}")
+                    # note: the environments are reset by the restoration, without running the curriculum
+                    snapshot.restore()
+                else:
+                    env.close()
+                    env = None
+            env_cfg_dict = new_env_cfg_dict
+            reused = env is not None
+            if env is None:
+                # create isaac environment on a new stage
+                omni.usd.get_context().new_stage()
+                env = RslRlVecEnvWrapper(gym.make(args_cli.task, cfg=env_cfg))
+                snapshot = EnvStateSnapshot(env.unwrapped)
+
+            # specify directory for logging runs: {time-stamp}_{run_name}
+            log_root_path = os.path.abspath(os.path.join("logs", "rsl_rl", agent_cfg.experiment_name))
+            log_dir = os.path.join(
+                log_root_path, datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + f"_{agent_cfg.run_name}"
+            )
+            if getattr(agent_cfg, "num_policies", 1) > 1:
+                runner = MultiPolicyRunner(env, agent_cfg.to_dict(), log_dir=log_dir, device=agent_cfg.device)
+                log_dirs = runner.log_dirs
+                agent_cfgs = [agent_cfg.replace(seed=seed) for seed in runner.seeds]
+            else:
+                runner = ExtOnPolicyRunner(env, agent_cfg.to_dict(), log_dir=log_dir, device=agent_cfg.device)
+                log_dirs = [log_dir]
+                agent_cfgs = [agent_cfg]
+            runner.add_git_repo_to_log(__file__)
+            # dump the configuration into the log-directory of each policy
+            for group_log_dir, group_agent_cfg in zip(log_dirs, agent_cfgs):
+                dump_yaml(os.path.join(group_log_dir, "params", "env.yaml"), env_cfg)
+                dump_yaml(os.path.join(group_log_dir, "params", "agent.yaml"), group_agent_cfg)
+                dump_pickle(os.path.join(group_log_dir, "params", "env.pkl"), env_cfg)
+                dump_pickle(os.path.join(group_log_dir, "params", "agent.pkl"), group_agent_cfg)
+            setup_time = time.perf_counter() - start
+
+            # run training
+            start = time.perf_counter()
+            runner.learn(num_learning_iterations=agent_cfg.max_iterations, init_at_random_ep_len=True)
+            train_time = time.perf_counter() - start
+
+            # tear down the runner
+            close_runner(runner)
+            del runner
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+            results.append((name, reused, setup_time, train_time, log_dirs))
+
+    # close the simulator
+    if env is not None:
+        env.close()
+
+    print(f"{'Point':>16} | {'Environment':>11} | {'Setup (s)':>9} | {'Training (s)':>12} | Log directory")
+    for name, reused, setup_time, train_time, log_dirs in results:
+        environment = "reused" if reused else "created"
+        print(f"{name:>16} | {environment:>11} | {setup_time:>9.1f} | {train_time:>12.1f} | {', '.join(log_dirs)}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
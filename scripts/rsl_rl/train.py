@@ -25,6 +25,15 @@ parser.add_argument("--num_envs", type=int, default=None, help="Number of enviro
 parser.add_argument("--task", type=str, default=None, help="Name of the task.")
 parser.add_argument("--seed", type=int, default=None, help="Seed used for the environment")
 parser.add_argument("--max_iterations", type=int, default=None, help="RL Policy training iterations.")
+parser.add_argument(
+    "--preemptible",
+    action="store_true",
+    default=False,
+    help="Checkpoint and exit on SIGTERM/SIGUSR1, and resume the last preempted run of the experiment on start.",
+)
+parser.add_argument(
+    "--requeue_exit_code", type=int, default=3, help="Exit code of the script when the training is preempted."
+)
 # append RSL-RL cli arguments
 cli_args.add_rsl_rl_args(parser)
 # append AppLauncher cli args
@@ -49,8 +58,6 @@ import os
 import torch
 from datetime import datetime
 
-from rsl_rl.runners import OnPolicyRunner
-
 from isaaclab.envs import (
     DirectMARLEnv,
     DirectMARLEnvCfg,
@@ -66,16 +73,28 @@ from isaaclab_tasks.utils.hydra import hydra_task_config
 
 # Import extensions to set up environment tasks
 import ext_template.tasks  # noqa: F401
+from ext_template.rsl_rl import (
+    ExtOnPolicyRunner,
+    MultiPolicyRunner,
+    PreemptionHandler,
+    clear_preemption_marker,
+    find_preempted_run,
+    resume_preempted_run,
+)
 
 torch.backends.cuda.matmul.allow_tf32 = True
 torch.backends.cudnn.allow_tf32 = True
 torch.backends.cudnn.deterministic = False
 torch.backends.cudnn.benchmark = False
 
+# exit code of the script (set on preemption)
+exit_code = 0
+
 
 @hydra_task_config(args_cli.task, "rsl_rl_cfg_entry_point")
 def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agent_cfg: RslRlOnPolicyRunnerCfg):
     """Train with RSL-RL agent."""
+    global exit_code
     # override configurations with non-hydra CLI arguments
     agent_cfg = cli_args.update_rsl_rl_cfg(agent_cfg, args_cli)
     env_cfg.scene.num_envs = args_cli.num_envs if args_cli.num_envs is not None else env_cfg.scene.num_envs
@@ -87,16 +106,25 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # note: certain randomizations occur in the environment initialization so we set the seed here
     env_cfg.seed = agent_cfg.seed
     env_cfg.sim.device = args_cli.device if args_cli.device is not None else env_cfg.sim.device
+    # keep the reward terms with zero weight, whose weights can then be changed by the hot reload
+    if getattr(agent_cfg, "hot_reload", False) and hasattr(env_cfg, "prune_noop_terms"):
+        env_cfg.prune_noop_terms = False
 
     # specify directory for logging experiments
     log_root_path = os.path.join("logs", "rsl_rl", agent_cfg.experiment_name)
     log_root_path = os.path.abspath(log_root_path)
     print(f"[INFO] Logging experiment in directory: {log_root_path}")
-    # specify directory for logging runs: {time-stamp}_{run_name}
-    log_dir = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    if agent_cfg.run_name:
-        log_dir += f"_{agent_cfg.run_name}"
-    log_dir = os.path.join(log_root_path, log_dir)
+    # continue the last preempted run, if any
+    preempted_run = find_preempted_run(log_root_path, agent_cfg.run_name) if args_cli.preemptible else None
+    if preempted_run is not None:
+        log_dir = preempted_run
+        print(f"[INFO] Resuming the preempted run: {log_dir}")
+    else:
+        # specify directory for logging runs: {time-stamp}_{run_name}
+        log_dir = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        if agent_cfg.run_name:
+            log_dir += f"_{agent_cfg.run_name}"
+        log_dir = os.path.join(log_root_path, log_dir)
 
     # create isaac environment
     env = gym.make(args_cli.task, cfg=env_cfg, render_mode="rgb_array" if args_cli.video else None)
@@ -119,26 +147,71 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     # wrap around environment for rsl-rl
     env = RslRlVecEnvWrapper(env)
 
-    # create runner from rsl-rl
-    runner = OnPolicyRunner(env, agent_cfg.to_dict(), log_dir=log_dir, device=agent_cfg.device)
-    # write git state to logs
-    runner.add_git_repo_to_log(__file__)
-    # save resume path before creating a new log_dir
-    if agent_cfg.resume:
-        # get path to previous checkpoint
-        resume_path = get_checkpoint_path(log_root_path, agent_cfg.load_run, agent_cfg.load_checkpoint)
-        print(f"[INFO]: Loading model checkpoint from: {resume_path}")
-        # load previously trained model
-        runner.load(resume_path)
-
-    # dump the configuration into log-directory
-    dump_yaml(os.path.join(log_dir, "params", "env.yaml"), env_cfg)
-    dump_yaml(os.path.join(log_dir, "params", "agent.yaml"), agent_cfg)
-    dump_pickle(os.path.join(log_dir, "params", "env.pkl"), env_cfg)
-    dump_pickle(os.path.join(log_dir, "params", "agent.pkl"), agent_cfg)
+    num_learning_iterations = agent_cfg.max_iterations
+    if getattr(agent_cfg, "num_policies", 1) > 1:
+        if args_cli.preemptible:
+            raise ValueError("Preemptible training is not supported with several policies.")
+        # create runner training one policy per group of environments (one run directory per seed)
+        runner = MultiPolicyRunner(env, agent_cfg.to_dict(), log_dir=log_dir, device=agent_cfg.device)
+        print(f"[INFO] Training {runner.num_policies} policies with seeds: {runner.seeds}")
+        # write git state to logs
+        runner.add_git_repo_to_log(__file__)
+        # save resume path before creating a new log_dir
+        if agent_cfg.resume:
+            # get paths to previous checkpoints (one run per seed)
+            resume_paths = [
+                get_checkpoint_path(log_root_path, f"{agent_cfg.load_run}_seed{seed}", agent_cfg.load_checkpoint)
+                for seed in runner.seeds
+            ]
+            print(f"[INFO]: Loading model checkpoints from: {resume_paths}")
+            # load previously trained models
+            runner.load(resume_paths)
+        # dump the configuration into the log-directory of each policy
+        for seed, group_log_dir in zip(runner.seeds, runner.log_dirs):
+            group_agent_cfg = agent_cfg.replace(seed=seed)
+            dump_yaml(os.path.join(group_log_dir, "params", "env.yaml"), env_cfg)
+            dump_yaml(os.path.join(group_log_dir, "params", "agent.yaml"), group_agent_cfg)
+            dump_pickle(os.path.join(group_log_dir, "params", "env.pkl"), env_cfg)
+            dump_pickle(os.path.join(group_log_dir, "params", "agent.pkl"), group_agent_cfg)
+    else:
+        # create runner from rsl-rl (with the rollout options of the extension)
+        runner = ExtOnPolicyRunner(env, agent_cfg.to_dict(), log_dir=log_dir, device=agent_cfg.device)
+        if runner.hot_reload is not None:
+            print(f"[INFO] Applying the changes of the hot reload file: {runner.hot_reload.path}")
+        if runner.telemetry is not None:
+            print(
+                f"[INFO] Sampling the resource telemetry every {runner.telemetry.interval} s: {runner.telemetry.path}"
+            )
+        # write git state to logs
+        runner.add_git_repo_to_log(__file__)
+        if preempted_run is not None:
+            # load the checkpoint written on preemption, and complete the interrupted training
+            num_learning_iterations = resume_preempted_run(runner, preempted_run)
+        # save resume path before creating a new log_dir
+        elif agent_cfg.resume:
+            # get path to previous checkpoint
+            resume_path = get_checkpoint_path(log_root_path, agent_cfg.load_run, agent_cfg.load_checkpoint)
+            print(f"[INFO]: Loading model checkpoint from: {resume_path}")
+            # load previously trained model
+            runner.load(resume_path)
+        # dump the configuration into log-directory
+        dump_yaml(os.path.join(log_dir, "params", "env.yaml"), env_cfg)
+        dump_yaml(os.path.join(log_dir, "params", "agent.yaml"), agent_cfg)
+        dump_pickle(os.path.join(log_dir, "params", "env.pkl"), env_cfg)
+        dump_pickle(os.path.join(log_dir, "params", "agent.pkl"), agent_cfg)
 
     # run training
-    runner.learn(num_learning_iterations=agent_cfg.max_iterations, init_at_random_ep_len=True)
+    if args_cli.preemptible:
+        with PreemptionHandler() as preemption:
+            runner.preemption = preemption
+            runner.learn(num_learning_iterations=num_learning_iterations, init_at_random_ep_len=True)
+        if runner.preempted:
+            print(f"[INFO] Training preempted: exiting with the requeue code {args_cli.requeue_exit_code}.")
+            exit_code = args_cli.requeue_exit_code
+        else:
+            clear_preemption_marker(log_dir)
+    else:
+        runner.learn(num_learning_iterations=num_learning_iterations, init_at_random_ep_len=True)
 
     # close the simulator
     env.close()
@@ -149,3 +222,4 @@ if __name__ == "__main__":
     main()
     # close sim app
     simulation_app.close()
+    sys.exit(exit_code)
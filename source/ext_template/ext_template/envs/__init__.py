@@ -0,0 +1,15 @@
+"""Environments of this extension.
+
+The environments extend the ones from :mod:`isaaclab.envs` with the managers of :mod:`ext_template.managers`.
+They are configured with the same configuration classes. The :class:`SurrogateManagerBasedRLEnv` runs them
+without the simulator, on a surrogate of the simulated scene.
+"""
+
+from .articulation_spec import ARTICULATION_SPECS, ArticulationSpec, find_articulation_spec
+from .contact_bodies import contact_sensor_buffer_size, restrict_contact_sensor_bodies
+from .finalize import finalize_env_cfg
+from .manager_based_rl_env import ExtManagerBasedRLEnv
+from .metrics import MetricsBuffer
+from .noop_terms import prune_noop_terms
+from .reconfigure import EnvStateSnapshot, find_cfg_changes, reconfigure_env
+from .surrogate import SurrogateManagerBasedRLEnv
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isaaclab.assets import ArticulationCfg
+
+
+@dataclass
+class ArticulationSpec:
+    """Joints and bodies of an articulation, which are otherwise only known once its USD file is loaded.
+
+    The names are ordered like in the physics simulation (breadth-first), but the consumers that only count the
+    names matching the expressions of the configurations do not depend on the order.
+    """
+
+    joint_names: list[str]
+    """Names of the joints of the articulation."""
+
+    body_names: list[str]
+    """Names of the bodies of the articulation. The first body is the root body."""
+
+    foot_body_names: list[str] = field(default_factory=list)
+    """Names of the bodies in contact with the ground in the nominal stance. Defaults to an empty list.
+
+    They are only used by the synthetic contact model of the
+    :class:`~ext_template.envs.SurrogateManagerBasedRLEnv`.
+    """
+
+
+def _legged_spec(legs: list[str], joints: list[str], bodies: list[str]) -> ArticulationSpec:
+    """Specification of a legged robot with the same joints and bodies on every leg (the last body is the foot)."""
+    return ArticulationSpec(
+        joint_names=[f"{leg}_{joint}" for joint in joints for leg in legs],
+        body_names=["base"] + [f"{leg}_{body}" for body in bodies for leg in legs],
+        foot_body_names=[f"{leg}_{bodies[-1]}" for leg in legs],
+    )
+
+
+ARTICULATION_SPECS: dict[str, ArticulationSpec] = {
+    "anymal_d.usd": _legged_spec(["LF", "LH", "RF", "RH"], ["HAA", "HFE", "KFE"], ["HIP", "THIGH", "SHANK", "FOOT"]),
+}
+"""Specifications of the articulations of the tasks, keyed by the file name of their USD file."""
+
+
+def find_articulation_spec(
+    asset_cfg: ArticulationCfg, articulations: dict[str, ArticulationSpec] | None = None
+) -> ArticulationSpec:
+    """Find the specification of an articulation from the USD file of its configuration.
+
+    Args:
+        asset_cfg: The configuration of the articulation.
+        articulations: The specifications of the articulations, keyed by the file name of their USD file.
+            Defaults to None, in which case :data:`ARTICULATION_SPECS` is used.
+
+    Returns:
+        The specification of the articulation.
+
+    Raises:
+        ValueError: If the specification of the articulation is unknown.
+    """
+    articulations = ARTICULATION_SPECS if articulations is None else articulations
+    usd_name = os.path.basename(str(getattr(asset_cfg.spawn, "usd_path", "")))
+    if usd_name not in articulations:
+        raise ValueError(f"Unknown specification of the articulation '{asset_cfg.prim_path}' ({usd_name}).")
+    return articulations[usd_name]
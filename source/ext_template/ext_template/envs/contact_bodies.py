@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from isaaclab.managers import SceneEntityCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnvCfg
+    from isaaclab.sensors import ContactSensorCfg
+
+
+def restrict_contact_sensor_bodies(env_cfg: ManagerBasedRLEnvCfg, sensor_name: str = "contact_forces") -> list[str]:
+    """Restrict a contact sensor to the bodies referenced by the terms of an environment configuration.
+
+    The contact sensor tracks all the bodies matching the last token of its prim path. The function collects the
+    body names of the scene entities referencing the sensor in the terms of the observations, rewards, terminations,
+    events and curriculum, and replaces a ``.*`` token by their union. The buffers of the sensor (history of the
+    forces, air and contact times) then only hold the referenced bodies. The terms resolve their body indices by
+    name, so that they are not affected by the smaller set of bodies.
+
+    The sensor is not restricted if a term references all its bodies (without body names), or if its prim path
+    already selects specific bodies. The configuration is modified in-place.
+
+    Args:
+        env_cfg: The configuration of the environment.
+        sensor_name: The name of the contact sensor in the scene. Defaults to "contact_forces".
+
+    Returns:
+        The body name patterns of the restricted sensor, or an empty list if the sensor is not restricted.
+    """
+    sensor_cfg: ContactSensorCfg | None = getattr(env_cfg.scene, sensor_name, None)
+    if sensor_cfg is None:
+        return []
+    prefix, leaf = sensor_cfg.prim_path.rsplit("/", 1)
+    if leaf != ".*":
+        return []
+    # collect the bodies referenced by the terms
+    body_names = []
+    for manager_cfg in (
+        env_cfg.observations,
+        env_cfg.rewards,
+        env_cfg.terminations,
+        env_cfg.events,
+        env_cfg.curriculum,
+    ):
+        for entity_cfg in _scene_entity_cfgs(manager_cfg):
+            if entity_cfg.name != sensor_name:
+                continue
+            if entity_cfg.body_names is None:
+                return []
+            names = [entity_cfg.body_names] if isinstance(entity_cfg.body_names, str) else entity_cfg.body_names
+            body_names += [name for name in names if name not in body_names]
+    if not body_names:
+        return []
+    # note: the tokens of the prim paths are matched as regular expressions
+    sensor_cfg.prim_path = f"{prefix}/({'|'.join(body_names)})"
+    print(f"[INFO] Contact sensor '{sensor_name}' restricted to the bodies: {body_names}")
+    return body_names
+
+
+def contact_sensor_buffer_size(sensor_cfg: ContactSensorCfg, num_bodies: int, num_filters: int = 0) -> int:
+    """Number of bytes of the data buffers of a contact sensor per environment.
+
+    The size accounts for the buffers allocated by the :class:`~isaaclab.sensors.ContactSensor` for its
+    configuration: net forces and their history, poses, air and contact times, and filtered contact forces.
+
+    Args:
+        sensor_cfg: The configuration of the contact sensor.
+        num_bodies: The number of bodies tracked by the sensor.
+        num_filters: The number of filtered bodies. Defaults to 0.
+
+    Returns:
+        The size of the buffers in bytes (the buffers hold 32-bit floats).
+    """
+    # net forces and their history
+    num_values = 3 * num_bodies * (1 + sensor_cfg.history_length)
+    # position and orientation
+    if sensor_cfg.track_pose:
+        num_values += 7 * num_bodies
+    # last and current air and contact times
+    if sensor_cfg.track_air_time:
+        num_values += 4 * num_bodies
+    # contact forces with the filtered bodies and their history
+    if sensor_cfg.filter_prim_paths_expr:
+        num_values += 3 * num_bodies * num_filters * (1 + sensor_cfg.history_length)
+    return 4 * num_values
+
+
+"""
+Helper functions.
+"""
+
+
+def _scene_entity_cfgs(cfg: object) -> Iterator[SceneEntityCfg]:
+    """Iterate over the scene entities in a manager configuration, including in nested terms and parameters."""
+    if isinstance(cfg, SceneEntityCfg):
+        yield cfg
+    elif isinstance(cfg, dict):
+        for value in cfg.values():
+            yield from _scene_entity_cfgs(value)
+    elif isinstance(cfg, (list, tuple)):
+        for value in cfg:
+            yield from _scene_entity_cfgs(value)
+    elif dataclasses.is_dataclass(cfg) and not isinstance(cfg, type):
+        # note: the managers read the terms from the attributes of the configurations
+        for value in vars(cfg).values():
+            yield from _scene_entity_cfgs(value)
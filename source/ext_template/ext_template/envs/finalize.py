@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .contact_bodies import restrict_contact_sensor_bodies
+from .noop_terms import prune_noop_terms
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnvCfg
+
+
+def finalize_env_cfg(env_cfg: ManagerBasedRLEnvCfg) -> list[str]:
+    """Finalize an environment configuration once all its overrides are applied.
+
+    The terms without effect are pruned (see :func:`~ext_template.envs.prune_noop_terms`), unless the
+    ``prune_noop_terms`` attribute of the configuration is False. The contact sensor ``contact_forces`` is then
+    restricted to the bodies referenced by the remaining terms (see
+    :func:`~ext_template.envs.restrict_contact_sensor_bodies`). The configuration is modified in-place.
+
+    Args:
+        env_cfg: The configuration of the environment.
+
+    Returns:
+        The names of the pruned reward terms.
+    """
+    pruned_reward_terms = prune_noop_terms(env_cfg) if getattr(env_cfg, "prune_noop_terms", True) else []
+    restrict_contact_sensor_bodies(env_cfg, "contact_forces")
+    return pruned_reward_terms
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+from isaaclab.envs import ManagerBasedRLEnv, ManagerBasedRLEnvCfg
+from isaaclab.managers import ActionManager, RecorderManager, RewardManager
+
+from ext_template.managers import ExtCommandManager, ExtCurriculumManager, ExtObservationManager, ExtTerminationManager
+
+from .finalize import finalize_env_cfg
+from .metrics import MetricsBuffer
+
+
+class ExtManagerBasedRLEnv(ManagerBasedRLEnv):
+    """Manager-based RL environment with the managers of this extension.
+
+    The environment is configured with a :class:`~isaaclab.envs.ManagerBasedRLEnvCfg` and behaves like the
+    :class:`~isaaclab.envs.ManagerBasedRLEnv`, except for the following managers:
+
+    * :class:`~ext_template.managers.ExtObservationManager`: evaluates the observation terms shared by several
+      groups once per step.
+    * :class:`~ext_template.managers.ExtCommandManager`,
+      :class:`~ext_template.managers.ExtTerminationManager` and
+      :class:`~ext_template.managers.ExtCurriculumManager`: log the metrics of the commands, the numbers of
+      terminations and the states of the curriculum terms without copying them to the host.
+
+    The scalars logged by the managers on reset are accumulated in :attr:`metrics`, a
+    :class:`~ext_template.envs.MetricsBuffer` on the device, in which the terms can also publish their own
+    metrics (for instance, with ``env.metrics.add_values(name, values)``). The runners of
+    :mod:`ext_template.rsl_rl` transfer the buffer to the host once per logging interval, instead of reducing the
+    logged values key by key. The logged values are also kept in ``extras["log"]`` for the other consumers.
+
+    The episodic sums of the reward terms pruned from the configuration (listed in :attr:`pruned_reward_terms`,
+    see :func:`~ext_template.envs.prune_noop_terms`) are logged as zero, like the reward manager logs the terms
+    with zero weight.
+
+    The configuration is finalized with :func:`finalize_env_cfg` before the environment is created, i.e. after the
+    overrides of the command line and of the sweeps are applied to it.
+    """
+
+    def __init__(self, cfg: ManagerBasedRLEnvCfg, render_mode: str | None = None, **kwargs):
+        self.pruned_reward_terms = finalize_env_cfg(cfg)
+        """Names of the reward terms pruned from the configuration."""
+        super().__init__(cfg, render_mode, **kwargs)
+
+    def load_managers(self):
+        # note: this mirrors ManagerBasedRLEnv.load_managers (and ManagerBasedEnv.load_managers). The managers
+        #   are created here since the observation manager resolves its terms in-place in the configuration,
+        #   so it cannot be replaced after being created by the parent classes.
+        # -- metrics (created first, so that the terms can keep a reference to it)
+        self.metrics = MetricsBuffer(self.device)
+        # -- command manager
+        self.command_manager = ExtCommandManager(self.cfg.commands, self)
+        print("[INFO] Command Manager: ", self.command_manager)
+        # -- event manager (we print it here to make the logging consistent)
+        print("[INFO] Event Manager: ", self.event_manager)
+        # -- recorder manager
+        self.recorder_manager = RecorderManager(self.cfg.recorders, self)
+        print("[INFO] Recorder Manager: ", self.recorder_manager)
+        # -- action manager
+        self.action_manager = ActionManager(self.cfg.actions, self)
+        print("[INFO] Action Manager: ", self.action_manager)
+        # -- observation manager
+        self.observation_manager = ExtObservationManager(self.cfg.observations, self)
+        print("[INFO] Observation Manager:", self.observation_manager)
+        # -- termination manager
+        self.termination_manager = ExtTerminationManager(self.cfg.terminations, self)
+        print("[INFO] Termination Manager: ", self.termination_manager)
+        # -- reward manager
+        self.reward_manager = RewardManager(self.cfg.rewards, self)
+        print("[INFO] Reward Manager: ", self.reward_manager)
+        # -- curriculum manager
+        self.curriculum_manager = ExtCurriculumManager(self.cfg.curriculum, self)
+        print("[INFO] Curriculum Manager: ", self.curriculum_manager)
+
+        # setup the action and observation spaces for Gym
+        self._configure_gym_env_spaces()
+
+        # perform events at the start of the simulation
+        if "startup" in self.event_manager.available_modes:
+            self.event_manager.apply(mode="startup")
+
+    def _reset_idx(self, env_ids: Sequence[int]):
+        super()._reset_idx(env_ids)
+        # log the pruned reward terms
+        for name in self.pruned_reward_terms:
+            self.extras["log"]["Episode_Reward/" + name] = 0.0
+        # accumulate the logged scalars on the device
+        self.metrics.add_dict(
+            {
+                key: value
+                for key, value in self.extras["log"].items()
+                if isinstance(value, (int, float)) or (isinstance(value, torch.Tensor) and value.numel() == 1)
+            }
+        )
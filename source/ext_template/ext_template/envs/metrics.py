@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Mapping, Sequence
+
+
+class MetricsBuffer:
+    """Device-side accumulator of the metrics logged by an environment.
+
+    The metrics are accumulated in a single flat tensor on the device, and are only transferred to the host in
+    :meth:`flush`, with a single copy per logging interval. The buffer supports two kinds of metrics:
+
+    * Scalars: the buffer accumulates the sum of the published values and their count, and reports their mean.
+      This is the reduction applied by the RSL-RL runner to the logged episode information.
+    * Histograms: the buffer counts the published values falling in the bins delimited by fixed edges (the values
+      outside the edges are counted in the first and last bins), together with their sum and sum of squares.
+
+    The values are published as tensors (or floats), so that the terms of the environment can log statistics
+    without calling :meth:`torch.Tensor.item`. A metric is registered the first time it is published, which
+    reallocates the accumulator: the set of metrics should therefore be stable after the first episodes.
+
+    The accumulator is always a normal tensor, also when metrics are registered in inference mode (for instance,
+    during the rollouts of a runner), so that it can be updated both inside and outside of inference mode.
+    """
+
+    def __init__(self, device: str = "cpu"):
+        """Initializes the buffer.
+
+        Args:
+            device: The device of the accumulator. Defaults to "cpu".
+        """
+        self.device = device
+        # flat accumulator of all the metrics
+        self._data = torch.zeros(0, device=device)
+        # offsets of the scalars (sum, count) and of the histograms (bin counts, sum, sum of squares)
+        self._scalars: dict[str, int] = {}
+        self._histograms: dict[str, tuple[int, list[float]]] = {}
+        self._histogram_edges: dict[str, torch.Tensor] = {}
+        # indices of the sums and counts of the groups of scalars published by add_dict
+        self._group_indices: dict[tuple[str, ...], torch.Tensor] = {}
+
+    def __str__(self) -> str:
+        return f"<MetricsBuffer> with {len(self._scalars)} scalars and {len(self._histograms)} histograms"
+
+    """
+    Properties.
+    """
+
+    @property
+    def scalar_names(self) -> list[str]:
+        """The names of the registered scalars."""
+        return list(self._scalars)
+
+    @property
+    def histogram_names(self) -> list[str]:
+        """The names of the registered histograms."""
+        return list(self._histograms)
+
+    """
+    Operations.
+    """
+
+    def add(self, name: str, value: torch.Tensor | float, count: torch.Tensor | float = 1.0):
+        """Accumulate a value of a scalar.
+
+        Args:
+            name: The name of the scalar.
+            value: The value to add to the sum of the scalar. Must be a scalar tensor or a float.
+            count: The number of samples summed in the value. Defaults to 1.0.
+        """
+        offset = self._register_scalar(name)
+        self._data[offset] += value
+        self._data[offset + 1] += count
+
+    def add_values(self, name: str, values: torch.Tensor, mask: torch.Tensor | None = None):
+        """Accumulate the elements of a tensor in a scalar, which then reports their mean.
+
+        Args:
+            name: The name of the scalar.
+            values: The values to accumulate.
+            mask: The elements of the values to accumulate. Defaults to None, in which case all the elements
+                are accumulated.
+        """
+        if mask is None:
+            self.add(name, values.sum(), values.numel())
+        else:
+            self.add(name, torch.where(mask, values, 0.0).sum(), mask.sum())
+
+    def add_dict(self, values: Mapping[str, torch.Tensor | float]):
+        """Accumulate a value of several scalars, with a count of one each.
+
+        The values are accumulated with a single indexed addition, which makes the method suitable to publish the
+        logging dictionaries of the managers.
+
+        Args:
+            values: The values of the scalars keyed by their names. The values must be scalar tensors or floats.
+        """
+        if not values:
+            return
+        names = tuple(values)
+        indices = self._group_indices.get(names)
+        if indices is None:
+            offsets = [self._register_scalar(name) for name in names]
+            # note: the sums of the scalars are followed by their counts
+            indices = torch.tensor(offsets + [offset + 1 for offset in offsets], device=self.device)
+            self._group_indices[names] = indices
+        # note: the floats are filled on the device, instead of being copied from the host
+        sums = [
+            (
+                value.float().reshape(())
+                if isinstance(value, torch.Tensor)
+                else torch.full((), float(value), device=self.device)
+            )
+            for value in values.values()
+        ]
+        counts = torch.ones(len(sums), device=self.device)
+        self._data.index_add_(0, indices, torch.cat((torch.stack(sums), counts)))
+
+    def add_histogram(self, name: str, values: torch.Tensor, edges: Sequence[float], mask: torch.Tensor | None = None):
+        """Accumulate the elements of a tensor in a histogram.
+
+        Args:
+            name: The name of the histogram.
+            values: The values to accumulate.
+            edges: The increasing edges of the bins of the histogram. They are only read when the histogram
+                is registered, i.e. the first time that it is published.
+            mask: The elements of the values to accumulate. Defaults to None, in which case all the elements
+                are accumulated.
+        """
+        offset = self._register_histogram(name, edges)
+        edges = self._histogram_edges[name]
+        num_bins = edges.numel() - 1
+        values = values.reshape(-1).float()
+        weights = torch.ones_like(values) if mask is None else mask.reshape(-1).float()
+        # note: the inner edges map the values outside of the edges to the first and last bins
+        bins = torch.bucketize(values, edges[1:-1], right=True)
+        self._data.index_add_(0, bins + offset, weights)
+        weighted_values = weights * values
+        self._data[offset + num_bins] += weighted_values.sum()
+        self._data[offset + num_bins + 1] += (weighted_values * values).sum()
+
+    def flush(self) -> tuple[dict[str, float], dict[str, dict[str, float | list[float]]]]:
+        """Transfer the metrics to the host and reset the buffer.
+
+        The scalars and histograms that were not published since the last flush are not returned.
+
+        Returns:
+            A tuple containing the mean values of the scalars keyed by their names, and the histograms keyed by their
+            names. A histogram is a dictionary with the entries ``edges`` and ``counts`` (the edges and the counts of
+            its bins), and ``num``, ``sum`` and ``sum_squares`` (the number of values and their sums).
+        """
+        # single device to host transfer
+        # note: the copy is explicit since the accumulator is reset in-place on the host too
+        data = self._data.to("cpu", copy=True).tolist()
+        self._data.zero_()
+        scalars = {}
+        for name, offset in self._scalars.items():
+            total, count = data[offset : offset + 2]
+            if count > 0:
+                scalars[name] = total / count
+        histograms = {}
+        for name, (offset, edges) in self._histograms.items():
+            num_bins = len(edges) - 1
+            values = data[offset : offset + num_bins + 2]
+            counts = values[:num_bins]
+            if sum(counts) > 0:
+                histograms[name] = {
+                    "edges": edges,
+                    "counts": counts,
+                    "num": sum(counts),
+                    "sum": values[num_bins],
+                    "sum_squares": values[num_bins + 1],
+                }
+        return scalars, histograms
+
+    def reset(self):
+        """Reset the accumulated metrics, without transferring them to the host."""
+        self._data.zero_()
+
+    """
+    Helper functions.
+    """
+
+    def _register_scalar(self, name: str) -> int:
+        """Return the offset of a scalar in the accumulator, and register it if needed."""
+        offset = self._scalars.get(name)
+        if offset is None:
+            offset = self._grow(2)
+            self._scalars[name] = offset
+        return offset
+
+    def _register_histogram(self, name: str, edges: Sequence[float]) -> int:
+        """Return the offset of a histogram in the accumulator, and register it if needed."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            edges = [float(edge) for edge in edges]
+            if len(edges) < 2 or any(upper <= lower for lower, upper in zip(edges[:-1], edges[1:])):
+                raise ValueError(f"The histogram '{name}' needs at least two increasing edges, received: {edges}.")
+            # bin counts, sum and sum of squares
+            histogram = (self._grow(len(edges) + 1), edges)
+            self._histograms[name] = histogram
+            with torch.inference_mode(False):
+                self._histogram_edges[name] = torch.tensor(edges, device=self.device)
+        return histogram[0]
+
+    def _grow(self, size: int) -> int:
+        """Append entries to the accumulator and return their offset."""
+        offset = self._data.numel()
+        # note: outside of inference mode, the accumulator remains a normal tensor
+        with torch.inference_mode(False):
+            self._data = torch.cat((self._data, torch.zeros(size, device=self.device)))
+        return offset
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import isaaclab.envs.mdp as mdp
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnvCfg
+    from isaaclab.managers import EventTermCfg
+
+
+def prune_noop_terms(env_cfg: ManagerBasedRLEnvCfg) -> list[str]:
+    """Remove the reward and event terms that have no effect from an environment configuration.
+
+    The following terms are pruned:
+
+    * Reward terms with a weight of zero. The reward manager skips their computation, but still fills their values
+      and episodic sums. Their names are returned, so that their episodic sums can be logged as constants.
+    * Events applying external forces and torques with zero ranges, or pushing with zero velocity ranges.
+    * Events randomizing the masses with an identity distribution (adding zero or scaling by one).
+
+    Events randomizing the materials with degenerate ranges (equal bounds) are turned into a single assignment of
+    the constant material at startup.
+
+    The configuration is modified in-place and the pruned terms are printed.
+
+    Args:
+        env_cfg: The configuration of the environment.
+
+    Returns:
+        The names of the pruned reward terms.
+    """
+    pruned_rewards = []
+    for name, term_cfg in _terms(env_cfg.rewards):
+        if term_cfg.weight == 0.0:
+            setattr(env_cfg.rewards, name, None)
+            pruned_rewards.append(name)
+    pruned_events = []
+    for name, term_cfg in _terms(env_cfg.events):
+        if _is_noop_event(term_cfg):
+            setattr(env_cfg.events, name, None)
+            pruned_events.append(name)
+        elif term_cfg.func is mdp.randomize_rigid_body_material and _is_constant_material(term_cfg):
+            # note: the sampled buckets all hold the same material
+            term_cfg.mode = "startup"
+            term_cfg.params["num_buckets"] = 1
+            print(f"[INFO] Event term '{name}' sets a constant material: applied once at startup.")
+    if pruned_rewards:
+        print(f"[INFO] Pruned reward terms with zero weight: {pruned_rewards}")
+    if pruned_events:
+        print(f"[INFO] Pruned event terms without effect: {pruned_events}")
+    return pruned_rewards
+
+
+"""
+Helper functions.
+"""
+
+
+def _terms(cfg: object) -> list[tuple[str, object]]:
+    """Return the name and configuration of the active terms of a manager configuration."""
+    if cfg is None:
+        return []
+    items = cfg.items() if isinstance(cfg, dict) else cfg.__dict__.items()
+    return [(name, term_cfg) for name, term_cfg in items if term_cfg is not None and hasattr(term_cfg, "func")]
+
+
+def _is_noop_event(term_cfg: EventTermCfg) -> bool:
+    """Whether an event term has no effect on the simulation."""
+    params = term_cfg.params
+    if term_cfg.func is mdp.apply_external_force_torque:
+        return _is_zero(params["force_range"]) and _is_zero(params["torque_range"])
+    if term_cfg.func is mdp.push_by_setting_velocity:
+        return all(_is_zero(value_range) for value_range in params["velocity_range"].values())
+    if term_cfg.func is mdp.randomize_rigid_body_mass:
+        low, high = params["mass_distribution_params"]
+        identity = {"add": 0.0, "scale": 1.0}.get(params["operation"])
+        return identity is not None and low == high == identity
+    return False
+
+
+def _is_constant_material(term_cfg: EventTermCfg) -> bool:
+    """Whether a material randomization samples a single material."""
+    ranges = ("static_friction_range", "dynamic_friction_range", "restitution_range")
+    return all(term_cfg.params[name][0] == term_cfg.params[name][1] for name in ranges)
+
+
+def _is_zero(value_range: tuple[float, float]) -> bool:
+    """Whether a sampling range only contains zero."""
+    return value_range[0] == value_range[1] == 0.0
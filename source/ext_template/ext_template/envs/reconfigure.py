@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from isaaclab.managers import ManagerBase, ManagerTermBase, ManagerTermBaseCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+_PARAMETER_TYPES = (bool, int, float, str)
+"""Types of the term parameters that can be changed without creating the environment again."""
+
+
+def find_cfg_changes(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the entries that differ between two configuration dictionaries.
+
+    The dictionaries are obtained with the ``to_dict`` method of the configurations. The nested dictionaries are
+    compared recursively, the other values are compared as a whole (e.g. a list that differs is a single change).
+
+    Args:
+        old: The dictionary of the previous configuration.
+        new: The dictionary of the new configuration.
+
+    Returns:
+        The values of the new configuration keyed by the dotted paths of the entries that differ. A path whose
+        entry is missing from the new configuration maps to None.
+    """
+    changes = {}
+    for key in old.keys() | new.keys():
+        old_value, new_value = old.get(key), new.get(key)
+        if isinstance(old_value, Mapping) and isinstance(new_value, Mapping):
+            for path, value in find_cfg_changes(old_value, new_value).items():
+                changes[f"{key}.{path}"] = value
+        elif old_value != new_value:
+            changes[key] = new_value
+    return changes
+
+
+def reconfigure_env(env: ManagerBasedRLEnv, changes: Mapping[str, Any]) -> bool:
+    """Apply changes of the configuration to an environment, without creating it again.
+
+    The following changes are applied to the managers and to the configuration of the environment:
+
+    * ``seed``: the random generators are seeded again and the events in the ``startup`` mode are applied again,
+      like when the environment is created. The observation terms caching the properties randomized at startup read
+      them again. The change is rejected if the environment has events in the ``prestartup`` mode, which modify the
+      scene before the simulation starts.
+    * ``episode_length_s``: the maximum episode length is computed from the configuration.
+    * ``rewards.<term>.weight``: the weight of a reward term.
+    * ``<group>.<term>.params.<name>``: a parameter of a function term (not a class term, which may have processed
+      its parameters at construction) of the rewards, terminations or events (except those in the ``startup`` and
+      ``prestartup`` modes). Only the parameters holding booleans, numbers, strings or sequences of them can be
+      changed.
+
+    The changes are applied only if they are all supported. Otherwise, the environment is left unchanged and should
+    be created again with the new configuration.
+
+    Args:
+        env: The environment.
+        changes: The changes of the configuration, as returned by :func:`find_cfg_changes`.
+
+    Returns:
+        Whether the changes were applied.
+    """
+    updates = []
+    for path, value in changes.items():
+        update = _resolve_update(env, path.split("."), value)
+        if update is None:
+            return False
+        updates.append(update)
+    for update in updates:
+        update()
+    return True
+
+
+class EnvStateSnapshot:
+    """Snapshot of the state of an environment that persists across resets.
+
+    Resetting an environment does not restore the state that evolves over the episodes: the counter of the steps,
+    the levels of the terrain curriculum, and the buffers of the curriculum and command terms (for instance, the
+    ranges of the commands widened by a curriculum). The snapshot holds the counter and a copy of the tensors of the
+    terrain, of the curriculum class terms and of the command terms, so that they can be restored when an
+    environment is reused for a new training run. The state of the terms must therefore be held in tensors (not in
+    Python numbers), which are updated in-place.
+
+    The snapshot can also be saved with a checkpoint through :meth:`state_dict`, and restored in a new environment
+    with the same configuration through :meth:`load_state_dict`.
+    """
+
+    def __init__(self, env: ManagerBasedRLEnv):
+        """Captures the state of an environment.
+
+        Args:
+            env: The environment.
+        """
+        self.env = env
+        self._common_step_counter = env.common_step_counter
+        owners = [("terrain", getattr(env.scene, "terrain", None))]
+        curriculum_terms = zip(
+            getattr(env.curriculum_manager, "_term_names", []), getattr(env.curriculum_manager, "_term_cfgs", [])
+        )
+        owners += [
+            (f"curriculum.{name}", term_cfg.func)
+            for name, term_cfg in curriculum_terms
+            if isinstance(term_cfg.func, ManagerTermBase)
+        ]
+        owners += [(f"commands.{name}", term) for name, term in getattr(env.command_manager, "_terms", {}).items()]
+        self._tensors: dict[str, tuple[torch.Tensor, torch.Tensor]] = {}
+        for prefix, owner in owners:
+            if owner is None:
+                continue
+            for attribute, value in vars(owner).items():
+                if isinstance(value, torch.Tensor):
+                    self._tensors[f"{prefix}.{attribute}"] = (value, value.clone())
+
+    def restore(self):
+        """Restore the captured state in-place and reset the environments.
+
+        The environments are reset once the state is restored, so that the robots are placed at the restored
+        origins of the terrain. The curriculum is paused during the reset (see
+        :attr:`~ext_template.managers.ExtCurriculumManager.paused`): its terms would otherwise update the restored
+        state from the interrupted episodes, for instance the terrain levels from the distances of the robots to
+        the restored origins. The metrics accumulated by the environment are cleared as well.
+        """
+        self.env.common_step_counter = self._common_step_counter
+        for tensor, value in self._tensors.values():
+            tensor.copy_(value)
+        curriculum_manager = self.env.curriculum_manager
+        curriculum_manager.paused = True
+        try:
+            self.env.reset()
+        finally:
+            curriculum_manager.paused = False
+        metrics = getattr(self.env, "metrics", None)
+        if metrics is not None:
+            metrics.reset()
+
+    def state_dict(self) -> dict[str, Any]:
+        """Return the captured state, with the tensors keyed by their owner and attribute names."""
+        return {
+            "common_step_counter": self._common_step_counter,
+            "tensors": {name: value for name, (_, value) in self._tensors.items()},
+        }
+
+    def load_state_dict(self, state: Mapping[str, Any]):
+        """Replace the captured state, for instance with the state saved in a checkpoint.
+
+        The state is applied to the environment (and the environments are reset) by :meth:`restore`.
+
+        Args:
+            state: The state returned by :meth:`state_dict`.
+
+        Raises:
+            ValueError: If the tensors of the state do not match the tensors of the environment.
+        """
+        tensors = state["tensors"]
+        if tensors.keys() != self._tensors.keys():
+            raise ValueError(
+                "The saved state does not match the environment. Missing tensors:"
+                f" {sorted(self._tensors.keys() - tensors.keys())}, unexpected tensors:"
+                f" {sorted(tensors.keys() - self._tensors.keys())}."
+            )
+        for name, (tensor, _) in self._tensors.items():
+            if tensors[name].shape != tensor.shape:
+                raise ValueError(
+                    f"The saved tensor '{name}' has the shape {tuple(tensors[name].shape)}, expected"
+                    f" {tuple(tensor.shape)}."
+                )
+        self._common_step_counter = state["common_step_counter"]
+        self._tensors = {
+            name: (tensor, tensors[name].to(device=tensor.device, dtype=tensor.dtype))
+            for name, (tensor, _) in self._tensors.items()
+        }
+
+
+"""
+Helper functions.
+"""
+
+
+def _resolve_update(env: ManagerBasedRLEnv, path: list[str], value: Any):
+    """Return the function applying a change of the configuration, or None if the change is not supported."""
+    if path == ["seed"] and value is not None:
+        if "prestartup" in env.event_manager.available_modes:
+            return None
+
+        def update():
+            env.cfg.seed = value
+            env.seed(value)
+            if "startup" in env.event_manager.available_modes:
+                env.event_manager.apply(mode="startup")
+                # the observation terms caching the properties randomized at startup read them again
+                for term_cfgs in env.observation_manager._group_obs_class_term_cfgs.values():
+                    for term_cfg in term_cfgs:
+                        if hasattr(term_cfg.func, "invalidate"):
+                            term_cfg.func.invalidate()
+
+        return update
+    if path == ["episode_length_s"] and isinstance(value, (int, float)):
+        return lambda: setattr(env.cfg, "episode_length_s", value)
+    # changes of the terms
+    managers = {"rewards": env.reward_manager, "terminations": env.termination_manager, "events": env.event_manager}
+    if len(path) < 3 or path[0] not in managers:
+        return None
+    manager = managers[path[0]]
+    term_name = path[1]
+    try:
+        term_cfg = manager.get_term_cfg(term_name)
+    except ValueError:
+        return None
+    if getattr(term_cfg, "mode", None) in ("startup", "prestartup"):
+        return None
+    if path[0] == "rewards" and path[2:] == ["weight"] and isinstance(value, (int, float)):
+        return lambda: _update_term_cfg(manager, term_name, term_cfg, weight=float(value))
+    if path[2] != "params" or len(path) != 4 or isinstance(term_cfg.func, ManagerTermBase):
+        return None
+    parameter = path[3]
+    old_value = term_cfg.params.get(parameter)
+    if not _is_parameter(old_value) or not _is_parameter(value):
+        return None
+    # note: the sequences are lists in the configuration dictionaries
+    if isinstance(old_value, tuple):
+        value = tuple(value)
+    return lambda: _update_term_cfg(manager, term_name, term_cfg, params={**term_cfg.params, parameter: value})
+
+
+def _update_term_cfg(manager: ManagerBase, term_name: str, term_cfg: ManagerTermBaseCfg, **attributes):
+    """Set attributes of the configuration of a term in its manager."""
+    for name, value in attributes.items():
+        setattr(term_cfg, name, value)
+    manager.set_term_cfg(term_name, term_cfg)
+
+
+def _is_parameter(value: Any) -> bool:
+    """Whether a value is a parameter that can be changed without creating the environment again."""
+    if isinstance(value, (list, tuple)):
+        return all(isinstance(element, _PARAMETER_TYPES) for element in value)
+    return isinstance(value, _PARAMETER_TYPES)
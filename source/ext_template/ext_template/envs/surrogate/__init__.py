@@ -0,0 +1,10 @@
+"""Surrogate of the simulated scene, for benchmarks without the simulator.
+
+The :class:`SurrogateManagerBasedRLEnv` runs the managers and terms of a task on a scene whose entities have the
+interfaces and buffer shapes of the simulated ones, but cheap synthetic dynamics.
+"""
+
+from .articulation import SurrogateArticulation, SurrogateArticulationData
+from .scene import SurrogateScene, SurrogateSimulationContext, SurrogateTerrain
+from .sensors import SurrogateContactSensor, SurrogateRayCaster
+from .surrogate_env import SurrogateManagerBasedRLEnv
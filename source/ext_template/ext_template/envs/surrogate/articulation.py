@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable, Sequence
+from types import SimpleNamespace
+
+import isaaclab.utils.math as math_utils
+import isaaclab.utils.string as string_utils
+from isaaclab.assets import Articulation, ArticulationCfg
+
+from ..articulation_spec import ArticulationSpec
+
+
+class SurrogateArticulationData:
+    """Data container of the :class:`SurrogateArticulation`.
+
+    The container holds the buffers of the :class:`~isaaclab.assets.ArticulationData` that are read by the terms of
+    the locomotion tasks, with the same names, shapes and frames. The quantities of the root are derived from its
+    state in the simulation world frame.
+    """
+
+    def __init__(self, num_envs: int, joint_names: list[str], body_names: list[str], device: str):
+        num_joints = len(joint_names)
+        num_bodies = len(body_names)
+        self.joint_names = joint_names
+        self.body_names = body_names
+        # root state: position, quaternion (w, x, y, z), linear and angular velocities in the world frame
+        self.root_state_w = torch.zeros(num_envs, 13, device=device)
+        self.root_state_w[:, 3] = 1.0
+        self.default_root_state = self.root_state_w.clone()
+        # joint state
+        self.joint_pos = torch.zeros(num_envs, num_joints, device=device)
+        self.joint_vel = torch.zeros_like(self.joint_pos)
+        self.joint_acc = torch.zeros_like(self.joint_pos)
+        self.default_joint_pos = torch.zeros_like(self.joint_pos)
+        self.default_joint_vel = torch.zeros_like(self.joint_pos)
+        # joint commands
+        self.joint_pos_target = torch.zeros_like(self.joint_pos)
+        self.joint_vel_target = torch.zeros_like(self.joint_pos)
+        self.joint_effort_target = torch.zeros_like(self.joint_pos)
+        self.computed_torque = torch.zeros_like(self.joint_pos)
+        self.applied_torque = torch.zeros_like(self.joint_pos)
+        # joint properties
+        self.joint_pos_limits = torch.zeros(num_envs, num_joints, 2, device=device)
+        self.soft_joint_pos_limits = torch.zeros_like(self.joint_pos_limits)
+        self.joint_vel_limits = torch.zeros_like(self.joint_pos)
+        self.soft_joint_vel_limits = torch.zeros_like(self.joint_pos)
+        self.joint_effort_limits = torch.zeros_like(self.joint_pos)
+        # body properties
+        # note: like in the articulation data, the default masses and inertias are on the host
+        self.default_mass = torch.zeros(num_envs, num_bodies)
+        self.default_inertia = torch.zeros(num_envs, num_bodies, 9)
+        # constants
+        self.GRAVITY_VEC_W = torch.tensor((0.0, 0.0, -1.0), device=device).repeat(num_envs, 1)
+        self.FORWARD_VEC_B = torch.tensor((1.0, 0.0, 0.0), device=device).repeat(num_envs, 1)
+
+    @property
+    def root_pose_w(self) -> torch.Tensor:
+        """Root pose (position and quaternion) in the world frame. Shape is (num_envs, 7)."""
+        return self.root_state_w[:, :7]
+
+    @property
+    def root_pos_w(self) -> torch.Tensor:
+        """Root position in the world frame. Shape is (num_envs, 3)."""
+        return self.root_state_w[:, :3]
+
+    @property
+    def root_quat_w(self) -> torch.Tensor:
+        """Root orientation (w, x, y, z) in the world frame. Shape is (num_envs, 4)."""
+        return self.root_state_w[:, 3:7]
+
+    @property
+    def root_vel_w(self) -> torch.Tensor:
+        """Root linear and angular velocities in the world frame. Shape is (num_envs, 6)."""
+        return self.root_state_w[:, 7:13]
+
+    @property
+    def root_lin_vel_w(self) -> torch.Tensor:
+        """Root linear velocity in the world frame. Shape is (num_envs, 3)."""
+        return self.root_state_w[:, 7:10]
+
+    @property
+    def root_ang_vel_w(self) -> torch.Tensor:
+        """Root angular velocity in the world frame. Shape is (num_envs, 3)."""
+        return self.root_state_w[:, 10:13]
+
+    @property
+    def root_lin_vel_b(self) -> torch.Tensor:
+        """Root linear velocity in the base frame. Shape is (num_envs, 3)."""
+        return math_utils.quat_apply_inverse(self.root_quat_w, self.root_lin_vel_w)
+
+    @property
+    def root_ang_vel_b(self) -> torch.Tensor:
+        """Root angular velocity in the base frame. Shape is (num_envs, 3)."""
+        return math_utils.quat_apply_inverse(self.root_quat_w, self.root_ang_vel_w)
+
+    @property
+    def projected_gravity_b(self) -> torch.Tensor:
+        """Projection of the gravity direction on the base frame. Shape is (num_envs, 3)."""
+        return math_utils.quat_apply_inverse(self.root_quat_w, self.GRAVITY_VEC_W)
+
+    @property
+    def heading_w(self) -> torch.Tensor:
+        """Yaw heading of the base frame (in radians). Shape is (num_envs,)."""
+        forward_w = math_utils.quat_apply(self.root_quat_w, self.FORWARD_VEC_B)
+        return torch.atan2(forward_w[:, 1], forward_w[:, 0])
+
+
+class _SurrogatePhysxView:
+    """Host-side buffers of the physical properties read and written through the PhysX view of an articulation.
+
+    Every body has a single collision shape.
+    """
+
+    def __init__(self, num_envs: int, body_names: list[str], masses: torch.Tensor, inertias: torch.Tensor):
+        self.count = num_envs
+        self.max_shapes = len(body_names)
+        self.link_paths = [[f"/World/envs/env_{i}/Robot/{name}" for name in body_names] for i in range(1)]
+        self._materials = torch.tensor((1.0, 1.0, 0.0)).repeat(num_envs, self.max_shapes, 1)
+        self._masses = masses.clone()
+        self._inertias = inertias.clone()
+
+    def get_material_properties(self) -> torch.Tensor:
+        return self._materials.clone()
+
+    def set_material_properties(self, data: torch.Tensor, indices: torch.Tensor):
+        self._materials[indices] = data[indices].cpu()
+
+    def get_masses(self) -> torch.Tensor:
+        return self._masses.clone()
+
+    def set_masses(self, data: torch.Tensor, indices: torch.Tensor):
+        self._masses[indices] = data[indices].cpu()
+
+    def get_inertias(self) -> torch.Tensor:
+        return self._inertias.clone()
+
+    def set_inertias(self, data: torch.Tensor, indices: torch.Tensor):
+        self._inertias[indices] = data[indices].cpu()
+
+
+class SurrogateArticulation(Articulation):
+    """Articulation with cheap synthetic dynamics, which does not require the simulator.
+
+    The articulation has the interface of the :class:`~isaaclab.assets.Articulation` used by the managers and the
+    terms of the locomotion tasks (joint and body names, data buffers, writes of the states and of the joint
+    targets, physical properties of the PhysX view). Its joints and bodies are given by an
+    :class:`~ext_template.envs.ArticulationSpec`, since its USD file is not loaded.
+
+    The dynamics are not physical, but depend on the actions like a legged robot would:
+
+    * The joints track their targets with a saturated PD controller and a unit inertia.
+    * The base tracks a planar velocity (forward, lateral and yaw rates) obtained from the joint positions through
+      a fixed random linear map, scaled by the friction and the mass of the base. The roll and pitch rates are
+      excited by a fixed random map of the joint positions and restored towards the upright orientation.
+    * The base keeps its nominal height above the ground.
+    * A foot is in contact with the ground unless its joints move along a fixed random direction, and the other
+      bodies touch the ground when their joints move far along their directions. The base touches the ground when
+      the robot falls over (more than 60 degrees of tilt or below a third of its nominal height).
+
+    The articulation integrates its dynamics when its buffers are updated, i.e. once per physics step.
+    """
+
+    stiffness: float = 80.0
+    """Stiffness of the joint PD controller (in N.m/rad)."""
+
+    damping: float = 2.0
+    """Damping of the joint PD controller (in N.m.s/rad)."""
+
+    max_speed: tuple[float, float, float] = (1.5, 1.0, 2.0)
+    """Maximum forward, lateral (in m/s) and yaw (in rad/s) velocities of the base."""
+
+    velocity_time_constant: float = 0.1
+    """Time constant of the velocity tracking of the base (in s)."""
+
+    tilt_stiffness: float = 40.0
+    """Stiffness of the restoring angular acceleration of the roll and pitch (in 1/s^2)."""
+
+    tilt_damping: float = 8.0
+    """Damping of the roll and pitch rates (in 1/s)."""
+
+    tilt_gain: float = 60.0
+    """Angular acceleration of the roll and pitch per unit of joint displacement (in rad/s^2 per rad)."""
+
+    base_mass: float = 20.0
+    """Default mass of the base (in kg)."""
+
+    link_mass: float = 2.0
+    """Default mass of the other bodies (in kg)."""
+
+    seed: int = 0
+    """Seed of the random maps of the dynamics, which are the same for all the environments."""
+
+    def __init__(
+        self,
+        cfg: ArticulationCfg,
+        spec: ArticulationSpec,
+        num_envs: int,
+        device: str,
+        ground_height: Callable[..., torch.Tensor],
+    ):
+        """Initialize the articulation.
+
+        Args:
+            cfg: The configuration of the articulation.
+            spec: The joints and bodies of the articulation.
+            num_envs: The number of environments.
+            device: The device of the buffers.
+            ground_height: The height of the ground at the given positions of the given environments (see
+                :meth:`~ext_template.envs.surrogate.SurrogateTerrain.height`).
+        """
+        # note: the parent class spawns the asset and waits for the simulation, so it is not initialized
+        self.cfg = cfg.copy()
+        self._device = device
+        self._is_initialized = True
+        self._prim_deletion_callback_id = None
+        self._initialize_handle = None
+        self._invalidate_initialize_handle = None
+        self._debug_vis_handle = None
+        self._ground_height = ground_height
+        self._data = SurrogateArticulationData(num_envs, list(spec.joint_names), list(spec.body_names), device)
+        self._process_cfg()
+        self._root_physx_view = _SurrogatePhysxView(
+            num_envs, self.body_names, self._data.default_mass, self._data.default_inertia
+        )
+        self._physics_sim_view = SimpleNamespace(create_rigid_body_view=lambda path: SimpleNamespace(max_shapes=1))
+        self._init_dynamics(spec)
+
+    """
+    Properties
+    """
+
+    @property
+    def data(self) -> SurrogateArticulationData:
+        return self._data
+
+    @property
+    def num_instances(self) -> int:
+        return self._data.root_state_w.shape[0]
+
+    @property
+    def is_fixed_base(self) -> bool:
+        return False
+
+    @property
+    def num_joints(self) -> int:
+        return len(self._data.joint_names)
+
+    @property
+    def num_fixed_tendons(self) -> int:
+        return 0
+
+    @property
+    def num_bodies(self) -> int:
+        return len(self._data.body_names)
+
+    @property
+    def joint_names(self) -> list[str]:
+        return self._data.joint_names
+
+    @property
+    def fixed_tendon_names(self) -> list[str]:
+        return []
+
+    @property
+    def body_names(self) -> list[str]:
+        return self._data.body_names
+
+    @property
+    def root_physx_view(self) -> _SurrogatePhysxView:
+        return self._root_physx_view
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            env_ids = slice(None)
+        self._data.joint_acc[env_ids] = 0.0
+
+    def write_data_to_sim(self):
+        # note: the joint targets are read when the dynamics are integrated
+        pass
+
+    def update(self, dt: float):
+        self._integrate(dt)
+
+    def find_bodies(self, name_keys: str | Sequence[str], preserve_order: bool = False) -> tuple[list[int], list[str]]:
+        return string_utils.resolve_matching_names(name_keys, self.body_names, preserve_order)
+
+    def find_joints(
+        self, name_keys: str | Sequence[str], joint_subset: list[str] | None = None, preserve_order: bool = False
+    ) -> tuple[list[int], list[str]]:
+        if joint_subset is None:
+            joint_subset = self.joint_names
+        return string_utils.resolve_matching_names(name_keys, joint_subset, preserve_order)
+
+    """
+    Operations - Write to simulation.
+    """
+
+    def write_root_state_to_sim(self, root_state: torch.Tensor, env_ids: Sequence[int] | None = None):
+        self.write_root_pose_to_sim(root_state[:, :7], env_ids=env_ids)
+        self.write_root_velocity_to_sim(root_state[:, 7:], env_ids=env_ids)
+
+    def write_root_pose_to_sim(self, root_pose: torch.Tensor, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            env_ids = slice(None)
+        self._data.root_state_w[env_ids, :7] = root_pose
+
+    def write_root_velocity_to_sim(self, root_velocity: torch.Tensor, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            env_ids = slice(None)
+        self._data.root_state_w[env_ids, 7:] = root_velocity
+
+    def write_joint_state_to_sim(
+        self,
+        position: torch.Tensor,
+        velocity: torch.Tensor,
+        joint_ids: Sequence[int] | slice | None = None,
+        env_ids: Sequence[int] | slice | None = None,
+    ):
+        env_ids, joint_ids = self._resolve_ids(env_ids, joint_ids)
+        self._data.joint_pos[env_ids, joint_ids] = position
+        self._data.joint_vel[env_ids, joint_ids] = velocity
+        self._data.joint_acc[env_ids, joint_ids] = 0.0
+
+    def set_joint_position_target(
+        self, target: torch.Tensor, joint_ids: Sequence[int] | slice | None = None, env_ids: Sequence[int] | None = None
+    ):
+        env_ids, joint_ids = self._resolve_ids(env_ids, joint_ids)
+        self._data.joint_pos_target[env_ids, joint_ids] = target
+
+    def set_joint_velocity_target(
+        self, target: torch.Tensor, joint_ids: Sequence[int] | slice | None = None, env_ids: Sequence[int] | None = None
+    ):
+        env_ids, joint_ids = self._resolve_ids(env_ids, joint_ids)
+        self._data.joint_vel_target[env_ids, joint_ids] = target
+
+    def set_joint_effort_target(
+        self, target: torch.Tensor, joint_ids: Sequence[int] | slice | None = None, env_ids: Sequence[int] | None = None
+    ):
+        env_ids, joint_ids = self._resolve_ids(env_ids, joint_ids)
+        self._data.joint_effort_target[env_ids, joint_ids] = target
+
+    """
+    Synthetic dynamics.
+    """
+
+    def contact_forces(self) -> torch.Tensor:
+        """Net contact forces of the bodies in the world frame. Shape is (num_envs, num_bodies, 3).
+
+        The feet share the weight of the robot, the other bodies in contact with the ground and the base of a fallen
+        robot each take half of the weight.
+        """
+        forces = torch.zeros(self.num_instances, self.num_bodies, 3, device=self.device)
+        weight = 9.81 * (self.base_mass + self.link_mass * (self.num_bodies - 1))
+        # joint motion along the directions of the bodies
+        motion = (self._data.joint_pos - self._data.default_joint_pos) @ self._contact_directions
+        feet_contact = (motion[:, self._foot_ids] < 0.1).float()
+        num_feet_contact = feet_contact.sum(dim=1, keepdim=True).clamp(min=1.0)
+        forces[:, self._foot_ids, 2] = weight * feet_contact / num_feet_contact
+        forces[:, self._other_ids, 2] = 0.5 * weight * (motion[:, self._other_ids] > 1.0).float()
+        forces[:, 0, 2] = 0.5 * weight * self.has_fallen().float()
+        return forces
+
+    def has_fallen(self) -> torch.Tensor:
+        """Whether the robot has fallen over. Shape is (num_envs,)."""
+        tilted = self._data.projected_gravity_b[:, 2] > -0.5
+        height = self._data.root_pos_w[:, 2] - self._ground_height(self._data.root_pos_w[:, None, :2])[:, 0]
+        return tilted | (height < self._nominal_height / 3.0)
+
+    """
+    Helper functions.
+    """
+
+    def _process_cfg(self):
+        """Set the default states and the properties from the configuration."""
+        data = self._data
+        init_state = self.cfg.init_state
+        data.default_root_state[:, :3] = torch.tensor(init_state.pos, device=self.device)
+        data.default_root_state[:, 3:7] = torch.tensor(init_state.rot, device=self.device)
+        data.default_root_state[:, 7:10] = torch.tensor(init_state.lin_vel, device=self.device)
+        data.default_root_state[:, 10:13] = torch.tensor(init_state.ang_vel, device=self.device)
+        data.root_state_w[:] = data.default_root_state
+        indices, _, values = string_utils.resolve_matching_names_values(init_state.joint_pos, self.joint_names)
+        data.default_joint_pos[:, indices] = torch.tensor(values, device=self.device)
+        indices, _, values = string_utils.resolve_matching_names_values(init_state.joint_vel, self.joint_names)
+        data.default_joint_vel[:, indices] = torch.tensor(values, device=self.device)
+        data.joint_pos[:] = data.default_joint_pos
+        data.joint_vel[:] = data.default_joint_vel
+        data.joint_pos_target[:] = data.default_joint_pos
+        # note: the limits of the joints are defined in the USD file, they are a full turn around the default
+        data.joint_pos_limits[..., 0] = data.default_joint_pos - torch.pi
+        data.joint_pos_limits[..., 1] = data.default_joint_pos + torch.pi
+        mean = data.joint_pos_limits.mean(dim=-1)
+        half_range = 0.5 * (data.joint_pos_limits[..., 1] - data.joint_pos_limits[..., 0])
+        factor = self.cfg.soft_joint_pos_limit_factor
+        data.soft_joint_pos_limits[..., 0] = mean - factor * half_range
+        data.soft_joint_pos_limits[..., 1] = mean + factor * half_range
+        # velocity and effort limits of the actuators
+        data.joint_vel_limits[:] = 10.0
+        data.joint_effort_limits[:] = 100.0
+        for actuator_cfg in self.cfg.actuators.values():
+            joint_ids, _ = self.find_joints(actuator_cfg.joint_names_expr)
+            if isinstance(actuator_cfg.velocity_limit, float):
+                data.joint_vel_limits[:, joint_ids] = actuator_cfg.velocity_limit
+            if isinstance(actuator_cfg.effort_limit, float):
+                data.joint_effort_limits[:, joint_ids] = actuator_cfg.effort_limit
+        data.soft_joint_vel_limits[:] = data.joint_vel_limits
+        # masses and inertias
+        data.default_mass[:] = self.link_mass
+        data.default_mass[:, 0] = self.base_mass
+        data.default_inertia[:] = torch.eye(3).flatten() * 0.1 * data.default_mass[..., None]
+
+    def _init_dynamics(self, spec: ArticulationSpec):
+        """Initialize the random maps of the dynamics."""
+        generator = torch.Generator().manual_seed(self.seed)
+        scale = self.num_joints**-0.5
+        self._velocity_map = (torch.randn(self.num_joints, 3, generator=generator) * scale).to(self.device)
+        self._tilt_map = (torch.randn(self.num_joints, 2, generator=generator) * scale).to(self.device)
+        self._contact_directions = (torch.randn(self.num_joints, self.num_bodies, generator=generator) * scale).to(
+            self.device
+        )
+        self._max_speed = torch.tensor(self.max_speed, device=self.device)
+        self._foot_ids = self.find_bodies(spec.foot_body_names, preserve_order=True)[0] if spec.foot_body_names else []
+        self._other_ids = [i for i in range(1, self.num_bodies) if i not in self._foot_ids]
+        self._nominal_height = float(self.cfg.init_state.pos[2])
+
+    def _integrate(self, dt: float):
+        """Integrate the synthetic dynamics over a physics step."""
+        data = self._data
+        # joints: saturated PD control of the targets
+        data.computed_torque[:] = (
+            self.stiffness * (data.joint_pos_target - data.joint_pos)
+            + self.damping * (data.joint_vel_target - data.joint_vel)
+            + data.joint_effort_target
+        )
+        torch.clamp(data.computed_torque, -data.joint_effort_limits, data.joint_effort_limits, out=data.applied_torque)
+        joint_vel = torch.clamp(
+            data.joint_vel + dt * data.applied_torque, -data.joint_vel_limits, data.joint_vel_limits
+        )
+        data.joint_acc[:] = (joint_vel - data.joint_vel) / dt
+        data.joint_vel[:] = joint_vel
+        data.joint_pos.add_(dt * joint_vel)
+        torch.clamp(data.joint_pos, data.joint_pos_limits[..., 0], data.joint_pos_limits[..., 1], out=data.joint_pos)
+        # base: planar velocity from the joint positions, scaled by the friction and the mass of the base
+        masses = self._root_physx_view._masses[:, 0].to(self.device)
+        friction = self._root_physx_view._materials[..., 0].mean(dim=1).to(self.device)
+        rate = (dt / self.velocity_time_constant) * (friction * self.base_mass / masses).clamp(max=1.0)
+        target = self._max_speed * torch.tanh((data.joint_pos - data.default_joint_pos) @ self._velocity_map)
+        lin_vel_b = data.root_lin_vel_b
+        ang_vel_b = data.root_ang_vel_b
+        lin_vel_b[:, :2] += rate[:, None] * (target[:, :2] - lin_vel_b[:, :2])
+        ang_vel_b[:, 2] += rate * (target[:, 2] - ang_vel_b[:, 2])
+        # base: roll and pitch excited by the joint positions and restored towards the upright orientation
+        gravity_b = data.projected_gravity_b
+        restoring = torch.stack((gravity_b[:, 1], -gravity_b[:, 0]), dim=1)
+        ang_vel_b[:, :2] += dt * (
+            self.tilt_gain * (data.joint_pos - data.default_joint_pos) @ self._tilt_map
+            + self.tilt_stiffness * restoring
+            - self.tilt_damping * ang_vel_b[:, :2]
+        )
+        # base: height above the ground
+        ground = self._ground_height(data.root_pos_w[:, None, :2])[:, 0]
+        lin_vel_w = math_utils.quat_apply(data.root_quat_w, lin_vel_b)
+        lin_vel_w[:, 2] = (ground + self._nominal_height - data.root_pos_w[:, 2]) / self.velocity_time_constant
+        ang_vel_w = math_utils.quat_apply(data.root_quat_w, ang_vel_b)
+        # integrate the root state
+        angle = torch.linalg.norm(ang_vel_w, dim=1)
+        axis = ang_vel_w / angle.clamp(min=1.0e-9)[:, None]
+        rotation = math_utils.quat_from_angle_axis(angle * dt, axis)
+        data.root_state_w[:, :3] += dt * lin_vel_w
+        data.root_state_w[:, 3:7] = math_utils.normalize(math_utils.quat_mul(rotation, data.root_quat_w))
+        data.root_state_w[:, 7:10] = lin_vel_w
+        data.root_state_w[:, 10:13] = ang_vel_w
+
+    def _resolve_ids(
+        self, env_ids: Sequence[int] | slice | None, joint_ids: Sequence[int] | slice | None
+    ) -> tuple[Sequence[int] | slice, Sequence[int] | slice]:
+        """Resolve the indices of a write into the joint buffers, like the articulation."""
+        if env_ids is None:
+            env_ids = slice(None)
+        if joint_ids is None:
+            joint_ids = slice(None)
+        # note: the environment indices are broadcast against the joint indices
+        if env_ids != slice(None) and joint_ids != slice(None):
+            env_ids = torch.as_tensor(env_ids, device=self.device)[:, None]
+        return env_ids, joint_ids
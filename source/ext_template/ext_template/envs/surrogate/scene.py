@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import math
+import torch
+from collections.abc import Sequence
+from typing import Any
+
+from isaaclab.assets import ArticulationCfg
+from isaaclab.scene import InteractiveSceneCfg
+from isaaclab.sensors import ContactSensorCfg, RayCasterCfg, SensorBaseCfg
+from isaaclab.sim import SimulationCfg
+from isaaclab.terrains import TerrainImporterCfg
+
+from ..articulation_spec import ArticulationSpec, find_articulation_spec
+from .articulation import SurrogateArticulation
+from .sensors import SurrogateContactSensor, SurrogateRayCaster
+
+
+class SurrogateTerrain:
+    """Terrain with the interface of the :class:`~isaaclab.terrains.TerrainImporter`, without its meshes.
+
+    The origins of the environments are computed like the terrain importer: on a grid for a plane and on the
+    sub-terrains of the generator otherwise, with the same terrain levels and types (and their curriculum). The
+    ground is a flat plane or, with a generator, a sinusoidal height field whose amplitude grows with the terrain
+    level of the environment.
+    """
+
+    max_height: float = 0.2
+    """Amplitude of the height field of the hardest terrain level (in m)."""
+
+    wavelength: float = 1.0
+    """Wavelength of the height field (in m)."""
+
+    def __init__(self, cfg: TerrainImporterCfg, num_envs: int, env_spacing: float, device: str):
+        """Initialize the terrain.
+
+        Args:
+            cfg: The configuration of the terrain.
+            num_envs: The number of environments.
+            env_spacing: The spacing between the environments on a plane (in m).
+            device: The device of the buffers.
+
+        Raises:
+            ValueError: If the terrain type is not supported.
+        """
+        self.cfg = cfg.copy()
+        self.device = device
+        self.terrain_levels = None
+        self.terrain_types = None
+        if cfg.terrain_type == "generator":
+            generator_cfg = cfg.terrain_generator
+            # note: this mirrors the origins of the sub-terrains of the terrain generator
+            rows = torch.arange(generator_cfg.num_rows, device=device)
+            cols = torch.arange(generator_cfg.num_cols, device=device)
+            ii, jj = torch.meshgrid(rows, cols, indexing="ij")
+            self.terrain_origins = torch.zeros(generator_cfg.num_rows, generator_cfg.num_cols, 3, device=device)
+            self.terrain_origins[..., 0] = (ii + 0.5) * generator_cfg.size[0]
+            self.terrain_origins[..., 0] -= generator_cfg.num_rows * generator_cfg.size[0] * 0.5
+            self.terrain_origins[..., 1] = (jj + 0.5) * generator_cfg.size[1]
+            self.terrain_origins[..., 1] -= generator_cfg.num_cols * generator_cfg.size[1] * 0.5
+            self._configure_env_origins(num_envs)
+        elif cfg.terrain_type == "plane":
+            self.terrain_origins = None
+            self.env_origins = self._compute_env_origins_grid(num_envs, env_spacing)
+        else:
+            raise ValueError(f"Unsupported terrain type for the surrogate terrain: '{cfg.terrain_type}'.")
+
+    def update_env_origins(self, env_ids: torch.Tensor, move_up: torch.Tensor, move_down: torch.Tensor):
+        # note: this mirrors TerrainImporter.update_env_origins
+        if self.terrain_origins is None:
+            return
+        self.terrain_levels[env_ids] += 1 * move_up - 1 * move_down
+        self.terrain_levels[env_ids] = torch.where(
+            self.terrain_levels[env_ids] >= self.max_terrain_level,
+            torch.randint_like(self.terrain_levels[env_ids], self.max_terrain_level),
+            torch.clip(self.terrain_levels[env_ids], 0),
+        )
+        self.env_origins[env_ids] = self.terrain_origins[self.terrain_levels[env_ids], self.terrain_types[env_ids]]
+
+    def height(self, pos: torch.Tensor, env_ids: torch.Tensor | None = None) -> torch.Tensor:
+        """Height of the ground at the given positions.
+
+        Args:
+            pos: The positions (x, y) in the world frame. Shape is (len(env_ids), num_points, 2).
+            env_ids: The environment indices of the positions. Defaults to None (all the environments).
+
+        Returns:
+            The heights of the ground. Shape is (len(env_ids), num_points).
+        """
+        if self.terrain_levels is None:
+            return torch.zeros(pos.shape[:-1], device=pos.device)
+        terrain_levels = self.terrain_levels if env_ids is None else self.terrain_levels[env_ids]
+        amplitude = self.max_height * terrain_levels / max(self.max_terrain_level - 1, 1)
+        phase = pos * (2.0 * math.pi / self.wavelength)
+        return amplitude[:, None] * torch.sin(phase[..., 0]) * torch.sin(phase[..., 1])
+
+    """
+    Helper functions.
+    """
+
+    def _configure_env_origins(self, num_envs: int):
+        """Distribute the environments on the sub-terrains like the terrain importer."""
+        num_rows, num_cols = self.terrain_origins.shape[:2]
+        max_init_level = self.cfg.max_init_terrain_level
+        if max_init_level is None:
+            max_init_level = num_rows - 1
+        max_init_level = min(max_init_level, num_rows - 1)
+        self.max_terrain_level = num_rows
+        self.terrain_levels = torch.randint(0, max_init_level + 1, (num_envs,), device=self.device)
+        self.terrain_types = torch.div(
+            torch.arange(num_envs, device=self.device), (num_envs / num_cols), rounding_mode="floor"
+        ).to(torch.long)
+        self.env_origins = self.terrain_origins[self.terrain_levels, self.terrain_types].clone()
+
+    def _compute_env_origins_grid(self, num_envs: int, env_spacing: float) -> torch.Tensor:
+        """Distribute the environments on a grid like the terrain importer."""
+        env_origins = torch.zeros(num_envs, 3, device=self.device)
+        num_rows = math.ceil(num_envs / int(math.sqrt(num_envs)))
+        num_cols = math.ceil(num_envs / num_rows)
+        ii, jj = torch.meshgrid(
+            torch.arange(num_rows, device=self.device), torch.arange(num_cols, device=self.device), indexing="ij"
+        )
+        env_origins[:, 0] = -(ii.flatten()[:num_envs] - (num_rows - 1) / 2) * env_spacing
+        env_origins[:, 1] = (jj.flatten()[:num_envs] - (num_cols - 1) / 2) * env_spacing
+        return env_origins
+
+
+class SurrogateScene:
+    """Scene with the interface of the :class:`~isaaclab.scene.InteractiveScene`, made of surrogate entities.
+
+    The articulations of the scene configuration are :class:`SurrogateArticulation` (with the specifications of
+    their USD files), its contact sensors and ray casters are attached to the articulation of their prim path and
+    its terrain is a :class:`SurrogateTerrain`. The other assets (such as the lights) are not part of the scene.
+    """
+
+    def __init__(
+        self,
+        cfg: InteractiveSceneCfg,
+        device: str,
+        articulations: dict[str, ArticulationSpec] | None = None,
+    ):
+        """Initialize the scene.
+
+        Args:
+            cfg: The configuration of the scene.
+            device: The device of the buffers.
+            articulations: The specifications of the articulations, keyed by the file name of their USD file.
+                Defaults to None, in which case :data:`~ext_template.envs.ARTICULATION_SPECS` is used.
+
+        Raises:
+            ValueError: If the scene has no terrain or an entity is not supported.
+        """
+        self.cfg = cfg
+        self.device = device
+        self._articulations: dict[str, SurrogateArticulation] = {}
+        self._sensors: dict[str, SurrogateContactSensor | SurrogateRayCaster] = {}
+        terrain_cfg = getattr(cfg, "terrain", None)
+        if not isinstance(terrain_cfg, TerrainImporterCfg):
+            raise ValueError("The surrogate scene requires a terrain.")
+        self._terrain = SurrogateTerrain(terrain_cfg, cfg.num_envs, cfg.env_spacing, device)
+        # note: the articulations are created first, since the sensors are attached to them
+        for name, value in cfg.__dict__.items():
+            if isinstance(value, ArticulationCfg):
+                spec = find_articulation_spec(value, articulations)
+                self._articulations[name] = SurrogateArticulation(
+                    value, spec, cfg.num_envs, device, self._terrain.height
+                )
+        for name, value in cfg.__dict__.items():
+            if isinstance(value, ContactSensorCfg):
+                self._sensors[name] = SurrogateContactSensor(value, self._find_articulation(value.prim_path))
+            elif isinstance(value, RayCasterCfg):
+                articulation = self._find_articulation(value.prim_path)
+                self._sensors[name] = SurrogateRayCaster(value, articulation, self._terrain.height)
+            elif isinstance(value, SensorBaseCfg):
+                raise ValueError(f"Unsupported entity for the surrogate scene: '{name}' ({type(value).__name__}).")
+
+    def __str__(self) -> str:
+        msg = f"<class SurrogateScene> object with {self.num_envs} environments:\n"
+        msg += f"\tArticulations : {list(self._articulations.keys())}\n"
+        msg += f"\tSensors       : {list(self._sensors.keys())}"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        return self.cfg.num_envs
+
+    @property
+    def env_origins(self) -> torch.Tensor:
+        return self._terrain.env_origins
+
+    @property
+    def terrain(self) -> SurrogateTerrain:
+        return self._terrain
+
+    @property
+    def articulations(self) -> dict[str, SurrogateArticulation]:
+        return self._articulations
+
+    @property
+    def rigid_objects(self) -> dict:
+        return {}
+
+    @property
+    def sensors(self) -> dict[str, SurrogateContactSensor | SurrogateRayCaster]:
+        return self._sensors
+
+    @property
+    def extras(self) -> dict:
+        return {}
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        for articulation in self._articulations.values():
+            articulation.reset(env_ids)
+        for sensor in self._sensors.values():
+            sensor.reset(env_ids)
+
+    def write_data_to_sim(self):
+        for articulation in self._articulations.values():
+            articulation.write_data_to_sim()
+
+    def update(self, dt: float):
+        for articulation in self._articulations.values():
+            articulation.update(dt)
+        for sensor in self._sensors.values():
+            sensor.update(dt, force_recompute=not self.cfg.lazy_sensor_update)
+
+    def keys(self) -> list[str]:
+        return ["terrain"] + list(self._articulations.keys()) + list(self._sensors.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "terrain":
+            return self._terrain
+        for entities in (self._articulations, self._sensors):
+            if key in entities:
+                return entities[key]
+        raise KeyError(f"Scene entity with key '{key}' not found. Available Entities: '{self.keys()}'")
+
+    """
+    Helper functions.
+    """
+
+    def _find_articulation(self, prim_path: str) -> SurrogateArticulation:
+        """Find the articulation whose bodies are under the given prim path."""
+        for articulation in self._articulations.values():
+            if prim_path.startswith(articulation.cfg.prim_path + "/"):
+                return articulation
+        raise ValueError(f"No articulation of the surrogate scene for the sensor at '{prim_path}'.")
+
+
+class SurrogateSimulationContext:
+    """Simulation context with the interface used by the environment and its managers, which never renders."""
+
+    def __init__(self, cfg: SimulationCfg):
+        self.cfg = cfg
+        self.device = cfg.device
+
+    def is_playing(self) -> bool:
+        return True
+
+    def is_stopped(self) -> bool:
+        return False
+
+    def has_gui(self) -> bool:
+        return False
+
+    def has_rtx_sensors(self) -> bool:
+        return False
+
+    def get_physics_dt(self) -> float:
+        return self.cfg.dt
+
+    def step(self, render: bool = True):
+        pass
+
+    def forward(self):
+        pass
+
+    def render(self, mode: Any = None):
+        pass
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable, Sequence
+
+import isaaclab.utils.math as math_utils
+import isaaclab.utils.string as string_utils
+from isaaclab.sensors import ContactSensorCfg, ContactSensorData, RayCasterCfg, RayCasterData
+
+from .articulation import SurrogateArticulation
+
+
+class SurrogateContactSensor:
+    """Contact sensor of the bodies of a :class:`SurrogateArticulation`.
+
+    The sensor has the interface of the :class:`~isaaclab.sensors.ContactSensor` used by the terms of the
+    locomotion tasks: it reports the net contact forces of the bodies matching the leaf of its prim path (with
+    their history) and tracks their air and contact times. The filtered contact forces and the contact points
+    are not supported.
+    """
+
+    def __init__(self, cfg: ContactSensorCfg, articulation: SurrogateArticulation):
+        """Initialize the sensor.
+
+        Args:
+            cfg: The configuration of the sensor.
+            articulation: The articulation whose bodies are sensed.
+        """
+        self.cfg = cfg.copy()
+        self._articulation = articulation
+        self._body_ids, self._body_names = articulation.find_bodies(cfg.prim_path.rsplit("/", 1)[1])
+        num_envs = articulation.num_instances
+        num_bodies = len(self._body_ids)
+        device = articulation.device
+        self._data = ContactSensorData()
+        self._data.net_forces_w = torch.zeros(num_envs, num_bodies, 3, device=device)
+        self._data.net_forces_w_history = torch.zeros(
+            num_envs, max(cfg.history_length, 1), num_bodies, 3, device=device
+        )
+        if cfg.track_air_time:
+            self._data.last_air_time = torch.zeros(num_envs, num_bodies, device=device)
+            self._data.current_air_time = torch.zeros(num_envs, num_bodies, device=device)
+            self._data.last_contact_time = torch.zeros(num_envs, num_bodies, device=device)
+            self._data.current_contact_time = torch.zeros(num_envs, num_bodies, device=device)
+
+    """
+    Properties
+    """
+
+    @property
+    def data(self) -> ContactSensorData:
+        return self._data
+
+    @property
+    def num_instances(self) -> int:
+        return self._articulation.num_instances
+
+    @property
+    def device(self) -> str:
+        return self._articulation.device
+
+    @property
+    def num_bodies(self) -> int:
+        return len(self._body_ids)
+
+    @property
+    def body_names(self) -> list[str]:
+        return self._body_names
+
+    """
+    Operations
+    """
+
+    def find_bodies(self, name_keys: str | Sequence[str], preserve_order: bool = False) -> tuple[list[int], list[str]]:
+        return string_utils.resolve_matching_names(name_keys, self.body_names, preserve_order)
+
+    def compute_first_contact(self, dt: float, abs_tol: float = 1.0e-8) -> torch.Tensor:
+        if not self.cfg.track_air_time:
+            raise RuntimeError("The contact sensor is not configured to track air time.")
+        currently_in_contact = self._data.current_contact_time > 0.0
+        less_than_dt_in_contact = self._data.current_contact_time < (dt + abs_tol)
+        return currently_in_contact * less_than_dt_in_contact
+
+    def compute_first_air(self, dt: float, abs_tol: float = 1.0e-8) -> torch.Tensor:
+        if not self.cfg.track_air_time:
+            raise RuntimeError("The contact sensor is not configured to track air time.")
+        currently_detached = self._data.current_air_time > 0.0
+        less_than_dt_detached = self._data.current_air_time < (dt + abs_tol)
+        return currently_detached * less_than_dt_detached
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            env_ids = slice(None)
+        self._data.net_forces_w[env_ids] = 0.0
+        self._data.net_forces_w_history[env_ids] = 0.0
+        if self.cfg.track_air_time:
+            self._data.current_air_time[env_ids] = 0.0
+            self._data.last_air_time[env_ids] = 0.0
+            self._data.current_contact_time[env_ids] = 0.0
+            self._data.last_contact_time[env_ids] = 0.0
+
+    def update(self, dt: float, force_recompute: bool = False):
+        # note: this mirrors ContactSensor._update_buffers_impl for all the environments
+        self._data.net_forces_w[:] = self._articulation.contact_forces()[:, self._body_ids]
+        if self.cfg.history_length > 0:
+            self._data.net_forces_w_history[:] = self._data.net_forces_w_history.roll(1, dims=1)
+        self._data.net_forces_w_history[:, 0] = self._data.net_forces_w
+        if self.cfg.track_air_time:
+            is_contact = torch.norm(self._data.net_forces_w, dim=-1) > self.cfg.force_threshold
+            is_first_contact = (self._data.current_air_time > 0) * is_contact
+            is_first_detached = (self._data.current_contact_time > 0) * ~is_contact
+            self._data.last_air_time[:] = torch.where(
+                is_first_contact, self._data.current_air_time + dt, self._data.last_air_time
+            )
+            self._data.current_air_time[:] = torch.where(~is_contact, self._data.current_air_time + dt, 0.0)
+            self._data.last_contact_time[:] = torch.where(
+                is_first_detached, self._data.current_contact_time + dt, self._data.last_contact_time
+            )
+            self._data.current_contact_time[:] = torch.where(is_contact, self._data.current_contact_time + dt, 0.0)
+
+
+class SurrogateRayCaster:
+    """Ray caster attached to the root of a :class:`SurrogateArticulation`, which casts its rays on a height field.
+
+    The sensor has the interface of the :class:`~isaaclab.sensors.RayCaster` used by the terms of the locomotion
+    tasks. The rays are given by the pattern of the configuration and are cast straight down onto the ground: the
+    hits are the heights of the ground below the starting points of the rays. Like the ray caster, the buffers are
+    updated lazily, when the data is read and the update period has elapsed.
+    """
+
+    def __init__(
+        self,
+        cfg: RayCasterCfg,
+        articulation: SurrogateArticulation,
+        ground_height: Callable[..., torch.Tensor],
+    ):
+        """Initialize the sensor.
+
+        Args:
+            cfg: The configuration of the sensor.
+            articulation: The articulation whose root carries the sensor.
+            ground_height: The height of the ground at the given positions of the given environments (see
+                :meth:`~ext_template.envs.surrogate.SurrogateTerrain.height`).
+        """
+        self.cfg = cfg.copy()
+        self._articulation = articulation
+        self._ground_height = ground_height
+        num_envs = articulation.num_instances
+        device = articulation.device
+        self._ray_starts, _ = cfg.pattern_cfg.func(cfg.pattern_cfg, device)
+        self._ray_starts += torch.tensor(cfg.offset.pos, device=device)
+        self._data = RayCasterData()
+        self._data.pos_w = torch.zeros(num_envs, 3, device=device)
+        self._data.quat_w = torch.zeros(num_envs, 4, device=device)
+        self._data.ray_hits_w = torch.zeros(num_envs, self._ray_starts.shape[0], 3, device=device)
+        self._timestamp = torch.zeros(num_envs, device=device)
+        self._timestamp_last_update = torch.zeros(num_envs, device=device)
+        self._is_outdated = torch.ones(num_envs, dtype=torch.bool, device=device)
+
+    """
+    Properties
+    """
+
+    @property
+    def data(self) -> RayCasterData:
+        # update the buffers of the outdated environments
+        if self._is_outdated.all():
+            self._update_buffers_impl(None)
+            self._timestamp_last_update[:] = self._timestamp
+            self._is_outdated[:] = False
+        elif self._is_outdated.any():
+            self._update_buffers_impl(self._is_outdated.nonzero().squeeze(-1))
+            self._timestamp_last_update[self._is_outdated] = self._timestamp[self._is_outdated]
+            self._is_outdated[:] = False
+        return self._data
+
+    @property
+    def num_instances(self) -> int:
+        return self._articulation.num_instances
+
+    @property
+    def device(self) -> str:
+        return self._articulation.device
+
+    @property
+    def num_rays(self) -> int:
+        return self._ray_starts.shape[0]
+
+    """
+    Operations
+    """
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            env_ids = slice(None)
+        self._timestamp[env_ids] = 0.0
+        self._timestamp_last_update[env_ids] = 0.0
+        self._is_outdated[env_ids] = True
+
+    def update(self, dt: float, force_recompute: bool = False):
+        # note: this mirrors SensorBase.update with lazy updates
+        self._timestamp += dt
+        self._is_outdated |= self._timestamp - self._timestamp_last_update + 1.0e-6 >= self.cfg.update_period
+
+    """
+    Helper functions.
+    """
+
+    def _update_buffers_impl(self, env_ids: torch.Tensor | None):
+        """Cast the rays of the given environments (all of them if None) onto the ground.
+
+        Like :meth:`~isaaclab.sensors.RayCaster._update_buffers_impl`, the timestamps of the environments are not
+        updated.
+        """
+        # note: like the ray caster, the pose of the sensor is the pose of the body (the offset only moves the rays)
+        pos_w = self._articulation.data.root_pos_w
+        quat_w = self._articulation.data.root_quat_w
+        if env_ids is None:
+            env_ids = slice(None)
+        else:
+            pos_w, quat_w = pos_w[env_ids], quat_w[env_ids]
+        self._data.pos_w[env_ids] = pos_w
+        self._data.quat_w[env_ids] = quat_w
+        if self.cfg.ray_alignment == "world":
+            ray_starts_w = self._ray_starts.unsqueeze(0).expand(len(pos_w), -1, -1)
+        elif self.cfg.ray_alignment == "yaw":
+            # note: the rotation about the yaw axis is applied on the plane, which is cheaper than with quaternions
+            yaw = math_utils.euler_xyz_from_quat(quat_w)[2]
+            cos_yaw, sin_yaw = torch.cos(yaw).unsqueeze(1), torch.sin(yaw).unsqueeze(1)
+            x, y = self._ray_starts[:, 0], self._ray_starts[:, 1]
+            ray_starts_w = torch.stack(
+                (cos_yaw * x - sin_yaw * y, sin_yaw * x + cos_yaw * y, self._ray_starts[:, 2].expand(len(pos_w), -1)),
+                dim=-1,
+            )
+        elif self.cfg.ray_alignment == "base":
+            quat = quat_w.unsqueeze(1).expand(-1, self.num_rays, -1)
+            ray_starts_w = math_utils.quat_apply(quat, self._ray_starts.expand(len(pos_w), -1, -1))
+        else:
+            raise ValueError(f"Unsupported ray alignment mode: {self.cfg.ray_alignment}.")
+        ray_starts_w = ray_starts_w + pos_w.unsqueeze(1)
+        # cast the rays straight down
+        self._data.ray_hits_w[env_ids, :, :2] = ray_starts_w[..., :2]
+        self._data.ray_hits_w[env_ids, :, 2] = self._ground_height(ray_starts_w[..., :2], env_ids)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import numpy as np
+import os
+import random
+import torch
+
+from isaaclab.envs import ManagerBasedRLEnvCfg
+from isaaclab.managers import EventManager
+
+from ..articulation_spec import ArticulationSpec
+from ..finalize import finalize_env_cfg
+from ..manager_based_rl_env import ExtManagerBasedRLEnv
+from .scene import SurrogateScene, SurrogateSimulationContext
+
+
+class SurrogateManagerBasedRLEnv(ExtManagerBasedRLEnv):
+    """Manager-based RL environment with surrogate entities, which does not require the simulator.
+
+    The environment is configured like the :class:`~ext_template.envs.ExtManagerBasedRLEnv` and runs the same managers and terms,
+    but its scene is a :class:`~ext_template.envs.surrogate.SurrogateScene`: the articulations have cheap
+    synthetic dynamics, the contact sensors and the ray casters are computed from them, and the terrain is a
+    height field. The buffers have the shapes of the simulated scene, so that the environment can be used to
+    profile the managers, the terms and the training loop on any device, for any number of environments.
+
+    The simulator is never launched: its modules are only imported by the modules of Isaac Lab (they can be
+    replaced by placeholders, see ``scripts/rsl_rl/sim_placeholders.py``). The rendering, the debug
+    visualization of the commands and the events of the ``"prestartup"`` mode (which modify the USD stage) are not
+    supported.
+
+    .. note::
+        The dynamics are not physical: the environment is meant for scaling benchmarks, not for learning
+        locomotion policies.
+    """
+
+    def __init__(
+        self,
+        cfg: ManagerBasedRLEnvCfg,
+        render_mode: str | None = None,
+        articulations: dict[str, ArticulationSpec] | None = None,
+        **kwargs,
+    ):
+        """Initialize the environment.
+
+        Args:
+            cfg: The configuration for the environment.
+            render_mode: The render mode for the environment. Only None is supported.
+            articulations: The specifications of the articulations, keyed by the file name of their USD file.
+                Defaults to None, in which case :data:`~ext_template.envs.ARTICULATION_SPECS` is used.
+
+        Raises:
+            ValueError: If the render mode is not None or the events have the ``"prestartup"`` mode.
+        """
+        if render_mode is not None:
+            raise ValueError(f"The surrogate environment cannot be rendered (render mode: '{render_mode}').")
+        self.pruned_reward_terms = finalize_env_cfg(cfg)
+        # note: this mirrors ManagerBasedRLEnv.__init__ and ManagerBasedEnv.__init__ without the simulator
+        # -- counter for curriculum
+        self.common_step_counter = 0
+        # initialize the episode length buffer BEFORE loading the managers to use it in mdp functions.
+        self.episode_length_buf = torch.zeros(cfg.scene.num_envs, device=cfg.sim.device, dtype=torch.long)
+        # check that the config is valid
+        cfg.validate()
+        self.cfg = cfg
+        self._is_closed = False
+        # set the seed for the environment
+        if self.cfg.seed is not None:
+            self.cfg.seed = self.seed(self.cfg.seed)
+        # the debug visualization of the commands requires the simulator
+        for command_cfg in self.cfg.commands.__dict__.values():
+            if hasattr(command_cfg, "debug_vis"):
+                command_cfg.debug_vis = False
+        self.sim = SurrogateSimulationContext(self.cfg.sim)
+        self._sim_step_counter = 0
+        self.extras = {}
+        self.scene = SurrogateScene(self.cfg.scene, self.device, articulations)
+        print("[INFO]: Scene manager: ", self.scene)
+        self.viewport_camera_controller = None
+        # create event manager
+        self.event_manager = EventManager(self.cfg.events, self)
+        if "prestartup" in self.event_manager.available_modes:
+            raise ValueError("The surrogate environment does not support the events of the 'prestartup' mode.")
+        # update scene to pre populate data buffers for assets and sensors
+        self.scene.update(dt=self.physics_dt)
+        self.load_managers()
+        self._window = None
+        self.obs_buf = {}
+        self.render_mode = render_mode
+        self.metadata["render_fps"] = 1 / self.step_dt
+        print("[INFO]: Completed setting up the surrogate environment...")
+
+    @staticmethod
+    def seed(seed: int = -1) -> int:
+        # note: this mirrors isaacsim.core.utils.torch.set_seed, which is not available without the simulator
+        if seed == -1:
+            seed = np.random.randint(0, 10_000)
+        random.seed(seed)
+        np.random.seed(seed)
+        torch.manual_seed(seed)
+        os.environ["PYTHONHASHSEED"] = str(seed)
+        torch.cuda.manual_seed_all(seed)
+        return seed
+
+    def render(self, recompute: bool = False) -> np.ndarray | None:
+        return None
+
+    def close(self):
+        if not self._is_closed:
+            # destructor is order-sensitive
+            del self.command_manager
+            del self.reward_manager
+            del self.termination_manager
+            del self.curriculum_manager
+            del self.action_manager
+            del self.observation_manager
+            del self.event_manager
+            del self.recorder_manager
+            del self.scene
+            self._is_closed = True
@@ -0,0 +1,10 @@
+"""Managers of the environments of this extension.
+
+The managers extend the ones from :mod:`isaaclab.managers` and are created by the environments of
+:mod:`ext_template.envs`.
+"""
+
+from .command_manager import ExtCommandManager
+from .curriculum_manager import ExtCurriculumManager
+from .observation_manager import ExtObservationManager
+from .termination_manager import ExtTerminationManager
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+from isaaclab.managers import CommandManager, CommandTerm
+
+
+class ExtCommandManager(CommandManager):
+    """Command manager that logs the metrics of the terms without copying them to the host.
+
+    The :meth:`~isaaclab.managers.CommandTerm.reset` method of the command terms converts the means of their metrics
+    to floats, which synchronizes the device with the host on every reset. This manager resets the terms itself and
+    logs the means as tensors instead. The terms that override the method are reset by it.
+    """
+
+    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, torch.Tensor]:
+        # resolve environment ids
+        if env_ids is None:
+            env_ids = slice(None)
+        # store information
+        extras = {}
+        for name, term in self._terms.items():
+            if type(term).reset is not CommandTerm.reset:
+                metrics = term.reset(env_ids=env_ids)
+            else:
+                metrics = self._reset_term(term, env_ids)
+            for metric_name, metric_value in metrics.items():
+                extras[f"Metrics/{name}/{metric_name}"] = metric_value
+        # return logged information
+        return extras
+
+    """
+    Helper functions.
+    """
+
+    def _reset_term(self, term: CommandTerm, env_ids: Sequence[int] | slice) -> dict[str, torch.Tensor]:
+        """Reset a command term and return the means of its metrics as tensors.
+
+        Args:
+            term: The command term.
+            env_ids: The environment ids.
+
+        Returns:
+            The means of the metrics of the term over the reset environments.
+        """
+        # note: this mirrors CommandTerm.reset, without converting the metrics to floats
+        metrics = {}
+        for metric_name, metric_value in term.metrics.items():
+            metrics[metric_name] = torch.mean(metric_value[env_ids])
+            metric_value[env_ids] = 0.0
+        # set the command counter to zero and resample the command
+        term.command_counter[env_ids] = 0
+        term._resample(env_ids)
+        return metrics
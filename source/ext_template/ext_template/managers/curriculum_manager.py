@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from isaaclab.managers import CurriculumManager
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+class ExtCurriculumManager(CurriculumManager):
+    """Curriculum manager that logs the states of the terms without copying them to the host.
+
+    The :class:`~isaaclab.managers.CurriculumManager` converts the tensor states of the terms to floats on every
+    reset, which synchronizes the device with the host. This manager logs them as tensors instead, like the reward
+    manager logs the episodic sums: they are only copied when the logger reduces them.
+
+    The terms can also be paused with :attr:`paused`, for instance to reset the environments without updating the
+    curriculum from the interrupted episodes (see :meth:`~ext_template.envs.EnvStateSnapshot.restore`).
+    """
+
+    def __init__(self, cfg: object, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        self.paused = False
+        """Whether :meth:`compute` leaves the terms and their states unchanged. Default is False."""
+
+    def compute(self, env_ids: Sequence[int] | None = None):
+        if self.paused:
+            return
+        super().compute(env_ids=env_ids)
+
+    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, float | torch.Tensor]:
+        extras = {}
+        for term_name, term_state in self._curriculum_state.items():
+            if term_state is None:
+                continue
+            if isinstance(term_state, dict):
+                # each key is a separate state to log
+                for key, value in term_state.items():
+                    extras[f"Curriculum/{term_name}/{key}"] = value
+            else:
+                extras[f"Curriculum/{term_name}"] = term_state
+        # reset all the curriculum terms
+        for term_cfg in self._class_term_cfgs:
+            term_cfg.func.reset(env_ids=env_ids)
+        return extras
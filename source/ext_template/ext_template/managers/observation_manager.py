@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import dataclasses
+import torch
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from isaaclab.managers import ObservationManager, ObservationTermCfg
+from isaaclab.utils import noise
+from isaaclab.utils.buffers import CircularBuffer
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+class ExtObservationManager(ObservationManager):
+    """Observation manager that evaluates the terms shared by several groups once per computation.
+
+    Observation groups often observe the same quantities, for instance a noisy version for the policy and a clean
+    version for the critic. The manager identifies the terms by their function and parameters: during a call of
+    :meth:`compute`, the function of a term is evaluated for the first group that includes it, and the following
+    groups reuse its raw value. Every group then applies its own modifiers, noise, clipping and scaling to a copy
+    of the raw value, so that the observations are the same as with the :class:`ObservationManager`.
+
+    Class terms are identified by their instance, so they are only shared within a group. The keys of the terms
+    are resolved at construction: the parameters of the terms should not be modified in-place afterwards.
+    Calls of :meth:`compute_group` outside of :meth:`compute` evaluate all the terms of the group.
+
+    The raw values are only copied when needed: if the terms of the group are not concatenated, or if the term is
+    clipped, scaled or modified in-place. The terms can therefore return views of their internal buffers, which
+    are copied once by the concatenation of the group.
+
+    For the concatenated groups with additive uniform noise, the post-processing is fused over the terms of the
+    group: the values of the terms are written in the observation vector of the group, and the noise, clipping and
+    scaling are applied to all the columns at once (see :class:`_FusedPostProcessing`). The noise is drawn with a
+    single call per group and step, instead of one per term.
+    """
+
+    def __init__(self, cfg: object, env: ManagerBasedEnv):
+        """Initialize the observation manager.
+
+        Args:
+            cfg: The configuration object or dictionary (``dict[str, ObservationGroupCfg]``).
+            env: The environment instance.
+        """
+        super().__init__(cfg, env)
+        # keys identifying the values of the terms
+        self._group_obs_term_keys: dict[str, list[Hashable]] = {
+            group_name: [_term_key(term_cfg) for term_cfg in term_cfgs]
+            for group_name, term_cfgs in self._group_obs_term_cfgs.items()
+        }
+        # whether the raw values of the terms must be copied before their post-processing
+        self._group_obs_term_copy: dict[str, list[bool]] = {
+            group_name: [_requires_copy(term_cfg, self._group_obs_concatenate[group_name]) for term_cfg in term_cfgs]
+            for group_name, term_cfgs in self._group_obs_term_cfgs.items()
+        }
+        # fused post-processing of the groups (None for the groups processed term by term)
+        self._group_obs_fused_post_processing: dict[str, _FusedPostProcessing | None] = dict()
+        for group_name, term_cfgs in self._group_obs_term_cfgs.items():
+            term_dims = self._group_obs_term_dim[group_name]
+            if _FusedPostProcessing.supports(term_cfgs, term_dims, self._group_obs_concatenate[group_name]):
+                fused = _FusedPostProcessing(term_cfgs, term_dims, self._env.num_envs, self.device)
+            else:
+                fused = None
+            self._group_obs_fused_post_processing[group_name] = fused
+        # raw values of the terms during a call of compute
+        self._term_values: dict[Hashable, torch.Tensor] | None = None
+
+    """
+    Operations.
+    """
+
+    def compute(self, update_history: bool = False) -> dict[str, torch.Tensor | dict[str, torch.Tensor]]:
+        # share the raw values of the terms between the groups
+        self._term_values = dict()
+        try:
+            return super().compute(update_history=update_history)
+        finally:
+            self._term_values = None
+
+    def compute_group(self, group_name: str, update_history: bool = False) -> torch.Tensor | dict[str, torch.Tensor]:
+        # check if group name is valid
+        if group_name not in self._group_obs_term_names:
+            raise ValueError(
+                f"Unable to find the group '{group_name}' in the observation manager."
+                f" Available groups are: {list(self._group_obs_term_names.keys())}"
+            )
+        # apply the post-processing to all the terms at once
+        if self._group_obs_fused_post_processing[group_name] is not None:
+            return self._compute_group_fused(group_name)
+        # iterate over all the terms in each group
+        group_term_names = self._group_obs_term_names[group_name]
+        # buffer to store obs per group
+        group_obs = dict.fromkeys(group_term_names, None)
+        # read attributes for each term
+        obs_terms = zip(
+            group_term_names,
+            self._group_obs_term_cfgs[group_name],
+            self._group_obs_term_keys[group_name],
+            self._group_obs_term_copy[group_name],
+        )
+
+        # evaluate terms: compute, add noise, clip, scale, custom modifiers
+        for term_name, term_cfg, term_key, copy in obs_terms:
+            # compute term's value (or reuse the value computed for another group)
+            obs: torch.Tensor = self._compute_term(term_cfg, term_key)
+            if copy:
+                obs = obs.clone()
+            # apply post-processing
+            if term_cfg.modifiers is not None:
+                for modifier in term_cfg.modifiers:
+                    obs = modifier.func(obs, **modifier.params)
+            if isinstance(term_cfg.noise, noise.NoiseCfg):
+                obs = term_cfg.noise.func(obs, term_cfg.noise)
+            elif isinstance(term_cfg.noise, noise.NoiseModelCfg) and term_cfg.noise.func is not None:
+                obs = term_cfg.noise.func(obs)
+            if term_cfg.clip:
+                obs = obs.clip_(min=term_cfg.clip[0], max=term_cfg.clip[1])
+            if term_cfg.scale is not None:
+                obs = obs.mul_(term_cfg.scale)
+            # Update the history buffer if observation term has history enabled
+            if term_cfg.history_length > 0:
+                circular_buffer = self._group_obs_term_history_buffer[group_name][term_name]
+                if update_history:
+                    circular_buffer.append(obs)
+                elif circular_buffer._buffer is None:
+                    # because circular buffer only exits after the simulation steps,
+                    # this guards history buffer from corruption by external calls before simulation start
+                    circular_buffer = CircularBuffer(
+                        max_len=circular_buffer.max_length,
+                        batch_size=circular_buffer.batch_size,
+                        device=circular_buffer.device,
+                    )
+                    circular_buffer.append(obs)
+
+                if term_cfg.flatten_history_dim:
+                    group_obs[term_name] = circular_buffer.buffer.reshape(self._env.num_envs, -1)
+                else:
+                    group_obs[term_name] = circular_buffer.buffer
+            else:
+                group_obs[term_name] = obs
+
+        # concatenate all observations in the group together
+        if self._group_obs_concatenate[group_name]:
+            # set the concatenate dimension, account for the batch dimension if positive dimension is given
+            return torch.cat(list(group_obs.values()), dim=self._group_obs_concatenate_dim[group_name])
+        else:
+            return group_obs
+
+    """
+    Helper functions.
+    """
+
+    def _compute_group_fused(self, group_name: str) -> torch.Tensor:
+        """Compute the concatenated observations of a group with the fused post-processing."""
+        fused = self._group_obs_fused_post_processing[group_name]
+        group_obs = torch.empty(self._env.num_envs, fused.num_columns, device=self.device)
+        obs_terms = zip(self._group_obs_term_cfgs[group_name], self._group_obs_term_keys[group_name], fused.columns)
+        for term_cfg, term_key, columns in obs_terms:
+            # compute term's value (or reuse the value computed for another group)
+            obs: torch.Tensor = self._compute_term(term_cfg, term_key)
+            # apply the modifiers and the noise that is not fused
+            if term_cfg.modifiers is not None:
+                obs = obs.clone()
+                for modifier in term_cfg.modifiers:
+                    obs = modifier.func(obs, **modifier.params)
+            if isinstance(term_cfg.noise, noise.NoiseCfg) and not _is_fusible_noise(term_cfg.noise):
+                obs = term_cfg.noise.func(obs, term_cfg.noise)
+            elif isinstance(term_cfg.noise, noise.NoiseModelCfg) and term_cfg.noise.func is not None:
+                obs = term_cfg.noise.func(obs)
+            group_obs[:, columns] = obs
+        # add the fused noise, clip and scale
+        return fused(group_obs)
+
+    def _compute_term(self, term_cfg: ObservationTermCfg, term_key: Hashable) -> torch.Tensor:
+        """Compute the raw value of a term, or reuse the value computed for another group.
+
+        The returned tensor must not be modified in-place.
+        """
+        if self._term_values is None:
+            return term_cfg.func(self._env, **term_cfg.params)
+        value = self._term_values.get(term_key)
+        if value is None:
+            value = term_cfg.func(self._env, **term_cfg.params)
+            self._term_values[term_key] = value
+        return value
+
+
+class _FusedPostProcessing:
+    """Noise, clipping and scaling applied at once to the concatenated observations of a group.
+
+    The additive uniform noise of all the terms is drawn with a single call into a reused buffer, and mapped to the
+    noise range of every column. The clipping and scaling are then applied with per-column bounds and scales, which
+    leave the columns of the terms without them unchanged. Every column follows the same distribution as with the
+    noise applied term by term: only the random numbers differ.
+    """
+
+    def __init__(
+        self, term_cfgs: list[ObservationTermCfg], term_dims: list[tuple[int, ...]], num_envs: int, device: str
+    ):
+        self.num_columns = sum(dims[0] for dims in term_dims)
+        # columns of the terms in the observation vector
+        self.columns: list[slice] = []
+        # per-column noise range, clipping bounds and scale
+        self.noise_min = torch.zeros(self.num_columns, device=device)
+        self.noise_range = torch.zeros(self.num_columns, device=device)
+        self.clip_min = torch.full((self.num_columns,), -torch.inf, device=device)
+        self.clip_max = torch.full((self.num_columns,), torch.inf, device=device)
+        self.scale = torch.ones(self.num_columns, device=device)
+        start = 0
+        for term_cfg, dims in zip(term_cfgs, term_dims):
+            columns = slice(start, start + dims[0])
+            start += dims[0]
+            self.columns.append(columns)
+            if _is_fusible_noise(term_cfg.noise):
+                self.noise_min[columns] = term_cfg.noise.n_min
+                self.noise_range[columns] = term_cfg.noise.n_max - term_cfg.noise.n_min
+            if term_cfg.clip:
+                self.clip_min[columns] = term_cfg.clip[0]
+                self.clip_max[columns] = term_cfg.clip[1]
+            if term_cfg.scale is not None:
+                self.scale[columns] = term_cfg.scale
+        self.clip = any(term_cfg.clip for term_cfg in term_cfgs)
+        self.scaled = any(term_cfg.scale is not None for term_cfg in term_cfgs)
+        # reused buffer of the noise
+        self.noise = torch.empty(num_envs, self.num_columns, device=device)
+
+    @staticmethod
+    def supports(term_cfgs: list[ObservationTermCfg], term_dims: list[tuple[int, ...]], concatenate: bool) -> bool:
+        """Whether the post-processing of a group can be fused.
+
+        The terms must be concatenated, flat and without history, and at least one of them must have an additive
+        uniform noise.
+        """
+        if not concatenate or any(len(dims) != 1 for dims in term_dims):
+            return False
+        if any(term_cfg.history_length > 0 for term_cfg in term_cfgs):
+            return False
+        return any(_is_fusible_noise(term_cfg.noise) for term_cfg in term_cfgs)
+
+    def __call__(self, obs: torch.Tensor) -> torch.Tensor:
+        """Apply the noise, clipping and scaling in-place to the observations of the group."""
+        self.noise.uniform_()
+        obs.addcmul_(self.noise, self.noise_range).add_(self.noise_min)
+        if self.clip:
+            obs.clamp_(min=self.clip_min, max=self.clip_max)
+        if self.scaled:
+            obs.mul_(self.scale)
+        return obs
+
+
+def _is_fusible_noise(noise_cfg: noise.NoiseCfg | noise.NoiseModelCfg | None) -> bool:
+    """Whether the noise is an additive uniform noise, which can be fused over the terms of a group."""
+    return (
+        isinstance(noise_cfg, noise.UniformNoiseCfg)
+        and noise_cfg.func is noise.uniform_noise
+        and noise_cfg.operation == "add"
+    )
+
+
+def _term_key(term_cfg: ObservationTermCfg) -> Hashable:
+    """Key identifying the raw value of a term by its function and parameters."""
+    return term_cfg.func, _freeze(term_cfg.params)
+
+
+def _requires_copy(term_cfg: ObservationTermCfg, concatenate: bool) -> bool:
+    """Whether the raw value of a term must be copied before its post-processing.
+
+    The value is shared with the other groups and possibly with the internal buffers of the term: it must be copied
+    if it is returned as is (the terms of the group are not concatenated), or if it is modified in-place. The noise
+    functions return a new tensor, so that the clipping and scaling that follow it are applied to the noisy copy.
+    """
+    if not concatenate or term_cfg.modifiers is not None:
+        return True
+    if isinstance(term_cfg.noise, noise.NoiseModelCfg):
+        # note: noise models may hold state and are not guaranteed to return a new tensor
+        return True
+    in_place = term_cfg.clip is not None or term_cfg.scale is not None
+    return in_place and not isinstance(term_cfg.noise, noise.NoiseCfg)
+
+
+def _freeze(value) -> Hashable:
+    """Convert a parameter into a hashable value that compares equal for equal parameters."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    if isinstance(value, slice):
+        # note: slices are only hashable from Python 3.12
+        return slice, value.start, value.stop, value.step
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # configuration objects, for instance scene entities
+        return type(value), tuple(
+            (field.name, _freeze(getattr(value, field.name))) for field in dataclasses.fields(value)
+        )
+    if isinstance(value, torch.Tensor):
+        return torch.Tensor, id(value)
+    try:
+        hash(value)
+    except TypeError:
+        # unknown objects are only equal to themselves
+        return type(value), id(value)
+    return value
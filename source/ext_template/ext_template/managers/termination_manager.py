@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+from isaaclab.managers import TerminationManager
+
+
+class ExtTerminationManager(TerminationManager):
+    """Termination manager that logs the number of terminations without copying them to the host.
+
+    The :class:`~isaaclab.managers.TerminationManager` converts the number of reset environments terminated by each
+    term to an integer on every reset, which synchronizes the device with the host. This manager logs the numbers as
+    tensors instead.
+    """
+
+    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, torch.Tensor]:
+        # resolve environment ids
+        if env_ids is None:
+            env_ids = slice(None)
+        # add to episode dict
+        extras = {}
+        for key in self._term_dones.keys():
+            extras["Episode_Termination/" + key] = torch.count_nonzero(self._term_dones[key][env_ids])
+        # reset all the termination terms
+        for term_cfg in self._class_term_cfgs:
+            term_cfg.func.reset(env_ids=env_ids)
+        return extras
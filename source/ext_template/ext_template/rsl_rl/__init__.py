@@ -0,0 +1,26 @@
+"""Extensions of the RSL-RL library used to train the agents of this extension.
+
+The configuration classes extend the ones from :mod:`isaaclab_rl.rsl_rl` with options that are specific
+to this extension. The options are read by the :class:`ExtOnPolicyRunner`, which installs the corresponding
+components on top of the RSL-RL runner.
+"""
+
+from .batched import BatchedModule
+from .distillation import DistillationDataset, StudentPolicy, action_error, measure_inference_time, train_student
+from .evaluation import EpisodeMetrics, load_batched_policy
+from .exporter import export_policy_manifest
+from .footprint import TrainingFootprint, estimate_training_footprint
+from .hot_reload import HotReloadFile
+from .multi_policy import GroupVecEnv, MultiPolicyRunner
+from .preemption import (
+    PreemptionHandler,
+    clear_preemption_marker,
+    find_preempted_run,
+    read_preemption_marker,
+    resume_preempted_run,
+)
+from .rl_cfg import ExtRslRlDistillationCfg, ExtRslRlOnPolicyRunnerCfg
+from .rollout import EpisodeStatisticsBuffer, RolloutPipeline
+from .runner import ExtOnPolicyRunner
+from .storage import FastRolloutStorage
+from .telemetry import TelemetrySampler
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import copy
+import torch
+from collections.abc import Sequence
+from torch.func import functional_call, stack_module_state, vmap
+
+
+class BatchedModule:
+    """Batched evaluation of modules that share an architecture but not their parameters.
+
+    The parameters and buffers of the modules are stacked along a leading dimension, and a stateless copy of the
+    first module is mapped over that dimension with :func:`torch.func.vmap`. Evaluating M networks on M batches of
+    inputs is then a single call with batched kernels instead of M calls.
+
+    The stacked parameters are a copy of the parameters of the modules. They need to be refreshed with
+    :meth:`update` after the modules have been modified, for instance after an optimizer step.
+    """
+
+    def __init__(self, modules: Sequence[torch.nn.Module]):
+        """Initializes the batched module.
+
+        Args:
+            modules: The modules to batch. They must have the same architecture.
+        """
+        if len(modules) == 0:
+            raise ValueError("At least one module is required to create a batched module.")
+        self.modules = list(modules)
+        # stateless copy of the architecture
+        self._module = copy.deepcopy(self.modules[0]).to("meta")
+        self.update()
+
+    def __len__(self) -> int:
+        """The number of batched modules."""
+        return len(self.modules)
+
+    def __call__(self, inputs: torch.Tensor, dim: int = 0) -> torch.Tensor:
+        """Evaluate every module on its batch of inputs.
+
+        Args:
+            inputs: The inputs of the modules, stacked along the dimension :attr:`dim`.
+            dim: The dimension of the inputs and outputs that indexes the modules. Defaults to 0.
+
+        Returns:
+            The outputs of the modules, stacked along the dimension :attr:`dim`.
+        """
+        return vmap(self._call, in_dims=(0, 0, dim), out_dims=dim)(self._params, self._buffers, inputs)
+
+    def interleaved(self, inputs: torch.Tensor) -> torch.Tensor:
+        """Evaluate the modules on interleaved inputs: the input ``i`` is evaluated by the module ``i % M``.
+
+        Args:
+            inputs: The inputs, whose number is a multiple of the number of modules M. Shape is (N, ...).
+
+        Returns:
+            The outputs, in the order of the inputs. Shape is (N, ...).
+        """
+        # note: the view puts the input k * M + j at row k and column j, evaluated by the module j
+        return self(inputs.view(-1, len(self), *inputs.shape[1:]), dim=1).flatten(0, 1)
+
+    def update(self):
+        """Stack the current parameters and buffers of the modules."""
+        with torch.no_grad():
+            self._params, self._buffers = stack_module_state(self.modules)
+
+    """
+    Helper functions.
+    """
+
+    def _call(self, params: dict, buffers: dict, inputs: torch.Tensor) -> torch.Tensor:
+        """Evaluate the stateless module with the given parameters and buffers."""
+        return functional_call(self._module, (params, buffers), (inputs,))
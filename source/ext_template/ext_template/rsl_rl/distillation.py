@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import time
+import torch
+import torch.nn as nn
+from collections.abc import Sequence
+
+from rsl_rl.utils import resolve_nn_activation
+
+
+class StudentPolicy(nn.Module):
+    """Deterministic MLP policy distilled from a teacher policy.
+
+    The network is stored under the ``actor`` attribute, so that the student is exported with the policy exporters
+    of Isaac Lab (:func:`~isaaclab_rl.rsl_rl.export_policy_as_onnx`) like the actor of an actor-critic.
+    """
+
+    is_recurrent = False
+
+    def __init__(self, num_obs: int, num_actions: int, hidden_dims: Sequence[int], activation: str = "elu"):
+        """Initializes the student.
+
+        Args:
+            num_obs: The dimension of the observations.
+            num_actions: The dimension of the actions.
+            hidden_dims: The widths of the hidden layers.
+            activation: The name of the activation function of the hidden layers. Defaults to "elu".
+        """
+        super().__init__()
+        self.num_obs = num_obs
+        self.num_actions = num_actions
+        self.hidden_dims = list(hidden_dims)
+        self.activation = activation
+        dims = [num_obs] + self.hidden_dims
+        layers = []
+        for in_dim, out_dim in zip(dims[:-1], dims[1:]):
+            layers += [nn.Linear(in_dim, out_dim), resolve_nn_activation(activation)]
+        layers.append(nn.Linear(dims[-1], num_actions))
+        self.actor = nn.Sequential(*layers)
+
+    def forward(self, observations: torch.Tensor) -> torch.Tensor:
+        return self.actor(observations)
+
+    def act_inference(self, observations: torch.Tensor) -> torch.Tensor:
+        return self.actor(observations)
+
+
+class DistillationDataset:
+    """Ring buffer of observations labelled with the actions of a teacher policy.
+
+    The samples are written into preallocated buffers, so that :meth:`add` does not synchronize the device with the
+    host. Once the buffer is full, the oldest samples are overwritten. The observations are stored before the
+    normalization of the teacher, so that the recorded shards do not depend on the normalizer.
+    """
+
+    def __init__(self, capacity: int, num_obs: int, num_actions: int, device: str = "cpu"):
+        """Initializes the dataset.
+
+        Args:
+            capacity: The maximum number of samples.
+            num_obs: The dimension of the observations.
+            num_actions: The dimension of the actions.
+            device: The device of the buffers. Defaults to "cpu".
+        """
+        self.capacity = capacity
+        self.device = device
+        self.observations = torch.zeros(capacity, num_obs, device=device)
+        self.actions = torch.zeros(capacity, num_actions, device=device)
+        self._size = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, observations: torch.Tensor, actions: torch.Tensor):
+        """Add a batch of labelled samples.
+
+        Args:
+            observations: The observations. Shape is (N, num_obs).
+            actions: The actions of the teacher. Shape is (N, num_actions).
+        """
+        # keep the newest samples of batches larger than the buffer
+        observations, actions = observations[-self.capacity :], actions[-self.capacity :]
+        indices = (self._next + torch.arange(observations.shape[0], device=self.device)) % self.capacity
+        self.observations[indices] = observations.to(self.device)
+        self.actions[indices] = actions.to(self.device)
+        self._next = (self._next + observations.shape[0]) % self.capacity
+        self._size = min(self._size + observations.shape[0], self.capacity)
+
+    def save(self, path: str):
+        """Save the samples into a shard file."""
+        torch.save(
+            {"observations": self.observations[: self._size].cpu(), "actions": self.actions[: self._size].cpu()}, path
+        )
+
+    @classmethod
+    def load(cls, paths: Sequence[str], device: str = "cpu", capacity: int | None = None) -> DistillationDataset:
+        """Load the samples of shard files into a dataset.
+
+        Args:
+            paths: The paths of the shard files.
+            device: The device of the buffers. Defaults to "cpu".
+            capacity: The capacity of the dataset. Defaults to None, in which case it is the number of samples.
+
+        Returns:
+            The dataset with the samples of all the shards.
+        """
+        shards = [torch.load(path, map_location="cpu") for path in paths]
+        if len(shards) == 0:
+            raise ValueError("No shards to load.")
+        num_samples = sum(shard["observations"].shape[0] for shard in shards)
+        num_obs, num_actions = shards[0]["observations"].shape[1], shards[0]["actions"].shape[1]
+        dataset = cls(capacity or num_samples, num_obs, num_actions, device=device)
+        for shard in shards:
+            dataset.add(shard["observations"], shard["actions"])
+        return dataset
+
+
+def train_student(
+    student: nn.Module,
+    dataset: DistillationDataset,
+    num_epochs: int,
+    mini_batch_size: int,
+    learning_rate: float = 1.0e-3,
+    max_grad_norm: float | None = 1.0,
+    validation_fraction: float = 0.1,
+    normalizer: nn.Module | None = None,
+    generator: torch.Generator | None = None,
+) -> dict[str, list[float]]:
+    """Train the student to regress the actions of the teacher on the samples of the dataset.
+
+    A random fraction of the samples is held out to measure the action error of the student. The losses are
+    accumulated on the device and transferred to the host once per epoch.
+
+    Args:
+        student: The student policy. It is trained in-place.
+        dataset: The labelled samples.
+        num_epochs: The number of passes over the training samples.
+        mini_batch_size: The number of samples per gradient step.
+        learning_rate: The learning rate of the Adam optimizer. Defaults to 1e-3.
+        max_grad_norm: The maximum norm of the gradients. Defaults to 1.0. If None, the gradients are not clipped.
+        validation_fraction: The fraction of held-out samples. Defaults to 0.1.
+        normalizer: The observation normalizer of the teacher, applied to the observations before the student.
+            Defaults to None, in which case the observations are not normalized.
+        generator: The random number generator of the split and the shuffling. Defaults to None.
+
+    Returns:
+        The mean training loss (``"train_loss"``) and the held-out action errors (see :func:`action_error`) of
+        every epoch.
+    """
+    device = dataset.device
+    normalizer = normalizer if normalizer is not None else nn.Identity()
+    # split the samples
+    permutation = torch.randperm(len(dataset), generator=generator).to(device)
+    num_validation = int(validation_fraction * len(dataset))
+    validation_indices, train_indices = permutation[:num_validation], permutation[num_validation:]
+    num_train = train_indices.shape[0]
+    if num_train == 0:
+        raise ValueError("The dataset has no training samples.")
+
+    optimizer = torch.optim.Adam(student.parameters(), lr=learning_rate)
+    history = {"train_loss": []}
+    for _ in range(num_epochs):
+        student.train()
+        order = train_indices[torch.randperm(num_train, generator=generator).to(device)]
+        total_loss = torch.zeros((), device=device)
+        for start in range(0, num_train, mini_batch_size):
+            indices = order[start : start + mini_batch_size]
+            with torch.no_grad():
+                observations = normalizer(dataset.observations[indices])
+            loss = (student(observations) - dataset.actions[indices]).pow(2).mean()
+            optimizer.zero_grad()
+            loss.backward()
+            if max_grad_norm is not None:
+                nn.utils.clip_grad_norm_(student.parameters(), max_grad_norm)
+            optimizer.step()
+            total_loss += loss.detach() * indices.shape[0]
+        # single device to host transfer per epoch
+        history["train_loss"].append(total_loss.item() / num_train)
+        if num_validation > 0:
+            errors = action_error(
+                nn.Sequential(normalizer, student),
+                dataset.observations[validation_indices],
+                dataset.actions[validation_indices],
+                batch_size=mini_batch_size,
+            )
+            for name, value in errors.items():
+                history.setdefault(name, []).append(value)
+    student.eval()
+    return history
+
+
+@torch.no_grad()
+def action_error(
+    policy: nn.Module, observations: torch.Tensor, actions: torch.Tensor, batch_size: int = 65536
+) -> dict[str, float]:
+    """Compute the error between the actions of a policy and reference actions.
+
+    Args:
+        policy: The policy mapping the observations to actions.
+        observations: The observations. Shape is (N, num_obs).
+        actions: The reference actions. Shape is (N, num_actions).
+        batch_size: The number of samples per forward pass. Defaults to 65536.
+
+    Returns:
+        The root mean squared error (``"rmse"``), the mean absolute error (``"mae"``) and the maximum absolute
+        error (``"max_error"``) over all the samples and action dimensions.
+    """
+    squared, absolute, maximum = [torch.zeros((), device=actions.device) for _ in range(3)]
+    for start in range(0, observations.shape[0], batch_size):
+        error = policy(observations[start : start + batch_size]) - actions[start : start + batch_size]
+        squared += error.pow(2).sum()
+        absolute += error.abs().sum()
+        maximum = torch.maximum(maximum, error.abs().max())
+    squared, absolute, maximum = torch.stack((squared, absolute, maximum)).tolist()
+    num_values = max(actions.numel(), 1)
+    return {"rmse": (squared / num_values) ** 0.5, "mae": absolute / num_values, "max_error": maximum}
+
+
+@torch.no_grad()
+def measure_inference_time(
+    policy: nn.Module, num_obs: int, batch_size: int, num_repeats: int = 100, device: str = "cpu"
+) -> float:
+    """Measure the median time of a forward pass of a policy (in s).
+
+    Args:
+        policy: The policy to time.
+        num_obs: The dimension of the observations.
+        batch_size: The number of observations per forward pass.
+        num_repeats: The number of timed forward passes. Defaults to 100.
+        device: The device of the observations. Defaults to "cpu".
+    """
+    observations = torch.randn(batch_size, num_obs, device=device)
+    synchronize = torch.cuda.synchronize if torch.device(device).type == "cuda" else lambda: None
+    # warm-up
+    for _ in range(10):
+        policy(observations)
+    timings = []
+    for _ in range(num_repeats):
+        synchronize()
+        start = time.perf_counter()
+        policy(observations)
+        synchronize()
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2]
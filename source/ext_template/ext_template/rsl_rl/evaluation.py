@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import copy
+import torch
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+from .batched import BatchedModule
+
+if TYPE_CHECKING:
+    from rsl_rl.runners import OnPolicyRunner
+
+
+class EpisodeMetrics:
+    """Device-side reduction of episode metrics over groups of environments.
+
+    The metrics are summed per environment over the steps of an episode. When an episode is done, its sums are
+    added to the totals of the group of its environment. Optionally, only the first ``episodes_per_env`` episodes
+    of every environment are counted, so that a fixed episode budget does not favour the groups with short
+    episodes. The episode length (in steps) is always tracked under the name ``"length"``.
+
+    All the updates are tensor operations, so :meth:`add` does not synchronize the device with the host. The
+    totals are transferred to the host with a single copy in :meth:`summary`.
+    """
+
+    def __init__(
+        self,
+        group_ids: torch.Tensor,
+        num_groups: int,
+        names: Sequence[str],
+        episodes_per_env: int | None = None,
+    ):
+        """Initializes the metrics.
+
+        Args:
+            group_ids: The group of every environment. Shape is (num_envs,).
+            num_groups: The number of groups.
+            names: The names of the metrics passed to :meth:`add`.
+            episodes_per_env: The number of counted episodes per environment. Defaults to None,
+                in which case all the episodes are counted.
+        """
+        self.group_ids = group_ids.long()
+        self.num_groups = num_groups
+        self.names = ["length"] + list(names)
+        self.episodes_per_env = episodes_per_env
+        num_envs, device = self.group_ids.shape[0], self.group_ids.device
+        # sums of the current episodes
+        self._current = torch.zeros(num_envs, len(self.names), device=device)
+        # sums over the counted episodes of every group
+        self._totals = torch.zeros(num_groups, len(self.names), device=device)
+        self._num_episodes = torch.zeros(num_groups, device=device)
+        # number of completed episodes of every environment
+        self._env_episodes = torch.zeros(num_envs, dtype=torch.long, device=device)
+
+    def add(self, values: Mapping[str, torch.Tensor], dones: torch.Tensor):
+        """Accumulate the values of a step and commit the episodes that are done.
+
+        Args:
+            values: The per-environment values of the step keyed by the names of the metrics. Shape is (num_envs,).
+                Values that describe the end of an episode (for instance, a termination cause) should be zero on
+                the other steps.
+            dones: The done flags of the environments. Shape is (num_envs,).
+        """
+        dones = dones.view(-1) > 0
+        self._current[:, 0] += 1.0
+        for index, name in enumerate(self.names[1:], start=1):
+            self._current[:, index] += values[name].view(-1)
+        # commit the counted episodes to the totals of their groups
+        counted = dones
+        if self.episodes_per_env is not None:
+            counted = counted & (self._env_episodes < self.episodes_per_env)
+        self._totals.index_add_(0, self.group_ids, self._current * counted.unsqueeze(1))
+        self._num_episodes.index_add_(0, self.group_ids, counted.float())
+        # reset the sums of the completed episodes
+        self._env_episodes += dones
+        self._current *= ~dones.unsqueeze(1)
+
+    def is_complete(self) -> torch.Tensor:
+        """Whether all the environments have completed their episode budget.
+
+        Returns:
+            A boolean tensor on the device. It is always False if no budget is set.
+        """
+        if self.episodes_per_env is None:
+            return torch.zeros((), dtype=torch.bool, device=self._env_episodes.device)
+        return torch.all(self._env_episodes >= self.episodes_per_env)
+
+    def summary(self) -> list[dict[str, float]]:
+        """Transfer the metrics of the counted episodes to the host.
+
+        Returns:
+            For every group, the number of counted episodes (``"episodes"``) and the mean of every metric per episode.
+        """
+        # single device to host transfer
+        data = torch.cat((self._num_episodes.unsqueeze(1), self._totals), dim=1).cpu()
+        summary = []
+        for group_data in data.tolist():
+            num_episodes = group_data[0]
+            means = [total / max(num_episodes, 1.0) for total in group_data[1:]]
+            summary.append({"episodes": int(num_episodes), **dict(zip(self.names, means))})
+        return summary
+
+
+def load_batched_policy(runner: OnPolicyRunner, checkpoints: Sequence[str]) -> BatchedModule:
+    """Load the inference policies of several checkpoints into a batched module.
+
+    The checkpoints are loaded one after the other into the runner, and a copy of the observation normalizer and
+    the actor of every checkpoint is taken. The checkpoints must have been trained with the configuration of the
+    runner.
+
+    Args:
+        runner: The runner used to load the checkpoints. Its policy is overwritten.
+        checkpoints: The paths of the checkpoints.
+
+    Returns:
+        The batched inference policies in the order of the checkpoints. They map the observations to the mean actions.
+    """
+    policies = []
+    for path in checkpoints:
+        runner.load(path, load_optimizer=False)
+        runner.eval_mode()
+        policy = torch.nn.Sequential(runner.obs_normalizer, runner.alg.policy.actor)
+        policies.append(copy.deepcopy(policy).eval())
+    return BatchedModule(policies)
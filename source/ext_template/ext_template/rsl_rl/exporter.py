@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import os
+import torch
+from typing import TYPE_CHECKING
+
+import isaaclab.envs.mdp as mdp
+from isaaclab.envs.mdp.actions.joint_actions import JointAction
+from isaaclab.managers import ObservationTermCfg, SceneEntityCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+MANIFEST_VERSION = 1
+"""Version of the schema of the policy manifest."""
+
+_JOINT_FUNCS = (mdp.joint_pos_rel, mdp.joint_vel_rel)
+"""Observation functions of joint-space terms."""
+
+
+def export_policy_manifest(
+    env: ManagerBasedRLEnv, path: str, filename: str = "policy_manifest.json", group: str = "policy"
+):
+    """Export the observation and action layout of a policy into a JSON manifest.
+
+    The manifest describes how the observation vector of the exported policy is assembled and how its actions are
+    turned into joint targets, so that the policy can be run without Isaac Lab (see the ``ext_template_deploy``
+    package). For every observation term, in the order of the observation group, it records:
+
+    * ``func``: The observation function. The deployment provides the value computed by the function, without the
+      ``offset`` (for instance, the absolute joint positions for :func:`~isaaclab.envs.mdp.joint_pos_rel`).
+    * ``source``: ``"last_action"`` for the terms filled with the previous action, ``"input"`` otherwise.
+    * ``dim`` and ``history_length``: The dimension of the term per step and the number of stacked steps.
+    * ``offset``, ``clip`` and ``scale``: The affine transformation applied to the provided value, in this order.
+    * ``joint_names``: The order of the joints for joint-space terms.
+
+    Terms wrapping a source term (with a ``term`` parameter) are recorded as the source term: the histories of
+    :class:`~ext_template.tasks.locomotion.velocity.mdp.observation_history` with their history length, and the
+    values of :class:`~ext_template.tasks.locomotion.velocity.mdp.held_observation` as if refreshed at every step.
+    Terms without dimension are skipped.
+
+    The observation normalizer is not part of the manifest: the exporters of Isaac Lab include it in the model.
+
+    Args:
+        env: The environment the policy was trained in.
+        path: The path to the saving directory.
+        filename: The name of the manifest file. Defaults to "policy_manifest.json".
+        group: The name of the observation group of the policy. Defaults to "policy".
+    """
+    obs_manager = env.observation_manager
+    if not obs_manager.group_obs_concatenate[group]:
+        raise ValueError(f"The terms of the observation group '{group}' must be concatenated to be exported.")
+    group_cfg = getattr(env.cfg.observations, group)
+
+    # observation terms
+    observations = []
+    for name, dims in zip(obs_manager.active_terms[group], obs_manager.group_obs_term_dim[group]):
+        term_cfg = getattr(group_cfg, name)
+        history_length = max(term_cfg.history_length, 1)
+        # note: the value of a wrapping term is provided as the value of its source term
+        source_cfg = term_cfg.params.get("term")
+        if isinstance(source_cfg, ObservationTermCfg):
+            if term_cfg.history_length > 0:
+                raise ValueError(f"The wrapping term '{name}' cannot have a history length in the manager.")
+            history_length = max(term_cfg.params.get("history_length", 1), 1)
+        else:
+            source_cfg = term_cfg
+        dim = int(torch.Size(dims).numel()) // history_length
+        if dim == 0:
+            continue
+        func = source_cfg.func
+        term = {
+            "name": name,
+            "func": f"{func.__module__}:{getattr(func, '__name__', type(func).__name__)}",
+            "source": "last_action" if func is mdp.last_action else "input",
+            "dim": dim,
+            "history_length": history_length,
+            "offset": None,
+            "clip": list(term_cfg.clip) if term_cfg.clip is not None else None,
+            "scale": _to_json(term_cfg.scale),
+        }
+        # joint-space terms (the default asset of the joint functions is not in the parameters of the term)
+        asset_cfg = source_cfg.params.get("asset_cfg", SceneEntityCfg("robot") if func in _JOINT_FUNCS else None)
+        if asset_cfg is not None and asset_cfg.name in env.scene.articulations:
+            asset = env.scene[asset_cfg.name]
+            joint_ids = asset_cfg.joint_ids
+            if func is mdp.joint_pos_rel:
+                term["joint_names"] = _joint_names(asset.joint_names, joint_ids)
+                term["offset"] = _to_json(asset.data.default_joint_pos[0, joint_ids])
+            elif func is mdp.joint_vel_rel:
+                term["joint_names"] = _joint_names(asset.joint_names, joint_ids)
+                term["offset"] = _to_json(asset.data.default_joint_vel[0, joint_ids])
+        elif func is mdp.height_scan:
+            term["offset"] = float(source_cfg.params.get("offset", 0.5))
+        observations.append(term)
+
+    # action terms
+    actions = []
+    for name in env.action_manager.active_terms:
+        action_term = env.action_manager.get_term(name)
+        action = {"name": name, "type": type(action_term).__name__, "dim": action_term.action_dim}
+        if isinstance(action_term, JointAction):
+            # processed actions: raw * scale + offset (then clipped)
+            # note: the resolved scale and offset of the term are only available as private attributes
+            _, joint_names = action_term._asset.find_joints(
+                action_term.cfg.joint_names, preserve_order=action_term.cfg.preserve_order
+            )
+            action["joint_names"] = joint_names
+            action["scale"] = _to_json(_first_env(action_term._scale))
+            action["offset"] = _to_json(_first_env(action_term._offset))
+            action["clip"] = _to_json(action_term._clip[0]) if action_term.cfg.clip is not None else None
+        actions.append(action)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "group": group,
+        "obs_dim": sum(term["dim"] * term["history_length"] for term in observations),
+        "action_dim": env.action_manager.total_action_dim,
+        "step_dt": env.step_dt,
+        "observations": observations,
+        "actions": actions,
+    }
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, filename), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+"""
+Helper functions.
+"""
+
+
+def _joint_names(names: list[str], joint_ids: slice | list[int]) -> list[str]:
+    """Resolve the names of the joints selected by the joint indices."""
+    if isinstance(joint_ids, slice):
+        return list(names[joint_ids])
+    return [names[index] for index in joint_ids]
+
+
+def _first_env(value: float | torch.Tensor) -> float | torch.Tensor:
+    """Select the value of the first environment of a per-environment tensor (scalars are returned as is)."""
+    return value[0] if isinstance(value, torch.Tensor) else value
+
+
+def _to_json(value):
+    """Convert a scalar, sequence or tensor into a JSON-serializable value."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, torch.Tensor):
+        return value.tolist()
+    return list(value)
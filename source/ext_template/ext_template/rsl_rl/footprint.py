@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import isaaclab.envs.mdp as mdp
+from isaaclab.assets import ArticulationCfg
+from isaaclab.envs.mdp.actions.actions_cfg import JointActionCfg
+from isaaclab.managers import ObservationGroupCfg, ObservationTermCfg, SceneEntityCfg
+from isaaclab.sensors import ContactSensorCfg, RayCasterCfg, patterns
+from isaaclab.utils.string import resolve_matching_names
+
+from ext_template.envs import ArticulationSpec, contact_sensor_buffer_size, finalize_env_cfg, find_articulation_spec
+from ext_template.tasks.locomotion.velocity.mdp import (
+    contact_states,
+    held_observation,
+    observation_history,
+    rigid_body_friction,
+    rigid_body_mass,
+)
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnvCfg
+
+    from .rl_cfg import ExtRslRlOnPolicyRunnerCfg
+
+
+@dataclass
+class TrainingFootprint:
+    """Estimated device memory and compute of a training job.
+
+    The memory is the size of the buffers allocated by the components of the job, in bytes. The compute is the
+    number of floating-point operations of the actor-critic (multiplications and additions of its linear layers).
+    """
+
+    num_envs: int
+    """Number of environments."""
+
+    obs_dims: dict[str, int]
+    """Dimension of every observation group."""
+
+    action_dim: int
+    """Dimension of the actions."""
+
+    memory: dict[str, int] = field(default_factory=dict)
+    """Memory of every component, in bytes."""
+
+    flops: dict[str, float] = field(default_factory=dict)
+    """Floating-point operations of the actor-critic."""
+
+    @property
+    def total_memory(self) -> int:
+        """Memory of all the components, in bytes."""
+        return sum(self.memory.values())
+
+
+def estimate_training_footprint(
+    env_cfg: ManagerBasedRLEnvCfg,
+    agent_cfg: ExtRslRlOnPolicyRunnerCfg,
+    articulations: dict[str, ArticulationSpec] | None = None,
+) -> TrainingFootprint:
+    """Estimate the device memory and compute of training an agent on an environment from their configurations.
+
+    The estimate is computed analytically from the resolved configurations, without creating the environment
+    or the agent. It covers:
+
+    * the observation buffers of the groups (with the history buffers of their terms),
+    * the buffers of the contact sensors and of the ray-caster sensors,
+    * the rollout storage of the runner and the buffers of its update (shuffled buffers of the
+      :class:`~ext_template.rsl_rl.FastRolloutStorage` or mini-batches of the original storage),
+    * the parameters of the actor-critic, their gradients and the state of the Adam optimizer,
+    * the activations of the actor-critic kept for the backward pass of a mini-batch.
+
+    The buffers of the physics simulation, of the assets and of the CUDA context are not included. The estimate is
+    computed on a copy of the configuration, finalized like the environment does on creation (see
+    :func:`~ext_template.envs.finalize_env_cfg`).
+
+    The floating-point operations are reported for a forward pass of the actor and of the critic per environment,
+    for the collection of a step over all the environments, for the update of an iteration (forward and backward
+    passes over all the epochs, with the backward pass counted as twice the forward pass), and per environment step
+    (collection and update of an iteration divided by the number of collected transitions).
+
+    Args:
+        env_cfg: The configuration of the environment.
+        agent_cfg: The configuration of the runner.
+        articulations: The specifications of the articulations, keyed by the file name of their USD file.
+            Defaults to None, in which case :data:`~ext_template.envs.ARTICULATION_SPECS` is used.
+
+    Returns:
+        The estimated footprint.
+
+    Raises:
+        ValueError: If the specification of an articulation or the dimension of a term is unknown, or if the
+            actor-critic is not a feed-forward actor-critic.
+    """
+    env_cfg = env_cfg.copy()
+    finalize_env_cfg(env_cfg)
+    resolver = _DimensionResolver(env_cfg, articulations)
+    num_envs = env_cfg.scene.num_envs
+    num_steps = agent_cfg.num_steps_per_env
+
+    # observations
+    obs_dims = dict()
+    obs_values = 0
+    for group_name, group_cfg in vars(env_cfg.observations).items():
+        if not isinstance(group_cfg, ObservationGroupCfg):
+            continue
+        group_dim = 0
+        for term_cfg in vars(group_cfg).values():
+            if not isinstance(term_cfg, ObservationTermCfg):
+                continue
+            dim = resolver.obs_term_dim(term_cfg)
+            # note: the history length of the group overrides the ones of its terms
+            history_length = term_cfg.history_length if group_cfg.history_length is None else group_cfg.history_length
+            if history_length > 0:
+                obs_values += history_length * dim
+                dim *= history_length
+            elif term_cfg.func is observation_history:
+                # note: the ring buffer holds twice the history
+                obs_values += 2 * dim
+            elif term_cfg.func is held_observation:
+                obs_values += dim
+            group_dim += dim
+        obs_dims[group_name] = group_dim
+        obs_values += group_dim
+    action_dim = resolver.action_dim()
+    footprint = TrainingFootprint(num_envs=num_envs, obs_dims=obs_dims, action_dim=action_dim)
+    footprint.memory["observations"] = 4 * num_envs * obs_values
+
+    # sensors
+    contact_size = 0
+    ray_caster_size = 0
+    for sensor_cfg in vars(env_cfg.scene).values():
+        if isinstance(sensor_cfg, ContactSensorCfg):
+            num_bodies = len(resolver.sensor_bodies(sensor_cfg))
+            num_filters = len(sensor_cfg.filter_prim_paths_expr)
+            contact_size += contact_sensor_buffer_size(sensor_cfg, num_bodies, num_filters)
+        elif isinstance(sensor_cfg, RayCasterCfg):
+            num_rays = _num_rays(sensor_cfg.pattern_cfg)
+            # ray starts, ray directions and hit positions, and the drifts and pose of the sensor
+            ray_caster_size += 4 * (9 * num_rays + 13)
+    footprint.memory["contact_sensors"] = num_envs * contact_size
+    footprint.memory["ray_casters"] = num_envs * ray_caster_size
+
+    # rollout storage
+    # note: the runner stores the critic observations as privileged observations, even without a critic group
+    num_obs = obs_dims["policy"]
+    num_critic_obs = obs_dims.get("critic", num_obs)
+    num_transitions = num_steps * num_envs
+    # observations, actions, means and standard deviations, rewards, values, log-probabilities, returns, advantages
+    transition_values = num_obs + num_critic_obs + 3 * action_dim + 5
+    footprint.memory["rollout_storage"] = num_transitions * (4 * transition_values + 1)
+    num_mini_batches = agent_cfg.algorithm.num_mini_batches
+    if getattr(agent_cfg, "fast_storage", False):
+        # shuffled copy of the rollout (without the rewards) and buffers of the advantage scan
+        footprint.memory["update_buffers"] = 4 * num_transitions * (transition_values - 1 + 4)
+    else:
+        # note: the original storage gathers every mini-batch (without the rewards)
+        footprint.memory["update_buffers"] = 4 * num_transitions * (transition_values - 1) // num_mini_batches
+
+    # actor-critic
+    policy_cfg = agent_cfg.policy
+    if policy_cfg.class_name != "ActorCritic":
+        raise ValueError(f"Only feed-forward actor-critics are supported, got '{policy_cfg.class_name}'.")
+    actor_dims = [num_obs] + list(policy_cfg.actor_hidden_dims) + [action_dim]
+    critic_dims = [num_critic_obs] + list(policy_cfg.critic_hidden_dims) + [1]
+    num_params = _mlp_num_params(actor_dims) + _mlp_num_params(critic_dims) + action_dim
+    # note: the independent policies of the multi-policy runner share the environments
+    num_params *= getattr(agent_cfg, "num_policies", 1)
+    footprint.memory["parameters"] = 4 * num_params
+    # gradients, and first and second moments of the Adam optimizer
+    footprint.memory["optimizer"] = 3 * 4 * num_params
+    # inputs and outputs of the activations of the hidden layers
+    mini_batch_size = num_transitions // num_mini_batches
+    num_activations = sum(actor_dims[1:-1]) + sum(critic_dims[1:-1])
+    footprint.memory["activations"] = 4 * mini_batch_size * 2 * num_activations
+
+    actor_flops = _mlp_flops(actor_dims)
+    critic_flops = _mlp_flops(critic_dims)
+    num_epochs = agent_cfg.algorithm.num_learning_epochs
+    footprint.flops["actor_forward_per_env"] = actor_flops
+    footprint.flops["critic_forward_per_env"] = critic_flops
+    footprint.flops["collection_per_step"] = num_envs * (actor_flops + critic_flops)
+    footprint.flops["update_per_iteration"] = 3.0 * num_epochs * num_transitions * (actor_flops + critic_flops)
+    footprint.flops["per_env_step"] = (
+        num_steps * footprint.flops["collection_per_step"] + footprint.flops["update_per_iteration"]
+    ) / num_transitions
+    return footprint
+
+
+"""
+Helper functions.
+"""
+
+
+class _DimensionResolver:
+    """Resolve the dimensions of the terms of an environment configuration from the articulation specifications."""
+
+    _OBS_DIMS = {
+        mdp.base_pos_z: 1,
+        mdp.base_lin_vel: 3,
+        mdp.base_ang_vel: 3,
+        mdp.projected_gravity: 3,
+        mdp.root_pos_w: 3,
+        mdp.root_quat_w: 4,
+        mdp.root_lin_vel_w: 3,
+        mdp.root_ang_vel_w: 3,
+        mdp.current_time_s: 1,
+        mdp.remaining_time_s: 1,
+        rigid_body_friction: 2,
+    }
+    """Dimensions of the observation terms that do not depend on their parameters."""
+
+    _JOINT_OBS = (
+        mdp.joint_pos,
+        mdp.joint_pos_rel,
+        mdp.joint_pos_limit_normalized,
+        mdp.joint_vel,
+        mdp.joint_vel_rel,
+        mdp.joint_effort,
+    )
+    """Observation terms with one value per selected joint."""
+
+    _COMMAND_DIMS = {
+        mdp.NullCommandCfg: 0,
+        mdp.UniformVelocityCommandCfg: 3,
+        mdp.UniformPoseCommandCfg: 7,
+        mdp.UniformPose2dCommandCfg: 4,
+    }
+    """Dimensions of the commands (the subclasses have the dimension of their base class)."""
+
+    def __init__(self, env_cfg: ManagerBasedRLEnvCfg, articulations: dict[str, ArticulationSpec] | None):
+        self.env_cfg = env_cfg
+        self.articulations = articulations
+
+    def obs_term_dim(self, term_cfg: ObservationTermCfg) -> int:
+        """Dimension of an observation term, without its history."""
+        func, params = term_cfg.func, term_cfg.params
+        if func in self._OBS_DIMS:
+            return self._OBS_DIMS[func]
+        if func in self._JOINT_OBS:
+            return len(self.joints(params.get("asset_cfg", SceneEntityCfg("robot"))))
+        if func is rigid_body_mass:
+            return len(self.bodies(params.get("asset_cfg", SceneEntityCfg("robot"))))
+        if func is contact_states:
+            sensor_cfg = params["sensor_cfg"]
+            sensor_bodies = self.sensor_bodies(getattr(self.env_cfg.scene, sensor_cfg.name))
+            return len(_match(sensor_cfg.body_names, sensor_bodies))
+        if func is mdp.height_scan:
+            return _num_rays(getattr(self.env_cfg.scene, params["sensor_cfg"].name).pattern_cfg)
+        if func is mdp.last_action:
+            return self.action_dim(params.get("action_name"))
+        if func is mdp.generated_commands:
+            return self.command_dim(params["command_name"])
+        if func is observation_history:
+            return params["history_length"] * self.obs_term_dim(params["term"])
+        if func is held_observation:
+            return self.obs_term_dim(params["term"])
+        raise ValueError(f"Unknown dimension of the observation term with function '{func.__name__}'.")
+
+    def action_dim(self, action_name: str | None = None) -> int:
+        """Dimension of an action term, or of all the action terms if the name is None."""
+        dim = 0
+        for name, term_cfg in vars(self.env_cfg.actions).items():
+            if term_cfg is None or (action_name is not None and name != action_name):
+                continue
+            if not isinstance(term_cfg, JointActionCfg):
+                raise ValueError(f"Unknown dimension of the action term '{name}' ({type(term_cfg).__name__}).")
+            dim += len(self.joints(SceneEntityCfg(term_cfg.asset_name, joint_names=term_cfg.joint_names)))
+        return dim
+
+    def command_dim(self, command_name: str) -> int:
+        """Dimension of a command term."""
+        command_cfg = getattr(self.env_cfg.commands, command_name)
+        for cfg_type, dim in self._COMMAND_DIMS.items():
+            if isinstance(command_cfg, cfg_type):
+                return dim
+        raise ValueError(f"Unknown dimension of the command '{command_name}' ({type(command_cfg).__name__}).")
+
+    def joints(self, asset_cfg: SceneEntityCfg) -> list[str]:
+        """Names of the joints selected by a scene entity."""
+        return _match(asset_cfg.joint_names, self.spec(asset_cfg.name).joint_names)
+
+    def bodies(self, asset_cfg: SceneEntityCfg) -> list[str]:
+        """Names of the bodies selected by a scene entity."""
+        return _match(asset_cfg.body_names, self.spec(asset_cfg.name).body_names)
+
+    def sensor_bodies(self, sensor_cfg: ContactSensorCfg) -> list[str]:
+        """Names of the bodies tracked by a contact sensor."""
+        prefix, leaf = sensor_cfg.prim_path.rsplit("/", 1)
+        for name, asset_cfg in vars(self.env_cfg.scene).items():
+            if isinstance(asset_cfg, ArticulationCfg) and asset_cfg.prim_path == prefix:
+                return _match(leaf, self.spec(name).body_names)
+        raise ValueError(f"No articulation in the scene has the bodies of the contact sensor '{sensor_cfg.prim_path}'.")
+
+    def spec(self, asset_name: str) -> ArticulationSpec:
+        """Specification of an articulation of the scene."""
+        return find_articulation_spec(getattr(self.env_cfg.scene, asset_name), self.articulations)
+
+
+def _match(keys: str | list[str] | None, names: list[str]) -> list[str]:
+    """Names matching the regular expressions, or all the names if the expressions are None."""
+    if keys is None or isinstance(keys, slice):
+        return names
+    return resolve_matching_names(keys, names)[1]
+
+
+def _num_rays(pattern_cfg: patterns.PatternBaseCfg) -> int:
+    """Number of rays of a ray-caster pattern."""
+    if isinstance(pattern_cfg, patterns.GridPatternCfg):
+        # note: the grid is computed with the same bounds as the pattern function
+        num_x = math.ceil((pattern_cfg.size[0] + 1.0e-9) / pattern_cfg.resolution)
+        num_y = math.ceil((pattern_cfg.size[1] + 1.0e-9) / pattern_cfg.resolution)
+        return num_x * num_y
+    if isinstance(pattern_cfg, patterns.PinholeCameraPatternCfg):
+        return pattern_cfg.width * pattern_cfg.height
+    raise ValueError(f"Unknown number of rays of the pattern '{type(pattern_cfg).__name__}'.")
+
+
+def _mlp_num_params(dims: list[int]) -> int:
+    """Number of parameters of a multi-layer perceptron with the given layer widths."""
+    return sum((dim_in + 1) * dim_out for dim_in, dim_out in zip(dims[:-1], dims[1:]))
+
+
+def _mlp_flops(dims: list[int]) -> float:
+    """Floating-point operations of a forward pass of a multi-layer perceptron for a single input."""
+    return float(sum(2 * dim_in * dim_out for dim_in, dim_out in zip(dims[:-1], dims[1:])))
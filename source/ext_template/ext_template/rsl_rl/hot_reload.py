@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import yaml
+from typing import Any
+
+
+class HotReloadFile:
+    """Override file of a training run, polled for changes between the training iterations.
+
+    The file is a YAML mapping with the following optional entries:
+
+    .. code-block:: yaml
+
+        learning_rate: 1.0e-3
+        entropy_coef: 0.005
+        rewards:
+          feet_air_time: 0.125
+          undesired_contacts: -1.0
+
+    The learning rate is only applied with a fixed schedule: the adaptive schedule of the PPO algorithm overwrites it
+    at every mini-batch, so the entry is ignored with a warning.
+
+    The file is created with the current values when the polling starts, so that it can be edited in place. A
+    modification is detected from the modification time of the file. Invalid files (for instance, saved while being
+    edited) are reported and ignored until their next modification.
+    """
+
+    def __init__(self, path: str):
+        """Initializes the override file.
+
+        Args:
+            path: The path of the file.
+        """
+        self.path = path
+        self._mtime: float | None = None
+
+    def initialize(self, values: dict[str, Any]):
+        """Write the current values to the file if it does not exist, and start watching it.
+
+        If the file already exists (for instance, when a preempted run is resumed), its content is returned by the
+        next poll, so that the overrides of the run are applied again.
+
+        Args:
+            values: The current values, with the entries of the file.
+        """
+        if os.path.exists(self.path):
+            self._mtime = None
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            yaml.safe_dump(values, f, sort_keys=False)
+        self._mtime = os.path.getmtime(self.path)
+
+    def poll(self) -> dict[str, Any] | None:
+        """Read the file if it was modified since the last poll.
+
+        Returns:
+            The content of the file, or None if it was not modified or is invalid.
+        """
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return None
+        if mtime == self._mtime:
+            return None
+        self._mtime = mtime
+        try:
+            with open(self.path) as f:
+                content = yaml.safe_load(f)
+        except (OSError, yaml.YAMLError) as e:
+            print(f"[WARN] Ignoring the invalid hot reload file '{self.path}': {e}")
+            return None
+        if not isinstance(content, dict):
+            print(f"[WARN] Ignoring the hot reload file '{self.path}': expected a mapping, got {type(content)}.")
+            return None
+        return content
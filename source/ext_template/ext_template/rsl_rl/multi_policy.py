@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import copy
+import os
+import time
+import torch
+from torch.distributions import Normal
+
+from rsl_rl.env import VecEnv
+from rsl_rl.utils import store_code_state
+
+from .batched import BatchedModule
+from .rollout import EpisodeStatisticsBuffer
+from .runner import ExtOnPolicyRunner
+
+
+class GroupVecEnv(VecEnv):
+    """View of a contiguous group of environments of a vectorized environment.
+
+    The view exposes the attributes of the environment restricted to the group, so that an RSL-RL runner can be
+    created for the group. The group cannot be stepped on its own: the environment is stepped for all the groups
+    at once by the :class:`MultiPolicyRunner`.
+    """
+
+    def __init__(self, env: VecEnv, env_ids: slice):
+        """Initializes the view.
+
+        Args:
+            env: The vectorized environment.
+            env_ids: The contiguous indices of the environments of the group.
+        """
+        self.env = env
+        self.env_ids = env_ids
+        self.num_envs = env_ids.stop - env_ids.start
+        self.num_actions = env.num_actions
+        self.max_episode_length = env.max_episode_length
+        self.device = env.device
+        self.cfg = env.cfg
+
+    @property
+    def unwrapped(self):
+        """The unwrapped environment."""
+        return self.env.unwrapped
+
+    @property
+    def episode_length_buf(self) -> torch.Tensor:
+        """The current episode lengths of the environments of the group."""
+        return self.env.episode_length_buf[self.env_ids]
+
+    @episode_length_buf.setter
+    def episode_length_buf(self, value: torch.Tensor):
+        self.env.episode_length_buf[self.env_ids] = value
+
+    def get_observations(self) -> tuple[torch.Tensor, dict]:
+        obs, extras = self.env.get_observations()
+        return obs[self.env_ids], self.slice_extras(extras)
+
+    def reset(self) -> tuple[torch.Tensor, dict]:
+        raise RuntimeError("The environments of a group are reset through the multi-policy runner.")
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        raise RuntimeError("The environments of a group are stepped through the multi-policy runner.")
+
+    def slice_extras(self, extras: dict) -> dict:
+        """Restrict the per-environment entries of the extras of the environment to the group.
+
+        Args:
+            extras: The extras of the environment.
+
+        Returns:
+            The extras with the observations and time-outs of the group.
+        """
+        extras = dict(extras)
+        extras["observations"] = {name: value[self.env_ids] for name, value in extras["observations"].items()}
+        if "time_outs" in extras:
+            extras["time_outs"] = extras["time_outs"][self.env_ids]
+        return extras
+
+
+class MultiPolicyRunner:
+    """Runner that trains independent policies on contiguous groups of environments of a single environment.
+
+    The environments are partitioned into ``num_policies`` contiguous groups of equal size. Every group gets its own
+    :class:`ExtOnPolicyRunner`, i.e. its own actor-critic, algorithm, rollout storage, normalizers, log directory and
+    writer. The groups are seeded with consecutive seeds starting from the seed of the training configuration.
+
+    The seed of a group only sets the initialization of its actor-critic. The other random draws are shared by the
+    groups: the environment (its randomization and resets), the sampling of the actions of all the groups at once and
+    the shuffling of the mini-batches by the algorithms, which all use the global random generators. A group is
+    therefore not reproducible on its own: its training differs from a single-policy training with the same seed,
+    and depends on the number of policies. Like a single-policy training, the training of all the groups together is
+    reproducible from the seed.
+
+    During the rollout, the actor-critics of all the groups are evaluated in a single batched call through a
+    :class:`BatchedModule`, whose parameters are refreshed once per iteration. The environment is stepped once for
+    all the groups. The returns and the updates are then computed per group.
+
+    .. note::
+        The episode information of the environment (``extras["log"]``) is aggregated over all the environments
+        by the environment itself. It is therefore logged identically for all the groups. The episode returns and
+        lengths are tracked per group.
+    """
+
+    def __init__(self, env: VecEnv, train_cfg: dict, log_dir: str | None = None, device="cpu"):
+        """Initializes the runner.
+
+        Args:
+            env: The vectorized environment.
+            train_cfg: The training configuration. The ``num_policies`` entry sets the number of groups.
+            log_dir: The log directory of the run. The groups log into sibling directories suffixed with
+                their seeds. Defaults to None, in which case nothing is logged.
+            device: The device of the runners. Defaults to "cpu".
+        """
+        self.env = env
+        self.cfg = train_cfg
+        self.device = device
+        self.num_policies = train_cfg.get("num_policies", 1)
+        if env.num_envs % self.num_policies != 0:
+            raise ValueError(
+                f"The number of environments ({env.num_envs}) is not divisible by the number of policies"
+                f" ({self.num_policies})."
+            )
+        if train_cfg["algorithm"]["class_name"] != "PPO":
+            raise ValueError("Multi-policy training is only available for reinforcement learning training.")
+        if train_cfg.get("pipelined_collection", False):
+            raise ValueError("Multi-policy training does not support pipelined collection.")
+        if train_cfg["algorithm"].get("rnd_cfg") is not None:
+            raise ValueError("Multi-policy training does not support random network distillation (RND).")
+        if train_cfg.get("hot_reload", False):
+            raise ValueError("Multi-policy training does not support hot reload.")
+        if train_cfg.get("telemetry_interval", 0.0) > 0.0:
+            raise ValueError("Multi-policy training does not support the resource telemetry.")
+
+        # create the runners of the groups
+        num_envs_per_group = env.num_envs // self.num_policies
+        self.seeds = [train_cfg.get("seed", 42) + index for index in range(self.num_policies)]
+        self.log_dirs = [None if log_dir is None else f"{log_dir}_seed{seed}" for seed in self.seeds]
+        self.runners: list[ExtOnPolicyRunner] = []
+        for index, (seed, group_log_dir) in enumerate(zip(self.seeds, self.log_dirs)):
+            # note: the runners modify their configuration in-place
+            group_cfg = copy.deepcopy(train_cfg)
+            group_cfg["seed"] = seed
+            group_env = GroupVecEnv(env, slice(index * num_envs_per_group, (index + 1) * num_envs_per_group))
+            # seed the initialization of the actor-critic
+            # note: the following random draws are shared by the groups (see the class docstring)
+            torch.manual_seed(seed)
+            self.runners.append(ExtOnPolicyRunner(group_env, group_cfg, log_dir=group_log_dir, device=device))
+
+        # check the runners
+        for runner in self.runners:
+            if runner.is_distributed:
+                raise ValueError("Multi-policy training does not support multi-GPU training.")
+            if runner.alg.policy.is_recurrent:
+                raise ValueError("Multi-policy training does not support recurrent policies.")
+
+        # create the batched networks for the inference
+        policies = [runner.alg.policy for runner in self.runners]
+        self.actors = BatchedModule([policy.actor for policy in policies])
+        self.critics = BatchedModule([policy.critic for policy in policies])
+
+    @property
+    def num_steps_per_env(self) -> int:
+        """The number of steps per environment and iteration."""
+        return self.runners[0].num_steps_per_env
+
+    @property
+    def current_learning_iteration(self) -> int:
+        """The current learning iteration."""
+        return self.runners[0].current_learning_iteration
+
+    def learn(self, num_learning_iterations: int, init_at_random_ep_len: bool = False):
+        # initialize writers
+        for runner in self.runners:
+            if runner.log_dir is not None and runner.writer is None:
+                runner._init_writer()
+
+        # randomize initial episode lengths (for exploration)
+        if init_at_random_ep_len:
+            self.env.episode_length_buf = torch.randint_like(
+                self.env.episode_length_buf, high=int(self.env.max_episode_length)
+            )
+
+        # start learning
+        obs, extras = self.env.get_observations()
+        obs, privileged_obs = self._split_observations(obs.to(self.device), extras)
+        for runner in self.runners:
+            runner.train_mode()  # switch to train mode (for dropout for example)
+
+        # Book keeping
+        ep_infos = []
+        metrics = getattr(self.env.unwrapped, "metrics", None)
+        for runner in self.runners:
+            runner.episode_statistics = EpisodeStatisticsBuffer(
+                ["reward", "length"], runner.env.num_envs, device=self.device
+            )
+
+        # Start training
+        start_iter = self.current_learning_iteration
+        tot_iter = start_iter + num_learning_iterations
+        for it in range(start_iter, tot_iter):
+            start = time.time()
+            # stack the parameters of the groups
+            self._update_batched_policies()
+            # Rollout
+            with torch.inference_mode():
+                for _ in range(self.num_steps_per_env):
+                    obs, privileged_obs, infos = self._step(obs, privileged_obs)
+                    # book keeping
+                    if "episode" in infos:
+                        ep_infos.append(infos["episode"])
+                    elif "log" in infos and metrics is None:
+                        ep_infos.append(infos["log"])
+
+                stop = time.time()
+                collection_time = stop - start
+                start = stop
+
+                # compute returns
+                for runner, group_privileged_obs in zip(self.runners, privileged_obs):
+                    runner.alg.compute_returns(group_privileged_obs)
+
+            # update policies
+            loss_dicts = [runner.alg.update() for runner in self.runners]
+
+            stop = time.time()
+            learn_time = stop - start
+            # note: the metrics of the environment are shared by the groups
+            histograms = {}
+            if metrics is not None and self.runners[0].log_dir is not None:
+                scalars, histograms = metrics.flush()
+                ep_infos.append(scalars)
+            for runner, loss_dict in zip(self.runners, loss_dicts):
+                runner.current_learning_iteration = it
+                # log info
+                if runner.log_dir is not None:
+                    # Log information
+                    runner._log_histograms(histograms, it)
+                    locs = dict(
+                        it=it,
+                        start_iter=start_iter,
+                        tot_iter=tot_iter,
+                        num_learning_iterations=num_learning_iterations,
+                        collection_time=collection_time,
+                        learn_time=learn_time,
+                        ep_infos=ep_infos,
+                        loss_dict=loss_dict,
+                    )
+                    runner.log(runner._log_locals(locs))
+                    # Save model
+                    if it % runner.save_interval == 0:
+                        runner.save(os.path.join(runner.log_dir, f"model_{it}.pt"))
+                    # Save code state
+                    if it == start_iter:
+                        git_file_paths = store_code_state(runner.log_dir, runner.git_status_repos)
+                        if runner.logger_type in ["wandb", "neptune"] and git_file_paths:
+                            for path in git_file_paths:
+                                runner.writer.save_file(path)
+
+            # Clear episode infos
+            ep_infos.clear()
+
+        # Save the final models after training
+        for runner in self.runners:
+            if runner.log_dir is not None:
+                runner.save(os.path.join(runner.log_dir, f"model_{runner.current_learning_iteration}.pt"))
+
+    def load(self, paths: list[str], load_optimizer: bool = True):
+        """Load the checkpoints of the groups.
+
+        Args:
+            paths: The paths of the checkpoints in the order of the groups.
+            load_optimizer: Whether to load the state of the optimizers. Defaults to True.
+        """
+        if len(paths) != self.num_policies:
+            raise ValueError(f"Expected {self.num_policies} checkpoints, but got {len(paths)}.")
+        for runner, path in zip(self.runners, paths):
+            runner.load(path, load_optimizer=load_optimizer)
+
+    def add_git_repo_to_log(self, repo_file_path: str):
+        """Add a repository to the code state logged by the runners of all the groups."""
+        for runner in self.runners:
+            runner.add_git_repo_to_log(repo_file_path)
+
+    """
+    Helper functions.
+    """
+
+    def _update_batched_policies(self):
+        """Stack the current parameters of the actor-critics of the groups."""
+        self.actors.update()
+        self.critics.update()
+        policies = [runner.alg.policy for runner in self.runners]
+        with torch.no_grad():
+            if policies[0].noise_std_type == "scalar":
+                self._action_std = torch.stack([policy.std for policy in policies])
+            else:
+                self._action_std = torch.stack([torch.exp(policy.log_std) for policy in policies])
+
+    def _step(self, obs: torch.Tensor, privileged_obs: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, dict]:
+        """Collect a transition for all the groups.
+
+        Args:
+            obs: The observations of the policies. Shape is (num_policies, num_envs_per_group, num_obs).
+            privileged_obs: The privileged observations of the critics. Shape is
+                (num_policies, num_envs_per_group, num_privileged_obs).
+
+        Returns:
+            A tuple containing the next observations, the next privileged observations and the step infos.
+        """
+        # Sample actions of all the groups
+        actions = self._act(obs, privileged_obs)
+        # Step the environment
+        obs, rewards, dones, infos = self.env.step(actions.flatten(0, 1).to(self.env.device))
+        # Move to device
+        obs, rewards, dones = (obs.to(self.device), rewards.to(self.device), dones.to(self.device))
+        # process the step of each group
+        next_obs, next_privileged_obs = [], []
+        for runner in self.runners:
+            env_ids = runner.env.env_ids
+            group_infos = runner.env.slice_extras(infos)
+            group_obs, group_privileged_obs = runner._normalize_observations(obs[env_ids], group_infos)
+            runner.alg.process_env_step(rewards[env_ids], dones[env_ids], group_infos)
+            runner.episode_statistics.add((rewards[env_ids], torch.ones_like(rewards[env_ids])), dones[env_ids])
+            next_obs.append(group_obs)
+            next_privileged_obs.append(group_privileged_obs)
+        obs = torch.stack(next_obs)
+        privileged_obs = obs if self.runners[0].privileged_obs_type is None else torch.stack(next_privileged_obs)
+        return obs, privileged_obs, infos
+
+    def _act(self, obs: torch.Tensor, privileged_obs: torch.Tensor) -> torch.Tensor:
+        """Sample the actions of all the groups and record them in the transitions of the algorithms.
+
+        This is the batched equivalent of :meth:`rsl_rl.algorithms.PPO.act` over the groups.
+
+        Args:
+            obs: The observations of the policies. Shape is (num_policies, num_envs_per_group, num_obs).
+            privileged_obs: The privileged observations of the critics. Shape is
+                (num_policies, num_envs_per_group, num_privileged_obs).
+
+        Returns:
+            The actions of the groups. Shape is (num_policies, num_envs_per_group, num_actions).
+        """
+        # compute the distributions and values of all the groups
+        mean = self.actors(obs)
+        std = self._action_std.unsqueeze(1).expand_as(mean)
+        values = self.critics(privileged_obs)
+        distribution = Normal(mean, std)
+        actions = distribution.sample()
+        actions_log_prob = distribution.log_prob(actions).sum(dim=-1)
+        # record the transitions
+        for index, runner in enumerate(self.runners):
+            transition = runner.alg.transition
+            transition.actions = actions[index]
+            transition.values = values[index]
+            transition.actions_log_prob = actions_log_prob[index]
+            transition.action_mean = mean[index]
+            transition.action_sigma = std[index]
+            transition.observations = obs[index]
+            transition.privileged_observations = privileged_obs[index]
+        return actions
+
+    def _split_observations(self, obs: torch.Tensor, extras: dict) -> tuple[torch.Tensor, torch.Tensor]:
+        """Split the observations of the environment into the groups.
+
+        Args:
+            obs: The observations of the environment on the device of the runner.
+            extras: The extras of the environment.
+
+        Returns:
+            A tuple containing the observations and privileged observations with a leading group dimension.
+        """
+        obs = obs.view(self.num_policies, -1, obs.shape[-1])
+        privileged_obs_type = self.runners[0].privileged_obs_type
+        if privileged_obs_type is None:
+            return obs, obs
+        privileged_obs = extras["observations"][privileged_obs_type].to(self.device)
+        return obs, privileged_obs.view(self.num_policies, -1, privileged_obs.shape[-1])
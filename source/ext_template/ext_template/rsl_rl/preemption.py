@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import numpy as np
+import os
+import random
+import signal
+import torch
+import yaml
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rsl_rl.runners import OnPolicyRunner
+
+    from ext_template.envs import EnvStateSnapshot
+
+    from .runner import ExtOnPolicyRunner
+
+PREEMPTION_FILE = "preempted.yaml"
+"""Name of the file marking a run directory whose training was preempted."""
+
+
+class PreemptionHandler:
+    """Handler of the signals sent by a job scheduler before preempting a job.
+
+    The handler only records the request: the training loop checks :attr:`requested` at the end of each iteration,
+    writes a checkpoint and stops (see :class:`~ext_template.rsl_rl.ExtOnPolicyRunner`). With SLURM, the signal is
+    sent ahead of the preemption with the ``--signal`` option of ``sbatch`` (for instance, ``--signal=B:USR1@120``)
+    or as the ``SIGTERM`` preceding the end of the grace time.
+
+    The handler is installed as a context manager, which restores the previous handlers on exit:
+
+    .. code-block:: python
+
+        with PreemptionHandler() as preemption:
+            runner.preemption = preemption
+            runner.learn(num_learning_iterations)
+    """
+
+    def __init__(self, signals: tuple[signal.Signals, ...] = (signal.SIGTERM, signal.SIGUSR1)):
+        """Initializes the handler.
+
+        Args:
+            signals: The signals requesting the preemption. Defaults to ``SIGTERM`` and ``SIGUSR1``.
+        """
+        self.signals = tuple(signals)
+        self.requested = False
+        """Whether a preemption signal was received."""
+        self.signal_name: str | None = None
+        """The name of the first preemption signal received, or None."""
+        self._previous_handlers = {}
+
+    def __enter__(self) -> PreemptionHandler:
+        self.install()
+        return self
+
+    def __exit__(self, *args):
+        self.uninstall()
+
+    def install(self):
+        """Install the handler for the preemption signals.
+
+        Note:
+            Signal handlers can only be installed from the main thread of the process.
+        """
+        for signum in self.signals:
+            self._previous_handlers[signum] = signal.signal(signum, self._handle)
+
+    def uninstall(self):
+        """Restore the handlers that were installed before this one."""
+        for signum, handler in self._previous_handlers.items():
+            signal.signal(signum, handler)
+        self._previous_handlers.clear()
+
+    def _handle(self, signum: int, frame):
+        """Record a preemption signal."""
+        if self.requested:
+            return
+        self.requested = True
+        self.signal_name = signal.Signals(signum).name
+        print(f"[INFO] Received {self.signal_name}: the training stops after the current iteration.")
+
+
+def get_rng_state() -> dict[str, Any]:
+    """Return the states of the random generators of Python, NumPy and PyTorch (including CUDA, if available)."""
+    state = {"python": random.getstate(), "numpy": np.random.get_state(), "torch": torch.get_rng_state()}
+    if torch.cuda.is_available():
+        state["cuda"] = torch.cuda.get_rng_state_all()
+    return state
+
+
+def set_rng_state(state: dict[str, Any]):
+    """Restore the states of the random generators returned by :func:`get_rng_state`.
+
+    The state of the CUDA generators is only restored if CUDA is available.
+    """
+    random.setstate(state["python"])
+    np.random.set_state(state["numpy"])
+    torch.set_rng_state(state["torch"])
+    if "cuda" in state and torch.cuda.is_available():
+        torch.cuda.set_rng_state_all(state["cuda"])
+
+
+def write_preemption_marker(
+    log_dir: str, checkpoint: str, iteration: int, final_iteration: int, signal_name: str | None = None
+):
+    """Mark a run directory as preempted.
+
+    Args:
+        log_dir: The run directory.
+        checkpoint: The path of the checkpoint to resume from.
+        iteration: The learning iteration to resume from.
+        final_iteration: The learning iteration at which the interrupted training would have stopped.
+        signal_name: The name of the signal that requested the preemption.
+    """
+    marker = {
+        "checkpoint": os.path.relpath(checkpoint, log_dir),
+        "iteration": iteration,
+        "final_iteration": final_iteration,
+        "signal": signal_name,
+        "time": datetime.now().isoformat(timespec="seconds"),
+    }
+    # note: the marker is replaced atomically, so that a second preemption never leaves a partial file
+    path = os.path.join(log_dir, PREEMPTION_FILE)
+    with open(path + ".tmp", "w") as f:
+        yaml.safe_dump(marker, f, sort_keys=False)
+    os.replace(path + ".tmp", path)
+
+
+def read_preemption_marker(log_dir: str) -> dict[str, Any] | None:
+    """Read the marker of a preempted run directory.
+
+    Args:
+        log_dir: The run directory.
+
+    Returns:
+        The entries of the marker, with the absolute path of the checkpoint, or None if the run is not preempted.
+    """
+    path = os.path.join(log_dir, PREEMPTION_FILE)
+    if not os.path.isfile(path):
+        return None
+    with open(path) as f:
+        marker = yaml.safe_load(f)
+    marker["checkpoint"] = os.path.join(log_dir, marker["checkpoint"])
+    return marker
+
+
+def clear_preemption_marker(log_dir: str):
+    """Remove the marker of a run directory, once its training is complete."""
+    path = os.path.join(log_dir, PREEMPTION_FILE)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def find_preempted_run(log_root_path: str, run_name: str | None = None) -> str | None:
+    """Find the most recently preempted run of an experiment.
+
+    Args:
+        log_root_path: The directory of the experiment, holding the run directories.
+        run_name: The name of the run, if any. Only the run directories ending with it are considered.
+
+    Returns:
+        The path of the run directory, or None if no run is preempted.
+    """
+    if not os.path.isdir(log_root_path):
+        return None
+    runs = []
+    for entry in os.scandir(log_root_path):
+        if not entry.is_dir() or (run_name and not entry.name.endswith(f"_{run_name}")):
+            continue
+        path = os.path.join(entry.path, PREEMPTION_FILE)
+        if os.path.isfile(path):
+            runs.append((os.path.getmtime(path), entry.path))
+    return max(runs)[1] if runs else None
+
+
+def save_preemption_checkpoint(
+    runner: OnPolicyRunner,
+    it: int,
+    final_iteration: int,
+    snapshot: EnvStateSnapshot | None = None,
+    signal_name: str | None = None,
+) -> str:
+    """Write the checkpoint of a preempted training and mark the run directory of the runner as preempted.
+
+    The checkpoint holds the states of the random generators and the persistent state of the environment in the
+    ``"preemption"`` entry of its infos. The training resumes at the iteration following the completed one.
+
+    Args:
+        runner: The runner of the training. The checkpoint is written to its log directory.
+        it: The completed learning iteration.
+        final_iteration: The learning iteration at which the training would have stopped.
+        snapshot: The snapshot of the persistent state of the environment. Defaults to None.
+        signal_name: The name of the signal that requested the preemption. Defaults to None.
+
+    Returns:
+        The path of the checkpoint.
+    """
+    # note: the training resumes at the next iteration
+    runner.current_learning_iteration = it + 1
+    infos = {
+        "preemption": {
+            "rng_state": get_rng_state(),
+            "env_state": snapshot.state_dict() if snapshot is not None else None,
+            "final_iteration": final_iteration,
+        }
+    }
+    path = os.path.join(runner.log_dir, f"model_{it}.pt")
+    runner.save(path, infos=infos)
+    write_preemption_marker(runner.log_dir, path, it + 1, final_iteration, signal_name=signal_name)
+    return path
+
+
+def load_preemption_checkpoint(
+    runner: OnPolicyRunner, path: str, snapshot: EnvStateSnapshot | None = None
+) -> dict[str, Any]:
+    """Load the checkpoint of a preempted training into a runner and restore the states saved with it.
+
+    Args:
+        runner: The runner of the training.
+        path: The path of the checkpoint written by :func:`save_preemption_checkpoint`.
+        snapshot: The snapshot restoring the persistent state of the environment. Defaults to None.
+
+    Returns:
+        The information stored with the checkpoint.
+
+    Raises:
+        ValueError: If the checkpoint was not written on preemption.
+    """
+    infos = runner.load(path)
+    state = infos.get("preemption") if isinstance(infos, dict) else None
+    if state is None:
+        raise ValueError(f"The checkpoint was not written on preemption: {path}")
+    set_rng_state(state["rng_state"])
+    if snapshot is not None and state["env_state"] is not None:
+        snapshot.load_state_dict(state["env_state"])
+        snapshot.restore()
+    return infos
+
+
+def resume_preempted_run(runner: ExtOnPolicyRunner, log_dir: str) -> int:
+    """Resume the preempted training of a run directory.
+
+    Args:
+        runner: The runner of the training.
+        log_dir: The run directory, marked as preempted.
+
+    Returns:
+        The number of learning iterations left to complete the interrupted training.
+
+    Raises:
+        ValueError: If the run directory is not marked as preempted.
+    """
+    marker = read_preemption_marker(log_dir)
+    if marker is None:
+        raise ValueError(f"The run was not preempted: {log_dir}")
+    print(f"[INFO]: Loading the preemption checkpoint from: {marker['checkpoint']}")
+    runner.resume_preempted(marker["checkpoint"])
+    return max(marker["final_iteration"] - runner.current_learning_iteration, 0)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import MISSING
+
+from isaaclab.utils import configclass
+from isaaclab_rl.rsl_rl import RslRlOnPolicyRunnerCfg
+
+
+@configclass
+class ExtRslRlDistillationCfg:
+    """Configuration of the distillation of a trained policy into a compact student policy."""
+
+    student_hidden_dims: list[int] = MISSING
+    """The widths of the hidden layers of the student."""
+
+    activation: str = "elu"
+    """The activation function of the hidden layers of the student. Default is "elu"."""
+
+    num_rounds: int = 3
+    """Number of rounds of data collection and training. Default is 3.
+
+    The teacher acts in the first round. In the following rounds, the student acts and the teacher labels the
+    visited observations (dataset aggregation), so that the student learns to recover from its own mistakes.
+    """
+
+    num_steps_per_round: int = 50
+    """Number of environment steps collected per round. Default is 50."""
+
+    dataset_capacity: int = 500_000
+    """Maximum number of labelled samples kept on the device. Default is 500000.
+
+    Once the dataset is full, the oldest samples are overwritten.
+    """
+
+    num_epochs: int = 10
+    """Number of passes over the dataset per round. Default is 10."""
+
+    mini_batch_size: int = 4096
+    """Number of samples per gradient step. Default is 4096."""
+
+    learning_rate: float = 1.0e-3
+    """The learning rate of the student. Default is 1e-3."""
+
+    max_grad_norm: float = 1.0
+    """The maximum norm of the gradients of the student. Default is 1.0."""
+
+    validation_fraction: float = 0.1
+    """Fraction of the samples held out to measure the action error of the student. Default is 0.1."""
+
+
+@configclass
+class ExtRslRlOnPolicyRunnerCfg(RslRlOnPolicyRunnerCfg):
+    """Configuration of the runner for on-policy algorithms with the options of this extension."""
+
+    fast_storage: bool = False
+    """Whether to use the :class:`~ext_template.rsl_rl.FastRolloutStorage` for the rollouts. Default is False.
+
+    The storage computes the advantages with a vectorized scan and draws the mini-batches as views into
+    buffers that are shuffled once per update. The mini-batches of recurrent actor-critics are generated
+    as in the original storage.
+    """
+
+    pipelined_collection: bool = False
+    """Whether to commit the rollout transitions asynchronously to the collection loop. Default is False.
+
+    The storage writes and the episode bookkeeping of a step are issued on a worker thread (and a side
+    CUDA stream) while the policy inference and the environment stepping of the next step proceed.
+    Only supported for feed-forward actor-critics trained with PPO without RND.
+    """
+
+    hot_reload: bool = False
+    """Whether to apply the changes of the hot reload file of the run directory during training. Default is False.
+
+    The file ``hot_reload.yaml`` is created in the run directory with the current weights of the reward terms,
+    learning rate and entropy coefficient. Its changes are applied between the training iterations and logged with
+    their iteration (see :class:`~ext_template.rsl_rl.ExtOnPolicyRunner`). With the adaptive learning rate
+    schedule, a new learning rate is the starting point of the schedule. Only supported for PPO on a single GPU.
+
+    The training scripts keep the reward terms with zero weight in the environment when the hot reload is enabled
+    (see the ``prune_noop_terms`` attribute of the environment configurations), so that they can be enabled.
+    """
+
+    telemetry_interval: float = 0.0
+    """Interval between the samples of the resource telemetry of the training process, in seconds. Default is 0.0,
+    in which case no telemetry is sampled.
+
+    The memory, CPU utilization, open files, write rate of the run directory and device memory are sampled in the
+    background and written to the file ``telemetry.csv`` of the run directory. The last sample is also logged with
+    every iteration (see :class:`~ext_template.rsl_rl.TelemetrySampler`).
+    """
+
+    num_policies: int = 1
+    """Number of independent policies trained in parallel in the same environment. Default is 1.
+
+    If larger than one, the environments are partitioned into contiguous groups of equal size, one per policy,
+    and the policies are trained by the :class:`~ext_template.rsl_rl.MultiPolicyRunner`. The policies are seeded
+    with consecutive seeds starting from :attr:`seed` and log into separate run directories. The seeds only set the
+    initialization of the policies: the other random draws are shared, so a policy is not reproducible on its own.
+    """
+
+    distillation: ExtRslRlDistillationCfg = ExtRslRlDistillationCfg(student_hidden_dims=[128, 64])
+    """Configuration of the distillation of the trained policy into a compact student policy.
+
+    It is only used by the ``distill.py`` script.
+    """
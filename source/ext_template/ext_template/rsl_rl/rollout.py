@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class RolloutPipeline:
+    """Two-stage pipeline that commits rollout transitions asynchronously to the collection loop.
+
+    The collection of a rollout is split into two stages:
+
+    1. *Collect*: the policy inference and the environment stepping. These run on the calling thread and on
+       the current CUDA stream, since every step depends on the observations of the previous one.
+    2. *Commit*: the writes of the transition into the rollout storage and the episode bookkeeping. Nothing
+       in the collect stage depends on them, so they are submitted to a single worker thread and, on CUDA
+       devices, issued on a side stream.
+
+    The pipeline is double-buffered: at most one transition is being committed while the next one is being
+    collected. Submitting a commit first waits for the previous commit to be issued, which keeps the commits
+    in the order of the steps and bounds the number of transitions held in memory.
+
+    .. note::
+        The commit functions must not modify any tensor that is read by the collect stage. Tensors that
+        the environment overwrites in-place on the next step (for instance, the reward buffer) must be
+        cloned before they are submitted.
+    """
+
+    def __init__(self, device: str | torch.device):
+        """Initializes the pipeline.
+
+        Args:
+            device: The device on which the committed tensors live.
+        """
+        self.device = torch.device(device)
+        # single worker: commits are executed in the order of submission
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rollout_commit")
+        self._stream = torch.cuda.Stream(device=self.device) if self.device.type == "cuda" else None
+        self._pending: Future | None = None
+
+    def __del__(self):
+        """Shuts down the worker thread."""
+        self.close()
+
+    """
+    Operations.
+    """
+
+    def submit(self, func: Callable[..., None], *args, record: Sequence[torch.Tensor] = ()):
+        """Submit a commit to the pipeline.
+
+        The call blocks until the previous commit has been issued (double-buffering).
+
+        Args:
+            func: The commit function.
+            *args: The arguments of the commit function.
+            record: The tensors produced by the collect stage that are read by the commit. On CUDA devices,
+                their memory is not reused before the commit has been executed on the side stream.
+        """
+        # wait for the previous commit (and propagate its exceptions)
+        self._wait_pending()
+        # make the side stream wait for the work that produced the tensors
+        if self._stream is not None:
+            self._stream.wait_stream(torch.cuda.current_stream(self.device))
+            # tell the allocator that the tensors are in use on the side stream
+            for tensor in record:
+                tensor.record_stream(self._stream)
+        # the inference mode is thread-local, so it needs to be forwarded to the worker
+        inference_mode = torch.is_inference_mode_enabled()
+        self._pending = self._executor.submit(self._run, func, inference_mode, *args)
+
+    def synchronize(self):
+        """Wait for all the submitted commits to complete.
+
+        After the call, the committed data can be read from the current stream.
+        """
+        self._wait_pending()
+        if self._stream is not None:
+            torch.cuda.current_stream(self.device).wait_stream(self._stream)
+
+    def close(self):
+        """Wait for the pending commit and shut down the worker thread."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+            self._executor = None
+
+    """
+    Helper functions.
+    """
+
+    def _wait_pending(self):
+        """Wait for the pending commit to be issued."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def _run(self, func: Callable[..., None], inference_mode: bool, *args):
+        """Execute the commit function on the worker thread."""
+        with torch.inference_mode(inference_mode):
+            if self._stream is not None:
+                with torch.cuda.stream(self._stream):
+                    func(*args)
+            else:
+                func(*args)
+
+
+class EpisodeStatisticsBuffer:
+    """Device-side bookkeeping of the statistics of completed episodes.
+
+    The buffer accumulates per-environment sums (for instance, the episode return and length) and stores the
+    sums of the completed episodes in ring buffers of fixed length. All the updates are performed with
+    tensor operations, so that the bookkeeping does not synchronize the device with the host. The ring buffers
+    are transferred to the host with a single copy in :meth:`to_lists`.
+
+    The ring buffers mirror the :class:`collections.deque` used by the RSL-RL runner, i.e. they hold the
+    statistics of the last ``maxlen`` completed episodes.
+    """
+
+    def __init__(self, names: Sequence[str], num_envs: int, maxlen: int = 100, device: str = "cpu"):
+        """Initializes the buffer.
+
+        Args:
+            names: The names of the tracked statistics.
+            num_envs: The number of environments.
+            maxlen: The number of completed episodes to keep. Defaults to 100.
+            device: The device of the buffers. Defaults to "cpu".
+        """
+        self.names = list(names)
+        self.maxlen = maxlen
+        self.device = device
+        # running sums of the current episodes
+        self._current = torch.zeros(len(self.names), num_envs, device=device)
+        # ring buffers of the completed episodes
+        # note: the last slot is a sink for the writes of the environments that are not done
+        self._completed = torch.zeros(len(self.names), maxlen + 1, device=device)
+        self._pointer = torch.zeros((), dtype=torch.long, device=device)
+        self._count = torch.zeros((), dtype=torch.long, device=device)
+
+    def add(self, values: Sequence[torch.Tensor], dones: torch.Tensor):
+        """Accumulate the values of a step and store the sums of the episodes that are done.
+
+        Args:
+            values: The per-environment values of the step in the order of :attr:`names`. Shape is (num_envs,).
+            dones: The done flags of the environments. Shape is (num_envs,).
+        """
+        for index, value in enumerate(values):
+            self._current[index] += value.view(-1)
+        dones = dones.view(-1) > 0
+        # compute the slots of the completed episodes in the ring buffers
+        num_dones = torch.cumsum(dones, dim=0)
+        slots = torch.remainder(self._pointer + num_dones - 1, self.maxlen)
+        # note: if more than maxlen episodes are completed, only the last maxlen are kept (like by a deque), so
+        #   that their slots are distinct
+        kept = dones & (num_dones > num_dones[-1] - self.maxlen)
+        slots = torch.where(kept, slots, self.maxlen)
+        self._completed[:, slots] = self._current
+        # advance the pointer and reset the sums of the completed episodes
+        self._pointer = torch.remainder(self._pointer + num_dones[-1], self.maxlen)
+        self._count = torch.clamp(self._count + num_dones[-1], max=self.maxlen)
+        self._current *= ~dones
+
+    def to_lists(self) -> dict[str, list[float]]:
+        """Transfer the statistics of the completed episodes to the host.
+
+        Returns:
+            The statistics of the completed episodes keyed by their names, from the oldest to the newest episode.
+        """
+        # order the ring buffers from the oldest episode
+        slots = torch.remainder(
+            self._pointer - self._count + torch.arange(self.maxlen, device=self.device), self.maxlen
+        )
+        completed = self._completed[:, slots]
+        # single device to host transfer
+        data = torch.cat((completed, self._count.expand(len(self.names), 1).float()), dim=1).cpu()
+        count = int(data[0, -1])
+        return {name: data[index, :count].tolist() for index, name in enumerate(self.names)}
@@ -0,0 +1,495 @@
+from __future__ import annotations
+
+import os
+import time
+import torch
+
+from rsl_rl.env import VecEnv
+from rsl_rl.runners import OnPolicyRunner
+from rsl_rl.storage import RolloutStorage
+from rsl_rl.utils import store_code_state
+
+from isaaclab.envs import ManagerBasedRLEnv
+
+from ext_template.envs import EnvStateSnapshot
+
+from .hot_reload import HotReloadFile
+from .preemption import PreemptionHandler, load_preemption_checkpoint, save_preemption_checkpoint
+from .rollout import EpisodeStatisticsBuffer, RolloutPipeline
+from .storage import FastRolloutStorage
+from .telemetry import TelemetrySampler
+
+
+class ExtOnPolicyRunner(OnPolicyRunner):
+    """On-policy runner with the rollout options of this extension.
+
+    The runner behaves as :class:`rsl_rl.runners.OnPolicyRunner` and additionally reads the options of
+    :class:`~ext_template.rsl_rl.ExtRslRlOnPolicyRunnerCfg` from the training configuration:
+
+    * ``fast_storage``: Replaces the rollout storage with :class:`~ext_template.rsl_rl.FastRolloutStorage`.
+    * ``pipelined_collection``: Commits the transitions of the rollout through a
+      :class:`~ext_template.rsl_rl.rollout.RolloutPipeline`, so that the storage writes and the episode
+      bookkeeping of a step overlap with the policy inference and the environment stepping of the next one.
+    * ``hot_reload``: Watches the file ``hot_reload.yaml`` of the run directory (see
+      :class:`~ext_template.rsl_rl.HotReloadFile`) and applies its changes to the weights of the reward
+      terms, the learning rate and the entropy coefficient between the training iterations. The changes are logged
+      with their iteration in ``hot_reload.log``, and as scalars and texts of the summary writer.
+    * ``telemetry_interval``: Samples the resources used by the process in the background with a
+      :class:`~ext_template.rsl_rl.TelemetrySampler`, which writes them to ``telemetry.csv`` in the run directory.
+      The last sample is logged with every iteration.
+
+    The training can also be made preemptible by setting the :attr:`preemption` attribute to an installed
+    :class:`~ext_template.rsl_rl.PreemptionHandler`. When a preemption signal is received, the current iteration is
+    completed, a checkpoint is written with the states that a regular checkpoint lacks (the random generators and the
+    curriculum state of the environment, see :class:`~ext_template.envs.EnvStateSnapshot`), the run directory is
+    marked as preempted (see :func:`~ext_template.rsl_rl.preemption.write_preemption_marker`) and :meth:`learn`
+    returns with :attr:`preempted` set. The training is continued from this checkpoint with :meth:`resume_preempted`,
+    which restores these states as well. :meth:`load` only restores the models, like for any other checkpoint.
+
+    In both collection modes, the episode returns and lengths are tracked on the device and transferred to
+    the host once per iteration, instead of once per step. Likewise, if the environment accumulates its logged
+    values in a :class:`~ext_template.envs.MetricsBuffer` (the ``metrics`` attribute of the environments of this
+    extension), the buffer is transferred to the host once per iteration, instead of collecting the logged values
+    of every step.
+    """
+
+    def __init__(self, env: VecEnv, train_cfg: dict, log_dir: str | None = None, device="cpu"):
+        super().__init__(env, train_cfg, log_dir=log_dir, device=device)
+        # replace the rollout storage
+        if self.cfg.get("fast_storage", False):
+            self.alg.storage = FastRolloutStorage.from_storage(self.alg.storage)
+        # resolve the collection mode
+        self.pipelined_collection = self.cfg.get("pipelined_collection", False)
+        if self.pipelined_collection:
+            if self.training_type != "rl":
+                raise ValueError("Pipelined collection is only available for reinforcement learning training.")
+            if self.alg.policy.is_recurrent:
+                raise ValueError("Pipelined collection does not support recurrent policies.")
+            if self.alg.rnd:
+                raise ValueError("Pipelined collection does not support random network distillation (RND).")
+        # watch the hot reload file of the run
+        self.hot_reload = None
+        if self.cfg.get("hot_reload", False) and log_dir is not None:
+            if self.training_type != "rl":
+                raise ValueError("Hot reload is only available for reinforcement learning training.")
+            if self.is_distributed:
+                raise ValueError("Hot reload does not support multi-GPU training.")
+            self.hot_reload = HotReloadFile(os.path.join(log_dir, "hot_reload.yaml"))
+        # sample the resources used by the training
+        self.telemetry = None
+        telemetry_interval = self.cfg.get("telemetry_interval", 0.0)
+        if telemetry_interval > 0.0 and log_dir is not None and not self.disable_logs:
+            self.telemetry = TelemetrySampler(log_dir, interval=telemetry_interval, device=self.device)
+        # preemption of the training
+        self.preemption: PreemptionHandler | None = None
+        """Handler of the preemption signals, checked at the end of each iteration. Default is None."""
+        self.preempted = False
+        """Whether the last call to :meth:`learn` stopped on a preemption signal."""
+
+    def learn(self, num_learning_iterations: int, init_at_random_ep_len: bool = False):
+        # initialize writer
+        if self.log_dir is not None and self.writer is None and not self.disable_logs:
+            self._init_writer()
+
+        # check if teacher is loaded
+        if self.training_type == "distillation" and not self.alg.policy.loaded_teacher:
+            raise ValueError("Teacher model parameters not loaded. Please load a teacher model to distill.")
+        # check if the training can be preempted
+        if self.preemption is not None:
+            if self.log_dir is None or self.disable_logs:
+                raise ValueError("Preemption requires a log directory to write the checkpoint to.")
+            if self.is_distributed:
+                raise ValueError("Preemption does not support multi-GPU training.")
+        self.preempted = False
+
+        # randomize initial episode lengths (for exploration)
+        if init_at_random_ep_len:
+            self.env.episode_length_buf = torch.randint_like(
+                self.env.episode_length_buf, high=int(self.env.max_episode_length)
+            )
+
+        # start learning
+        obs, extras = self.env.get_observations()
+        privileged_obs = extras["observations"].get(self.privileged_obs_type, obs)
+        obs, privileged_obs = obs.to(self.device), privileged_obs.to(self.device)
+        self.train_mode()  # switch to train mode (for dropout for example)
+
+        # Book keeping
+        ep_infos = []
+        names = ["reward", "length"] + (["extrinsic_reward", "intrinsic_reward"] if self.alg.rnd else [])
+        self.episode_statistics = EpisodeStatisticsBuffer(names, self.env.num_envs, device=self.device)
+        pipeline = RolloutPipeline(self.device) if self.pipelined_collection else None
+        metrics = getattr(self.env.unwrapped, "metrics", None)
+        if self.hot_reload is not None:
+            self.hot_reload.initialize(self._hot_reload_values())
+        if self.telemetry is not None:
+            self.telemetry.start()
+
+        # Ensure all parameters are in-synced
+        if self.is_distributed:
+            print(f"Synchronizing parameters for rank {self.gpu_global_rank}...")
+            self.alg.broadcast_parameters()
+
+        # Start training
+        start_iter = self.current_learning_iteration
+        tot_iter = start_iter + num_learning_iterations
+        try:
+            for it in range(start_iter, tot_iter):
+                # apply the changes of the hot reload file
+                if self.hot_reload is not None:
+                    self._apply_hot_reload(it)
+                start = time.time()
+                # Rollout
+                with torch.inference_mode():
+                    for _ in range(self.num_steps_per_env):
+                        if pipeline is not None:
+                            obs, privileged_obs, infos = self._pipelined_step(pipeline, obs, privileged_obs)
+                        else:
+                            obs, privileged_obs, infos = self._step(obs, privileged_obs)
+                        # book keeping
+                        if self.log_dir is not None:
+                            if "episode" in infos:
+                                ep_infos.append(infos["episode"])
+                            elif "log" in infos and metrics is None:
+                                ep_infos.append(infos["log"])
+                    # wait for the transitions to be committed
+                    if pipeline is not None:
+                        pipeline.synchronize()
+
+                    stop = time.time()
+                    collection_time = stop - start
+                    start = stop
+
+                    # compute returns
+                    if self.training_type == "rl":
+                        self.alg.compute_returns(privileged_obs)
+
+                # update policy
+                loss_dict = self.alg.update()
+
+                stop = time.time()
+                learn_time = stop - start
+                self.current_learning_iteration = it
+                # log info
+                if self.log_dir is not None and not self.disable_logs:
+                    # Log information
+                    if metrics is not None:
+                        scalars, histograms = metrics.flush()
+                        ep_infos.append(scalars)
+                        self._log_histograms(histograms, it)
+                    if self.telemetry is not None:
+                        self._log_telemetry(it)
+                    self.log(self._log_locals(locals()))
+                    # Save model
+                    if it % self.save_interval == 0:
+                        self.save(os.path.join(self.log_dir, f"model_{it}.pt"))
+
+                # Clear episode infos
+                ep_infos.clear()
+                # Save code state
+                if it == start_iter and self.log_dir is not None and not self.disable_logs:
+                    # obtain all the diff files
+                    git_file_paths = store_code_state(self.log_dir, self.git_status_repos)
+                    # if possible store them to wandb
+                    if self.logger_type in ["wandb", "neptune"] and git_file_paths:
+                        for path in git_file_paths:
+                            self.writer.save_file(path)
+                # stop after the iteration on preemption
+                if self.preemption is not None and self.preemption.requested:
+                    self._save_preemption_checkpoint(it, tot_iter)
+                    break
+        finally:
+            if pipeline is not None:
+                pipeline.close()
+            if self.telemetry is not None:
+                self.telemetry.stop()
+
+        # Save the final model after training
+        if self.log_dir is not None and not self.disable_logs and not self.preempted:
+            self.save(os.path.join(self.log_dir, f"model_{self.current_learning_iteration}.pt"))
+
+    def resume_preempted(self, path: str) -> dict:
+        """Load the checkpoint of a preempted training and restore the states saved with it.
+
+        Besides the models and the optimizer, the states of the random generators and the persistent state of the
+        environment are restored. The environments are reset at the restored state (see
+        :meth:`~ext_template.envs.EnvStateSnapshot.restore`).
+
+        Args:
+            path: The path of the checkpoint written on preemption.
+
+        Returns:
+            The information stored with the checkpoint.
+
+        Raises:
+            ValueError: If the checkpoint was not written on preemption.
+        """
+        return load_preemption_checkpoint(self, path, self._env_state_snapshot())
+
+    """
+    Helper functions.
+    """
+
+    def _init_writer(self):
+        """Launch either Tensorboard or Neptune & Tensorboard summary writer(s), default: Tensorboard."""
+        self.logger_type = self.cfg.get("logger", "tensorboard")
+        self.logger_type = self.logger_type.lower()
+
+        if self.logger_type == "neptune":
+            from rsl_rl.utils.neptune_utils import NeptuneSummaryWriter
+
+            self.writer = NeptuneSummaryWriter(log_dir=self.log_dir, flush_secs=10, cfg=self.cfg)
+            self.writer.log_config(self.env.cfg, self.cfg, self.alg_cfg, self.policy_cfg)
+        elif self.logger_type == "wandb":
+            from rsl_rl.utils.wandb_utils import WandbSummaryWriter
+
+            self.writer = WandbSummaryWriter(log_dir=self.log_dir, flush_secs=10, cfg=self.cfg)
+            self.writer.log_config(self.env.cfg, self.cfg, self.alg_cfg, self.policy_cfg)
+        elif self.logger_type == "tensorboard":
+            from torch.utils.tensorboard import SummaryWriter
+
+            self.writer = SummaryWriter(log_dir=self.log_dir, flush_secs=10)
+        else:
+            raise ValueError("Logger type not found. Please choose 'neptune', 'wandb' or 'tensorboard'.")
+
+    def _step(self, obs: torch.Tensor, privileged_obs: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, dict]:
+        """Collect a transition and commit it sequentially.
+
+        Args:
+            obs: The observations of the policy.
+            privileged_obs: The privileged observations of the critic.
+
+        Returns:
+            A tuple containing the next observations, the next privileged observations and the step infos.
+        """
+        # Sample actions
+        actions = self.alg.act(obs, privileged_obs)
+        # Step the environment
+        obs, rewards, dones, infos = self.env.step(actions.to(self.env.device))
+        # Move to device
+        obs, rewards, dones = (obs.to(self.device), rewards.to(self.device), dones.to(self.device))
+        # perform normalization
+        obs, privileged_obs = self._normalize_observations(obs, infos)
+        # process the step
+        self.alg.process_env_step(rewards, dones, infos)
+        # track the episode statistics
+        if self.alg.rnd:
+            intrinsic_rewards = self.alg.intrinsic_rewards
+            values = (rewards + intrinsic_rewards, torch.ones_like(rewards), rewards, intrinsic_rewards)
+        else:
+            values = (rewards, torch.ones_like(rewards))
+        self.episode_statistics.add(values, dones)
+        return obs, privileged_obs, infos
+
+    def _pipelined_step(
+        self, pipeline: RolloutPipeline, obs: torch.Tensor, privileged_obs: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, dict]:
+        """Collect a transition and submit its commit to the pipeline.
+
+        The transition of the algorithm is swapped for a new one after the policy inference, so that the
+        inference of the next step can proceed while the current transition is being committed.
+
+        Args:
+            pipeline: The rollout pipeline.
+            obs: The observations of the policy.
+            privileged_obs: The privileged observations of the critic.
+
+        Returns:
+            A tuple containing the next observations, the next privileged observations and the step infos.
+        """
+        # Sample actions
+        actions = self.alg.act(obs, privileged_obs)
+        transition, self.alg.transition = self.alg.transition, RolloutStorage.Transition()
+        # Step the environment
+        obs, rewards, dones, infos = self.env.step(actions.to(self.env.device))
+        # Move to device
+        # note: the environment overwrites its reward and time-out buffers in-place on the next step
+        rewards, dones = rewards.to(self.device).clone(), dones.to(self.device)
+        if "time_outs" in infos:
+            time_outs = infos["time_outs"].to(self.device).clone()
+        else:
+            time_outs = torch.zeros_like(dones)
+        # perform normalization
+        obs, privileged_obs = self._normalize_observations(obs.to(self.device), infos)
+        # commit the transition asynchronously
+        record = [
+            transition.observations,
+            transition.privileged_observations,
+            transition.actions,
+            transition.values,
+            transition.actions_log_prob,
+            transition.action_mean,
+            transition.action_sigma,
+            rewards,
+            dones,
+            time_outs,
+        ]
+        pipeline.submit(self._commit_transition, transition, rewards, dones, time_outs, record=record)
+        return obs, privileged_obs, infos
+
+    def _commit_transition(
+        self, transition: RolloutStorage.Transition, rewards: torch.Tensor, dones: torch.Tensor, time_outs: torch.Tensor
+    ):
+        """Commit a transition collected by :meth:`_pipelined_step` to the storage.
+
+        This is the equivalent of :meth:`rsl_rl.algorithms.PPO.process_env_step` for a transition that is
+        not the current transition of the algorithm.
+
+        Args:
+            transition: The transition filled by the policy inference.
+            rewards: The rewards of the step.
+            dones: The done flags of the step.
+            time_outs: The time-out flags of the step.
+        """
+        # track the episode statistics
+        self.episode_statistics.add((rewards, torch.ones_like(rewards)), dones)
+        # bootstrapping on time outs
+        transition.rewards = rewards + self.alg.gamma * torch.squeeze(transition.values * time_outs.unsqueeze(1), 1)
+        transition.dones = dones
+        # record the transition
+        self.alg.storage.add_transitions(transition)
+
+    def _normalize_observations(self, obs: torch.Tensor, infos: dict) -> tuple[torch.Tensor, torch.Tensor]:
+        """Normalize the observations of the policy and the critic.
+
+        Args:
+            obs: The observations of the policy on the device of the runner.
+            infos: The step infos of the environment.
+
+        Returns:
+            A tuple containing the normalized observations and privileged observations.
+        """
+        obs = self.obs_normalizer(obs)
+        if self.privileged_obs_type is not None:
+            privileged_obs = self.privileged_obs_normalizer(
+                infos["observations"][self.privileged_obs_type].to(self.device)
+            )
+        else:
+            privileged_obs = obs
+        return obs, privileged_obs
+
+    def _log_histograms(self, histograms: dict[str, dict], it: int):
+        """Log the histograms flushed from the metrics buffer of the environment.
+
+        Args:
+            histograms: The histograms returned by :meth:`~ext_template.envs.MetricsBuffer.flush`.
+            it: The current learning iteration.
+        """
+        for name, histogram in histograms.items():
+            self.writer.add_histogram_raw(
+                name,
+                min=histogram["edges"][0],
+                max=histogram["edges"][-1],
+                num=histogram["num"],
+                sum=histogram["sum"],
+                sum_squares=histogram["sum_squares"],
+                bucket_limits=histogram["edges"][1:],
+                bucket_counts=histogram["counts"],
+                global_step=it,
+            )
+
+    def _log_telemetry(self, it: int):
+        """Log the last sample of the resource telemetry.
+
+        Args:
+            it: The current learning iteration.
+        """
+        sample = self.telemetry.latest()
+        if sample is None:
+            return
+        for name, value in sample.items():
+            self.writer.add_scalar(f"Telemetry/{name}", value, it)
+
+    def _hot_reload_values(self) -> dict:
+        """Current values of the entries of the hot reload file.
+
+        The learning rate is left out with the adaptive schedule, which does not apply it (see :meth:`_apply_hot_reload`).
+        """
+        reward_manager = self.env.unwrapped.reward_manager
+        values = {
+            "learning_rate": self.alg.learning_rate,
+            "entropy_coef": self.alg.entropy_coef,
+            "rewards": {name: reward_manager.get_term_cfg(name).weight for name in reward_manager.active_terms},
+        }
+        if getattr(self.alg, "schedule", None) == "adaptive":
+            del values["learning_rate"]
+        return values
+
+    def _apply_hot_reload(self, it: int):
+        """Apply the changes of the hot reload file and log them.
+
+        Args:
+            it: The current learning iteration.
+        """
+        content = self.hot_reload.poll()
+        if content is None:
+            return
+        reward_manager = self.env.unwrapped.reward_manager
+        current = self._hot_reload_values()
+        changes = []
+        for key, value in content.items():
+            if key == "rewards" and isinstance(value, dict):
+                for name, weight in value.items():
+                    if name not in reward_manager.active_terms or not isinstance(weight, (int, float)):
+                        print(f"[WARN] Hot reload: ignoring the weight of the reward term '{name}': {weight}.")
+                    elif weight != current["rewards"][name]:
+                        term_cfg = reward_manager.get_term_cfg(name)
+                        term_cfg.weight = float(weight)
+                        reward_manager.set_term_cfg(name, term_cfg)
+                        changes.append((f"rewards/{name}", current["rewards"][name], float(weight)))
+            elif key == "learning_rate" and getattr(self.alg, "schedule", None) == "adaptive":
+                # note: the adaptive schedule overwrites the learning rate at every mini-batch of the update
+                print(f"[WARN] Hot reload: ignoring the learning rate {value}, adapted by the 'adaptive' schedule.")
+            elif key in ("learning_rate", "entropy_coef") and isinstance(value, (int, float)):
+                if value == current[key]:
+                    continue
+                setattr(self.alg, key, float(value))
+                if key == "learning_rate":
+                    for param_group in self.alg.optimizer.param_groups:
+                        param_group["lr"] = float(value)
+                changes.append((key, current[key], float(value)))
+            else:
+                print(f"[WARN] Hot reload: ignoring the entry '{key}': {value}.")
+        if not changes:
+            return
+        # record the changes with their iteration
+        lines = [f"iteration {it}: {name}: {old} -> {new}" for name, old, new in changes]
+        with open(os.path.join(self.log_dir, "hot_reload.log"), "a") as f:
+            f.write("\n".join(lines) + "\n")
+        for line in lines:
+            print(f"[INFO] Hot reload at {line}")
+        if self.writer is not None:
+            self.writer.add_text("HotReload", "  \n".join(lines), it)
+            for name, _, new in changes:
+                self.writer.add_scalar(f"HotReload/{name}", new, it)
+
+    def _env_state_snapshot(self) -> EnvStateSnapshot | None:
+        """Snapshot of the persistent state of the environment, or None if it is not a manager-based environment."""
+        env = getattr(self.env, "unwrapped", None)
+        return EnvStateSnapshot(env) if isinstance(env, ManagerBasedRLEnv) else None
+
+    def _save_preemption_checkpoint(self, it: int, tot_iter: int):
+        """Write the checkpoint of a preempted training and mark the run directory as preempted.
+
+        Args:
+            it: The completed learning iteration.
+            tot_iter: The learning iteration at which the training would have stopped.
+        """
+        snapshot = self._env_state_snapshot()
+        path = save_preemption_checkpoint(self, it, tot_iter, snapshot, signal_name=self.preemption.signal_name)
+        self.preempted = True
+        print(f"[INFO] Saved the preemption checkpoint of iteration {it}: {path}")
+
+    def _log_locals(self, locs: dict) -> dict:
+        """Complete the local variables of :meth:`learn` with the entries expected by :meth:`log`.
+
+        The episode statistics are transferred from the device to the host here, once per iteration.
+        """
+        locs = dict(locs)
+        statistics = self.episode_statistics.to_lists()
+        locs["rewbuffer"] = statistics["reward"]
+        locs["lenbuffer"] = statistics["length"]
+        if self.alg.rnd:
+            locs["erewbuffer"] = statistics["extrinsic_reward"]
+            locs["irewbuffer"] = statistics["intrinsic_reward"]
+        return locs
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import torch
+
+from rsl_rl.storage import RolloutStorage
+
+
+class FastRolloutStorage(RolloutStorage):
+    """Rollout storage with a vectorized advantage estimate and copy-free mini-batch generation.
+
+    The storage is a drop-in replacement of :class:`rsl_rl.storage.RolloutStorage` for feed-forward
+    actor-critics trained with PPO. It keeps the same buffers and transition interface and only changes
+    how the collected rollout is post-processed:
+
+    * The generalized advantage estimate (GAE) is computed with a reverse associative scan over the time
+      dimension. This replaces the Python loop over ``num_transitions_per_env`` with ``log2(T)`` batched
+      operations.
+    * The mini-batches are drawn through a single permutation index. The buffers are gathered once per
+      update into pre-allocated shuffled buffers, and every mini-batch of every epoch is a contiguous view
+      into them. The shuffled buffers are allocated on the first update and reused afterwards.
+
+    .. note::
+        As in the original implementation, the same permutation is used for all the learning epochs
+        of an update. The yielded mini-batches are views into the reused buffers, so they are only valid
+        until the next call of :meth:`mini_batch_generator`.
+    """
+
+    @classmethod
+    def from_storage(cls, storage: RolloutStorage) -> FastRolloutStorage:
+        """Create the storage from an existing rollout storage.
+
+        The created storage shares the buffers of the given storage, i.e. no data is copied.
+
+        Args:
+            storage: The rollout storage to convert.
+
+        Returns:
+            The storage sharing the buffers of the input storage.
+        """
+        fast_storage = cls.__new__(cls)
+        fast_storage.__dict__.update(storage.__dict__)
+        fast_storage._init_scan_buffers()
+        return fast_storage
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_scan_buffers()
+
+    def compute_returns(self, last_values, gamma, lam, normalize_advantage: bool = True):
+        # 1 if we are not in a terminal state, 0 otherwise
+        next_is_not_terminal = 1.0 - self.dones.float()
+        # values of the next states: bootstrap the return value at the last step
+        next_values = torch.cat((self.values[1:], last_values.unsqueeze(0)), dim=0)
+        # TD error: r_t + gamma * V(s_{t+1}) - V(s_t)
+        delta = self.rewards + gamma * next_is_not_terminal * next_values - self.values
+        # Advantage: A(s_t, a_t) = delta_t + gamma * lambda * A(s_{t+1}, a_{t+1})
+        self._reverse_linear_scan(delta, gamma * lam * next_is_not_terminal, out=self.advantages)
+        # Return: R_t = A(s_t, a_t) + V(s_t)
+        torch.add(self.advantages, self.values, out=self.returns)
+        # Normalize the advantages if flag is set
+        # This is to prevent double normalization (i.e. if per minibatch normalization is used)
+        if normalize_advantage:
+            mean, std = self.advantages.mean(), self.advantages.std()
+            self.advantages.sub_(mean).div_(std + 1e-8)
+
+    def mini_batch_generator(self, num_mini_batches, num_epochs=8):
+        if self.training_type != "rl":
+            raise ValueError("This function is only available for reinforcement learning training.")
+        batch_size = self.num_envs * self.num_transitions_per_env
+        mini_batch_size = batch_size // num_mini_batches
+        indices = torch.randperm(num_mini_batches * mini_batch_size, requires_grad=False, device=self.device)
+
+        # gather the rollout into the shuffled buffers
+        # note: this is the only copy of the rollout during the update
+        buffers = dict(self._gather_shuffled_buffers(indices))
+        if "privileged_observations" not in buffers:
+            buffers["privileged_observations"] = buffers["observations"]
+
+        for epoch in range(num_epochs):
+            for i in range(num_mini_batches):
+                # Select the slice for the mini-batch
+                batch = slice(i * mini_batch_size, (i + 1) * mini_batch_size)
+                # -- For RND
+                if self.rnd_state_shape is not None:
+                    rnd_state_batch = buffers["rnd_state"][batch]
+                else:
+                    rnd_state_batch = None
+
+                # yield the mini-batch
+                yield (
+                    buffers["observations"][batch],
+                    buffers["privileged_observations"][batch],
+                    buffers["actions"][batch],
+                    buffers["values"][batch],
+                    buffers["advantages"][batch],
+                    buffers["returns"][batch],
+                    buffers["actions_log_prob"][batch],
+                    buffers["mu"][batch],
+                    buffers["sigma"][batch],
+                    (None, None),
+                    None,
+                    rnd_state_batch,
+                )
+
+    """
+    Helper functions.
+    """
+
+    def _init_scan_buffers(self):
+        """Initialize the lazily allocated buffers of the storage."""
+        self._scan_buffers: tuple[torch.Tensor, ...] | None = None
+        self._shuffled_buffers: dict[str, torch.Tensor] = dict()
+
+    def _reverse_linear_scan(self, b: torch.Tensor, a: torch.Tensor, out: torch.Tensor):
+        """Solve the recursion :math:`x_t = b_t + a_t x_{t+1}` with :math:`x_T = 0` over the first dimension.
+
+        The recursion is solved with a Hillis-Steele scan: after the iteration with offset :math:`d`, every
+        element holds the solution of the recursion truncated at :math:`t + 2d`. The scan ping-pongs between
+        pre-allocated buffers so that no memory is allocated after the first call.
+
+        Args:
+            b: The additive terms. Shape is (T, ...).
+            a: The multiplicative terms. Shape is (T, ...).
+            out: The output buffer. Shape is (T, ...).
+        """
+        if self._scan_buffers is None or self._scan_buffers[0].shape != b.shape:
+            self._scan_buffers = tuple(torch.empty_like(b) for _ in range(4))
+        b_cur, b_next, a_cur, a_next = self._scan_buffers
+        b_cur.copy_(b)
+        a_cur.copy_(a)
+        num_steps = b.shape[0]
+        offset = 1
+        while offset < num_steps:
+            # combine each element with the one `offset` steps ahead of it
+            torch.addcmul(b_cur[:-offset], a_cur[:-offset], b_cur[offset:], out=b_next[:-offset])
+            b_next[-offset:] = b_cur[-offset:]
+            # the last iteration does not need the multiplicative terms anymore
+            if 2 * offset < num_steps:
+                torch.mul(a_cur[:-offset], a_cur[offset:], out=a_next[:-offset])
+                a_next[-offset:] = a_cur[-offset:]
+                a_cur, a_next = a_next, a_cur
+            b_cur, b_next = b_next, b_cur
+            offset *= 2
+        out.copy_(b_cur)
+
+    def _gather_shuffled_buffers(self, indices: torch.Tensor) -> dict[str, torch.Tensor]:
+        """Gather the flattened rollout buffers along the given indices into the shuffled buffers.
+
+        Args:
+            indices: The permutation of the flattened (time and environment) indices.
+
+        Returns:
+            The shuffled buffers keyed by the name of the storage attribute.
+        """
+        names = ["observations", "actions", "values", "returns", "actions_log_prob", "advantages", "mu", "sigma"]
+        if self.privileged_observations is not None:
+            names.append("privileged_observations")
+        if self.rnd_state_shape is not None:
+            names.append("rnd_state")
+
+        for name in names:
+            source = getattr(self, name).flatten(0, 1)
+            buffer = self._shuffled_buffers.get(name)
+            if buffer is None or buffer.shape[0] != indices.shape[0]:
+                buffer = torch.empty((indices.shape[0], *source.shape[1:]), dtype=source.dtype, device=self.device)
+                self._shuffled_buffers[name] = buffer
+            torch.index_select(source, 0, indices, out=buffer)
+        return self._shuffled_buffers
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import psutil
+import threading
+import time
+import torch
+
+TELEMETRY_FILE = "telemetry.csv"
+"""Name of the file of the time series in the run directory."""
+
+
+class TelemetrySampler:
+    """Background sampler of the resources used by a training process.
+
+    A daemon thread samples, at a fixed interval:
+
+    * ``rss_mb``: The resident memory of the process.
+    * ``cpu_percent``: The CPU utilization of the process since the previous sample (100 per fully used core).
+    * ``open_files``: The number of open file descriptors (handles on Windows) of the process.
+    * ``log_write_mb_s``: The growth rate of the size of the log directory since the previous sample.
+    * ``device_allocated_mb``, ``device_reserved_mb``: The memory allocated and reserved by PyTorch on the
+      device, if it is a CUDA device.
+    * ``device_used_mb``: The memory used on the device by all the processes (including the simulator), if it is
+      a CUDA device.
+
+    The samples are appended, with their wall-clock time, to the file ``telemetry.csv`` of the log directory, which
+    is flushed after every sample. The last sample is available through :meth:`latest`, for instance to add it to
+    the summary writer of the training.
+    """
+
+    def __init__(self, log_dir: str, interval: float = 10.0, device: str = "cpu"):
+        """Initializes the sampler.
+
+        Args:
+            log_dir: The log directory of the run, holding the time series.
+            interval: The interval between two samples, in seconds. Defaults to 10.0.
+            device: The device whose memory is sampled. Defaults to "cpu", in which case no device memory is sampled.
+        """
+        self.log_dir = log_dir
+        self.path = os.path.join(log_dir, TELEMETRY_FILE)
+        self.interval = interval
+        self.device = torch.device(device)
+        self.sample_device = self.device.type == "cuda" and torch.cuda.is_available()
+        self.fields = ["rss_mb", "cpu_percent", "open_files", "log_write_mb_s"]
+        if self.sample_device:
+            self.fields += ["device_allocated_mb", "device_reserved_mb", "device_used_mb"]
+        self._process = psutil.Process()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._latest: dict[str, float] | None = None
+        self._log_size = 0
+        self._log_time = 0.0
+
+    def start(self):
+        """Start sampling in the background. Does nothing if the sampler is already running."""
+        if self._thread is not None:
+            return
+        os.makedirs(self.log_dir, exist_ok=True)
+        # note: the time series is appended to, for instance when a preempted run is resumed
+        if not os.path.exists(self.path):
+            with open(self.path, "w") as f:
+                f.write(",".join(["time"] + self.fields) + "\n")
+        # note: the first measurements of the CPU utilization and the log growth are relative to this point
+        self._process.cpu_percent(None)
+        self._log_size, self._log_time = _directory_size(self.log_dir), time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="TelemetrySampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the background thread to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def latest(self) -> dict[str, float] | None:
+        """Return the last sample, or None if no sample was taken yet."""
+        with self._lock:
+            return self._latest
+
+    def sample(self) -> dict[str, float]:
+        """Measure the resources used by the process.
+
+        Returns:
+            The values of the fields of the sampler.
+        """
+        now = time.monotonic()
+        log_size = _directory_size(self.log_dir)
+        values = {
+            "rss_mb": self._process.memory_info().rss / 2**20,
+            "cpu_percent": self._process.cpu_percent(None),
+            "open_files": self._process.num_fds() if hasattr(self._process, "num_fds") else self._process.num_handles(),
+            # note: the size of the log directory can shrink when checkpoints are replaced
+            "log_write_mb_s": max(log_size - self._log_size, 0) / 2**20 / max(now - self._log_time, 1e-6),
+        }
+        self._log_size, self._log_time = log_size, now
+        if self.sample_device:
+            free, total = torch.cuda.mem_get_info(self.device)
+            values["device_allocated_mb"] = torch.cuda.memory_allocated(self.device) / 2**20
+            values["device_reserved_mb"] = torch.cuda.memory_reserved(self.device) / 2**20
+            values["device_used_mb"] = (total - free) / 2**20
+        return values
+
+    def _run(self):
+        """Sample the resources until the sampler is stopped."""
+        while not self._stop.wait(self.interval):
+            values = self.sample()
+            with self._lock:
+                self._latest = values
+            with open(self.path, "a") as f:
+                f.write(",".join([f"{time.time():.1f}"] + [f"{values[name]:.6g}" for name in self.fields]) + "\n")
+
+
+"""
+Helper functions.
+"""
+
+
+def _directory_size(path: str) -> int:
+    """Total size of the files in a directory and its subdirectories, in bytes."""
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            # note: the file may be removed during the walk
+            with contextlib.suppress(OSError):
+                size += os.path.getsize(os.path.join(root, name))
+    return size
@@ -1,10 +1,10 @@
 """Package containing task implementations for various robotic environments."""
 
+import importlib
 import os
+import pkgutil
 import toml
 
-from isaaclab_tasks.utils import import_packages
-
 ##
 # Register Gym environments.
 ##
@@ -12,5 +12,19 @@ from isaaclab_tasks.utils import import_packages
 
 # The blacklist is used to prevent importing configs from sub-packages
 _BLACKLIST_PKGS = ["utils"]
+
+
+def _import_packages(path: list[str], prefix: str):
+    """Import the sub-packages of a package recursively, like :func:`isaaclab_tasks.utils.import_packages`.
+
+    The packages are imported with the standard library: importing :mod:`isaaclab_tasks` registers all the tasks of
+    Isaac Lab, which takes several seconds and is not needed by the tools that only resolve the configurations.
+    """
+    for info in pkgutil.iter_modules(path, prefix):
+        if info.ispkg and not any(black_pkg_name in info.name for black_pkg_name in _BLACKLIST_PKGS):
+            package = importlib.import_module(info.name)
+            _import_packages(package.__path__, info.name + ".")
+
+
 # Import all configs in this package
-import_packages(__name__, _BLACKLIST_PKGS)
+_import_packages(__path__, __name__ + ".")
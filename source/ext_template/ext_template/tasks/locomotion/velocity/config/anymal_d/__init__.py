@@ -8,7 +8,7 @@ from . import agents, flat_env_cfg, rough_env_cfg
 
 gym.register(
     id="Ext-Isaac-Velocity-Flat-Anymal-D-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="ext_template.envs:ExtManagerBasedRLEnv",
     disable_env_checker=True,
     kwargs={
         "env_cfg_entry_point": flat_env_cfg.AnymalDFlatEnvCfg,
@@ -18,7 +18,7 @@ gym.register(
 
 gym.register(
     id="Ext-Isaac-Velocity-Flat-Anymal-D-Play-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="ext_template.envs:ExtManagerBasedRLEnv",
     disable_env_checker=True,
     kwargs={
         "env_cfg_entry_point": flat_env_cfg.AnymalDFlatEnvCfg_PLAY,
@@ -28,7 +28,7 @@ gym.register(
 
 gym.register(
     id="Ext-Isaac-Velocity-Rough-Anymal-D-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="ext_template.envs:ExtManagerBasedRLEnv",
     disable_env_checker=True,
     kwargs={
         "env_cfg_entry_point": rough_env_cfg.AnymalDRoughEnvCfg,
@@ -38,10 +38,20 @@ gym.register(
 
 gym.register(
     id="Ext-Isaac-Velocity-Rough-Anymal-D-Play-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="ext_template.envs:ExtManagerBasedRLEnv",
     disable_env_checker=True,
     kwargs={
         "env_cfg_entry_point": rough_env_cfg.AnymalDRoughEnvCfg_PLAY,
         "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:AnymalDRoughPPORunnerCfg",
     },
 )
+
+gym.register(
+    id="Ext-Isaac-Velocity-Surrogate-Anymal-D-v0",
+    entry_point="ext_template.envs:SurrogateManagerBasedRLEnv",
+    disable_env_checker=True,
+    kwargs={
+        "env_cfg_entry_point": rough_env_cfg.AnymalDRoughEnvCfg,
+        "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:AnymalDRoughPPORunnerCfg",
+    },
+)
@@ -19,6 +19,7 @@ class AnymalDFlatEnvCfg(AnymalDRoughEnvCfg):
         # no height scan
         self.scene.height_scanner = None
         self.observations.policy.height_scan = None
+        self.observations.critic.height_scan = None
         # no terrain curriculum
         self.curriculum.terrain_levels = None
 
@@ -36,3 +37,5 @@ class AnymalDFlatEnvCfg_PLAY(AnymalDFlatEnvCfg):
         # remove random pushing
         self.events.base_external_force_torque = None
         self.events.push_robot = None
+        # sample the commands in their full ranges
+        self.curriculum.command_velocity_levels = None
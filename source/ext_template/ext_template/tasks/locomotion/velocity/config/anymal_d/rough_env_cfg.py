@@ -39,3 +39,5 @@ class AnymalDRoughEnvCfg_PLAY(AnymalDRoughEnvCfg):
         # remove random pushing
         self.events.base_external_force_torque = None
         self.events.push_robot = None
+        # sample the commands in their full ranges
+        self.curriculum.command_velocity_levels = None
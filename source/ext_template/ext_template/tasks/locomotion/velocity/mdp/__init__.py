@@ -2,5 +2,8 @@
 
 from isaaclab.envs.mdp import *  # noqa: F401, F403
 
+from .commands import *  # noqa: F401, F403
 from .curriculums import *  # noqa: F401, F403
+from .events import *  # noqa: F401, F403
+from .observations import *  # noqa: F401, F403
 from .rewards import *  # noqa: F401, F403
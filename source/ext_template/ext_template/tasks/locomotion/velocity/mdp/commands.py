@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from isaaclab.envs.mdp import UniformVelocityCommand, UniformVelocityCommandCfg
+from isaaclab.utils import configclass
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+class ScaledVelocityCommand(UniformVelocityCommand):
+    """Uniform velocity command whose ranges are scaled on the device.
+
+    The command behaves like the :class:`~isaaclab.envs.mdp.UniformVelocityCommand`, except that the ranges of
+    the linear velocities and of the angular velocity are multiplied by :attr:`range_scales`: the velocities are
+    sampled uniformly in the scaled ranges, and the angular velocities computed from the heading errors are clipped
+    to the scaled range. The scales are a tensor on the device, so that they can be updated by a curriculum term
+    (see :class:`~ext_template.tasks.locomotion.velocity.mdp.command_velocity_levels`) without copying values to
+    the host. They are one by default, in which case the command is the uniform velocity command.
+    """
+
+    cfg: ScaledVelocityCommandCfg
+    """The configuration of the command generator."""
+
+    def __init__(self, cfg: ScaledVelocityCommandCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        self.range_scales = torch.ones(3, device=self.device)
+        """Scales of the ranges of the forward, lateral and angular velocities. Shape is (3,)."""
+        self._ang_vel_z_range = torch.tensor(cfg.ranges.ang_vel_z, device=self.device)
+
+    """
+    Implementation specific functions.
+    """
+
+    def _resample_command(self, env_ids: Sequence[int]):
+        super()._resample_command(env_ids)
+        # note: scaling the samples of a uniform distribution samples the scaled range
+        self.vel_command_b[env_ids] *= self.range_scales
+
+    def _update_command(self):
+        super()._update_command()
+        # clip the angular velocities computed from the headings to the scaled range
+        ang_vel_z_range = self._ang_vel_z_range * self.range_scales[2]
+        self.vel_command_b[:, 2].clamp_(ang_vel_z_range[0], ang_vel_z_range[1])
+
+
+@configclass
+class ScaledVelocityCommandCfg(UniformVelocityCommandCfg):
+    """Configuration for the uniform velocity command with scaled ranges."""
+
+    class_type: type = ScaledVelocityCommand
@@ -11,11 +11,14 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from isaaclab.assets import Articulation
-from isaaclab.managers import SceneEntityCfg
+from isaaclab.managers import ManagerTermBase, SceneEntityCfg
 from isaaclab.terrains import TerrainImporter
 
+from .commands import ScaledVelocityCommand
+
 if TYPE_CHECKING:
-    from isaaclab.envs import RLTaskEnv
+    from isaaclab.envs import ManagerBasedRLEnv, RLTaskEnv
+    from isaaclab.managers import CurriculumTermCfg
 
 
 def terrain_levels_vel(
@@ -48,3 +51,97 @@ def terrain_levels_vel(
     terrain.update_env_origins(env_ids, move_up, move_down)
     # return the mean terrain level
     return torch.mean(terrain.terrain_levels.float())
+
+
+class command_velocity_levels(ManagerTermBase):
+    """Curriculum widening the ranges of a velocity command once the policy tracks the current ranges.
+
+    The term scales the ranges of a :class:`~ext_template.tasks.locomotion.velocity.mdp.ScaledVelocityCommand`:
+    the scales start at ``initial_scale`` and grow by ``scale_step`` (up to one) on the axes whose tracking reward is
+    high enough. The tracking of the linear velocities (both axes) is measured by the reward term named
+    ``lin_vel_reward``, and the tracking of the angular velocity by the reward term named ``ang_vel_reward``.
+
+    On every reset, the episodic sums of the tracking rewards of the reset environments are normalized like their
+    logged values (by the maximum episode length) and by the current weights of the terms, which may be changed
+    during the training (for instance, by a hot reload), and accumulated on the device. Every ``update_interval``
+    steps of the environment (by default, the maximum episode length), the axes whose average normalized reward
+    exceeds ``threshold`` are widened and the averages restart. The environments reset before their first step, as
+    on the first reset of the environment, are not accumulated. The term never copies values to the host: the step
+    of the last update is held on the device and the update is masked instead of branched on. The state of the term
+    is therefore held in tensors (see :class:`~ext_template.envs.EnvStateSnapshot`).
+
+    Returns:
+        The scales of the ranges of the forward, lateral and angular velocities.
+    """
+
+    def __init__(self, cfg: CurriculumTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        params = cfg.params
+        self.command: ScaledVelocityCommand = env.command_manager.get_term(params.get("command_name", "base_velocity"))
+        if not isinstance(self.command, ScaledVelocityCommand):
+            raise ValueError(f"The command term must be a ScaledVelocityCommand, got {type(self.command).__name__}.")
+        self.command.range_scales[:] = params.get("initial_scale", 0.2)
+        self.reward_names = [
+            params.get("lin_vel_reward", "track_lin_vel_xy_exp"),
+            params.get("ang_vel_reward", "track_ang_vel_z_exp"),
+        ]
+        for name in self.reward_names:
+            if name not in env.reward_manager.active_terms:
+                raise ValueError(f"The reward term '{name}' of the command curriculum is not active.")
+        # index of the reward of each axis of the command
+        self._axis_rewards = torch.tensor([0, 0, 1], device=self.device)
+        self.update_interval: int = params.get("update_interval") or env.max_episode_length
+        # running sums of the normalized rewards and number of accumulated episodes
+        self._reward_sums = torch.zeros(2, device=self.device)
+        self._num_episodes = torch.zeros((), device=self.device)
+        self._last_update_step = torch.tensor(env.common_step_counter, device=self.device)
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        env_ids: Sequence[int],
+        command_name: str = "base_velocity",
+        lin_vel_reward: str = "track_lin_vel_xy_exp",
+        ang_vel_reward: str = "track_ang_vel_z_exp",
+        initial_scale: float = 0.2,
+        scale_step: float = 0.1,
+        threshold: float = 0.8,
+        update_interval: int | None = None,
+    ) -> dict[str, torch.Tensor]:
+        # accumulate the normalized rewards of the episodes that took at least one step
+        is_episode = (env.episode_length_buf[env_ids] > 0).float()
+        # note: the episodic sums are read before the reward manager resets them, and normalized like their logged
+        #   values, then by the weights (host floats, read at every call since they can change during the training)
+        episode_sums = torch.stack(
+            [env.reward_manager._episode_sums[name][env_ids] * _normalization(env, name) for name in self.reward_names]
+        )
+        self._reward_sums += episode_sums @ is_episode
+        self._num_episodes += is_episode.sum()
+        # widen the ranges of the axes that are tracked well enough, once per update interval
+        is_update = env.common_step_counter - self._last_update_step >= self.update_interval
+        is_tracked = self._reward_sums > threshold * self._num_episodes.clamp(min=1.0)
+        is_tracked &= (self._num_episodes > 0) & is_update
+        scales = self.command.range_scales + scale_step * is_tracked[self._axis_rewards]
+        self.command.range_scales[:] = scales.clamp(max=1.0)
+        # restart the averages after an update
+        # note: the tensors are updated in-place, since their references are held by the snapshots of the state
+        self._last_update_step += is_update * (env.common_step_counter - self._last_update_step)
+        self._reward_sums *= ~is_update
+        self._num_episodes *= ~is_update
+        # note: the scales are copied since they are logged and modified in-place by the following updates
+        scales = self.command.range_scales.clone()
+        return {"lin_vel_x": scales[0], "lin_vel_y": scales[1], "ang_vel_z": scales[2]}
+
+
+"""
+Helper functions.
+"""
+
+
+def _normalization(env: ManagerBasedRLEnv, reward_name: str) -> float:
+    """Factor normalizing the episodic sum of a reward term like its logged value, then by its current weight.
+
+    The sums of the terms with a zero weight, which are not accumulated by the reward manager, are ignored.
+    """
+    weight = env.reward_manager.get_term_cfg(reward_name).weight
+    return 1.0 / (weight * env.max_episode_length_s) if weight != 0.0 else 0.0
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+import isaaclab.utils.math as math_utils
+from isaaclab.assets import Articulation
+from isaaclab.managers import ManagerTermBase, SceneEntityCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+    from isaaclab.managers import EventTermCfg
+
+_AXES = ("x", "y", "z", "roll", "pitch", "yaw")
+"""Keys of the ranges of the root pose and velocity."""
+
+
+class reset_root_and_joint_state(ManagerTermBase):
+    """Reset the root state and the joint state of an articulation in a single term.
+
+    The term fuses :func:`~isaaclab.envs.mdp.reset_root_state_uniform` and
+    :func:`~isaaclab.envs.mdp.reset_joints_by_scale`, with the same parameters and distributions: the root pose and
+    velocity are offset from the default root state by values sampled uniformly in ``pose_range`` and
+    ``velocity_range``, and the default joint positions and velocities are scaled by values sampled uniformly in
+    ``joint_position_range`` and ``joint_velocity_range`` (then clamped to the soft joint limits).
+
+    The bounds of the ranges are stored as tensors when the term is created, all the values of the reset
+    environments are drawn at once, and the articulation receives a single write of its root state and a single
+    write of its joint state.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        self.asset_cfg: SceneEntityCfg = cfg.params.get("asset_cfg", SceneEntityCfg("robot"))
+        self.asset: Articulation = env.scene[self.asset_cfg.name]
+        joint_ids = self.asset_cfg.joint_ids
+        num_joints = self.asset.num_joints if isinstance(joint_ids, slice) else len(joint_ids)
+        # bounds of the samples: root pose (6), root velocity (6), joint position scales and joint velocity scales
+        ranges = [cfg.params["pose_range"].get(key, (0.0, 0.0)) for key in _AXES]
+        ranges += [cfg.params["velocity_range"].get(key, (0.0, 0.0)) for key in _AXES]
+        ranges += [cfg.params["joint_position_range"]] * num_joints
+        ranges += [cfg.params["joint_velocity_range"]] * num_joints
+        ranges = torch.tensor(ranges, device=self.device)
+        self._lower = ranges[:, 0]
+        self._width = ranges[:, 1] - ranges[:, 0]
+        self._num_joints = num_joints
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor | None,
+        pose_range: dict[str, tuple[float, float]],
+        velocity_range: dict[str, tuple[float, float]],
+        joint_position_range: tuple[float, float],
+        joint_velocity_range: tuple[float, float],
+        asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+    ):
+        if env_ids is None:
+            env_ids = torch.arange(env.scene.num_envs, device=self.device)
+        data = self.asset.data
+        # sample all the values at once
+        samples = torch.rand(len(env_ids), self._lower.numel(), device=self.device) * self._width + self._lower
+        pose_samples, velocity_samples, position_scales, velocity_scales = samples.split(
+            [6, 6, self._num_joints, self._num_joints], dim=1
+        )
+        # root state
+        root_state = data.default_root_state[env_ids].clone()
+        root_state[:, 0:3] += env.scene.env_origins[env_ids] + pose_samples[:, 0:3]
+        orientations_delta = math_utils.quat_from_euler_xyz(pose_samples[:, 3], pose_samples[:, 4], pose_samples[:, 5])
+        root_state[:, 3:7] = math_utils.quat_mul(root_state[:, 3:7], orientations_delta)
+        root_state[:, 7:13] += velocity_samples
+        # joint state
+        joint_ids = self.asset_cfg.joint_ids
+        # note: the environment indices are broadcast against a subset of the joints
+        rows = env_ids if isinstance(joint_ids, slice) else env_ids[:, None]
+        joint_pos = data.default_joint_pos[rows, joint_ids] * position_scales
+        joint_vel = data.default_joint_vel[rows, joint_ids] * velocity_scales
+        joint_pos_limits = data.soft_joint_pos_limits[rows, joint_ids]
+        joint_pos.clamp_(joint_pos_limits[..., 0], joint_pos_limits[..., 1])
+        joint_vel_limits = data.soft_joint_vel_limits[rows, joint_ids]
+        joint_vel.clamp_(-joint_vel_limits, joint_vel_limits)
+        # set into the physics simulation
+        self.asset.write_root_state_to_sim(root_state, env_ids=env_ids)
+        self.asset.write_joint_state_to_sim(joint_pos, joint_vel, joint_ids=joint_ids, env_ids=env_ids)
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import torch
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from isaaclab.assets import Articulation
+from isaaclab.envs.mdp import height_scan
+from isaaclab.managers import ManagerTermBase, SceneEntityCfg
+from isaaclab.sensors import ContactSensor, RayCaster
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv, ManagerBasedRLEnv
+    from isaaclab.managers import ObservationTermCfg
+
+
+def contact_states(env: ManagerBasedEnv, sensor_cfg: SceneEntityCfg, threshold: float = 1.0) -> torch.Tensor:
+    """Contact states of the selected bodies.
+
+    A body is in contact if the norm of its net contact force exceeds the threshold over the history of the sensor.
+    """
+    # extract the used quantities (to enable type-hinting)
+    contact_sensor: ContactSensor = env.scene.sensors[sensor_cfg.name]
+    # check if contact force is above threshold
+    net_contact_forces = contact_sensor.data.net_forces_w_history
+    is_contact = torch.max(torch.norm(net_contact_forces[:, :, sensor_cfg.body_ids], dim=-1), dim=1)[0] > threshold
+    return is_contact.float()
+
+
+class _StartupPropertyTerm(ManagerTermBase, ABC):
+    """Base class of the terms observing physical properties of an asset that are randomized at startup.
+
+    The properties are read from the physics simulation, which copies them to the host. They are therefore read
+    once, at the first reset of the environments (after the startup events), and cached on the device. Properties
+    randomized by reset or interval events are not tracked. When the startup events are applied again (see
+    :func:`~ext_template.envs.reconfigure_env`), the cache must be cleared with :meth:`invalidate`.
+    """
+
+    def __init__(self, cfg: ObservationTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        self.asset_cfg: SceneEntityCfg = cfg.params.get("asset_cfg", SceneEntityCfg("robot"))
+        self.asset: Articulation = env.scene[self.asset_cfg.name]
+        self._values: torch.Tensor | None = None
+
+    def invalidate(self):
+        """Clear the cached properties, which are read again at the next reset."""
+        self._values = None
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        if self._values is None:
+            self._values = self._read()
+
+    def __call__(self, env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+        # note: the properties are read without caching before the first reset (for instance, when the
+        #   observation manager resolves the dimension of the term)
+        return self._values if self._values is not None else self._read()
+
+    @abstractmethod
+    def _read(self) -> torch.Tensor:
+        """Read the properties of the asset from the physics simulation."""
+        raise NotImplementedError
+
+
+class rigid_body_friction(_StartupPropertyTerm):
+    """Static and dynamic friction coefficients of the asset, averaged over its collision shapes.
+
+    The coefficients are randomized by :class:`~isaaclab.envs.mdp.randomize_rigid_body_material`.
+    """
+
+    def _read(self) -> torch.Tensor:
+        materials = self.asset.root_physx_view.get_material_properties()
+        return materials[..., :2].mean(dim=1).to(self.device)
+
+
+class rigid_body_mass(_StartupPropertyTerm):
+    """Offsets of the masses of the selected bodies from their default masses.
+
+    The masses are randomized by :func:`~isaaclab.envs.mdp.randomize_rigid_body_mass`.
+    """
+
+    def _read(self) -> torch.Tensor:
+        masses = self.asset.root_physx_view.get_masses()
+        body_ids = self.asset_cfg.body_ids
+        return (masses[:, body_ids] - self.asset.data.default_mass[:, body_ids]).to(self.device)
+
+
+class observation_history(ManagerTermBase):
+    """History of an observation term, stored in a preallocated ring buffer.
+
+    The term evaluates the function and parameters of the source term ``term`` once per step of the environment and
+    returns its values over the last ``history_length`` steps, flattened and ordered from the oldest to the newest.
+    The other attributes of the source term are ignored: the noise, clipping and scaling of the history are
+    configured on the history term itself, like for any other term.
+
+    Every value is written twice in a buffer of ``2 * history_length`` steps per environment, so that the history is
+    always a contiguous slice of the buffer, which is returned as a view without copying. The view is overwritten by
+    the following steps: it must not be modified in-place or kept by the consumer. The
+    :class:`~ext_template.managers.ExtObservationManager` only copies it if the term is post-processed in-place or
+    if the terms of the group are not concatenated.
+
+    Further computations of the observations within a step overwrite the newest value instead of appending it.
+    After a reset, the history of the reset environments is filled with their first value. A history length of
+    zero disables the term, which then has no dimension.
+    """
+
+    def __init__(self, cfg: ObservationTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        self.source_cfg = _resolve_source_term(cfg, env)
+        self.history_length: int = cfg.params["history_length"]
+        self._empty = torch.empty(self.num_envs, 0, device=self.device)
+        # ring buffer, allocated at the first computation once the dimension of the source term is known
+        self._buffer: torch.Tensor | None = None
+        # index of the newest value in the first half of the buffer and step of the environment it belongs to
+        self._index = -1
+        self._step = -1
+        # environments whose history must be filled with their next value
+        self._fill_ids: list[torch.Tensor] | None = None
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            # fill the history of all the environments
+            self._fill_ids = None
+        elif self._fill_ids is not None:
+            self._fill_ids.append(torch.as_tensor(env_ids, device=self.device, dtype=torch.long))
+
+    def __call__(self, env: ManagerBasedRLEnv, term: ObservationTermCfg, history_length: int) -> torch.Tensor:
+        if self.history_length == 0:
+            return self._empty
+        value = self.source_cfg.func(env, **self.source_cfg.params).reshape(self.num_envs, -1)
+        if self._buffer is None:
+            self._buffer = torch.empty(self.num_envs, 2 * self.history_length, value.shape[1], device=self.device)
+            self._fill_ids = None
+        # append the value at a new step, overwrite the newest value within a step
+        if env.common_step_counter != self._step:
+            self._step = env.common_step_counter
+            self._index = (self._index + 1) % self.history_length
+        self._buffer[:, self._index] = value
+        self._buffer[:, self._index + self.history_length] = value
+        # fill the history of the reset environments
+        if self._fill_ids is None:
+            self._buffer[:] = value.unsqueeze(1)
+            self._fill_ids = []
+        elif self._fill_ids:
+            env_ids = torch.cat(self._fill_ids)
+            self._buffer[env_ids] = value[env_ids].unsqueeze(1)
+            self._fill_ids = []
+        # contiguous slice of the buffer from the oldest to the newest value
+        start = self._index + 1
+        return self._buffer[:, start : start + self.history_length].flatten(start_dim=1)
+
+
+class held_observation(ManagerTermBase):
+    """Observation term refreshed every ``update_period`` steps of the environment and held in-between.
+
+    The term evaluates the function and parameters of the source term ``term`` when the step counter of the
+    environment is a multiple of the update period, and returns the last value otherwise. Like for
+    :class:`observation_history`, the other attributes of the source term are ignored. The value of the environments
+    that were reset is refreshed at the next computation. For the height scan (:func:`isaaclab.envs.mdp.height_scan`),
+    only the rays of the reset environments are cast for this refresh. The other source terms compute the values of
+    all the environments, of which only the rows of the reset environments are kept.
+
+    Holding the terms that read lazily updated sensors, like the height scan of the ray caster, also skips the
+    updates of the sensors in-between, as long as no other term reads them. The returned tensor is the buffer of the
+    held value: it must not be modified in-place by the consumer.
+    """
+
+    def __init__(self, cfg: ObservationTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        self.source_cfg = _resolve_source_term(cfg, env)
+        self.update_period: int = cfg.params["update_period"]
+        if self.update_period < 1:
+            raise ValueError(f"The update period must be a positive number of steps, got: {self.update_period}.")
+        # held value, allocated at the first computation
+        self._buffer: torch.Tensor | None = None
+        # step of the environment of the last refresh
+        self._step = -1
+        # environments whose value must be refreshed (None for all the environments)
+        self._reset_ids: list[torch.Tensor] | None = None
+        # function computing the value of selected environments only (None if the source term has none)
+        self._source_rows_func = _SOURCE_ROWS_FUNCS.get(self.source_cfg.func)
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            self._reset_ids = None
+        elif self._reset_ids is not None:
+            self._reset_ids.append(torch.as_tensor(env_ids, device=self.device, dtype=torch.long))
+
+    def __call__(self, env: ManagerBasedRLEnv, term: ObservationTermCfg, update_period: int) -> torch.Tensor:
+        step = env.common_step_counter
+        if self._buffer is None:
+            self._buffer = self.source_cfg.func(env, **self.source_cfg.params).clone()
+            self._step = step
+            self._reset_ids = []
+        elif (step != self._step and step % self.update_period == 0) or self._reset_ids is None:
+            # refresh the value of all the environments
+            self._buffer.copy_(self.source_cfg.func(env, **self.source_cfg.params))
+            self._step = step
+            self._reset_ids = []
+        elif self._reset_ids:
+            # refresh the value of the reset environments
+            env_ids = torch.cat(self._reset_ids)
+            if self._source_rows_func is not None:
+                self._buffer[env_ids] = self._source_rows_func(env, env_ids, **self.source_cfg.params)
+            else:
+                self._buffer[env_ids] = self.source_cfg.func(env, **self.source_cfg.params)[env_ids]
+            self._reset_ids = []
+        return self._buffer
+
+
+"""
+Helper functions.
+"""
+
+
+def _resolve_source_term(cfg: ObservationTermCfg, env: ManagerBasedEnv) -> ObservationTermCfg:
+    """Return the source term of a term wrapping another term, with its scene entities resolved.
+
+    The observation manager only resolves the scene entities in the parameters of the wrapping term.
+    """
+    source_cfg: ObservationTermCfg = cfg.params["term"]
+    if isinstance(source_cfg.func, type):
+        raise TypeError(f"The source term must be a function, got: {source_cfg.func}.")
+    for value in source_cfg.params.values():
+        if isinstance(value, SceneEntityCfg):
+            value.resolve(env.scene)
+    return source_cfg
+
+
+def _height_scan_rows(
+    env: ManagerBasedEnv, env_ids: torch.Tensor, sensor_cfg: SceneEntityCfg, offset: float = 0.5
+) -> torch.Tensor:
+    """Height scan of the given environments, like :func:`isaaclab.envs.mdp.height_scan` for all of them.
+
+    Only the rays of the given environments are cast, which are marked as up to date: reading the data of the sensor
+    would cast the rays of all its outdated environments.
+    """
+    sensor: RayCaster = env.scene.sensors[sensor_cfg.name]
+    sensor._update_buffers_impl(env_ids)
+    sensor._timestamp_last_update[env_ids] = sensor._timestamp[env_ids]
+    sensor._is_outdated[env_ids] = False
+    return sensor._data.pos_w[env_ids, 2].unsqueeze(1) - sensor._data.ray_hits_w[env_ids, ..., 2] - offset
+
+
+_SOURCE_ROWS_FUNCS = {height_scan: _height_scan_rows}
+"""Functions computing the value of the source terms of :class:`held_observation` for selected environments."""
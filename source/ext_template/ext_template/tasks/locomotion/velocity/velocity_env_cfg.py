@@ -20,6 +20,7 @@ from isaaclab.utils import configclass
 from isaaclab.utils.noise import AdditiveUniformNoiseCfg as Unoise
 
 import ext_template.tasks.locomotion.velocity.mdp as mdp
+from ext_template.terrains import cached_terrain_generator_cfg
 
 ##
 # Pre-defined configs
@@ -40,7 +41,7 @@ class MySceneCfg(InteractiveSceneCfg):
     terrain = TerrainImporterCfg(
         prim_path="/World/ground",
         terrain_type="generator",
-        terrain_generator=ROUGH_TERRAINS_CFG,
+        terrain_generator=cached_terrain_generator_cfg(ROUGH_TERRAINS_CFG),
         max_init_terrain_level=5,
         collision_group=-1,
         physics_material=sim_utils.RigidBodyMaterialCfg(
@@ -66,6 +67,7 @@ class MySceneCfg(InteractiveSceneCfg):
         debug_vis=False,
         mesh_prim_paths=["/World/ground"],
     )
+    # note: the environment restricts the sensor to the bodies referenced by the terms (see finalize_env_cfg)
     contact_forces = ContactSensorCfg(prim_path="{ENV_REGEX_NS}/Robot/.*", history_length=3, track_air_time=True)
     # lights
     light = AssetBaseCfg(
@@ -87,7 +89,8 @@ class MySceneCfg(InteractiveSceneCfg):
 class CommandsCfg:
     """Command specifications for the MDP."""
 
-    base_velocity = mdp.UniformVelocityCommandCfg(
+    # note: the ranges are widened by the command curriculum (see command_velocity_levels)
+    base_velocity = mdp.ScaledVelocityCommandCfg(
         asset_name="robot",
         resampling_time_range=(10.0, 10.0),
         rel_standing_envs=0.02,
@@ -95,7 +98,7 @@ class CommandsCfg:
         heading_command=True,
         heading_control_stiffness=0.5,
         debug_vis=True,
-        ranges=mdp.UniformVelocityCommandCfg.Ranges(
+        ranges=mdp.ScaledVelocityCommandCfg.Ranges(
             lin_vel_x=(-1.0, 1.0), lin_vel_y=(-1.0, 1.0), ang_vel_z=(-1.0, 1.0), heading=(-math.pi, math.pi)
         ),
     )
@@ -117,7 +120,7 @@ class ObservationsCfg:
         """Observations for policy group."""
 
         # observation terms (order preserved)
-        base_lin_vel = ObsTerm(func=mdp.base_lin_vel, noise=Unoise(n_min=-0.1, n_max=0.1))
+        # note: the base linear velocity is only observed by the critic
         base_ang_vel = ObsTerm(func=mdp.base_ang_vel, noise=Unoise(n_min=-0.2, n_max=0.2))
         projected_gravity = ObsTerm(
             func=mdp.projected_gravity,
@@ -127,9 +130,27 @@ class ObservationsCfg:
         joint_pos = ObsTerm(func=mdp.joint_pos_rel, noise=Unoise(n_min=-0.01, n_max=0.01))
         joint_vel = ObsTerm(func=mdp.joint_vel_rel, noise=Unoise(n_min=-1.5, n_max=1.5))
         actions = ObsTerm(func=mdp.last_action)
+        # note: the histories include the current step and are disabled with a history length of zero
+        joint_pos_history = ObsTerm(
+            func=mdp.observation_history,
+            params={"term": ObsTerm(func=mdp.joint_pos_rel), "history_length": 0},
+            noise=Unoise(n_min=-0.01, n_max=0.01),
+        )
+        joint_vel_history = ObsTerm(
+            func=mdp.observation_history,
+            params={"term": ObsTerm(func=mdp.joint_vel_rel), "history_length": 0},
+            noise=Unoise(n_min=-1.5, n_max=1.5),
+        )
+        actions_history = ObsTerm(
+            func=mdp.observation_history, params={"term": ObsTerm(func=mdp.last_action), "history_length": 0}
+        )
+        # note: the height scan is refreshed every update period (in steps) and held in-between
         height_scan = ObsTerm(
-            func=mdp.height_scan,
-            params={"sensor_cfg": SceneEntityCfg("height_scanner")},
+            func=mdp.held_observation,
+            params={
+                "term": ObsTerm(func=mdp.height_scan, params={"sensor_cfg": SceneEntityCfg("height_scanner")}),
+                "update_period": 1,
+            },
             noise=Unoise(n_min=-0.1, n_max=0.1),
             clip=(-1.0, 1.0),
         )
@@ -138,8 +159,50 @@ class ObservationsCfg:
             self.enable_corruption = True
             self.concatenate_terms = True
 
+    @configclass
+    class CriticCfg(ObsGroup):
+        """Observations for critic group.
+
+        The critic observes the noise-free terms of the policy group and privileged terms that are not available
+        on the robot: the base linear velocity, the contact states of the feet and the randomized physical
+        properties of the robot.
+        """
+
+        # observation terms (order preserved)
+        base_lin_vel = ObsTerm(func=mdp.base_lin_vel)
+        base_ang_vel = ObsTerm(func=mdp.base_ang_vel)
+        projected_gravity = ObsTerm(func=mdp.projected_gravity)
+        velocity_commands = ObsTerm(func=mdp.generated_commands, params={"command_name": "base_velocity"})
+        joint_pos = ObsTerm(func=mdp.joint_pos_rel)
+        joint_vel = ObsTerm(func=mdp.joint_vel_rel)
+        actions = ObsTerm(func=mdp.last_action)
+        # note: the ray casts are only skipped if no group reads the height scan: it should be held with the same
+        #   update period as in the policy group
+        height_scan = ObsTerm(
+            func=mdp.held_observation,
+            params={
+                "term": ObsTerm(func=mdp.height_scan, params={"sensor_cfg": SceneEntityCfg("height_scanner")}),
+                "update_period": 1,
+            },
+            clip=(-1.0, 1.0),
+        )
+        # privileged terms
+        feet_contact = ObsTerm(
+            func=mdp.contact_states,
+            params={"sensor_cfg": SceneEntityCfg("contact_forces", body_names=".*FOOT"), "threshold": 1.0},
+        )
+        friction = ObsTerm(func=mdp.rigid_body_friction, params={"asset_cfg": SceneEntityCfg("robot")})
+        base_mass = ObsTerm(
+            func=mdp.rigid_body_mass, params={"asset_cfg": SceneEntityCfg("robot", body_names="base")}, scale=0.2
+        )
+
+        def __post_init__(self):
+            self.enable_corruption = False
+            self.concatenate_terms = True
+
     # observation groups
     policy: PolicyCfg = PolicyCfg()
+    critic: CriticCfg = CriticCfg()
 
 
 @configclass
@@ -180,8 +243,9 @@ class EventCfg:
         },
     )
 
-    reset_base = EventTerm(
-        func=mdp.reset_root_state_uniform,
+    # note: the root and joint states are sampled and written together (see reset_root_and_joint_state)
+    reset_robot = EventTerm(
+        func=mdp.reset_root_and_joint_state,
         mode="reset",
         params={
             "pose_range": {"x": (-0.5, 0.5), "y": (-0.5, 0.5), "yaw": (-3.14, 3.14)},
@@ -193,15 +257,8 @@ class EventCfg:
                 "pitch": (-0.5, 0.5),
                 "yaw": (-0.5, 0.5),
             },
-        },
-    )
-
-    reset_robot_joints = EventTerm(
-        func=mdp.reset_joints_by_scale,
-        mode="reset",
-        params={
-            "position_range": (0.5, 1.5),
-            "velocity_range": (0.0, 0.0),
+            "joint_position_range": (0.5, 1.5),
+            "joint_velocity_range": (0.0, 0.0),
         },
     )
 
@@ -266,6 +323,17 @@ class CurriculumCfg:
     """Curriculum terms for the MDP."""
 
     terrain_levels = CurrTerm(func=mdp.terrain_levels_vel)
+    command_velocity_levels = CurrTerm(
+        func=mdp.command_velocity_levels,
+        params={
+            "command_name": "base_velocity",
+            "lin_vel_reward": "track_lin_vel_xy_exp",
+            "ang_vel_reward": "track_ang_vel_z_exp",
+            "initial_scale": 0.2,
+            "scale_step": 0.1,
+            "threshold": 0.8,
+        },
+    )
 
 
 ##
@@ -288,6 +356,14 @@ class LocomotionVelocityRoughEnvCfg(ManagerBasedRLEnvCfg):
     terminations: TerminationsCfg = TerminationsCfg()
     events: EventCfg = EventCfg()
     curriculum: CurriculumCfg = CurriculumCfg()
+    # Pruning of the terms without effect
+    prune_noop_terms: bool = True
+    """Whether the environment prunes the reward and event terms without effect on creation. Default is True.
+
+    The terms are pruned by :func:`~ext_template.envs.prune_noop_terms` when the environment is created, i.e. after
+    the overrides of the configuration (see :func:`~ext_template.envs.finalize_env_cfg`). The pruned reward terms
+    cannot be re-enabled during training: the pruning is disabled when the hot reload of the rewards is enabled.
+    """
 
     def __post_init__(self):
         """Post initialization."""
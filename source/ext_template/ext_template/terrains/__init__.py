@@ -0,0 +1,8 @@
+"""Terrains of this extension.
+
+The terrain generators extend the ones from :mod:`isaaclab.terrains` and are configured with the same
+configuration classes.
+"""
+
+from .terrain_generator import CachedTerrainGenerator, terrain_cache_key
+from .terrain_generator_cfg import CachedTerrainGeneratorCfg, cached_terrain_generator_cfg
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import numpy as np
+import os
+import shutil
+import tempfile
+import time
+import torch
+import trimesh
+import uuid
+from typing import TYPE_CHECKING
+
+import omni.log
+
+import isaaclab
+from isaaclab.terrains import HfTerrainBaseCfg, TerrainGenerator
+from isaaclab.utils.dict import class_to_dict, dict_to_md5_hash
+
+if TYPE_CHECKING:
+    from .terrain_generator_cfg import CachedTerrainGeneratorCfg
+
+CACHE_VERSION = 1
+"""Version of the layout of the cached terrains."""
+
+_STALE_TMP_AGE = 3600.0
+"""Age in seconds after which the temporary directories of interrupted writes are removed."""
+
+
+class CachedTerrainGenerator(TerrainGenerator):
+    """Terrain generator that caches the generated terrains on disk.
+
+    The generated terrain is identified by the hash of the resolved configuration of the generator (see
+    :func:`terrain_cache_key`). The first launch generates the terrain and stores the vertices and triangles of its
+    mesh, the origins of the sub-terrains and the flat patches as NumPy arrays. The following launches with the same
+    configuration memory-map the arrays instead of generating the terrain.
+
+    The cache directory can be shared by concurrent jobs: the terrains are written in temporary directories that are
+    renamed once complete, so that a terrain is either fully visible or not at all. When the size of the cache
+    exceeds :attr:`CachedTerrainGeneratorCfg.max_cache_size`, the least recently used terrains are evicted.
+
+    The meshes of the individual sub-terrains (:attr:`terrain_meshes`) are not cached: they are empty for the
+    terrains loaded from the cache.
+    """
+
+    def __init__(self, cfg: CachedTerrainGeneratorCfg, device: str = "cpu"):
+        """Initialize the terrain generator.
+
+        Args:
+            cfg: Configuration for the terrain generator.
+            device: The device to use for the flat patches tensor.
+        """
+        key = terrain_cache_key(cfg)
+        path = os.path.join(cfg.terrain_cache_dir, key)
+        start = time.perf_counter()
+        if self._load(cfg, device, path):
+            print(f"[INFO] Loading the terrain from the cache took: {time.perf_counter() - start:.3f} s ({path})")
+            return
+        # generate the terrain and store it in the cache
+        super().__init__(cfg, device)
+        try:
+            self._store(path)
+            _evict(cfg.terrain_cache_dir, cfg.max_cache_size, keep=key)
+        except OSError as e:
+            omni.log.warn(f"Unable to store the terrain in the cache '{cfg.terrain_cache_dir}': {e}")
+
+    """
+    Helper functions.
+    """
+
+    def _load(self, cfg: CachedTerrainGeneratorCfg, device: str, path: str) -> bool:
+        """Load the terrain from the cache, and return whether it was found."""
+        if not os.path.isdir(path):
+            return False
+        try:
+            with open(os.path.join(path, "meta.json")) as f:
+                meta = json.load(f)
+            vertices = np.load(os.path.join(path, "vertices.npy"), mmap_mode="c")
+            faces = np.load(os.path.join(path, "faces.npy"), mmap_mode="c")
+            origins = np.load(os.path.join(path, "origins.npy"))
+            flat_patches = {
+                name: torch.from_numpy(np.load(os.path.join(path, f"flat_patches_{name}.npy"))).to(device)
+                for name in meta["flat_patches"]
+            }
+            colors = np.load(os.path.join(path, "colors.npy"), mmap_mode="c") if meta["colors"] else None
+        except (OSError, ValueError, KeyError) as e:
+            # note: the terrain may have been evicted by a concurrent job
+            omni.log.warn(f"Unable to load the cached terrain '{path}': {e}")
+            return False
+        # mark the terrain as recently used
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        self.cfg = cfg
+        self.device = device
+        self.terrain_meshes = list()
+        self.terrain_origins = origins
+        self.flat_patches = flat_patches
+        # note: the arrays are mapped copy-on-write, so that the mesh can be modified without modifying the cache
+        self.terrain_mesh = trimesh.Trimesh(vertices=vertices, faces=faces, vertex_colors=colors, process=False)
+        return True
+
+    def _store(self, path: str):
+        """Store the generated terrain in the cache."""
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # write the terrain in a temporary directory, which is then renamed atomically
+        tmp_path = tempfile.mkdtemp(prefix=".tmp-", dir=cache_dir)
+        try:
+            np.save(os.path.join(tmp_path, "vertices.npy"), np.asarray(self.terrain_mesh.vertices))
+            np.save(os.path.join(tmp_path, "faces.npy"), np.asarray(self.terrain_mesh.faces))
+            np.save(os.path.join(tmp_path, "origins.npy"), self.terrain_origins)
+            for name, patches in self.flat_patches.items():
+                np.save(os.path.join(tmp_path, f"flat_patches_{name}.npy"), patches.cpu().numpy())
+            colors = self.cfg.color_scheme != "none"
+            if colors:
+                np.save(os.path.join(tmp_path, "colors.npy"), np.asarray(self.terrain_mesh.visual.vertex_colors))
+            meta = {
+                "version": CACHE_VERSION,
+                "flat_patches": list(self.flat_patches.keys()),
+                "colors": colors,
+                "cfg": _cache_dict(self.cfg),
+            }
+            with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+                json.dump(meta, f, indent=2)
+            os.rename(tmp_path, path)
+        except OSError:
+            # note: the rename fails if a concurrent job stored the same terrain first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+
+
+def terrain_cache_key(cfg: CachedTerrainGeneratorCfg) -> str:
+    """Hash of the resolved configuration of a terrain generator, which identifies the generated terrain.
+
+    The configuration is resolved as in the :class:`~isaaclab.terrains.TerrainGenerator`: the common parameters
+    are set in the configurations of the sub-terrains, and an unset seed is replaced by the seed drawn from the
+    global NumPy random state. The parameters of the cache do not contribute to the hash.
+
+    Args:
+        cfg: The configuration of the terrain generator. The configurations of its sub-terrains are modified
+            in-place, like in the :class:`~isaaclab.terrains.TerrainGenerator`.
+
+    Returns:
+        The hash of the configuration.
+    """
+    for sub_cfg in cfg.sub_terrains.values():
+        sub_cfg.size = cfg.size
+        if isinstance(sub_cfg, HfTerrainBaseCfg):
+            sub_cfg.horizontal_scale = cfg.horizontal_scale
+            sub_cfg.vertical_scale = cfg.vertical_scale
+            sub_cfg.slope_threshold = cfg.slope_threshold
+    data = _cache_dict(cfg)
+    # note: the generator draws the same seed when it is not set
+    data["seed"] = int(cfg.seed if cfg.seed is not None else np.random.get_state()[1][0])
+    data["version"] = [CACHE_VERSION, getattr(isaaclab, "__version__", None)]
+    return dict_to_md5_hash(data)
+
+
+"""
+Helper functions.
+"""
+
+
+def _cache_dict(cfg: CachedTerrainGeneratorCfg) -> dict:
+    """Convert the configuration into a dictionary without the parameters that do not affect the terrain."""
+    data = class_to_dict(cfg)
+    for name in ("class_type", "terrain_cache_dir", "max_cache_size", "use_cache", "cache_dir"):
+        data.pop(name, None)
+    return data
+
+
+def _evict(cache_dir: str, max_size: int, keep: str):
+    """Evict the least recently used terrains until the size of the cache is below the maximum size."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        try:
+            if name.startswith("."):
+                # remove the temporary directories of interrupted writes
+                if time.time() - os.path.getmtime(path) > _STALE_TMP_AGE:
+                    shutil.rmtree(path, ignore_errors=True)
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(path))
+            entries.append((os.path.getmtime(path), size, name))
+        except OSError:
+            # note: the entry may have been evicted by a concurrent job
+            continue
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total_size <= max_size:
+            break
+        if name == keep:
+            continue
+        # note: the terrain is renamed first so that concurrent jobs do not load a partially removed terrain
+        evicted_path = os.path.join(cache_dir, f".evicted-{uuid.uuid4().hex}")
+        try:
+            os.rename(os.path.join(cache_dir, name), evicted_path)
+        except OSError:
+            continue
+        shutil.rmtree(evicted_path, ignore_errors=True)
+        total_size -= size
+        print(f"[INFO] Evicted the terrain '{name}' from the cache ({size / 1024**2:.1f} MiB).")
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from isaaclab.terrains import TerrainGeneratorCfg
+from isaaclab.utils import configclass
+
+from .terrain_generator import CachedTerrainGenerator
+
+
+@configclass
+class CachedTerrainGeneratorCfg(TerrainGeneratorCfg):
+    """Configuration for the terrain generator with a cache of the generated terrains."""
+
+    class_type: type = CachedTerrainGenerator
+
+    terrain_cache_dir: str = "/tmp/ext_template/terrains"
+    """The directory of the cache of the generated terrains. Defaults to "/tmp/ext_template/terrains".
+
+    The directory can be shared by concurrent jobs.
+    """
+
+    max_cache_size: int = 2 * 1024**3
+    """The maximum size of the cache in bytes. Defaults to 2 GiB.
+
+    The least recently used terrains are evicted when a new terrain makes the cache exceed this size.
+    """
+
+
+def cached_terrain_generator_cfg(cfg: TerrainGeneratorCfg, **kwargs) -> CachedTerrainGeneratorCfg:
+    """Convert a terrain generator configuration into a configuration with a cache of the generated terrains.
+
+    Args:
+        cfg: The configuration of the terrain generator.
+        **kwargs: The attributes of the cached configuration to override.
+
+    Returns:
+        The configuration of the cached terrain generator.
+    """
+    attributes = {name: value for name, value in vars(cfg).items() if name != "class_type"}
+    return CachedTerrainGeneratorCfg(**{**attributes, **kwargs})
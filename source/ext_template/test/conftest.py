@@ -0,0 +1,71 @@
+"""Configuration of the tests of the extension.
+
+The tests run on the CPU, without the simulator. Importing the ``ext_template`` package registers the tasks, which
+imports Isaac Lab: the modules of the extension that only depend on PyTorch are therefore loaded from their files,
+through the fixtures below, so that their tests run without Isaac Lab.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+EXTENSION_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ext_template")
+"""Directory of the ``ext_template`` package."""
+
+
+def _load_module(name: str) -> types.ModuleType:
+    """Load a module of the extension from its file, without importing its parent packages.
+
+    The parent packages are replaced by empty packages (named ``_standalone_ext_template...``), so that the module
+    can import its sibling modules.
+
+    Args:
+        name: The name of the module, relative to the ``ext_template`` package (for instance, ``rsl_rl.rollout``).
+    """
+    qualified_name = f"ext_template.{name}"
+    if qualified_name in sys.modules:
+        return sys.modules[qualified_name]
+    package_name, package_dir = "_standalone_ext_template", EXTENSION_DIR
+    for part in [""] + name.split(".")[:-1]:
+        if part:
+            package_name, package_dir = f"{package_name}.{part}", os.path.join(package_dir, part)
+        if package_name not in sys.modules:
+            package = types.ModuleType(package_name)
+            package.__path__ = [package_dir]
+            sys.modules[package_name] = package
+    return importlib.import_module(f"_standalone_ext_template.{name}")
+
+
+@pytest.fixture(scope="session")
+def preemption() -> types.ModuleType:
+    """The module :mod:`ext_template.rsl_rl.preemption`."""
+    return _load_module("rsl_rl.preemption")
+
+
+@pytest.fixture(scope="session")
+def rollout() -> types.ModuleType:
+    """The module :mod:`ext_template.rsl_rl.rollout`."""
+    return _load_module("rsl_rl.rollout")
+
+
+@pytest.fixture(scope="session")
+def distillation() -> types.ModuleType:
+    """The module :mod:`ext_template.rsl_rl.distillation`."""
+    return _load_module("rsl_rl.distillation")
+
+
+@pytest.fixture(scope="session")
+def batched() -> types.ModuleType:
+    """The module :mod:`ext_template.rsl_rl.batched`."""
+    return _load_module("rsl_rl.batched")
+
+
+@pytest.fixture(scope="session")
+def evaluation() -> types.ModuleType:
+    """The module :mod:`ext_template.rsl_rl.evaluation`."""
+    return _load_module("rsl_rl.evaluation")
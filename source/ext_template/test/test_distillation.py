@@ -0,0 +1,97 @@
+"""Tests of the offline distillation of the policies (see :mod:`ext_template.rsl_rl.distillation`)."""
+
+from __future__ import annotations
+
+import math
+import torch
+import torch.nn as nn
+
+import pytest
+
+
+def samples(start: int, num_samples: int, num_obs: int = 3, num_actions: int = 2) -> tuple[torch.Tensor, torch.Tensor]:
+    """Samples whose observations and actions hold their index, to identify them in the dataset."""
+    index = torch.arange(start, start + num_samples, dtype=torch.float).unsqueeze(1)
+    return index.repeat(1, num_obs), -index.repeat(1, num_actions)
+
+
+def test_dataset_wraps_around(distillation):
+    """Once the dataset is full, the oldest samples are overwritten."""
+    dataset = distillation.DistillationDataset(5, num_obs=3, num_actions=2)
+    dataset.add(*samples(0, 3))
+    assert len(dataset) == 3
+    dataset.add(*samples(3, 4))
+    assert len(dataset) == 5
+    # samples 0 and 1 are overwritten by samples 5 and 6
+    assert dataset.observations[:, 0].tolist() == [5.0, 6.0, 2.0, 3.0, 4.0]
+    assert dataset.actions[:, 1].tolist() == [-5.0, -6.0, -2.0, -3.0, -4.0]
+    assert dataset._next == 2
+
+
+def test_dataset_keeps_the_newest_samples_of_oversize_batches(distillation):
+    """A batch larger than the dataset fills it with its newest samples, in order from the write position."""
+    dataset = distillation.DistillationDataset(4, num_obs=3, num_actions=2)
+    dataset.add(*samples(0, 1))
+    dataset.add(*samples(1, 10))
+    assert len(dataset) == 4
+    assert dataset.observations[:, 0].tolist() == [10.0, 7.0, 8.0, 9.0]
+    assert dataset.actions[:, 0].tolist() == [-10.0, -7.0, -8.0, -9.0]
+    # the next sample overwrites the oldest one
+    dataset.add(*samples(11, 1))
+    assert dataset.observations[:, 0].tolist() == [10.0, 11.0, 8.0, 9.0]
+
+
+def test_dataset_save_load_round_trip(distillation, tmp_path):
+    """The shards hold the samples of the datasets, which are loaded back in the order of the shards."""
+    paths = []
+    for shard, (start, num_samples) in enumerate([(0, 3), (10, 5)]):
+        dataset = distillation.DistillationDataset(8, num_obs=3, num_actions=2)
+        dataset.add(*samples(start, num_samples))
+        paths.append(str(tmp_path / f"shard_{shard}.pt"))
+        dataset.save(paths[-1])
+    loaded = distillation.DistillationDataset.load(paths)
+    assert loaded.capacity == len(loaded) == 8
+    expected_obs, expected_actions = (torch.cat(values) for values in zip(samples(0, 3), samples(10, 5)))
+    torch.testing.assert_close(loaded.observations, expected_obs)
+    torch.testing.assert_close(loaded.actions, expected_actions)
+    # a smaller capacity keeps the newest samples
+    loaded = distillation.DistillationDataset.load(paths, capacity=4)
+    assert sorted(loaded.observations[:, 0].tolist()) == [11.0, 12.0, 13.0, 14.0]
+    with pytest.raises(ValueError, match="No shards"):
+        distillation.DistillationDataset.load([])
+
+
+def test_train_student_reduces_the_held_out_error(distillation):
+    """The student regresses the actions of a fixed random teacher, measured on the held-out samples."""
+    torch.manual_seed(0)
+    num_obs, num_actions = 8, 3
+    teacher = nn.Sequential(nn.Linear(num_obs, 32), nn.Tanh(), nn.Linear(32, num_actions)).requires_grad_(False)
+    dataset = distillation.DistillationDataset(4096, num_obs, num_actions)
+    observations = torch.randn(4096, num_obs)
+    dataset.add(observations, teacher(observations))
+    student = distillation.StudentPolicy(num_obs, num_actions, hidden_dims=[64, 64])
+    initial_error = distillation.action_error(student, observations, teacher(observations))["rmse"]
+    history = distillation.train_student(
+        student, dataset, num_epochs=20, mini_batch_size=256, generator=torch.Generator().manual_seed(0)
+    )
+    assert set(history) == {"train_loss", "rmse", "mae", "max_error"}
+    assert all(len(values) == 20 for values in history.values())
+    assert history["rmse"][-1] < 0.25 * initial_error
+    assert history["rmse"][-1] < 0.75 * history["rmse"][0]
+    assert history["train_loss"][-1] < history["train_loss"][0]
+    assert not student.training
+
+
+def test_action_error_of_known_actions(distillation):
+    """The errors are reduced over all the samples and action dimensions, whatever the batch size."""
+    observations = torch.zeros(4, 1)
+    actions = torch.tensor([[1.0, -1.0], [0.0, 0.0], [2.0, 0.0], [0.0, -3.0]])
+
+    def policy(observations):
+        return torch.zeros(observations.shape[0], 2)
+
+    for batch_size in (1, 3, 4):
+        errors = distillation.action_error(policy, observations, actions, batch_size=batch_size)
+        assert errors["rmse"] == pytest.approx(math.sqrt(15.0 / 8.0))
+        assert errors["mae"] == pytest.approx(7.0 / 8.0)
+        assert errors["max_error"] == pytest.approx(3.0)
@@ -0,0 +1,103 @@
+"""Tests of the batched evaluation of the checkpoints (see :mod:`ext_template.rsl_rl.evaluation`)."""
+
+from __future__ import annotations
+
+import torch
+import torch.nn as nn
+
+import pytest
+
+
+def make_policies(num_policies: int, num_obs: int = 5, num_actions: int = 3) -> list[nn.Module]:
+    """Policies with the same architecture and different parameters, including the buffers of a normalizer."""
+    torch.manual_seed(0)
+    policies = []
+    for _ in range(num_policies):
+        normalizer = nn.BatchNorm1d(num_obs)
+        normalizer.running_mean.normal_()
+        normalizer.running_var.uniform_(0.5, 2.0)
+        policy = nn.Sequential(normalizer, nn.Linear(num_obs, 16), nn.ELU(), nn.Linear(16, num_actions))
+        policies.append(policy.eval())
+    return policies
+
+
+def test_batched_forward_matches_the_modules(batched):
+    """The vmapped forward pass is the forward pass of every module on its inputs, along any dimension."""
+    policies = make_policies(4)
+    policy = batched.BatchedModule(policies)
+    assert len(policy) == 4
+    inputs = torch.randn(4, 10, 5)
+    outputs = policy(inputs)
+    outputs_dim1 = policy(inputs.transpose(0, 1), dim=1)
+    for index, module in enumerate(policies):
+        expected = module(inputs[index])
+        torch.testing.assert_close(outputs[index], expected)
+        torch.testing.assert_close(outputs_dim1[:, index], expected)
+
+
+def test_batched_parameters_are_refreshed_on_update(batched):
+    """The stacked parameters are a copy of the parameters of the modules until they are updated."""
+    policies = make_policies(2)
+    policy = batched.BatchedModule(policies)
+    inputs = torch.randn(2, 4, 5)
+    expected = policy(inputs)
+    with torch.no_grad():
+        policies[1][-1].bias.add_(1.0)
+    torch.testing.assert_close(policy(inputs), expected)
+    policy.update()
+    torch.testing.assert_close(policy(inputs)[1], policies[1](inputs[1]))
+    with pytest.raises(ValueError):
+        batched.BatchedModule([])
+
+
+def test_interleaved_inputs_are_evaluated_by_their_module(batched):
+    """The input ``k * M + j`` is evaluated by the module ``j``, like the environments of the evaluation."""
+    num_policies, num_envs = 3, 12
+    policies = make_policies(num_policies)
+    obs = torch.randn(num_envs, 5)
+    actions = batched.BatchedModule(policies).interleaved(obs)
+    assert actions.shape == (num_envs, 3)
+    for env_id in range(num_envs):
+        torch.testing.assert_close(actions[env_id], policies[env_id % num_policies](obs[env_id : env_id + 1])[0])
+
+
+def test_metrics_are_reduced_per_group(evaluation):
+    """The sums of the episodes are committed to the group of their environment when they are done."""
+    num_groups = 2
+    group_ids = torch.arange(4) % num_groups
+    metrics = evaluation.EpisodeMetrics(group_ids, num_groups, ["return"])
+    # environment 0 ends an episode of 2 steps, environment 1 one of 3 steps, environment 2 one of 1 step
+    rewards = torch.tensor([[1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 3.0, 4.0], [10.0, 2.0, 3.0, 4.0]])
+    dones = torch.tensor([[0, 0, 1, 0], [1, 0, 0, 0], [0, 1, 0, 0]])
+    for step_rewards, step_dones in zip(rewards, dones):
+        metrics.add({"return": step_rewards}, step_dones)
+    # group 0: environment 2 (return 3, length 1) and environment 0 (return 2, length 2)
+    # group 1: environment 1 (return 6, length 3), environment 3 has not completed its episode
+    assert metrics.summary() == [
+        {"episodes": 2, "length": 1.5, "return": 2.5},
+        {"episodes": 1, "length": 3.0, "return": 6.0},
+    ]
+    # the sums of the completed episodes are reset: the next episodes of environments 0 and 2 have returns of
+    # 10 + 1 and 3 + 3 + 1
+    metrics.add({"return": torch.ones(4)}, torch.ones(4))
+    assert metrics.summary()[0] == {"episodes": 4, "length": 2.0, "return": (3.0 + 2.0 + 11.0 + 7.0) / 4}
+
+
+def test_metrics_count_the_episode_budget_of_every_environment(evaluation):
+    """Only the first episodes of every environment are counted, until all the environments complete their budget."""
+    group_ids = torch.tensor([0, 1])
+    metrics = evaluation.EpisodeMetrics(group_ids, 2, ["fall"], episodes_per_env=2)
+    # environment 0 ends an episode at every step, environment 1 every other step
+    for step in range(6):
+        assert not metrics.is_complete()
+        dones = torch.tensor([1, step % 2])
+        metrics.add({"fall": torch.tensor([float(step), 1.0]) * dones}, dones)
+        if step == 3:
+            break
+    assert metrics.is_complete()
+    summary = metrics.summary()
+    # environment 0 completed 4 episodes, of which only the first 2 are counted
+    assert summary[0] == {"episodes": 2, "length": 1.0, "fall": 0.5}
+    assert summary[1] == {"episodes": 2, "length": 2.0, "fall": 1.0}
+    # no budget is never complete
+    assert not evaluation.EpisodeMetrics(group_ids, 2, ["fall"]).is_complete()
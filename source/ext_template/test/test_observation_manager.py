@@ -0,0 +1,155 @@
+"""Tests of the sharing of the terms between the groups of the :class:`~ext_template.managers.ExtObservationManager`.
+
+The tests run without the simulator: the simulator modules imported by Isaac Lab are replaced by placeholders.
+"""
+
+from __future__ import annotations
+
+"""Replace the simulator modules first."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "scripts", "rsl_rl"))
+
+# local imports
+import sim_placeholders  # isort: skip
+
+sim_placeholders.install_simulator_placeholders()
+
+"""Rest everything follows."""
+
+import collections
+import torch
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("isaaclab")
+
+from isaaclab.managers import ManagerTermBase, ObservationGroupCfg, ObservationManager, ObservationTermCfg
+from isaaclab.utils import configclass
+from isaaclab.utils.noise import UniformNoiseCfg
+
+from ext_template.managers import ExtObservationManager
+
+CALLS = collections.Counter()
+"""Number of evaluations of the observation functions, keyed by their name and parameters."""
+
+
+def lin_vel_term(env) -> torch.Tensor:
+    CALLS["base_lin_vel"] += 1
+    return env.data.lin_vel.clone()
+
+
+def joint_pos_term(env, joint_ids: list[int]) -> torch.Tensor:
+    CALLS[f"joint_pos{joint_ids}"] += 1
+    return env.data.joint_pos[:, joint_ids].clone()
+
+
+class time_term(ManagerTermBase):
+    def __init__(self, cfg: ObservationTermCfg, env: object):
+        self.cfg = cfg
+        self._env = env
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        pass
+
+    def __call__(self, env) -> torch.Tensor:
+        CALLS["time_passed"] += 1
+        return env.data.time.unsqueeze(-1).clone()
+
+
+@configclass
+class ObservationsCfg:
+    """Groups observing the same quantities."""
+
+    @configclass
+    class PolicyCfg(ObservationGroupCfg):
+        """Noisy observations, whose post-processing is fused."""
+
+        base_lin_vel = ObservationTermCfg(func=lin_vel_term, noise=UniformNoiseCfg(n_min=-0.1, n_max=0.1))
+        joint_pos = ObservationTermCfg(func=joint_pos_term, params={"joint_ids": [0, 1]}, scale=2.0)
+
+    @configclass
+    class CriticCfg(ObservationGroupCfg):
+        """Clean observations."""
+
+        base_lin_vel = ObservationTermCfg(func=lin_vel_term)
+        joint_pos = ObservationTermCfg(func=joint_pos_term, params={"joint_ids": [0, 1]}, clip=(-0.5, 0.5))
+        all_joint_pos = ObservationTermCfg(func=joint_pos_term, params={"joint_ids": [0, 1, 2]})
+        time_passed = ObservationTermCfg(func=time_term)
+
+    @configclass
+    class ExtrasCfg(ObservationGroupCfg):
+        """Observations that are not concatenated."""
+
+        base_lin_vel = ObservationTermCfg(func=lin_vel_term, scale=-1.0)
+        all_joint_pos = ObservationTermCfg(func=joint_pos_term, params={"joint_ids": [0, 1, 2]})
+
+        def __post_init__(self):
+            self.concatenate_terms = False
+
+    policy: PolicyCfg = PolicyCfg()
+    critic: CriticCfg = CriticCfg()
+    extras: ExtrasCfg = ExtrasCfg()
+
+
+@pytest.fixture
+def env():
+    """Stand-in for the environment, with the data observed by the terms."""
+    num_envs = 8
+    data = SimpleNamespace(
+        lin_vel=torch.rand(num_envs, 3), joint_pos=torch.rand(num_envs, 3) - 0.5, time=torch.zeros(num_envs)
+    )
+    # note: the managers resolve their terms at construction if the simulation is playing
+    sim = SimpleNamespace(is_playing=lambda: True)
+    return namedtuple("ManagerBasedEnv", ["num_envs", "device", "dt", "data", "sim"])(num_envs, "cpu", 0.01, data, sim)
+
+
+def step(env):
+    """Advance the data observed by the terms."""
+    env.data.lin_vel.copy_(torch.rand_like(env.data.lin_vel))
+    env.data.joint_pos.copy_(torch.rand_like(env.data.joint_pos) - 0.5)
+    env.data.time.add_(env.dt)
+
+
+def test_terms_are_evaluated_once_per_step(env):
+    """Every function term is evaluated once per computation, whatever the number of groups including it."""
+    manager = ExtObservationManager(ObservationsCfg(), env)
+    for _ in range(5):
+        step(env)
+        CALLS.clear()
+        manager.compute()
+        assert CALLS == {"base_lin_vel": 1, "joint_pos[0, 1]": 1, "joint_pos[0, 1, 2]": 1, "time_passed": 1}
+
+
+def test_groups_computed_separately_evaluate_their_terms(env):
+    """Computing a group outside of a computation of all the groups evaluates all its terms."""
+    manager = ExtObservationManager(ObservationsCfg(), env)
+    CALLS.clear()
+    manager.compute_group("critic")
+    manager.compute_group("extras")
+    assert CALLS == {"base_lin_vel": 2, "joint_pos[0, 1]": 1, "joint_pos[0, 1, 2]": 2, "time_passed": 1}
+
+
+def test_observations_match_the_observation_manager(env):
+    """The shared terms are post-processed like with the observation manager of Isaac Lab."""
+    manager = ExtObservationManager(ObservationsCfg(), env)
+    reference = ObservationManager(ObservationsCfg(), env)
+    for _ in range(3):
+        step(env)
+        obs = manager.compute()
+        expected = reference.compute()
+        # note: the class term is evaluated by both managers, which differ in the instances of the term only
+        torch.testing.assert_close(obs["critic"], expected["critic"])
+        assert obs["extras"].keys() == expected["extras"].keys()
+        for name in obs["extras"]:
+            torch.testing.assert_close(obs["extras"][name], expected["extras"][name])
+        # the noise only differs in its random numbers
+        policy, expected_policy = obs["policy"], expected["policy"]
+        torch.testing.assert_close(policy[:, 3:], expected_policy[:, 3:])
+        assert (policy[:, :3] - env.data.lin_vel).abs().max() <= 0.1
+    # the values shared between the groups are not modified by the post-processing of the other groups
+    torch.testing.assert_close(obs["extras"]["base_lin_vel"], -env.data.lin_vel)
@@ -0,0 +1,251 @@
+"""Tests of the preemption of the training (see :mod:`ext_template.rsl_rl.preemption`)."""
+
+from __future__ import annotations
+
+import os
+import random
+import signal
+import torch
+
+import pytest
+
+
+@pytest.fixture
+def previous_handlers():
+    """Install known handlers for the preemption signals and restore the original ones afterwards."""
+
+    def handler(signum, frame):
+        pass
+
+    originals = {signum: signal.signal(signum, handler) for signum in (signal.SIGTERM, signal.SIGUSR1)}
+    yield handler
+    for signum, original in originals.items():
+        signal.signal(signum, original)
+
+
+def test_handler_records_the_first_signal(preemption, previous_handlers):
+    """The handler records the first signal received and restores the previous handlers on exit."""
+    with preemption.PreemptionHandler() as handler:
+        assert not handler.requested
+        os.kill(os.getpid(), signal.SIGUSR1)
+        assert handler.requested
+        assert handler.signal_name == "SIGUSR1"
+        # further signals are ignored
+        os.kill(os.getpid(), signal.SIGTERM)
+        assert handler.signal_name == "SIGUSR1"
+    assert signal.getsignal(signal.SIGTERM) is previous_handlers
+    assert signal.getsignal(signal.SIGUSR1) is previous_handlers
+
+
+def test_handler_ignores_other_signals(preemption, previous_handlers):
+    """Only the configured signals are handled."""
+    with preemption.PreemptionHandler(signals=(signal.SIGUSR1,)) as handler:
+        assert signal.getsignal(signal.SIGTERM) is previous_handlers
+        os.kill(os.getpid(), signal.SIGUSR1)
+    assert handler.signal_name == "SIGUSR1"
+
+
+def test_rng_state_round_trip(preemption):
+    """The random generators draw the same values after their state is restored."""
+    state = preemption.get_rng_state()
+    expected = (random.random(), torch.rand(3))
+    random.random(), torch.rand(3)
+    preemption.set_rng_state(state)
+    assert random.random() == expected[0]
+    assert torch.equal(torch.rand(3), expected[1])
+
+
+def test_marker_round_trip(preemption, tmp_path):
+    """The marker is written atomically, read with the absolute path of the checkpoint and cleared."""
+    log_dir = str(tmp_path)
+    assert preemption.read_preemption_marker(log_dir) is None
+    checkpoint = os.path.join(log_dir, "model_41.pt")
+    preemption.write_preemption_marker(log_dir, checkpoint, 42, 100, signal_name="SIGTERM")
+    assert sorted(os.listdir(log_dir)) == [preemption.PREEMPTION_FILE]
+    marker = preemption.read_preemption_marker(log_dir)
+    assert marker["checkpoint"] == checkpoint
+    assert marker["iteration"] == 42
+    assert marker["final_iteration"] == 100
+    assert marker["signal"] == "SIGTERM"
+    # a second preemption replaces the marker
+    preemption.write_preemption_marker(log_dir, os.path.join(log_dir, "model_59.pt"), 60, 100)
+    assert preemption.read_preemption_marker(log_dir)["iteration"] == 60
+    preemption.clear_preemption_marker(log_dir)
+    assert preemption.read_preemption_marker(log_dir) is None
+    # clearing an unmarked run directory does nothing
+    preemption.clear_preemption_marker(log_dir)
+
+
+def test_find_preempted_run(preemption, tmp_path):
+    """The most recently preempted run is found, optionally filtered by the name of the run."""
+    log_root = str(tmp_path)
+    assert preemption.find_preempted_run(os.path.join(log_root, "missing")) is None
+    runs = {}
+    for index, name in enumerate(["2024-01-01_00-00-00_a", "2024-01-02_00-00-00_b", "2024-01-03_00-00-00"]):
+        runs[name] = os.path.join(log_root, name)
+        os.makedirs(runs[name])
+        preemption.write_preemption_marker(runs[name], os.path.join(runs[name], "model_0.pt"), 1, 10)
+        # note: the modification times are set explicitly, since they may have a coarse resolution
+        os.utime(os.path.join(runs[name], preemption.PREEMPTION_FILE), (1000 + index, 1000 + index))
+    os.makedirs(os.path.join(log_root, "2024-01-04_00-00-00_a"))
+    with open(os.path.join(log_root, "not_a_run"), "w"):
+        pass
+    assert preemption.find_preempted_run(log_root) == runs["2024-01-03_00-00-00"]
+    assert preemption.find_preempted_run(log_root, "a") == runs["2024-01-01_00-00-00_a"]
+    assert preemption.find_preempted_run(log_root, "c") is None
+    preemption.clear_preemption_marker(runs["2024-01-03_00-00-00"])
+    assert preemption.find_preempted_run(log_root) == runs["2024-01-02_00-00-00_b"]
+
+
+class EnvState:
+    """Stand-in for the :class:`~ext_template.envs.EnvStateSnapshot` of an environment with terrain levels."""
+
+    def __init__(self, num_envs: int = 4):
+        self.terrain_levels = torch.zeros(num_envs, dtype=torch.long)
+        self.restored = False
+
+    def state_dict(self) -> dict:
+        return {"terrain_levels": self.terrain_levels.clone()}
+
+    def load_state_dict(self, state_dict: dict):
+        self.terrain_levels = state_dict["terrain_levels"].clone()
+
+    def restore(self):
+        self.restored = True
+
+
+class Runner:
+    """Minimal CPU stand-in for the :class:`~ext_template.rsl_rl.ExtOnPolicyRunner`.
+
+    The runner saves and loads its checkpoints like :class:`rsl_rl.runners.OnPolicyRunner`, goes through the
+    preemption functions like the extension runner, and checks the preemption handler at the end of each iteration.
+    """
+
+    def __init__(self, preemption, log_dir: str):
+        self.preemption_module = preemption
+        self.log_dir = log_dir
+        self.model = torch.nn.Linear(2, 1)
+        self.optimizer = torch.optim.SGD(self.model.parameters(), lr=0.1)
+        self.env_state = EnvState()
+        self.current_learning_iteration = 0
+        self.preemption = None
+        self.preempted = False
+
+    def learn(self, num_learning_iterations: int, signal_at: int | None = None) -> list[float]:
+        """Train on random data and return the losses of the iterations.
+
+        Args:
+            num_learning_iterations: The number of learning iterations.
+            signal_at: The iteration during which the preemption signal is received. Defaults to None.
+        """
+        losses = []
+        start_iter = self.current_learning_iteration
+        tot_iter = start_iter + num_learning_iterations
+        for it in range(start_iter, tot_iter):
+            if it == signal_at:
+                os.kill(os.getpid(), signal.SIGTERM)
+            inputs = torch.rand(8, 2)
+            loss = (self.model(inputs) - inputs.sum(dim=1, keepdim=True)).pow(2).mean()
+            self.optimizer.zero_grad()
+            loss.backward()
+            self.optimizer.step()
+            self.env_state.terrain_levels += torch.randint(0, 2, self.env_state.terrain_levels.shape)
+            losses.append(loss.item())
+            self.current_learning_iteration = it
+            if self.preemption is not None and self.preemption.requested:
+                self.preemption_module.save_preemption_checkpoint(
+                    self, it, tot_iter, self.env_state, signal_name=self.preemption.signal_name
+                )
+                self.preempted = True
+                break
+        return losses
+
+    def resume_preempted(self, path: str) -> dict:
+        return self.preemption_module.load_preemption_checkpoint(self, path, self.env_state)
+
+    def save(self, path: str, infos=None):
+        torch.save(
+            {
+                "model_state_dict": self.model.state_dict(),
+                "optimizer_state_dict": self.optimizer.state_dict(),
+                "iter": self.current_learning_iteration,
+                "infos": infos,
+            },
+            path,
+        )
+
+    def load(self, path: str):
+        loaded_dict = torch.load(path, weights_only=False)
+        self.model.load_state_dict(loaded_dict["model_state_dict"])
+        self.optimizer.load_state_dict(loaded_dict["optimizer_state_dict"])
+        self.current_learning_iteration = loaded_dict["iter"]
+        return loaded_dict["infos"]
+
+
+def test_save_preemption_checkpoint(preemption, previous_handlers, tmp_path):
+    """The checkpoint resumes at the next iteration, with the random and environment states of the preemption."""
+    log_dir = str(tmp_path)
+    runner = Runner(preemption, log_dir)
+    with preemption.PreemptionHandler() as handler:
+        runner.preemption = handler
+        runner.learn(10, signal_at=0)
+    assert runner.preempted and runner.current_learning_iteration == 1
+    marker = preemption.read_preemption_marker(log_dir)
+    assert marker["checkpoint"] == os.path.join(log_dir, "model_0.pt")
+    assert (marker["iteration"], marker["final_iteration"], marker["signal"]) == (1, 10, "SIGTERM")
+    checkpoint = torch.load(marker["checkpoint"], weights_only=False)
+    assert checkpoint["iter"] == 1
+    state = checkpoint["infos"]["preemption"]
+    assert state["final_iteration"] == 10
+    assert torch.equal(state["env_state"]["terrain_levels"], runner.env_state.terrain_levels)
+    # the random generators continue from their state at the preemption
+    expected = torch.rand(3)
+    preemption.set_rng_state(state["rng_state"])
+    assert torch.equal(torch.rand(3), expected)
+
+
+def test_load_preemption_checkpoint_requires_a_preemption_checkpoint(preemption, tmp_path):
+    """Only the checkpoints written on preemption are resumed, and only the run directories marked as preempted."""
+    runner = Runner(preemption, str(tmp_path))
+    path = str(tmp_path / "model_0.pt")
+    runner.save(path)
+    with pytest.raises(ValueError, match="not written on preemption"):
+        preemption.load_preemption_checkpoint(runner, path)
+    with pytest.raises(ValueError, match="not preempted"):
+        preemption.resume_preempted_run(runner, str(tmp_path))
+
+
+@pytest.mark.parametrize("signal_at", [3, 9])
+def test_preempted_training_resumes_the_training(preemption, previous_handlers, tmp_path, signal_at):
+    """A preempted and resumed training is the uninterrupted training.
+
+    The signal is received during an iteration, which is completed before the runner writes its checkpoint and
+    stops. The resumed run completes the iterations left, none if the last iteration was preempted.
+    """
+    log_dir = str(tmp_path)
+    # reference: the uninterrupted training
+    torch.manual_seed(0)
+    reference = Runner(preemption, log_dir)
+    expected = reference.learn(10)
+    # preempted training
+    torch.manual_seed(0)
+    runner = Runner(preemption, log_dir)
+    with preemption.PreemptionHandler() as handler:
+        runner.preemption = handler
+        losses = runner.learn(10, signal_at=signal_at)
+    assert len(losses) == signal_at + 1
+    # resumed training, in a new process with other random states
+    torch.manual_seed(1)
+    resumed = Runner(preemption, log_dir)
+    num_learning_iterations = preemption.resume_preempted_run(resumed, log_dir)
+    assert resumed.current_learning_iteration == signal_at + 1
+    assert num_learning_iterations == 10 - (signal_at + 1)
+    assert resumed.env_state.restored
+    assert torch.equal(resumed.env_state.terrain_levels, runner.env_state.terrain_levels)
+    with preemption.PreemptionHandler() as handler:
+        resumed.preemption = handler
+        losses += resumed.learn(num_learning_iterations)
+    assert not resumed.preempted
+    assert losses == expected
+    torch.testing.assert_close(resumed.model.state_dict(), reference.model.state_dict())
+    assert torch.equal(resumed.env_state.terrain_levels, reference.env_state.terrain_levels)
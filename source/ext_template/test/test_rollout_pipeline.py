@@ -0,0 +1,149 @@
+"""Tests of the pipelined collection of the rollouts (see :class:`~ext_template.rsl_rl.RolloutPipeline`)."""
+
+from __future__ import annotations
+
+import collections
+import time
+import torch
+
+import pytest
+
+
+class SlowVecEnv:
+    """Stand-in for a vectorized environment whose steps take time.
+
+    Like the environments of Isaac Lab, the environment overwrites its reward and done buffers in-place at every
+    step, and resets the environments whose episode is done, whose lengths differ between the environments.
+    """
+
+    def __init__(self, num_envs: int = 16, step_time: float = 1e-3, seed: int = 0):
+        self.num_envs = num_envs
+        self.step_time = step_time
+        self.generator = torch.Generator().manual_seed(seed)
+        self.max_episode_length = torch.randint(3, 9, (num_envs,), generator=self.generator)
+        self.episode_length = torch.zeros(num_envs, dtype=torch.long)
+        self.state = torch.zeros(num_envs, 3)
+        self.rewards = torch.zeros(num_envs)
+        self.dones = torch.zeros(num_envs, dtype=torch.long)
+        self.common_step_counter = 0
+        # steps and environments of the resets
+        self.resets: list[tuple[int, list[int]]] = []
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        time.sleep(self.step_time)
+        self.common_step_counter += 1
+        self.state += actions + torch.randn(self.state.shape, generator=self.generator)
+        self.episode_length += 1
+        self.rewards[:] = -self.state.norm(dim=1)
+        self.dones[:] = self.episode_length >= self.max_episode_length
+        reset_ids = self.dones.nonzero().flatten()
+        if len(reset_ids) > 0:
+            self.resets.append((self.common_step_counter, reset_ids.tolist()))
+            self.state[reset_ids] = 0.0
+            self.episode_length[reset_ids] = 0
+        return self.state.clone(), self.rewards, self.dones, {}
+
+
+def collect(
+    rollout, pipelined: bool, num_steps: int = 40, step_time: float = 1e-3, commit_time: float = 0.0
+) -> tuple[dict, SlowVecEnv]:
+    """Collect a rollout like the :class:`~ext_template.rsl_rl.ExtOnPolicyRunner`.
+
+    Args:
+        rollout: The module :mod:`ext_template.rsl_rl.rollout`.
+        pipelined: Whether the transitions are committed through a :class:`RolloutPipeline`.
+        num_steps: The number of steps of the rollout.
+        step_time: The time taken by each step of the environment, in seconds.
+        commit_time: The time taken by each commit, in seconds.
+
+    Returns:
+        A tuple containing the committed transitions with the episode statistics, and the environment.
+    """
+    env = SlowVecEnv(step_time=step_time)
+    storage = {"steps": [], "observations": [], "actions": [], "rewards": [], "dones": []}
+    statistics = rollout.EpisodeStatisticsBuffer(["reward", "length"], env.num_envs, maxlen=1000)
+
+    def commit(step, obs, actions, rewards, dones):
+        time.sleep(commit_time)
+        statistics.add((rewards, torch.ones_like(rewards)), dones)
+        for name, value in zip(storage, (step, obs, actions, rewards, dones)):
+            storage[name].append(value)
+
+    pipeline = rollout.RolloutPipeline("cpu") if pipelined else None
+    obs = env.state.clone()
+    for step in range(num_steps):
+        actions = -0.5 * obs
+        next_obs, rewards, dones, _ = env.step(actions)
+        # note: the environment overwrites its reward and done buffers in-place on the next step
+        transition = (step, obs, actions, rewards.clone(), dones.clone())
+        if pipeline is not None:
+            pipeline.submit(commit, *transition)
+        else:
+            commit(*transition)
+        obs = next_obs
+    if pipeline is not None:
+        pipeline.synchronize()
+        pipeline.close()
+    storage["statistics"] = statistics.to_lists()
+    return storage, env
+
+
+@pytest.mark.parametrize("commit_time", [0.0, 2e-3])
+def test_pipelined_collection_matches_sequential_collection(rollout, commit_time):
+    """The pipelined transitions, resets and episode statistics are the same as with a sequential collection."""
+    expected, expected_env = collect(rollout, pipelined=False)
+    storage, env = collect(rollout, pipelined=True, commit_time=commit_time)
+    # the transitions are committed in the order of the steps
+    assert storage["steps"] == list(range(40))
+    for name in ("observations", "actions", "rewards", "dones"):
+        for value, expected_value in zip(storage[name], expected[name], strict=True):
+            torch.testing.assert_close(value, expected_value)
+    # the resets follow the done flags of the committed transitions
+    assert env.resets == expected_env.resets
+    committed_resets = [(step + 1, dones.nonzero().flatten().tolist()) for step, dones in enumerate(storage["dones"])]
+    assert env.resets == [reset for reset in committed_resets if reset[1]]
+    assert storage["statistics"] == expected["statistics"]
+    assert len(storage["statistics"]["length"]) == sum(len(ids) for _, ids in env.resets)
+
+
+def test_pipeline_overlaps_the_commits_with_the_steps(rollout):
+    """The commits run while the next steps are collected."""
+    start = time.perf_counter()
+    collect(rollout, pipelined=False, num_steps=20, step_time=5e-3, commit_time=5e-3)
+    sequential_time = time.perf_counter() - start
+    start = time.perf_counter()
+    collect(rollout, pipelined=True, num_steps=20, step_time=5e-3, commit_time=5e-3)
+    pipelined_time = time.perf_counter() - start
+    # note: sequentially, every step takes the time of the step and the commit; pipelined, the longest of both
+    assert pipelined_time < 0.8 * sequential_time
+
+
+def test_pipeline_propagates_the_exceptions_of_the_commits(rollout):
+    """An exception raised by a commit is raised by the next call to the pipeline."""
+
+    def commit():
+        raise ValueError("commit failed")
+
+    pipeline = rollout.RolloutPipeline("cpu")
+    pipeline.submit(commit)
+    with pytest.raises(ValueError, match="commit failed"):
+        pipeline.synchronize()
+    pipeline.close()
+
+
+def test_statistics_keep_the_last_episodes(rollout):
+    """The statistics are those of the last completed episodes, even when more episodes than kept end in a step."""
+    num_envs, maxlen = 16, 5
+    statistics = rollout.EpisodeStatisticsBuffer(["reward"], num_envs, maxlen=maxlen)
+    expected = collections.deque(maxlen=maxlen)
+    generator = torch.Generator().manual_seed(0)
+    returns = torch.zeros(num_envs)
+    for step in range(20):
+        rewards = torch.randn(num_envs, generator=generator)
+        # alternate between steps ending a few episodes and steps ending more episodes than kept
+        dones = torch.rand(num_envs, generator=generator) < (0.2 if step % 2 else 0.9)
+        statistics.add((rewards,), dones)
+        returns += rewards
+        expected.extend(returns[dones].tolist())
+        returns[dones] = 0.0
+        assert statistics.to_lists()["reward"] == pytest.approx(list(expected))
@@ -0,0 +1,205 @@
+"""Tests of the pipelined collection of the :class:`~ext_template.rsl_rl.ExtOnPolicyRunner`.
+
+The tests run without the simulator: the simulator modules imported by Isaac Lab are replaced by placeholders.
+"""
+
+from __future__ import annotations
+
+"""Replace the simulator modules first."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "scripts", "rsl_rl"))
+
+# local imports
+import sim_placeholders  # isort: skip
+
+sim_placeholders.install_simulator_placeholders()
+
+"""Rest everything follows."""
+
+import threading
+import time
+import torch
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("isaaclab")
+
+from rsl_rl.algorithms import PPO
+from rsl_rl.modules import ActorCritic
+
+from ext_template.rsl_rl import ExtOnPolicyRunner
+from ext_template.rsl_rl.rollout import EpisodeStatisticsBuffer, RolloutPipeline
+
+
+class InPlaceVecEnv:
+    """Stand-in for the wrapped environment of Isaac Lab, stepped on the CPU.
+
+    Like the environments of Isaac Lab, the environment overwrites its reward and time-out buffers in-place at every
+    step, while the done flags are a new tensor (converted by the wrapper). Episodes end on termination or time-out.
+    """
+
+    def __init__(self, num_envs: int = 8, num_obs: int = 4, num_actions: int = 2, max_episode_length: int = 5):
+        self.num_envs = num_envs
+        self.num_obs = num_obs
+        self.num_actions = num_actions
+        self.device = "cpu"
+        self.max_episode_length = max_episode_length
+        self.generator = torch.Generator().manual_seed(0)
+        self.state = torch.zeros(num_envs, num_obs)
+        self.episode_length = torch.zeros(num_envs, dtype=torch.long)
+        self.rewards = torch.zeros(num_envs)
+        self.time_outs = torch.zeros(num_envs, dtype=torch.bool)
+
+    def step(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, dict]:
+        self.state += torch.randn(self.state.shape, generator=self.generator) + actions.sum(dim=1, keepdim=True)
+        self.episode_length += 1
+        self.rewards[:] = -self.state.norm(dim=1)
+        terminated = self.state[:, 0].abs() > 3.0
+        self.time_outs[:] = self.episode_length >= self.max_episode_length
+        dones = (terminated | self.time_outs).long()
+        reset_ids = dones.nonzero().flatten()
+        self.state[reset_ids] = 0.0
+        self.episode_length[reset_ids] = 0
+        return self.state.clone(), self.rewards, dones, {"time_outs": self.time_outs}
+
+
+class SlowStatisticsBuffer(EpisodeStatisticsBuffer):
+    """Episode statistics whose updates take time, and which record the threads of the updates.
+
+    The commits of the pipeline start with the update of the statistics: delaying it makes the environment overwrite
+    its buffers before the rest of the commit reads them.
+    """
+
+    def __init__(self, *args, delay: float = 0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delay = delay
+        self.threads = []
+
+    def add(self, values, dones):
+        time.sleep(self.delay)
+        self.threads.append(threading.current_thread().name)
+        super().add(values, dones)
+
+
+def make_runner(env: InPlaceVecEnv, num_steps: int, delay: float = 0.0) -> ExtOnPolicyRunner:
+    """Runner with the attributes read by the collection, around a PPO algorithm with a small actor-critic."""
+    torch.manual_seed(0)
+    policy = ActorCritic(env.num_obs, env.num_obs, env.num_actions, actor_hidden_dims=[16], critic_hidden_dims=[16])
+    alg = PPO(policy, gamma=0.9, device="cpu")
+    alg.init_storage("rl", env.num_envs, num_steps, [env.num_obs], [env.num_obs], [env.num_actions])
+    # note: the runner is not initialized, which requires an environment of Isaac Lab
+    runner = ExtOnPolicyRunner.__new__(ExtOnPolicyRunner)
+    runner.env, runner.alg, runner.device = env, alg, "cpu"
+    runner.obs_normalizer = torch.nn.Identity()
+    runner.privileged_obs_type = None
+    runner.episode_statistics = SlowStatisticsBuffer(["reward", "length"], env.num_envs, delay=delay)
+    return runner
+
+
+def collect(pipelined: bool, num_steps: int = 12, delay: float = 0.0) -> tuple[ExtOnPolicyRunner, InPlaceVecEnv]:
+    """Collect a rollout with the real steps of the runner."""
+    env = InPlaceVecEnv()
+    runner = make_runner(env, num_steps, delay=delay)
+    pipeline = RolloutPipeline("cpu") if pipelined else None
+    obs = privileged_obs = env.state.clone()
+    with torch.inference_mode():
+        for _ in range(num_steps):
+            if pipeline is not None:
+                obs, privileged_obs, _ = runner._pipelined_step(pipeline, obs, privileged_obs)
+            else:
+                obs, privileged_obs, _ = runner._step(obs, privileged_obs)
+        if pipeline is not None:
+            pipeline.synchronize()
+            pipeline.close()
+    return runner, env
+
+
+def test_pipelined_step_matches_the_sequential_step():
+    """The pipelined transitions, including the bootstrapped rewards, are the transitions of the sequential steps.
+
+    The commits are delayed until the environment has overwritten its reward and time-out buffers.
+    """
+    expected, _ = collect(pipelined=False)
+    runner, _ = collect(pipelined=True, delay=2e-3)
+    storage, expected_storage = runner.alg.storage, expected.alg.storage
+    assert storage.step == expected_storage.step == 12
+    for name in ("observations", "actions", "values", "actions_log_prob", "rewards", "dones"):
+        torch.testing.assert_close(getattr(storage, name), getattr(expected_storage, name))
+    assert runner.episode_statistics.to_lists() == expected.episode_statistics.to_lists()
+    # the commits run on the worker thread of the pipeline
+    assert all(name.startswith("rollout_commit") for name in runner.episode_statistics.threads)
+    assert all(name == threading.current_thread().name for name in expected.episode_statistics.threads)
+
+
+def test_commit_bootstraps_the_time_outs():
+    """The rewards of the time-outs are bootstrapped with the values of the transition, from cloned buffers."""
+    env = InPlaceVecEnv(max_episode_length=2)
+    runner = make_runner(env, num_steps=2, delay=2e-3)
+    pipeline = RolloutPipeline("cpu")
+    obs = env.state.clone()
+    rewards, time_outs = [], []
+    with torch.inference_mode():
+        for _ in range(2):
+            previous = runner.alg.transition
+            obs, _, _ = runner._pipelined_step(pipeline, obs, obs)
+            # the transition of the algorithm is swapped for a new one
+            assert runner.alg.transition is not previous and runner.alg.transition.actions is None
+            rewards.append(env.rewards.clone())
+            time_outs.append(env.time_outs.clone())
+        pipeline.synchronize()
+        pipeline.close()
+    storage = runner.alg.storage
+    assert time_outs[1].any() and not time_outs[0].any()
+    for step in range(2):
+        expected = rewards[step] + 0.9 * storage.values[step, :, 0] * time_outs[step]
+        torch.testing.assert_close(storage.rewards[step, :, 0], expected)
+
+
+class EnvStateSnapshot:
+    """Stand-in for the :class:`~ext_template.envs.EnvStateSnapshot` of an environment with terrain levels."""
+
+    def __init__(self, terrain_levels: torch.Tensor):
+        self.terrain_levels = terrain_levels
+        self.restored = False
+
+    def state_dict(self) -> dict:
+        return {"terrain_levels": self.terrain_levels.clone()}
+
+    def load_state_dict(self, state_dict: dict):
+        self.terrain_levels.copy_(state_dict["terrain_levels"])
+
+    def restore(self):
+        self.restored = True
+
+
+def test_preemption_checkpoint_round_trip(monkeypatch, tmp_path):
+    """The runner resumes from the iteration after the preempted one, with the models and states of the preemption."""
+    env = InPlaceVecEnv()
+    runner = make_runner(env, num_steps=4)
+    runner.log_dir, runner.logger_type, runner.disable_logs = str(tmp_path), "tensorboard", False
+    runner.empirical_normalization = False
+    runner.preemption = SimpleNamespace(signal_name="SIGUSR1")
+    snapshot = EnvStateSnapshot(torch.arange(env.num_envs))
+    monkeypatch.setattr(runner, "_env_state_snapshot", lambda: snapshot)
+    runner._save_preemption_checkpoint(6, 10)
+    assert runner.preempted and runner.current_learning_iteration == 7
+    checkpoint = str(tmp_path / "model_6.pt")
+    assert torch.load(checkpoint, weights_only=False)["iter"] == 7
+    expected = torch.rand(3)
+    # the resumed runner is a new one, with other parameters and states
+    torch.manual_seed(1)
+    resumed = make_runner(env, num_steps=4)
+    resumed.empirical_normalization = False
+    resumed_snapshot = EnvStateSnapshot(torch.zeros(env.num_envs, dtype=torch.long))
+    monkeypatch.setattr(resumed, "_env_state_snapshot", lambda: resumed_snapshot)
+    infos = resumed.resume_preempted(checkpoint)
+    assert resumed.current_learning_iteration == 7
+    assert infos["preemption"]["final_iteration"] == 10
+    torch.testing.assert_close(resumed.alg.policy.state_dict(), runner.alg.policy.state_dict())
+    assert resumed_snapshot.restored
+    assert torch.equal(resumed_snapshot.terrain_levels, snapshot.terrain_levels)
+    assert torch.equal(torch.rand(3), expected)
@@ -0,0 +1,255 @@
+"""Tests of the static reading of the configuration modules (see ``scripts/rsl_rl/static_modules.py``).
+
+The static modules are installed in subprocesses, since they replace the modules of the packages for the whole
+interpreter.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "scripts", "rsl_rl")
+"""Directory of the scripts, with the module of the static reading."""
+
+sys.path.insert(0, SCRIPTS_DIR)
+
+# local imports
+import static_modules  # isort: skip
+
+
+def run_python(code: str, path: list[str]) -> dict:
+    """Run a Python script in a subprocess and return the JSON object printed last."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([SCRIPTS_DIR, *path, os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)], env=env, capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_function_bodies_are_stripped():
+    """The bodies of the functions are removed, without changing the other statements and the line numbers."""
+    source = textwrap.dedent('''
+        import torch
+
+
+        def scale(x: float, factor: float = (
+            2.0
+        )) -> float:
+            """Scale a value."""
+        # a comment at the start of the line
+            y = x * factor
+            return y
+
+
+        def one_liner(x): return x
+
+
+        class Cfg:
+            weight: float = 1.0
+
+            def __post_init__(self):
+                def nested():
+                    return 0
+
+                self.weight = nested()
+
+            name = "cfg"
+        ''')
+    stripped = static_modules._strip_function_bodies(source)
+    assert len(stripped.splitlines()) == len(source.splitlines())
+    tree, expected = ast.parse(stripped), ast.parse(source)
+    functions = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
+    assert [(node.name, node.lineno) for node in functions] == [("scale", 5), ("one_liner", 14), ("__post_init__", 20)]
+    assert [type(node).__name__ for node in functions[0].body + functions[2].body] == ["Pass", "Pass"]
+    assert ast.dump(functions[1]) == ast.dump(expected.body[2])
+    # the fields of the class are unchanged
+    assert [ast.dump(node) for node in tree.body[3].body if not isinstance(node, ast.FunctionDef)] == [
+        ast.dump(node) for node in expected.body[3].body if not isinstance(node, ast.FunctionDef)
+    ]
+
+
+def test_static_package(tmp_path):
+    """The classes, functions and imports of a static package behave like their imported counterparts."""
+    package_dir = tmp_path / "static_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(textwrap.dedent("""
+        import gymnasium as gym
+
+        from .terms import *
+
+        gym.register(id="Task-v0", kwargs={"cfg_entry_point": f"{__name__}.cfgs:TaskCfg"})
+        """))
+    (package_dir / "terms.py").write_text(textwrap.dedent("""
+        import torch
+
+        __all__ = ["reward", "TermCfg"]
+
+
+        def reward(env):
+            return torch.ones(env.num_envs)
+
+
+        class TermCfg:
+            func: callable = reward
+            weight: float = 1.0
+            params: dict = {"scale": torch.ones(3)}
+        """))
+    (package_dir / "cfgs.py").write_text(textwrap.dedent("""
+        from dataclasses import MISSING
+
+        import static_pkg
+
+        from .terms import TermCfg
+
+
+        def _scaled(weight: float, factor: float = 2.0) -> float:
+            return weight * factor
+
+
+        def _is_positive(value) -> bool:
+            if value > 0:
+                return True
+            return False
+
+
+        class TaskCfg:
+            name: str = MISSING
+            terms: list = [TermCfg(weight=-1.0)]
+            sizes = (1, 2)
+            alive = TermCfg(func=static_pkg.reward)
+            positive = _is_positive(terms[0].params["scale"])
+
+            def __post_init__(self):
+                super().__post_init__()
+                self.terms.append(TermCfg(weight=_scaled(len(self.terms))))
+
+
+        class PlayCfg(TaskCfg):
+            name = "play"
+
+            def __post_init__(self):
+                super().__post_init__()
+                self.alive.weight = {weight for weight in (0.5,)}.pop()
+
+
+        class InvalidCfg(TaskCfg):
+            def __post_init__(self):
+                if self.alive.params["scale"]:
+                    self.sizes = ()
+        """))
+    values = run_python(
+        """
+        import dataclasses
+        import json
+        import static_modules
+
+        static_modules.install_static_modules(packages=["static_pkg"])
+
+        import static_pkg
+        from static_pkg import cfgs
+
+        (args, kwargs), = static_modules.recorded_calls("gymnasium.register")
+        cfg = cfgs.PlayCfg()
+        other = cfgs.PlayCfg()
+        weights = [term.weight for term in cfg.terms]
+        replaced = cfg.replace(sizes=(4,))
+        copied = cfg.copy()
+        copied.from_dict({"alive": {"weight": 2.0}, "sizes": [5, 6]})
+        try:
+            cfgs.InvalidCfg()
+            error = None
+        except static_modules.StaticReadError as exc:
+            error = str(exc)
+        print(json.dumps({
+            "entry_point": kwargs["kwargs"]["cfg_entry_point"],
+            "fields": list(vars(cfg)),
+            "name": cfg.name,
+            "weights": weights,
+            "shared": cfg.terms is other.terms,
+            "same_func": cfg.alive.func is static_pkg.reward and cfg.terms[0].func is static_pkg.reward,
+            "sizes": cfg.sizes,
+            "alive_weight": cfg.alive.weight,
+            "replaced": [replaced.sizes, [term.weight for term in replaced.terms]],
+            "copied": [copied.alive.weight, list(copied.sizes), cfg.alive.weight],
+            "dataclass": dataclasses.is_dataclass(cfg),
+            "instance": isinstance(cfg, cfgs.TaskCfg),
+            "opaque": [str(cfg.alive.params["scale"]), str(cfg.positive)],
+            "error": error,
+        }))
+        """,
+        [str(tmp_path)],
+    )
+    assert values == {
+        "entry_point": "static_pkg.cfgs:TaskCfg",
+        "fields": ["name", "terms", "sizes", "alive", "positive"],
+        "name": "play",
+        "weights": [-1.0, 2.0],
+        "shared": False,
+        "same_func": True,
+        "sizes": [1, 2],
+        "alive_weight": 0.5,
+        # note: the members are deep-copied after the initialization, like by the configuration classes
+        "replaced": [[4], [-1.0, 2.0, 4.0]],
+        "copied": [2.0, [5, 6], 0.5],
+        "dataclass": True,
+        "instance": True,
+        # note: the value depending on the comparison with an opaque value is opaque, unless the function is called
+        #   from an imported module
+        "opaque": ["{torch.ones()}", "{_is_positive()}"],
+        "error": "The truth value of 'torch.ones()' is unknown.",
+    }
+
+
+def test_footprint_matches_the_imported_configurations():
+    """The footprint estimated from the static modules is the one of the imported configurations."""
+    pytest.importorskip("isaaclab")
+    estimate = """
+        env_cfg = load_task_cfg("Ext-Isaac-Velocity-Rough-Anymal-D-v0", "env_cfg_entry_point")
+        agent_cfg = load_task_cfg("Ext-Isaac-Velocity-Rough-Anymal-D-v0", "rsl_rl_cfg_entry_point")
+        print(json.dumps(dataclasses.asdict(estimate_training_footprint(env_cfg, agent_cfg))))
+        """
+    # note: the script reads the configurations statically when it is imported
+    static = run_python(
+        """
+        import dataclasses
+        import json
+        import sys
+
+        sys.argv = ["estimate_footprint.py"]
+
+        from estimate_footprint import estimate_training_footprint, load_task_cfg
+        """ + estimate,
+        [],
+    )
+    imported = run_python(
+        """
+        import dataclasses
+        import gymnasium as gym
+        import importlib
+        import json
+        import sim_placeholders
+
+        sim_placeholders.install_simulator_placeholders()
+
+        import ext_template.tasks  # noqa: F401
+        from ext_template.rsl_rl import estimate_training_footprint
+
+
+        def load_task_cfg(task_name, entry_point_key):
+            entry_point = gym.spec(task_name).kwargs[entry_point_key]
+            if isinstance(entry_point, str):
+                module_name, class_name = entry_point.split(":")
+                entry_point = getattr(importlib.import_module(module_name), class_name)
+            return entry_point()
+        """ + estimate,
+        [],
+    )
+    assert static == imported
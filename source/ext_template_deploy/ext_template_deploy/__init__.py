@@ -0,0 +1,9 @@
+"""
+Standalone runtime for the policies exported by the ext_template extension.
+
+The package has no dependency on Isaac Sim or Isaac Lab. It only imports numpy, and the model backends
+(``onnxruntime`` or ``torch``) are imported when a model is loaded.
+"""
+
+from .manifest import ActionTermSpec, ObservationTermSpec, PolicyManifest
+from .runtime import PolicyRuntime
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+MANIFEST_VERSION = 1
+"""Version of the schema of the policy manifest supported by the runtime."""
+
+
+@dataclass
+class ObservationTermSpec:
+    """Layout of an observation term of the policy."""
+
+    name: str
+    """Name of the term."""
+
+    func: str
+    """Observation function of the term, as ``module:name``."""
+
+    dim: int
+    """Dimension of the term per step."""
+
+    source: str = "input"
+    """Source of the term: ``"input"`` (provided by the caller) or ``"last_action"`` (filled by the runtime)."""
+
+    history_length: int = 1
+    """Number of stacked steps, ordered from the oldest to the newest."""
+
+    offset: float | list[float] | None = None
+    """Offset subtracted from the provided value."""
+
+    clip: list[float] | None = None
+    """Clipping range applied after the offset."""
+
+    scale: float | list[float] | None = None
+    """Scale applied after the clipping."""
+
+    joint_names: list[str] | None = None
+    """Order of the joints for joint-space terms."""
+
+
+@dataclass
+class ActionTermSpec:
+    """Layout of an action term of the policy."""
+
+    name: str
+    """Name of the term."""
+
+    type: str
+    """Type of the action term in Isaac Lab."""
+
+    dim: int
+    """Dimension of the term."""
+
+    joint_names: list[str] | None = None
+    """Order of the joints of the term."""
+
+    scale: float | list[float] | None = None
+    """Scale applied to the raw actions."""
+
+    offset: float | list[float] | None = None
+    """Offset added after the scaling."""
+
+    clip: list[list[float]] | None = None
+    """Per-joint clipping range (lower, upper) applied after the offset."""
+
+
+@dataclass
+class PolicyManifest:
+    """Observation and action layout of an exported policy.
+
+    The manifest is generated next to the exported model by ``play.py`` (see
+    ``ext_template.rsl_rl.export_policy_manifest``).
+    """
+
+    obs_dim: int
+    """Dimension of the observation vector."""
+
+    action_dim: int
+    """Dimension of the action vector."""
+
+    step_dt: float
+    """Control period of the policy (in s)."""
+
+    observations: list[ObservationTermSpec] = field(default_factory=list)
+    """Observation terms in the order of the observation vector."""
+
+    actions: list[ActionTermSpec] = field(default_factory=list)
+    """Action terms in the order of the action vector."""
+
+    group: str = "policy"
+    """Name of the observation group of the policy."""
+
+    version: int = MANIFEST_VERSION
+    """Version of the schema of the manifest."""
+
+    def __post_init__(self):
+        if self.version != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version: {self.version}. Expected: {MANIFEST_VERSION}.")
+        # check the consistency of the layout
+        obs_dim = sum(term.dim * term.history_length for term in self.observations)
+        if obs_dim != self.obs_dim:
+            raise ValueError(f"The observation terms have {obs_dim} dimensions, but the manifest has {self.obs_dim}.")
+        action_dim = sum(term.dim for term in self.actions)
+        if action_dim != self.action_dim:
+            raise ValueError(f"The action terms have {action_dim} dimensions, but the manifest has {self.action_dim}.")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PolicyManifest:
+        """Create the manifest from its dictionary representation."""
+        data = dict(data)
+        data["observations"] = [ObservationTermSpec(**term) for term in data.get("observations", [])]
+        data["actions"] = [ActionTermSpec(**term) for term in data.get("actions", [])]
+        return cls(**data)
+
+    @classmethod
+    def load(cls, path: str) -> PolicyManifest:
+        """Load the manifest from a JSON file."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import numpy as np
+import os
+
+from .manifest import ObservationTermSpec, PolicyManifest
+
+
+class PolicyRuntime:
+    """Runtime of an exported policy.
+
+    The runtime assembles the observation vector of the policy from the layout of a :class:`PolicyManifest`, runs
+    the exported model and converts its actions into joint targets. All the buffers are allocated once: the
+    observation terms are written into views of a single observation buffer, and the model reads from and writes
+    into the runtime buffers directly.
+
+    The model is loaded with an optional backend, selected from the file extension:
+
+    * ``.onnx``: ONNX Runtime (``onnxruntime``).
+    * ``.pt``: TorchScript (``torch``).
+
+    A control step consists of one call of :meth:`set_observation` per input term, followed by :meth:`step`:
+
+    .. code-block:: python
+
+        runtime = PolicyRuntime("exported/policy.onnx")
+        runtime.reset()
+        while True:
+            runtime.set_observation("base_lin_vel", base_lin_vel)
+            ...
+            joint_targets = runtime.step()
+
+    The terms with the ``"last_action"`` source are filled by the runtime with the actions of the previous step.
+    """
+
+    def __init__(self, model_path: str, manifest_path: str | None = None, num_threads: int = 1):
+        """Initializes the runtime.
+
+        Args:
+            model_path: The path to the exported model.
+            manifest_path: The path to the manifest. Defaults to None, in which case the file
+                ``policy_manifest.json`` next to the model is used.
+            num_threads: The number of threads of the model backend. Defaults to 1.
+        """
+        if manifest_path is None:
+            manifest_path = os.path.join(os.path.dirname(model_path), "policy_manifest.json")
+        self.manifest = PolicyManifest.load(manifest_path)
+
+        # observation buffer and term views
+        self.obs = np.zeros((1, self.manifest.obs_dim), dtype=np.float32)
+        self._terms: dict[str, _ObservationTerm] = dict()
+        start = 0
+        for spec in self.manifest.observations:
+            stop = start + spec.dim * spec.history_length
+            self._terms[spec.name] = _ObservationTerm(spec, self.obs[0, start:stop])
+            start = stop
+        self._last_action_terms = [term for term in self._terms.values() if term.spec.source == "last_action"]
+
+        # action buffers and affine transformation
+        self._raw_actions = np.zeros((1, self.manifest.action_dim), dtype=np.float32)
+        self.actions = self._raw_actions[0]
+        self.joint_targets = np.zeros(self.manifest.action_dim, dtype=np.float32)
+        self._action_scale = self._concatenate_actions("scale", 1.0)
+        self._action_offset = self._concatenate_actions("offset", 0.0)
+        clip = [term.clip or [[-np.inf, np.inf]] * term.dim for term in self.manifest.actions]
+        clip = np.asarray(np.concatenate(clip), dtype=np.float32)
+        self._action_clip = (clip[:, 0].copy(), clip[:, 1].copy()) if np.isfinite(clip).any() else None
+
+        # model
+        self._model = _load_model(model_path, self.obs, self._raw_actions, num_threads)
+
+    """
+    Properties.
+    """
+
+    @property
+    def input_terms(self) -> list[str]:
+        """The names of the observation terms provided by the caller, in the order of the observation vector."""
+        return [term.spec.name for term in self._terms.values() if term.spec.source == "input"]
+
+    """
+    Operations.
+    """
+
+    def reset(self):
+        """Reset the previous actions and the observation histories.
+
+        After a reset, the first value written into a term fills its whole history.
+        """
+        self.actions.fill(0.0)
+        for term in self._terms.values():
+            term.needs_fill = True
+
+    def set_observation(self, name: str, value: np.ndarray):
+        """Write the value of an observation term for the current step.
+
+        Args:
+            name: The name of the term.
+            value: The value of the term, as computed by its observation function without the offset.
+                Shape is (dim,).
+        """
+        self._terms[name].write(value)
+
+    def step(self) -> np.ndarray:
+        """Run the policy on the current observations.
+
+        Returns:
+            The joint targets of the actions. The array is reused by the next step.
+        """
+        # fill the previous actions
+        for term in self._last_action_terms:
+            term.write(self.actions)
+        # inference: reads the observation buffer, writes the action buffer
+        self._model()
+        # processed actions: raw * scale + offset (then clipped)
+        np.multiply(self.actions, self._action_scale, out=self.joint_targets)
+        np.add(self.joint_targets, self._action_offset, out=self.joint_targets)
+        if self._action_clip is not None:
+            np.clip(self.joint_targets, *self._action_clip, out=self.joint_targets)
+        return self.joint_targets
+
+    """
+    Helper functions.
+    """
+
+    def _concatenate_actions(self, name: str, default: float) -> np.ndarray:
+        """Concatenate a per-term parameter of the actions into a per-joint array."""
+        values = []
+        for term in self.manifest.actions:
+            value = getattr(term, name)
+            values.append(np.broadcast_to(np.asarray(default if value is None else value, dtype=np.float32), term.dim))
+        return np.concatenate(values).astype(np.float32)
+
+
+class _ObservationTerm:
+    """Writer of an observation term into its view of the observation buffer."""
+
+    def __init__(self, spec: ObservationTermSpec, buffer: np.ndarray):
+        self.spec = spec
+        self.buffer = buffer
+        # the newest step is the last one of the history
+        self.latest = buffer[buffer.shape[0] - spec.dim :]
+        self.offset = None if spec.offset is None else np.asarray(spec.offset, dtype=np.float32)
+        self.clip = None if spec.clip is None else (np.float32(spec.clip[0]), np.float32(spec.clip[1]))
+        self.scale = None if spec.scale is None else np.asarray(spec.scale, dtype=np.float32)
+        self.needs_fill = True
+
+    def write(self, value: np.ndarray):
+        """Apply the offset, the clipping and the scale to the value and append it to the history."""
+        dim = self.spec.dim
+        # shift the history by one step
+        if self.spec.history_length > 1:
+            self.buffer[:-dim] = self.buffer[dim:]
+        # apply the affine transformation in-place
+        if self.offset is not None:
+            np.subtract(value, self.offset, out=self.latest)
+        else:
+            self.latest[:] = value
+        if self.clip is not None:
+            np.clip(self.latest, *self.clip, out=self.latest)
+        if self.scale is not None:
+            np.multiply(self.latest, self.scale, out=self.latest)
+        # the first value after a reset fills the history
+        if self.needs_fill:
+            if self.spec.history_length > 1:
+                self.buffer.reshape(self.spec.history_length, dim)[:] = self.latest
+            self.needs_fill = False
+
+
+def _load_model(path: str, obs: np.ndarray, actions: np.ndarray, num_threads: int):
+    """Load the exported model bound to the observation and action buffers."""
+    extension = os.path.splitext(path)[1]
+    if extension == ".onnx":
+        return _OnnxModel(path, obs, actions, num_threads)
+    if extension in (".pt", ".jit"):
+        return _TorchScriptModel(path, obs, actions, num_threads)
+    raise ValueError(f"Unsupported model format: '{extension}'. Expected '.onnx' or '.pt'.")
+
+
+class _OnnxModel:
+    """ONNX Runtime backend. The buffers are bound to the session, so the inference does not copy any data."""
+
+    def __init__(self, path: str, obs: np.ndarray, actions: np.ndarray, num_threads: int):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        # bind the buffers
+        self._binding = self._session.io_binding()
+        self._binding.bind_cpu_input(self._session.get_inputs()[0].name, obs)
+        self._actions = ort.OrtValue.ortvalue_from_numpy(actions)
+        self._binding.bind_ortvalue_output(self._session.get_outputs()[0].name, self._actions)
+
+    def __call__(self):
+        self._session.run_with_iobinding(self._binding)
+
+
+class _TorchScriptModel:
+    """TorchScript backend. The buffers are shared with tensors, so the inference only copies the actions."""
+
+    def __init__(self, path: str, obs: np.ndarray, actions: np.ndarray, num_threads: int):
+        import torch
+
+        torch.set_num_threads(num_threads)
+        self._torch = torch
+        self._module = torch.jit.load(path, map_location="cpu").eval()
+        self._obs = torch.from_numpy(obs)
+        self._actions = torch.from_numpy(actions)
+
+    def __call__(self):
+        with self._torch.inference_mode():
+            self._actions.copy_(self._module(self._obs))
@@ -0,0 +1,35 @@
+"""Installation script for the 'ext_template_deploy' python package.
+
+The package runs the policies exported by the 'ext_template' extension without Isaac Sim or Isaac Lab.
+It only depends on numpy. The model backends are optional dependencies.
+"""
+
+from setuptools import setup
+
+# Minimum dependencies required prior to installation
+INSTALL_REQUIRES = [
+    "numpy",
+]
+
+# Optional dependencies of the model backends
+EXTRAS_REQUIRE = {
+    "onnx": ["onnxruntime"],
+    "torch": ["torch"],
+}
+
+# Installation operation
+setup(
+    name="ext_template_deploy",
+    packages=["ext_template_deploy"],
+    version="0.1.0",
+    description="Standalone runtime for the policies exported by the ext_template extension.",
+    install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
+    license="Apache 2.0",
+    python_requires=">=3.10",
+    classifiers=[
+        "Natural Language :: English",
+        "Programming Language :: Python :: 3.10",
+    ],
+    zip_safe=False,
+)